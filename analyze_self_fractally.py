@@ -23,7 +23,8 @@ from ljpw_semantic_capabilities import (
     match_archetype, describe_archetype,
     semantic_gravity, semantic_friction, semantic_resonance,
     all_secondary_metrics, aggregate_profiles, build_fractal_tree,
-    full_semantic_diagnostic, ANCHOR_POINT, NATURAL_EQUILIBRIUM
+    full_semantic_diagnostic, entity_coordinates, top_pairs, LJPWSpatialIndex,
+    ANCHOR_POINT, NATURAL_EQUILIBRIUM
 )
 
 
@@ -146,22 +147,14 @@ def find_gravitational_centers(entities: List[SemanticEntity], top_n: int = 5) -
 
 def find_friction_pairs(entities: List[SemanticEntity], top_n: int = 5) -> List[Tuple[str, str, float]]:
     """Find entity pairs with highest friction."""
-    pairs = []
-    for i, e1 in enumerate(entities):
-        for e2 in entities[i+1:]:
-            friction = semantic_friction(e1, e2)
-            pairs.append((e1.name, e2.name, friction))
-    return sorted(pairs, key=lambda x: x[2], reverse=True)[:top_n]
+    pairs = LJPWSpatialIndex(entity_coordinates(entities)).top_friction_pairs(top_n)
+    return [(entities[i].name, entities[j].name, friction) for i, j, friction in pairs]
 
 
 def find_resonant_pairs(entities: List[SemanticEntity], top_n: int = 5) -> List[Tuple[str, str, float]]:
     """Find entity pairs with highest resonance."""
-    pairs = []
-    for i, e1 in enumerate(entities):
-        for e2 in entities[i+1:]:
-            res = semantic_resonance(e1, e2)
-            pairs.append((e1.name, e2.name, res))
-    return sorted(pairs, key=lambda x: x[2], reverse=True)[:top_n]
+    pairs = top_pairs(entity_coordinates(entities), 'resonance', top_n)
+    return [(entities[i].name, entities[j].name, res) for i, j, res in pairs]
 
 
 def analyze_archetypes(entities: List[SemanticEntity]) -> Dict[str, List[str]]:
@@ -36,13 +36,15 @@ Individual functions specialize. Systems integrate. Autopoiesis requires integra
 Threshold for autopoiesis: L > 0.7, H > 0.6
 """
 
-from .analyzer import CodeAnalyzer, FileAnalysis, FunctionAnalysis, SystemAnalysis
+from .analyzer import CodeAnalyzer, FileAnalysis, FunctionAnalysis, SystemAnalysis, SystemAggregate
 from .healer import Healer, NovelSolution
 from .rhythm import BreathingOrchestrator, BreathState
 from .system import SystemHarmonyMeasurer, SystemPhase, SystemHealthReport
 from .engine import AutopoiesisEngine
 from .js_analyzer import JSAnalyzer, JSFileAnalysis, JSFunction
 from .multi_analyzer import MultiLanguageAnalyzer, MultiLanguageReport, UnifiedFileAnalysis, FileType
+from .cache import AnalysisCache
+from .profiling import PipelineProfiler
 
 # Auto-healed: Logging infrastructure for observability (Wisdom dimension)
 import logging
@@ -64,6 +66,8 @@ __all__ = [
     "Healer",
     "BreathingOrchestrator",
     "SystemHarmonyMeasurer",
+    "AnalysisCache",
+    "PipelineProfiler",
     
     # Multi-language support
     "JSAnalyzer",
@@ -73,6 +77,7 @@ __all__ = [
     "FileAnalysis",
     "FunctionAnalysis", 
     "SystemAnalysis",
+    "SystemAggregate",
     "NovelSolution",
     "BreathState",
     
@@ -14,12 +14,15 @@ Key capabilities:
 - Validation pattern detection
 - LJPW dimension scoring via SemanticResonanceAnalyzer
 - System-level aggregation
+- Optional persistent content-hash cache (see cache.py)
+- Optional process-pool parallel directory scans (see parallel.py)
+- Stage timers and counters for the active profiler (see profiling.py)
 """
 
 import ast
 import os
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -28,6 +31,10 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from ljpw_quantum.semantic_resonance_analyzer import SemanticResonanceAnalyzer
 
+from .cache import MISS, AnalysisCache, content_key, get_default_cache
+from .parallel import parallel_map
+from .profiling import get_profiler
+
 
 @dataclass
 class FunctionAnalysis:
@@ -123,15 +130,7 @@ class SystemAnalysis:
             for dim in 'LJPW':
                 self.system_ljpw[dim] = aggregated[dim] / total_weight
         
-        # Calculate system harmony as geometric mean
-        if all(self.system_ljpw.get(d, 0) > 0 for d in 'LJPW'):
-            product = 1.0
-            for d in 'LJPW':
-                product *= self.system_ljpw[d]
-            self.system_harmony = product ** 0.25
-        else:
-            # If any dimension is 0, use average instead
-            self.system_harmony = sum(self.system_ljpw.values()) / 4
+        self.system_harmony = _system_harmony(self.system_ljpw)
         
         # Count deficits
         self.deficit_distribution = {'L': 0, 'J': 0, 'P': 0, 'W': 0}
@@ -140,6 +139,140 @@ class SystemAnalysis:
                 self.deficit_distribution[f.deficit] += 1
 
 
+def _system_harmony(system_ljpw: Dict[str, float]) -> float:
+    """System harmony as the geometric mean of the aggregated LJPW."""
+    if all(system_ljpw.get(d, 0) > 0 for d in 'LJPW'):
+        product = 1.0
+        for d in 'LJPW':
+            product *= system_ljpw[d]
+        return product ** 0.25
+    # If any dimension is 0, use average instead
+    return sum(system_ljpw.values()) / 4
+
+
+class SystemAggregate:
+    """
+    System metrics maintained one file at a time.
+    
+    Keeps running weighted LJPW sums, totals and deficit counts so a single
+    file can be added, updated or removed in O(1), instead of re-running
+    SystemAnalysis.calculate_system_metrics over every file. Files are
+    weighted exactly as there (functions + classes + 1).
+    
+    Usage:
+        aggregate = SystemAggregate.from_system(analyzer.analyze_directory(path))
+        aggregate.update(analyzer.analyze_file(healed_path))
+        print(aggregate.system_harmony)
+    """
+    
+    def __init__(self, path: str, files: Iterable[FileAnalysis] = ()):
+        """
+        Initialize the aggregate.
+        
+        Args:
+            path: Root path the files belong to
+            files: Initial file analyses (paths must be unique)
+        """
+        self.path = path
+        self._files: Dict[str, FileAnalysis] = {}
+        self.total_functions = 0
+        self.total_classes = 0
+        self.total_weight = 0
+        self._weighted = {'L': 0.0, 'J': 0.0, 'P': 0.0, 'W': 0.0}
+        self.deficit_distribution = {'L': 0, 'J': 0, 'P': 0, 'W': 0}
+        for analysis in files:
+            self.add(analysis)
+    
+    @classmethod
+    def from_system(cls, system: SystemAnalysis) -> 'SystemAggregate':
+        """Build an aggregate from an existing SystemAnalysis."""
+        return cls(system.path, system.files)
+    
+    def __len__(self) -> int:
+        return len(self._files)
+    
+    def __contains__(self, path: str) -> bool:
+        return path in self._files
+    
+    @property
+    def files(self) -> List[FileAnalysis]:
+        """Tracked file analyses, in insertion order."""
+        return list(self._files.values())
+    
+    def get(self, path: str) -> Optional[FileAnalysis]:
+        """Tracked analysis for a path, if any."""
+        return self._files.get(path)
+    
+    def add(self, analysis: FileAnalysis):
+        """Add a file that is not tracked yet."""
+        if analysis.path in self._files:
+            raise ValueError(f'{analysis.path} is already tracked; use update()')
+        self._files[analysis.path] = analysis
+        self._apply(analysis, 1)
+    
+    def update(self, analysis: FileAnalysis):
+        """Replace a file's analysis (or add it if untracked)."""
+        previous = self._files.get(analysis.path)
+        if previous is not None:
+            self._apply(previous, -1)
+        self._files[analysis.path] = analysis
+        self._apply(analysis, 1)
+    
+    def remove(self, path: str) -> Optional[FileAnalysis]:
+        """Stop tracking a file. Returns its analysis, or None if untracked."""
+        previous = self._files.pop(path, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        return previous
+    
+    def _apply(self, analysis: FileAnalysis, sign: int):
+        functions = len(analysis.functions)
+        classes = len(analysis.classes)
+        weight = functions + classes + 1
+        self.total_functions += sign * functions
+        self.total_classes += sign * classes
+        self.total_weight += sign * weight
+        if self._files:
+            for dim in 'LJPW':
+                self._weighted[dim] += sign * analysis.ljpw.get(dim, 0) * weight
+        else:
+            # Reset exactly rather than carrying rounding residue
+            self._weighted = {'L': 0.0, 'J': 0.0, 'P': 0.0, 'W': 0.0}
+        if analysis.deficit in self.deficit_distribution:
+            self.deficit_distribution[analysis.deficit] += sign
+    
+    @property
+    def system_ljpw(self) -> Dict[str, float]:
+        """Weighted average LJPW over tracked files ({} when empty)."""
+        if not self._files:
+            return {}
+        return {dim: self._weighted[dim] / self.total_weight for dim in 'LJPW'}
+    
+    @property
+    def system_harmony(self) -> float:
+        """Geometric mean harmony of the system LJPW."""
+        if not self._files:
+            return 0.0
+        return _system_harmony(self.system_ljpw)
+    
+    def to_system_analysis(self) -> SystemAnalysis:
+        """
+        Snapshot as a SystemAnalysis, without re-aggregating.
+        
+        Matches calculate_system_metrics over the same files up to
+        floating-point rounding of the running sums.
+        """
+        system = SystemAnalysis(path=self.path, files=self.files)
+        if not self._files:
+            return system
+        system.total_functions = self.total_functions
+        system.total_classes = self.total_classes
+        system.system_ljpw = self.system_ljpw
+        system.system_harmony = self.system_harmony
+        system.deficit_distribution = dict(self.deficit_distribution)
+        return system
+
+
 class CodeAnalyzer:
     """
     Deep code analyzer using AST parsing and LJPW measurement.
@@ -150,8 +283,19 @@ class CodeAnalyzer:
     - System level (aggregated harmony)
     """
     
-    def __init__(self):
+    def __init__(self, cache: Optional[AnalysisCache] = None, workers: int = 1):
+        """
+        Initialize the analyzer.
+        
+        Args:
+            cache: Persistent analysis cache. Defaults to the shared cache
+                   configured by AUTOPOIESIS_CACHE_DIR, or no caching.
+            workers: Processes used by analyze_directory (1 = sequential,
+                     0 or less = one per CPU core)
+        """
         self.semantic_analyzer = SemanticResonanceAnalyzer()
+        self.cache = cache if cache is not None else get_default_cache()
+        self.workers = workers
     
     def analyze_file(self, filepath: str) -> Optional[FileAnalysis]:
         """
@@ -165,13 +309,37 @@ class CodeAnalyzer:
         """
         if not os.path.exists(filepath):
             return None
-            
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
         
+        profiler = get_profiler()
+        with profiler.stage('read_file'):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                content = f.read()
+                if profiler:
+                    profiler.count('files_read')
+                    profiler.count('bytes_read', os.fstat(f.fileno()).st_size)
+        
+        if self.cache is None:
+            return self._analyze_content(filepath, content)
+        
+        key = content_key(content)
+        cached = self.cache.get(key, filepath)
+        if cached is not MISS:
+            profiler.count('cache_hits')
+            return cached
+        profiler.count('cache_misses')
+        
+        analysis = self._analyze_content(filepath, content)
+        self.cache.put(key, analysis)
+        return analysis
+    
+    def _analyze_content(self, filepath: str, content: str) -> Optional[FileAnalysis]:
+        """Analyze already-read file content (the uncached path)."""
+        profiler = get_profiler()
         # Get LJPW metrics from semantic analyzer
         try:
-            report = self.semantic_analyzer.analyze_code(content, os.path.basename(filepath))
+            with profiler.stage('semantic_resonance'):
+                report = self.semantic_analyzer.analyze_code(content, os.path.basename(filepath))
+            profiler.count('resonance_cycles', report.get('cycles_run', 0))
             ljpw = {
                 'L': report['final_ljpw'][0],
                 'J': report['final_ljpw'][1],
@@ -187,8 +355,10 @@ class CodeAnalyzer:
             harmony = 0.5
         
         # Parse AST
+        profiler.count('ast_parses')
         try:
-            tree = ast.parse(content)
+            with profiler.stage('ast_parse'):
+                tree = ast.parse(content)
         except SyntaxError:
             return None
         
@@ -224,7 +394,8 @@ class CodeAnalyzer:
             harmony=harmony
         )
     
-    def analyze_directory(self, dirpath: str, recursive: bool = True) -> SystemAnalysis:
+    def analyze_directory(self, dirpath: str, recursive: bool = True,
+                          workers: Optional[int] = None) -> SystemAnalysis:
         # Auto-healed: Input validation for analyze_directory
         if dirpath is not None and not isinstance(dirpath, str):
             raise TypeError(f'dirpath must be str, got {type(dirpath).__name__}')
@@ -234,30 +405,59 @@ class CodeAnalyzer:
         Args:
             dirpath: Path to directory
             recursive: Whether to search subdirectories
+            workers: Override for self.workers (1 = sequential, 0 or less = all cores)
             
         Returns:
-            SystemAnalysis with aggregated metrics
+            SystemAnalysis with aggregated metrics. File order matches the
+            sequential scan regardless of worker count.
         """
-        files = []
-        path = Path(dirpath)
+        with get_profiler().stage('analyze_directory'):
+            return self._analyze_paths(dirpath, self.collect_files(dirpath, recursive), workers)
+    
+    def _analyze_paths(self, dirpath: str, paths: List[str], workers: Optional[int]) -> SystemAnalysis:
+        """Analyze collected paths into a SystemAnalysis for dirpath."""
+        if workers is None:
+            workers = self.workers
         
-        pattern = '**/*.py' if recursive else '*.py'
-        for py_file in path.glob(pattern):
-            # Skip __pycache__ and test files
-            if '__pycache__' in str(py_file):
-                continue
-            if py_file.name.startswith('test_'):
-                continue
-                
-            analysis = self.analyze_file(str(py_file))
-            if analysis:
-                files.append(analysis)
+        cache_config = None
+        if self.cache is not None:
+            cache_config = (str(self.cache.cache_dir), self.cache.max_entries, self.cache.max_bytes)
+        
+        results = parallel_map(
+            _analyze_file_in_worker,
+            paths,
+            workers=workers,
+            initializer=_init_worker,
+            initargs=(cache_config,),
+            sequential_fn=self.analyze_file,
+        )
+        files = [analysis for analysis in results if analysis]
         
         system = SystemAnalysis(path=dirpath, files=files)
         system.calculate_system_metrics()
         
         return system
     
+    def collect_files(self, dirpath: str, recursive: bool = True) -> List[str]:
+        """
+        List the Python files analyze_directory would analyze, in scan order.
+        
+        Skips __pycache__ and test files.
+        """
+        pattern = '**/*.py' if recursive else '*.py'
+        return [str(py_file) for py_file in Path(dirpath).glob(pattern)
+                if self.should_analyze(str(py_file))]
+    
+    def should_analyze(self, filepath: str) -> bool:
+        """Check if a path is a Python file analyze_directory would include."""
+        path = Path(filepath)
+        if path.suffix != '.py':
+            return False
+        # Skip __pycache__ and test files
+        if '__pycache__' in str(path):
+            return False
+        return not path.name.startswith('test_')
+    
     def _analyze_function(self, node: ast.FunctionDef, content: str) -> FunctionAnalysis:
         """Deep analysis of a single function."""
         # Extract parameters with types
@@ -368,3 +568,22 @@ class CodeAnalyzer:
                 needs_healing['W'].append(func)
         
         return needs_healing
+
+
+# =============================================================================
+# PROCESS-POOL WORKERS
+# =============================================================================
+
+_worker_analyzer: Optional[CodeAnalyzer] = None
+
+
+def _init_worker(cache_config: Optional[tuple]):
+    """Create the per-process analyzer (sharing the parent's cache directory)."""
+    global _worker_analyzer
+    cache = AnalysisCache(*cache_config) if cache_config else None
+    _worker_analyzer = CodeAnalyzer(cache=cache)
+
+
+def _analyze_file_in_worker(filepath: str) -> Optional[FileAnalysis]:
+    """Analyze one file inside a worker process."""
+    return _worker_analyzer.analyze_file(filepath)
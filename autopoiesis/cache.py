@@ -0,0 +1,306 @@
+"""
+Autopoiesis Analysis Cache
+==========================
+
+Persistent, content-addressed cache for FileAnalysis results.
+
+Every breath, dashboard refresh and agent heartbeat re-measures the whole
+tree, but most files have not changed since the last measurement. This
+module remembers the analysis of each file keyed by the SHA-256 of its
+content plus the analyzer version, so repeat measurements only pay for
+the files that actually changed.
+
+Key properties:
+- Content-addressed: renaming or copying a file is still a cache hit
+- Versioned: bumping ANALYZER_VERSION invalidates every stored entry
+- Shared: entries live on disk and are reused across processes
+- Bounded: least-recently-used entries are evicted past a size cap
+
+Usage:
+    from autopoiesis.cache import AnalysisCache
+    from autopoiesis import CodeAnalyzer
+
+    analyzer = CodeAnalyzer(cache=AnalysisCache())
+    system = analyzer.analyze_directory("./my_package")  # cold: full analysis
+    system = analyzer.analyze_directory("./my_package")  # warm: hashes only
+
+Setting AUTOPOIESIS_CACHE_DIR enables a shared cache for every
+CodeAnalyzer created without an explicit cache.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bump whenever analysis heuristics change so stale entries are ignored.
+ANALYZER_VERSION = "1"
+
+# Environment variable that turns on the shared default cache.
+CACHE_DIR_ENV = "AUTOPOIESIS_CACHE_DIR"
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256 MB
+
+# Marker stored for files that could not be parsed (analyze_file -> None).
+_UNPARSEABLE = {'unparseable': True}
+
+
+def content_key(content: str) -> str:
+    """Return the cache key for a file's content under the current analyzer version."""
+    digest = hashlib.sha256()
+    digest.update(ANALYZER_VERSION.encode('ascii'))
+    digest.update(b'\0')
+    digest.update(content.encode('utf-8', errors='surrogatepass'))
+    return digest.hexdigest()
+
+
+class AnalysisCache:
+    """
+    On-disk LRU cache of FileAnalysis results.
+
+    Each entry is a small JSON file sharded by the first two hex digits of
+    its key (like git objects). Writes are atomic (temp file + rename) so
+    concurrent processes never observe a half-written entry. Recency is
+    tracked through file mtimes, which hits refresh, so eviction order is
+    shared by every process using the same directory.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: ~/.cache/autopoiesis/analysis)
+            max_entries: Maximum number of entries before LRU eviction
+            max_bytes: Maximum total size of entries before LRU eviction
+        """
+        if max_entries <= 0:
+            raise ValueError(f'max_entries must be positive, got {max_entries}')
+        if max_bytes <= 0:
+            raise ValueError(f'max_bytes must be positive, got {max_bytes}')
+
+        if cache_dir is None:
+            cache_dir = str(Path.home() / '.cache' / 'autopoiesis' / 'analysis')
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        # Statistics (per process)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Running totals, computed lazily from disk on first write
+        self._entry_count: Optional[int] = None
+        self._total_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, path: str) -> Any:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: Content key from content_key()
+            path: Path of the file being analyzed (restored into the result)
+
+        Returns:
+            FileAnalysis on hit, None for a cached unparseable file,
+            or MISS if there is no entry.
+        """
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return MISS
+
+        # Refresh recency for LRU ordering
+        try:
+            os.utime(entry_path, None)
+        except OSError:
+            pass
+
+        self.hits += 1
+        if data.get('unparseable'):
+            return None
+        return _file_analysis_from_dict(data, path)
+
+    def put(self, key: str, analysis) -> None:
+        """
+        Store an analysis result (or None for an unparseable file).
+
+        Args:
+            key: Content key from content_key()
+            analysis: FileAnalysis or None
+        """
+        data = _UNPARSEABLE if analysis is None else asdict(analysis)
+        payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+        with self._lock:
+            self._ensure_totals()
+
+        entry_path = self._entry_path(key)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                old_size = entry_path.stat().st_size
+            except OSError:
+                old_size = None
+            fd, tmp_path = tempfile.mkstemp(dir=str(entry_path.parent), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            # A cache that cannot write is just a slower analyzer
+            return
+
+        with self._lock:
+            if old_size is None:
+                self._entry_count += 1
+            else:
+                self._total_bytes -= old_size
+            self._total_bytes += len(payload)
+            if self._entry_count > self.max_entries or self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> int:
+        """Remove every entry. Returns the number of entries removed."""
+        removed = 0
+        with self._lock:
+            for entry in self._iter_entries():
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+            self._entry_count = 0
+            self._total_bytes = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            self._ensure_totals()
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'evictions': self.evictions,
+                'entries': self._entry_count,
+                'bytes': self._total_bytes,
+                'cache_dir': str(self.cache_dir),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f'{key}.json'
+
+    def _iter_entries(self):
+        if not self.cache_dir.is_dir():
+            return
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.json'):
+                    yield entry
+
+    def _ensure_totals(self):
+        if self._entry_count is not None:
+            return
+        count = 0
+        size = 0
+        for entry in self._iter_entries():
+            try:
+                size += entry.stat().st_size
+                count += 1
+            except OSError:
+                pass
+        self._entry_count = count
+        self._total_bytes = size
+
+    def _evict(self):
+        """Evict least-recently-used entries down to 90% of the caps."""
+        entries = []
+        for entry in self._iter_entries():
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+        entries.sort()
+
+        count = len(entries)
+        size = sum(e[1] for e in entries)
+        target_entries = int(self.max_entries * 0.9)
+        target_bytes = int(self.max_bytes * 0.9)
+
+        for _, entry_size, entry_path in entries:
+            if count <= target_entries and size <= target_bytes:
+                break
+            try:
+                os.remove(entry_path)
+            except OSError:
+                continue
+            count -= 1
+            size -= entry_size
+            self.evictions += 1
+
+        self._entry_count = count
+        self._total_bytes = size
+
+
+class _Miss:
+    """Sentinel for a cache miss (distinct from a cached None)."""
+
+    def __repr__(self):
+        return 'MISS'
+
+
+MISS = _Miss()
+
+
+def _file_analysis_from_dict(data: Dict[str, Any], path: str):
+    """Rebuild a FileAnalysis (with nested FunctionAnalysis) from its JSON form."""
+    from .analyzer import FileAnalysis, FunctionAnalysis
+
+    functions = [FunctionAnalysis(**func) for func in data.get('functions', [])]
+    fields = dict(data)
+    fields['functions'] = functions
+    fields['path'] = path
+    return FileAnalysis(**fields)
+
+
+_default_cache: Optional[AnalysisCache] = None
+
+
+def get_default_cache() -> Optional[AnalysisCache]:
+    """
+    Return the shared cache configured by AUTOPOIESIS_CACHE_DIR, if any.
+
+    Returns:
+        AnalysisCache when the environment variable is set, otherwise None
+    """
+    global _default_cache
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    if _default_cache is None or str(_default_cache.cache_dir) != str(Path(cache_dir)):
+        _default_cache = AnalysisCache(cache_dir)
+    return _default_cache
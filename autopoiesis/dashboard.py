@@ -8,17 +8,28 @@ A web-based dashboard for monitoring the autopoiesis system:
 - Learning insights visualization
 - LJPW dimension breakdown
 
+Data is measured by a background refresher and served from a snapshot,
+so any number of open dashboards share one analysis per refresh. The
+refresher pauses while no client has asked for data recently, and file
+analyses are cached, so unchanged files are not re-analyzed:
+- /            HTML page (reloads itself when new data arrives)
+- /api/data    JSON snapshot (ETag / 304, gzip)
+- /api/stream  Server-sent events, one 'data' event per new snapshot
+
 Usage:
     python dashboard.py  # Opens browser to http://localhost:5000
+    python dashboard.py --ttl 30  # Re-measure every 30 seconds
 """
 
 import os
 import sys
+import gzip
 import json
 import time
+import hashlib
 from pathlib import Path
 from datetime import datetime
-from http.server import HTTPServer, SimpleHTTPRequestHandler
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
 import threading
 import webbrowser
 
@@ -27,19 +38,69 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 class DashboardData:
-    """Collects data for the dashboard."""
+    """
+    Collects data for the dashboard.
     
-    def __init__(self, target_path: str = "."):
+    Each refresh serializes the data once into a snapshot (JSON, gzipped
+    JSON, ETag, HTML) that every request then reuses. Call start() to
+    refresh in the background every ttl seconds; otherwise get_all_data()
+    refreshes on demand once the snapshot is older than ttl.
+    
+    The background refresher skips refreshes while no snapshot has been
+    requested for idle_timeout seconds (event streams request one at least
+    every stream keep-alive); the next request then refreshes on demand.
+    """
+    
+    def __init__(self, target_path: str = ".", ttl: float = 5.0,
+                 cache=None, idle_timeout: float = 60.0):
+        """
+        Initialize the dashboard data.
+        
+        Args:
+            target_path: Path to the project to monitor
+            ttl: Seconds between re-measurements
+            cache: AnalysisCache for the measurer. Defaults to the shared
+                   cache configured by AUTOPOIESIS_CACHE_DIR, or an
+                   AnalysisCache in its default directory.
+            idle_timeout: Seconds without requests before background
+                          refreshes pause
+        """
         self.target_path = Path(target_path).resolve()
+        self.ttl = ttl
+        self.cache = cache
+        self.idle_timeout = idle_timeout
+        self._last_request = 0.0
+        self._measurer = None
         self._cache = {}
         self._cache_time = 0
+        
+        # Serialized snapshot of _cache
+        self._version = 0
+        self._etag = ''
+        self._body = b''
+        self._gzip_body = b''
+        self._html = b''
+        
+        self._refresh_lock = threading.RLock()
+        self._updated = threading.Condition()
+        self._stop_event = threading.Event()
+        self._refresher = None
+    
+    @property
+    def measurer(self):
+        """Lazy load one measurer (and its analysis cache) for all refreshes."""
+        if self._measurer is None:
+            from autopoiesis.cache import AnalysisCache, get_default_cache
+            from autopoiesis.system import SystemHarmonyMeasurer
+            if self.cache is None:
+                self.cache = get_default_cache() or AnalysisCache()
+            self._measurer = SystemHarmonyMeasurer(cache=self.cache)
+        return self._measurer
     
     def get_harmony(self) -> dict:
         """Get current harmony measurement."""
         try:
-            from autopoiesis.system import SystemHarmonyMeasurer
-            measurer = SystemHarmonyMeasurer()
-            report = measurer.measure(str(self.target_path))
+            report = self.measurer.measure(str(self.target_path))
             return {
                 'harmony': report.harmony,
                 'love': report.love,
@@ -70,20 +131,123 @@ class DashboardData:
                 return json.load(f)
         return {}
     
+    def refresh(self) -> int:
+        """
+        Re-collect all data and rebuild the snapshot.
+        
+        The version only advances when the content changed (timestamps
+        aside), so clients are not told about identical data.
+        
+        Returns:
+            Current snapshot version
+        """
+        with self._refresh_lock:
+            data = {
+                'harmony': self.get_harmony(),
+                'memory': self.get_memory(),
+                'learning': self.get_learning(),
+            }
+            # Fingerprint the content, not the measurement time
+            content = dict(data, harmony={
+                k: v for k, v in data['harmony'].items() if k != 'timestamp'
+            })
+            etag = '"' + hashlib.sha1(
+                json.dumps(content, sort_keys=True, default=str).encode()
+            ).hexdigest() + '"'
+            
+            with self._updated:
+                self._cache_time = time.time()
+                if etag == self._etag:
+                    return self._version
+                
+                data['timestamp'] = datetime.now().isoformat()
+                data['version'] = self._version + 1
+                body = json.dumps(data).encode()
+                
+                self._cache = data
+                self._etag = etag
+                self._body = body
+                self._gzip_body = gzip.compress(body)
+                self._html = generate_dashboard_html(data).encode()
+                self._version += 1
+                self._updated.notify_all()
+                return self._version
+    
+    def _has_clients(self) -> bool:
+        return time.time() - self._last_request < self.idle_timeout
+    
+    def _is_stale(self, idle: bool) -> bool:
+        # With a refresher running, requests only refresh after it has idled
+        return ((self._refresher is None or idle)
+                and time.time() - self._cache_time >= self.ttl)
+    
+    def _ensure_fresh(self):
+        idle = not self._has_clients()
+        self._last_request = time.time()
+        if self._is_stale(idle):
+            with self._refresh_lock:
+                # Concurrent requests wait for one refresh instead of each measuring
+                if self._is_stale(idle):
+                    self.refresh()
+    
     def get_all_data(self) -> dict:
         """Get all dashboard data."""
-        # Cache for 5 seconds
-        if time.time() - self._cache_time < 5:
-            return self._cache
-        
-        self._cache = {
-            'harmony': self.get_harmony(),
-            'memory': self.get_memory(),
-            'learning': self.get_learning(),
-            'timestamp': datetime.now().isoformat()
-        }
-        self._cache_time = time.time()
+        self._ensure_fresh()
         return self._cache
+    
+    def snapshot(self) -> dict:
+        """Current serialized snapshot: version, etag, body, gzip_body, html."""
+        self._ensure_fresh()
+        with self._updated:
+            return {
+                'version': self._version,
+                'etag': self._etag,
+                'body': self._body,
+                'gzip_body': self._gzip_body,
+                'html': self._html,
+            }
+    
+    def wait_for_update(self, version: int, timeout: float) -> int:
+        """
+        Block until the snapshot is newer than version (or timeout).
+        
+        Returns:
+            Current snapshot version
+        """
+        with self._updated:
+            self._updated.wait_for(
+                lambda: self._version > version or self._stop_event.is_set(), timeout
+            )
+            return self._version
+    
+    def start(self):
+        """Start refreshing in the background every ttl seconds while clients are active."""
+        if self._refresher is not None:
+            return
+        self._stop_event.clear()
+        self.refresh()
+        self._refresher = threading.Thread(
+            target=self._refresh_loop, daemon=True, name="DashboardRefresher"
+        )
+        self._refresher.start()
+    
+    def stop(self):
+        """Stop the background refresher and release waiting streams."""
+        self._stop_event.set()
+        with self._updated:
+            self._updated.notify_all()
+        if self._refresher is not None:
+            self._refresher.join(timeout=5)
+            self._refresher = None
+    
+    def _refresh_loop(self):
+        while not self._stop_event.wait(self.ttl):
+            if not self._has_clients():
+                continue
+            try:
+                self.refresh()
+            except Exception:
+                continue  # Keep serving the last good snapshot
 
 
 def generate_dashboard_html(data: dict) -> str:
@@ -98,6 +262,7 @@ def generate_dashboard_html(data: dict) -> str:
     p = harmony.get('power', 0)
     w = harmony.get('wisdom', 0)
     phase = harmony.get('phase', 'unknown')
+    version = data.get('version', 0)
     
     # Phase colors
     phase_colors = {
@@ -393,10 +558,17 @@ def generate_dashboard_html(data: dict) -> str:
             </div>
         </div>
         
-        <p class="refresh-hint">Refresh page to update data (Ctrl+R)</p>
+        <p class="refresh-hint">Updates automatically when new data arrives</p>
     </div>
     
     <script>
+        if (window.EventSource) {{
+            const stream = new EventSource('/api/stream');
+            stream.addEventListener('data', (event) => {{
+                if (Number(event.lastEventId) > {version}) location.reload();
+            }});
+        }}
+        
         const ctx = document.getElementById('harmonyChart').getContext('2d');
         new Chart(ctx, {{
             type: 'line',
@@ -455,31 +627,112 @@ class DashboardHandler(SimpleHTTPRequestHandler):
     
     data_source: DashboardData = None
     
+    # Seconds between SSE keep-alive comments
+    stream_keepalive = 15.0
+    
     def do_GET(self):
         if self.path == '/' or self.path == '/index.html':
-            data = self.data_source.get_all_data() if self.data_source else {}
-            html = generate_dashboard_html(data)
+            if self.data_source:
+                html = self.data_source.snapshot()['html']
+            else:
+                html = generate_dashboard_html({}).encode()
             
             self.send_response(200)
             self.send_header('Content-type', 'text/html')
+            self.send_header('Content-Length', str(len(html)))
             self.end_headers()
-            self.wfile.write(html.encode())
+            self.wfile.write(html)
         elif self.path == '/api/data':
-            data = self.data_source.get_all_data() if self.data_source else {}
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(data).encode())
+            self._send_data()
+        elif self.path == '/api/stream' and self.data_source:
+            self._stream()
         else:
             self.send_response(404)
             self.end_headers()
     
+    def _send_data(self):
+        """Serve the JSON snapshot with ETag revalidation and gzip."""
+        if self.data_source:
+            snap = self.data_source.snapshot()
+        else:
+            body = json.dumps({}).encode()
+            snap = {'etag': '', 'body': body, 'gzip_body': gzip.compress(body)}
+        
+        if snap['etag'] and self.headers.get('If-None-Match') == snap['etag']:
+            self.send_response(304)
+            self.send_header('ETag', snap['etag'])
+            self.end_headers()
+            return
+        
+        use_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        body = snap['gzip_body'] if use_gzip else snap['body']
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if snap['etag']:
+            self.send_header('ETag', snap['etag'])
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _stream(self):
+        """Server-sent events: one 'data' event per new snapshot."""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+        
+        version = -1
+        try:
+            while not self.data_source._stop_event.is_set():
+                snap = self.data_source.snapshot()
+                if snap['version'] > version:
+                    version = snap['version']
+                    event = f"event: data\nid: {version}\ndata: {snap['body'].decode()}\n\n"
+                    self.wfile.write(event.encode())
+                else:
+                    self.wfile.write(b': keep-alive\n\n')
+                self.wfile.flush()
+                self.data_source.wait_for_update(version, self.stream_keepalive)
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away
+    
     def log_message(self, format, *args):
         pass  # Suppress log messages
 
 
-def run_dashboard(target_path: str = ".", port: int = 5000, open_browser: bool = True):
+def create_dashboard_server(target_path: str = ".", port: int = 5000,
+                            ttl: float = 5.0, host: str = 'localhost',
+                            cache=None) -> ThreadingHTTPServer:
+    """
+    Create a threaded dashboard server with a running background refresher.
+    
+    Args:
+        target_path: Path to the project to monitor
+        port: Port to bind (0 = any free port)
+        ttl: Seconds between background re-measurements
+        host: Interface to bind
+        cache: AnalysisCache for the measurer (see DashboardData)
+        
+    Returns:
+        ThreadingHTTPServer; its data_source attribute is the DashboardData
+    """
+    data_source = DashboardData(target_path, ttl=ttl, cache=cache)
+    handler = type('BoundDashboardHandler', (DashboardHandler,), {'data_source': data_source})
+    
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.data_source = data_source
+    data_source.start()
+    return server
+
+
+def run_dashboard(target_path: str = ".", port: int = 5000, open_browser: bool = True,
+                  ttl: float = 5.0):
     """
     Run the dashboard server.
     
@@ -487,10 +740,9 @@ def run_dashboard(target_path: str = ".", port: int = 5000, open_browser: bool =
         target_path: Path to the project to monitor
         port: Port to run on
         open_browser: Whether to auto-open browser
+        ttl: Seconds between background re-measurements
     """
-    DashboardHandler.data_source = DashboardData(target_path)
-    
-    server = HTTPServer(('localhost', port), DashboardHandler)
+    server = create_dashboard_server(target_path, port, ttl)
     
     url = f"http://localhost:{port}"
     print(f"\n  Autopoiesis Dashboard running at: {url}\n")
@@ -502,7 +754,9 @@ def run_dashboard(target_path: str = ".", port: int = 5000, open_browser: bool =
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n  Dashboard stopped.")
-        server.shutdown()
+    finally:
+        server.data_source.stop()
+        server.server_close()
 
 
 if __name__ == "__main__":
@@ -512,7 +766,9 @@ if __name__ == "__main__":
     parser.add_argument("path", nargs="?", default=".", help="Path to monitor")
     parser.add_argument("--port", "-p", type=int, default=5000, help="Port (default: 5000)")
     parser.add_argument("--no-browser", action="store_true", help="Don't open browser")
+    parser.add_argument("--ttl", type=float, default=5.0,
+                        help="Seconds between background re-measurements (default: 5)")
     
     args = parser.parse_args()
     
-    run_dashboard(args.path, args.port, not args.no_browser)
+    run_dashboard(args.path, args.port, not args.no_browser, args.ttl)
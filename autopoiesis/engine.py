@@ -13,14 +13,17 @@ This engine provides:
 - Configurable healing intensity
 - Progress tracking and reporting
 - Integration with all autopoiesis components
+- Optional per-stage profiling (see profiling.py)
 """
 
 from typing import Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
 
-from .analyzer import CodeAnalyzer, SystemAnalysis
+from .analyzer import CodeAnalyzer, SystemAggregate, SystemAnalysis
+from .cache import AnalysisCache
 from .healer import Healer
+from .profiling import PipelineProfiler, activate, get_profiler, profiler_from_env, summary_path
 from .rhythm import BreathingOrchestrator, BreathingSession
 from .system import SystemHarmonyMeasurer, SystemHealthReport, SystemPhase
 
@@ -41,22 +44,30 @@ class AutopoiesisEngine:
     4. System - Measure emergent harmony at package level
     """
     
-    def __init__(self, target_path: str, dry_run: bool = False):
+    def __init__(self, target_path: str, dry_run: bool = False,
+                 cache: Optional[AnalysisCache] = None,
+                 profiler: Optional[PipelineProfiler] = None):
         """
         Initialize the autopoiesis engine.
         
         Args:
             target_path: Directory or file to heal
             dry_run: If True, analyze and diagnose but don't modify files
+            cache: Persistent analysis cache shared by all components
+            profiler: Stage timer / counter collector shared by all
+                      components. Defaults to one configured by
+                      AUTOPOIESIS_PROFILE, or none.
         """
         self.target_path = Path(target_path)
         self.dry_run = dry_run
+        self.profiler = profiler if profiler is not None else profiler_from_env()
         
         # Initialize components
-        self.analyzer = CodeAnalyzer()
+        self.analyzer = CodeAnalyzer(cache=cache)
         self.healer = Healer()
-        self.measurer = SystemHarmonyMeasurer()
-        self.orchestrator = BreathingOrchestrator(str(target_path), dry_run)
+        self.measurer = SystemHarmonyMeasurer(cache=cache)
+        self.orchestrator = BreathingOrchestrator(str(target_path), dry_run, cache=cache,
+                                                  profiler=self.profiler)
         
         # State
         self.initial_report: Optional[SystemHealthReport] = None
@@ -71,7 +82,11 @@ class AutopoiesisEngine:
         Returns:
             SystemHealthReport with all metrics
         """
-        self.current_report = self.measurer.measure(str(self.target_path))
+        return self._record_report(self.measurer.measure(str(self.target_path)))
+    
+    def _record_report(self, report: SystemHealthReport) -> SystemHealthReport:
+        """Make report the current one (and the initial one, if first)."""
+        self.current_report = report
         
         if self.initial_report is None:
             self.initial_report = self.current_report
@@ -112,14 +127,22 @@ class AutopoiesisEngine:
         Returns:
             BreathingSession with all results
         """
-        # Record initial state
-        self.analyze()
-        
-        # Execute breathing
-        self.breathing_session = self.orchestrator.breathe(cycles)
+        with activate(self.profiler):
+            profiler = get_profiler()
+            
+            # Record initial state
+            with profiler.stage('measure'):
+                self.analyze()
+            
+            # Execute breathing
+            self.breathing_session = self.orchestrator.breathe(cycles)
+            
+            # Record final state
+            with profiler.stage('measure'):
+                self.current_report = self.analyze()
         
-        # Record final state
-        self.current_report = self.analyze()
+        if self.profiler is not None:
+            self.breathing_session.profile = self.profiler.summary()
         
         # Add to history
         self.history.append({
@@ -146,7 +169,14 @@ class AutopoiesisEngine:
         if self.dry_run:
             return {'status': 'dry_run', 'message': 'No modifications in dry run mode'}
         
-        report = self.analyze()
+        aggregate = None
+        if self.target_path.is_dir():
+            # Scan once; healed files are re-analyzed individually below
+            system = self.analyzer.analyze_directory(str(self.target_path))
+            aggregate = SystemAggregate.from_system(system)
+            report = self._record_report(self.measurer.measure_system(system))
+        else:
+            report = self.analyze()
         
         if dimension is None:
             dimension = report.priority_dimension
@@ -154,15 +184,19 @@ class AutopoiesisEngine:
         solutions_applied = 0
         files_modified = 0
         
-        if self.target_path.is_dir():
-            system = self.analyzer.analyze_directory(str(self.target_path))
-            for file_analysis in system.files:
+        if aggregate is not None:
+            for file_analysis in aggregate.files:
                 solutions = self.healer.heal_file(file_analysis, dimension)
                 if solutions:
                     applied = self.healer.apply_solutions(file_analysis.path, solutions)
                     if applied > 0:
                         files_modified += 1
                         solutions_applied += applied
+                        healed = self.analyzer.analyze_file(file_analysis.path)
+                        if healed:
+                            aggregate.update(healed)
+                        else:
+                            aggregate.remove(file_analysis.path)
         else:
             file_analysis = self.analyzer.analyze_file(str(self.target_path))
             if file_analysis:
@@ -173,8 +207,11 @@ class AutopoiesisEngine:
                         files_modified = 1
                         solutions_applied = applied
         
-        # Re-analyze
-        new_report = self.analyze()
+        # Re-measure
+        if aggregate is not None:
+            new_report = self._record_report(self.measurer.measure_system(aggregate.to_system_analysis()))
+        else:
+            new_report = self.analyze()
         
         return {
             'dimension': dimension,
@@ -286,7 +323,7 @@ Distance to Autopoiesis: {report.distance_to_autopoiesis:.3f}
         return md
     
     def save_report(self, output_path: Optional[str] = None):
-        """Save report to file."""
+        """Save report to file (and the profile summary beside it, if profiled)."""
         if output_path is None:
             output_path = self.target_path / "AUTOPOIESIS_REPORT.md"
         
@@ -294,6 +331,9 @@ Distance to Autopoiesis: {report.distance_to_autopoiesis:.3f}
             f.write(self.report())
         
         print(f"Report saved to: {output_path}")
+        
+        if self.profiler is not None:
+            print(f"Profile saved to: {self.profiler.write_json(summary_path(output_path))}")
 
 
 # Convenience function
@@ -24,6 +24,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from .analyzer import FileAnalysis, FunctionAnalysis
+from .profiling import get_profiler
 
 
 @dataclass
@@ -100,6 +101,14 @@ class Healer:
         if not solutions:
             return 0
         
+        profiler = get_profiler()
+        with profiler.stage('apply_solutions'):
+            applied = self._apply_solutions(filepath, solutions)
+        profiler.count('solutions_applied', applied)
+        return applied
+    
+    def _apply_solutions(self, filepath: str, solutions: List[NovelSolution]) -> int:
+        """Apply solutions to a file (see apply_solutions)."""
         with open(filepath, 'r', encoding='utf-8') as f:
             lines = f.readlines()
         
@@ -159,8 +168,11 @@ class Healer:
         
         # Verify syntax before writing
         new_content = ''.join(lines)
+        profiler = get_profiler()
+        profiler.count('ast_parses')
         try:
-            ast.parse(new_content)
+            with profiler.stage('ast_parse'):
+                ast.parse(new_content)
         except SyntaxError:
             # Don't write if syntax is broken
             return 0
@@ -168,6 +180,7 @@ class Healer:
         # Write back
         with open(filepath, 'w', encoding='utf-8') as f:
             f.writelines(lines)
+        profiler.count('files_written')
         
         return applied_count
     
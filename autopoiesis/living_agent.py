@@ -27,7 +27,6 @@ import sys
 import json
 import time
 import threading
-import hashlib
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
@@ -38,6 +37,8 @@ from enum import Enum
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from autopoiesis.watcher import create_watcher
+
 
 # =============================================================================
 # LJPW CORE - The Central Framework That Drives Everything
@@ -404,42 +405,27 @@ class AgentSenses:
     """
     The agent's senses - how it perceives the environment.
     Watches files for changes.
+    
+    Uses inotify where available and a stat-first polling scan otherwise,
+    so unchanged files are never re-read between heartbeats.
     """
     
     WATCHED_EXTENSIONS = {'.py', '.js', '.jsx', '.ts', '.tsx', '.html', '.css'}
     IGNORED_DIRS = {'node_modules', '__pycache__', '.git', 'venv', 'dist', 'build'}
     
-    def __init__(self, root_path: str, memory: AgentMemory):
+    def __init__(self, root_path: str, memory: AgentMemory, use_inotify: bool = True):
         self.root_path = Path(root_path)
         self.memory = memory
-        self.file_hashes: Dict[str, str] = {}
-        self._scan_files()
+        self.watcher = create_watcher(
+            str(self.root_path), self.WATCHED_EXTENSIONS, self.IGNORED_DIRS,
+            use_inotify=use_inotify
+        )
+        self.memory.watched_files = self.file_hashes
     
-    def _hash_file(self, path: Path) -> str:
-        """Get hash of file contents."""
-        try:
-            content = path.read_bytes()
-            return hashlib.md5(content).hexdigest()
-        except:
-            return ""
-    
-    def _should_watch(self, path: Path) -> bool:
-        """Check if file should be watched."""
-        if path.suffix not in self.WATCHED_EXTENSIONS:
-            return False
-        for ignored in self.IGNORED_DIRS:
-            if ignored in str(path):
-                return False
-        return True
-    
-    def _scan_files(self):
-        """Initial scan of all files."""
-        for file_path in self.root_path.rglob('*'):
-            if file_path.is_file() and self._should_watch(file_path):
-                rel_path = str(file_path.relative_to(self.root_path))
-                self.file_hashes[rel_path] = self._hash_file(file_path)
-        
-        self.memory.watched_files = self.file_hashes.copy()
+    @property
+    def file_hashes(self) -> Dict[str, str]:
+        """Content hash of every watched file, keyed by relative path."""
+        return self.watcher.file_hashes
     
     def detect_changes(self) -> Dict[str, List[str]]:
         """
@@ -448,31 +434,14 @@ class AgentSenses:
         Returns:
             Dict with 'created', 'modified', 'deleted' lists
         """
-        changes = {'created': [], 'modified': [], 'deleted': []}
-        current_files = {}
-        
-        # Scan current state
-        for file_path in self.root_path.rglob('*'):
-            if file_path.is_file() and self._should_watch(file_path):
-                rel_path = str(file_path.relative_to(self.root_path))
-                current_hash = self._hash_file(file_path)
-                current_files[rel_path] = current_hash
-                
-                if rel_path not in self.file_hashes:
-                    changes['created'].append(rel_path)
-                elif self.file_hashes[rel_path] != current_hash:
-                    changes['modified'].append(rel_path)
-        
-        # Check for deletions
-        for rel_path in self.file_hashes:
-            if rel_path not in current_files:
-                changes['deleted'].append(rel_path)
-        
-        # Update stored state
-        self.file_hashes = current_files
-        self.memory.watched_files = current_files.copy()
-        
+        changes = self.watcher.poll()
+        if any(changes.values()):
+            self.memory.watched_files = self.file_hashes
         return changes
+    
+    def close(self):
+        """Stop watching."""
+        self.watcher.close()
 
 
 # =============================================================================
@@ -600,6 +569,9 @@ class LivingAgent:
     and maintains the codebase it inhabits.
     """
     
+    # Heartbeats between full rescans (catches files the watcher ignores)
+    FULL_MEASURE_INTERVAL = 20
+    
     def __init__(self, target_path: str, 
                  heartbeat_interval: int = 60,
                  dry_run: bool = True):
@@ -638,6 +610,10 @@ class LivingAgent:
         self._engine = None
         self._learner = None
         self._syntax_healer = None
+        
+        # Per-file analyses behind the last measurement (SystemAggregate)
+        self._aggregate = None
+        self._pending_changes = {'created': [], 'modified': [], 'deleted': []}
     
     @property
     def multi_analyzer(self):
@@ -680,10 +656,24 @@ class LivingAgent:
             self._syntax_healer = SyntaxHealer(dry_run=self.dry_run)
         return self._syntax_healer
     
-    def _measure_harmony(self) -> Dict:
-        """Measure current harmony of the codebase."""
+    def _measure_harmony(self, changes: Optional[Dict[str, List[str]]] = None) -> Dict:
+        """
+        Measure current harmony of the codebase.
+        
+        Args:
+            changes: File changes since the last measurement. When given,
+                only the changed Python files are re-analyzed; otherwise
+                the whole tree is scanned.
+        """
         try:
-            report = self.system_analyzer.measure(str(self.target_path))
+            from autopoiesis.analyzer import SystemAggregate
+            
+            if changes is None or self._aggregate is None:
+                system = self.system_analyzer.analyzer.analyze_directory(str(self.target_path))
+                self._aggregate = SystemAggregate.from_system(system)
+            else:
+                self._update_aggregate(changes)
+            report = self.system_analyzer.measure_system(self._aggregate.to_system_analysis())
             ljpw = {
                 'L': report.love,
                 'J': report.justice,
@@ -707,6 +697,22 @@ class LivingAgent:
                 'total_functions': 0
             }
     
+    def _update_aggregate(self, changes: Dict[str, List[str]]):
+        """Re-analyze only changed files, updating the system aggregate in place."""
+        analyzer = self.system_analyzer.analyzer
+        for rel_path in changes['deleted']:
+            self._aggregate.remove(str(self.target_path / rel_path))
+        
+        for rel_path in changes['created'] + changes['modified']:
+            path = str(self.target_path / rel_path)
+            if not analyzer.should_analyze(path):
+                continue
+            analysis = analyzer.analyze_file(path)
+            if analysis:
+                self._aggregate.update(analysis)
+            else:
+                self._aggregate.remove(path)
+    
     def _heartbeat_loop(self):
         """The continuous heartbeat loop."""
         beat_num = self.memory.total_heartbeats
@@ -715,8 +721,18 @@ class LivingAgent:
             beat_num += 1
             self.memory.total_heartbeats = beat_num
             
-            # Measure
-            measurement = self._measure_harmony()
+            # Detect changes (including files healed since the last beat)
+            changes = self.senses.detect_changes()
+            for change_type, files in self._pending_changes.items():
+                changes[change_type] = files + [f for f in changes[change_type] if f not in files]
+            self._pending_changes = {'created': [], 'modified': [], 'deleted': []}
+            total_changes = sum(len(v) for v in changes.values())
+            
+            # Measure (incrementally, with a periodic full rescan)
+            if beat_num % self.FULL_MEASURE_INTERVAL == 0:
+                measurement = self._measure_harmony()
+            else:
+                measurement = self._measure_harmony(changes)
             harmony = measurement['harmony']
             ljpw = measurement['ljpw']
             
@@ -727,10 +743,6 @@ class LivingAgent:
             # Heartbeat output
             self.voice.heartbeat(beat_num, harmony)
             
-            # Detect changes
-            changes = self.senses.detect_changes()
-            total_changes = sum(len(v) for v in changes.values())
-            
             if total_changes > 0:
                 self.voice.observe(f"{total_changes} file change(s) detected")
                 for change_type, files in changes.items():
@@ -784,8 +796,9 @@ class LivingAgent:
                         }, harmony_before=harmony)
                         self.memory.total_heals += 1
                         
-                        # Re-measure
-                        new_measurement = self._measure_harmony()
+                        # Re-measure the files the heal touched
+                        self._pending_changes = self.senses.detect_changes()
+                        new_measurement = self._measure_harmony(self._pending_changes)
                         new_harmony = new_measurement['harmony']
                         
                         # LEARN from this experience!
@@ -22,11 +22,13 @@ from enum import Enum
 try:
     from .analyzer import CodeAnalyzer
     from .js_analyzer import JSAnalyzer, JSFileAnalysis
+    from .parallel import parallel_map
 except ImportError:
     # Running as standalone script
     sys.path.insert(0, str(Path(__file__).parent.parent))
     from autopoiesis.analyzer import CodeAnalyzer
     from autopoiesis.js_analyzer import JSAnalyzer, JSFileAnalysis
+    from autopoiesis.parallel import parallel_map
 
 
 class FileType(Enum):
@@ -125,9 +127,17 @@ class MultiLanguageAnalyzer:
     # Directories to skip
     SKIP_DIRS = {'node_modules', 'dist', 'build', '__pycache__', '.git', 'venv', 'env'}
     
-    def __init__(self):
+    def __init__(self, workers: int = 1):
+        """
+        Initialize the analyzer.
+        
+        Args:
+            workers: Processes used by analyze_directory (1 = sequential,
+                     0 or less = one per CPU core)
+        """
         self.python_analyzer = CodeAnalyzer()
         self.js_analyzer = JSAnalyzer()
+        self.workers = workers
     
     def detect_file_type(self, path: str) -> FileType:
         # Auto-healed: Input validation for detect_file_type
@@ -329,7 +339,7 @@ class MultiLanguageAnalyzer:
             print(f"  Warning: Could not analyze CSS file {path}: {e}")
             return UnifiedFileAnalysis(path=path, file_type=FileType.CSS)
     
-    def analyze_directory(self, dir_path: str) -> MultiLanguageReport:
+    def analyze_directory(self, dir_path: str, workers: Optional[int] = None) -> MultiLanguageReport:
         # Auto-healed: Input validation for analyze_directory
         if dir_path is not None and not isinstance(dir_path, str):
             raise TypeError(f'dir_path must be str, got {type(dir_path).__name__}')
@@ -338,32 +348,43 @@ class MultiLanguageAnalyzer:
         
         Args:
             dir_path: Path to directory
+            workers: Override for self.workers (1 = sequential, 0 or less = all cores)
             
         Returns:
-            MultiLanguageReport with aggregated metrics
+            MultiLanguageReport with aggregated metrics. Per-language file
+            order matches the sequential scan regardless of worker count.
         """
         path = Path(dir_path)
         report = MultiLanguageReport(path=str(path))
         
+        file_paths = []
         for file_path in path.rglob('*'):
             # Skip directories in skip list
             if any(skip in str(file_path) for skip in self.SKIP_DIRS):
                 continue
             
-            if file_path.is_file():
-                file_type = self.detect_file_type(str(file_path))
-                
-                if file_type != FileType.UNKNOWN:
-                    analysis = self.analyze_file(str(file_path))
-                    if analysis:
-                        if file_type == FileType.PYTHON:
-                            report.python_files.append(analysis)
-                        elif file_type == FileType.JAVASCRIPT:
-                            report.javascript_files.append(analysis)
-                        elif file_type == FileType.HTML:
-                            report.html_files.append(analysis)
-                        elif file_type == FileType.CSS:
-                            report.css_files.append(analysis)
+            if file_path.is_file() and self.detect_file_type(str(file_path)) != FileType.UNKNOWN:
+                file_paths.append(str(file_path))
+        
+        results = parallel_map(
+            _analyze_file_in_worker,
+            file_paths,
+            workers=self.workers if workers is None else workers,
+            initializer=_init_worker,
+            sequential_fn=self.analyze_file,
+        )
+        
+        for analysis in results:
+            if not analysis:
+                continue
+            if analysis.file_type == FileType.PYTHON:
+                report.python_files.append(analysis)
+            elif analysis.file_type == FileType.JAVASCRIPT:
+                report.javascript_files.append(analysis)
+            elif analysis.file_type == FileType.HTML:
+                report.html_files.append(analysis)
+            elif analysis.file_type == FileType.CSS:
+                report.css_files.append(analysis)
         
         # Aggregate metrics
         self._aggregate_report(report)
@@ -400,6 +421,24 @@ class MultiLanguageAnalyzer:
         report.harmony = (report.love * report.justice * report.power * report.wisdom) ** 0.25
 
 
+# =============================================================================
+# PROCESS-POOL WORKERS
+# =============================================================================
+
+_worker_analyzer: Optional[MultiLanguageAnalyzer] = None
+
+
+def _init_worker():
+    """Create the per-process analyzer."""
+    global _worker_analyzer
+    _worker_analyzer = MultiLanguageAnalyzer()
+
+
+def _analyze_file_in_worker(file_path: str) -> Optional[UnifiedFileAnalysis]:
+    """Analyze one file inside a worker process."""
+    return _worker_analyzer.analyze_file(file_path)
+
+
 # =============================================================================
 # SELF-TEST
 # =============================================================================
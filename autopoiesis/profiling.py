@@ -0,0 +1,365 @@
+"""
+Autopoiesis Pipeline Profiling
+==============================
+
+Per-stage timers and counters for the healing pipeline:
+
+    AutopoiesisEngine.breathe
+      -> BreathingOrchestrator (inhale / exhale)
+        -> CodeAnalyzer.analyze_file (read, semantic resonance, AST parse)
+        -> Healer.apply_solutions
+
+Pipeline code reports to whichever PipelineProfiler is active. When none
+is, get_profiler() returns a no-op profiler, so the instrumentation costs
+one function call per hook.
+
+A profiler records:
+- Stages: calls and wall time per named stage (stages may nest)
+- Counters: files read, bytes read, AST parses, resonance cycles,
+  cache hits / misses, solutions applied, files written
+- Optionally a cProfile capture (top functions by cumulative time)
+- Optionally a tracemalloc capture (peak memory, top allocation sites)
+
+Only work done in this process is counted: with parallel directory scans
+(workers > 1) the per-file counters cover just the in-process files, while
+the enclosing stages still time the whole scan.
+
+Usage:
+    from autopoiesis.profiling import PipelineProfiler
+
+    profiler = PipelineProfiler(cprofile=True)
+    engine = AutopoiesisEngine("./my_package", profiler=profiler)
+    engine.breathe(cycles=4)
+    engine.orchestrator.generate_report("BREATHING_REPORT.md")
+    # -> BREATHING_REPORT.md and BREATHING_REPORT.profile.json
+
+Setting AUTOPOIESIS_PROFILE profiles every engine and orchestrator created
+without an explicit profiler. Its value lists the captures to add to the
+timers: "1" (timers only), "cprofile", "tracemalloc" or "all", comma
+separated. From the command line:
+
+    python -m autopoiesis.profiling ./my_package --cycles 4 --cprofile
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Environment variable that turns on profiling (see profiler_from_env).
+PROFILE_ENV = "AUTOPOIESIS_PROFILE"
+
+# Rows kept in the cProfile and tracemalloc sections of a summary.
+DEFAULT_TOP = 25
+
+# Suffix of the JSON summary written next to a report.
+SUMMARY_SUFFIX = '.profile.json'
+
+
+class PipelineProfiler:
+    """
+    Collects stage timings, counters and optional captures for a run.
+
+    Activate it (profiler.activate() or a component built with it) so
+    pipeline code can find it through get_profiler().
+    """
+
+    def __init__(self, cprofile: bool = False, tracemalloc: bool = False,
+                 top: int = DEFAULT_TOP):
+        """
+        Initialize the profiler.
+
+        Args:
+            cprofile: Capture a cProfile profile while active
+            tracemalloc: Capture memory allocations while active
+            top: Rows kept in the cProfile / tracemalloc summaries
+        """
+        if top <= 0:
+            raise ValueError(f'top must be positive, got {top}')
+        self.cprofile = cprofile
+        self.tracemalloc = tracemalloc
+        self.top = top
+
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self.wall_seconds = 0.0
+
+        self._lock = threading.Lock()
+        self._depth = 0
+        self._started: Optional[float] = None
+        self._profile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._memory: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time the enclosed block as one call of stage name."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                timing = self.stages.setdefault(name, {'calls': 0, 'total_seconds': 0.0})
+                timing['calls'] += 1
+                timing['total_seconds'] += elapsed
+
+    def count(self, name: str, n: int = 1):
+        """Add n to counter name."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    # ------------------------------------------------------------------
+    # Activation
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def activate(self):
+        """
+        Make this the active profiler for the enclosed block.
+
+        Activations nest: captures start on the outermost one and stop
+        when it exits, and the previously active profiler is restored.
+        """
+        global _active
+        previous = _active
+        _active = self
+        if self._depth == 0:
+            self._start()
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._stop()
+            _active = previous
+
+    def _start(self):
+        self._started = time.perf_counter()
+        if self.cprofile:
+            if self._profile is None:
+                self._profile = cProfile.Profile()
+            self._profile.enable()
+        if self.tracemalloc and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def _stop(self):
+        self.wall_seconds += time.perf_counter() - self._started
+        self._started = None
+        if self._profile is not None:
+            self._profile.disable()
+        if self.tracemalloc and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().statistics('lineno')
+            self._memory = {
+                'current_bytes': current,
+                'peak_bytes': max(peak, (self._memory or {}).get('peak_bytes', 0)),
+                'top': [
+                    {'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                     'size_bytes': stat.size,
+                     'count': stat.count}
+                    for stat in statistics[:self.top]
+                ],
+            }
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+                self._started_tracemalloc = False
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def get_timing_report(self) -> List[Dict]:
+        """
+        Cost of each stage, most expensive first.
+
+        Returns:
+            List of dicts with name, calls, total_seconds, mean_ms
+        """
+        with self._lock:
+            report = [
+                {
+                    'name': name,
+                    'calls': timing['calls'],
+                    'total_seconds': timing['total_seconds'],
+                    'mean_ms': 1000.0 * timing['total_seconds'] / timing['calls'] if timing['calls'] else 0.0,
+                }
+                for name, timing in self.stages.items()
+            ]
+        return sorted(report, key=lambda r: r['total_seconds'], reverse=True)
+
+    def _cprofile_top(self) -> List[Dict]:
+        stats = pstats.Stats(self._profile)
+        rows = []
+        for (filename, lineno, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+            rows.append({
+                'function': f"{filename}:{lineno}({function})",
+                'calls': calls,
+                'total_seconds': tottime,
+                'cumulative_seconds': cumtime,
+            })
+        rows.sort(key=lambda r: r['cumulative_seconds'], reverse=True)
+        return rows[:self.top]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Everything recorded so far, as JSON-serializable data.
+
+        Returns:
+            Dict with wall_seconds, stages (see get_timing_report),
+            counters, and 'cprofile' / 'tracemalloc' sections when those
+            captures are enabled
+        """
+        with self._lock:
+            counters = dict(self.counters)
+        summary = {
+            'generated_at': datetime.now().isoformat(),
+            'wall_seconds': self.wall_seconds,
+            'stages': self.get_timing_report(),
+            'counters': counters,
+        }
+        if self.cprofile:
+            summary['cprofile'] = self._cprofile_top() if self._profile is not None else []
+        if self.tracemalloc:
+            summary['tracemalloc'] = self._memory
+        return summary
+
+    def write_json(self, path) -> Path:
+        """
+        Write summary() to path (and the raw cProfile stats to a .prof
+        file beside it, for pstats or snakeviz).
+
+        Returns:
+            Path of the JSON file
+        """
+        path = Path(path)
+        summary = self.summary()
+        if self._profile is not None:
+            prof_path = path.with_name(path.name[:-len('.json')] + '.prof'
+                                       if path.name.endswith('.json') else path.name + '.prof')
+            self._profile.dump_stats(str(prof_path))
+            summary['cprofile_stats_file'] = prof_path.name
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+        return path
+
+
+class _NullProfiler:
+    """Stand-in returned by get_profiler() when nothing is being profiled."""
+
+    _stage = contextlib.nullcontext()
+
+    def stage(self, name: str):
+        return self._stage
+
+    def count(self, name: str, n: int = 1):
+        pass
+
+    def __bool__(self):
+        return False
+
+
+NULL_PROFILER = _NullProfiler()
+
+_active: Optional[PipelineProfiler] = None
+
+
+def get_profiler():
+    """
+    Return the active PipelineProfiler, or a no-op profiler.
+
+    The no-op profiler is falsy, so callers can skip building expensive
+    counter values with `if profiler:`.
+    """
+    return _active if _active is not None else NULL_PROFILER
+
+
+def activate(profiler: Optional[PipelineProfiler]):
+    """Context manager activating profiler, or doing nothing for None."""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.activate()
+
+
+def profiler_from_env() -> Optional[PipelineProfiler]:
+    """
+    Return a PipelineProfiler configured by AUTOPOIESIS_PROFILE, if set.
+
+    Returns:
+        PipelineProfiler when the environment variable is set to anything
+        other than "", "0", "false" or "no", otherwise None
+    """
+    value = os.environ.get(PROFILE_ENV, '').strip().lower()
+    if value in ('', '0', 'false', 'no'):
+        return None
+    options = {option.strip() for option in value.split(',')}
+    unknown = options - {'1', 'true', 'yes', 'timers', 'cprofile', 'tracemalloc', 'all'}
+    if unknown:
+        raise ValueError(f"{PROFILE_ENV} has unknown options: {', '.join(sorted(unknown))}")
+    return PipelineProfiler(
+        cprofile=bool(options & {'cprofile', 'all'}),
+        tracemalloc=bool(options & {'tracemalloc', 'all'}),
+    )
+
+
+def summary_path(report_path) -> Path:
+    """Where the JSON summary for a report is written (REPORT.md -> REPORT.profile.json)."""
+    report_path = Path(report_path)
+    return report_path.with_name(report_path.stem + SUMMARY_SUFFIX)
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+def main(argv=None):
+    """Profile a breathing session from the command line."""
+    import argparse
+    from .engine import AutopoiesisEngine
+
+    parser = argparse.ArgumentParser(
+        description="Profile an autopoiesis breathing session"
+    )
+    parser.add_argument("target", help="Directory or file to breathe over")
+    parser.add_argument("--cycles", "-c", type=int, default=4,
+                        help="Breathing cycles (default: 4)")
+    parser.add_argument("--live", "-l", action="store_true",
+                        help="Apply healing (modify files). Default is dry-run.")
+    parser.add_argument("--cprofile", action="store_true", help="Capture a cProfile profile")
+    parser.add_argument("--tracemalloc", action="store_true", help="Capture memory allocations")
+    parser.add_argument("--report", "-o", default="BREATHING_REPORT.md",
+                        help="Breathing report path; the profile is written beside it "
+                             "(default: BREATHING_REPORT.md)")
+
+    args = parser.parse_args(argv)
+
+    profiler = PipelineProfiler(cprofile=args.cprofile, tracemalloc=args.tracemalloc)
+    engine = AutopoiesisEngine(args.target, dry_run=not args.live, profiler=profiler)
+    engine.breathe(cycles=args.cycles)
+    engine.orchestrator.generate_report(args.report)
+
+    print(f"\n  Report:  {args.report}")
+    print(f"  Profile: {summary_path(args.report)}")
+    for row in profiler.get_timing_report():
+        print(f"    {row['name']:<20} {row['calls']:>6} calls {row['total_seconds']:>9.3f}s")
+    return profiler
+
+
+if __name__ == "__main__":
+    # Run the package's copy of this module: the pipeline reports to its
+    # active profiler, not to this __main__ one
+    from autopoiesis.profiling import main as package_main
+    package_main()
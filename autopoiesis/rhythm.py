@@ -15,6 +15,15 @@ The breathing pattern:
 - INHALE (Freedom): Diagnose without fixing, allow system to reveal state
 - EXHALE (Structure): Apply healing, enforce constraints, fix deficits
 - Cycle through: L → J → P → W → L → ...
+
+A session scans the target once and keeps the result as a live
+SystemAnalysis: each exhale re-analyzes only the files the healer wrote,
+so breaths after the first cost as much as the healing they do. Edits
+made to the target by anything else during a session are not seen.
+
+With a PipelineProfiler (or AUTOPOIESIS_PROFILE set), each session records
+per-stage timings and counters, written as JSON next to the report (see
+profiling.py).
 """
 
 from typing import Dict, List, Optional, Any
@@ -23,7 +32,9 @@ from datetime import datetime
 from pathlib import Path
 
 from .analyzer import CodeAnalyzer, FileAnalysis, SystemAnalysis
+from .cache import AnalysisCache
 from .healer import Healer, NovelSolution
+from .profiling import PipelineProfiler, activate, get_profiler, profiler_from_env, summary_path
 
 
 @dataclass
@@ -50,6 +61,7 @@ class BreathingSession:
     breaths: List[BreathState]
     initial_harmony: float
     final_harmony: float
+    profile: Optional[Dict[str, Any]] = None  # PipelineProfiler.summary(), when profiled
     
     @property
     def harmony_improvement(self) -> float:
@@ -86,7 +98,9 @@ class BreathingOrchestrator:
         'W': 'Wisdom (Observability)'
     }
     
-    def __init__(self, target_path: str, dry_run: bool = False):
+    def __init__(self, target_path: str, dry_run: bool = False,
+                 cache: Optional[AnalysisCache] = None,
+                 profiler: Optional[PipelineProfiler] = None):
         # Auto-healed: Input validation for __init__
         if target_path is not None and not isinstance(target_path, str):
             raise TypeError(f'target_path must be str, got {type(target_path).__name__}')
@@ -96,13 +110,18 @@ class BreathingOrchestrator:
         Args:
             target_path: Directory or file to heal
             dry_run: If True, don't apply modifications (diagnose only)
+            cache: Persistent analysis cache (unchanged files are not re-analyzed)
+            profiler: Stage timer / counter collector for breathe(). Defaults
+                      to one configured by AUTOPOIESIS_PROFILE, or none.
         """
         self.target_path = target_path
         self.dry_run = dry_run
-        self.analyzer = CodeAnalyzer()
+        self.analyzer = CodeAnalyzer(cache=cache)
         self.healer = Healer()
+        self.profiler = profiler if profiler is not None else profiler_from_env()
         self.session: Optional[BreathingSession] = None
         self.breaths: List[BreathState] = []
+        self.system: Optional[SystemAnalysis] = None  # Live analysis of the target during a session
     
     def breathe(self, cycles: int = 8) -> BreathingSession:
         # Auto-healed: Input validation for breathe
@@ -118,8 +137,21 @@ class BreathingOrchestrator:
             cycles: Number of complete breath cycles
             
         Returns:
-            BreathingSession with all results
+            BreathingSession with all results (and its profile, if profiled)
         """
+        with activate(self.profiler):
+            self._breathe(cycles)
+        if self.profiler is not None:
+            self.session.profile = self.profiler.summary()
+        
+        # Print summary
+        self._print_session_summary()
+        
+        return self.session
+    
+    def _breathe(self, cycles: int):
+        """Run the session's scans and breaths (see breathe)."""
+        profiler = get_profiler()
         self.session = BreathingSession(
             start_time=datetime.now(),
             end_time=None,
@@ -130,13 +162,10 @@ class BreathingOrchestrator:
             final_harmony=0.0
         )
         
-        # Initial system analysis
-        if Path(self.target_path).is_dir():
-            system = self.analyzer.analyze_directory(self.target_path)
-            self.session.initial_harmony = system.system_harmony
-        else:
-            file_analysis = self.analyzer.analyze_file(self.target_path)
-            self.session.initial_harmony = file_analysis.harmony if file_analysis else 0.0
+        # Initial system analysis (the only full scan of the session)
+        with profiler.stage('initial_scan'):
+            self._scan()
+        self.session.initial_harmony = self._harmony()
         
         print(f"\n{'='*70}")
         print(f"  BREATHING AUTOPOIESIS SESSION")
@@ -156,31 +185,61 @@ class BreathingOrchestrator:
             print(f"  {'-'*60}")
             
             # INHALE: Diagnose
-            inhale_state = self._inhale(cycle, dimension, pressure)
+            with profiler.stage('inhale'):
+                inhale_state = self._inhale(cycle, dimension, pressure)
             self.breaths.append(inhale_state)
             self.session.breaths.append(inhale_state)
             
             # EXHALE: Heal
-            exhale_state = self._exhale(cycle, dimension, pressure)
+            with profiler.stage('exhale'):
+                exhale_state = self._exhale(cycle, dimension, pressure)
             self.breaths.append(exhale_state)
             self.session.breaths.append(exhale_state)
             
             self.session.cycles_completed = cycle
+            profiler.count('breaths', 2)
         
         # Final system analysis
+        self.session.final_harmony = self._harmony()
+        
+        self.session.end_time = datetime.now()
+    
+    def _scan(self):
+        """Analyze the whole target into self.system."""
         if Path(self.target_path).is_dir():
-            system = self.analyzer.analyze_directory(self.target_path)
-            self.session.final_harmony = system.system_harmony
+            self.system = self.analyzer.analyze_directory(self.target_path)
         else:
             file_analysis = self.analyzer.analyze_file(self.target_path)
-            self.session.final_harmony = file_analysis.harmony if file_analysis else 0.0
-        
-        self.session.end_time = datetime.now()
-        
-        # Print summary
-        self._print_session_summary()
+            self.system = SystemAnalysis(path=self.target_path,
+                                         files=[file_analysis] if file_analysis else [])
+            self.system.calculate_system_metrics()
+    
+    def _reanalyze(self, paths: List[str]):
+        """
+        Re-analyze files the healer wrote and re-aggregate self.system.
         
-        return self.session
+        Files keep their scan order and metrics are recomputed with
+        calculate_system_metrics, so the harmony is exactly what a fresh
+        analyze_directory of the target would report.
+        """
+        if not paths:
+            return
+        changed = set(paths)
+        files = []
+        for file_analysis in self.system.files:
+            if file_analysis.path in changed:
+                file_analysis = self.analyzer.analyze_file(file_analysis.path)
+            if file_analysis:
+                files.append(file_analysis)
+        self.system = SystemAnalysis(path=self.system.path, files=files)
+        self.system.calculate_system_metrics()
+        get_profiler().count('files_reanalyzed', len(changed))
+    
+    def _harmony(self) -> float:
+        """Harmony of the whole target (system harmony for a directory)."""
+        if Path(self.target_path).is_dir():
+            return self.system.system_harmony
+        return self.system.files[0].harmony if self.system.files else 0.0
     
     def _inhale(self, cycle: int, dimension: str, pressure: float) -> BreathState:
         """
@@ -189,14 +248,12 @@ class BreathingOrchestrator:
         """
         print(f"    ^ INHALE (diagnose {dimension})...")
         
-        # Analyze current state
+        # Current state (kept up to date by _exhale)
+        harmony = self._harmony()
         if Path(self.target_path).is_dir():
-            system = self.analyzer.analyze_directory(self.target_path)
-            harmony = system.system_harmony
-            
             # Count files needing this dimension
             files_needing = []
-            for f in system.files:
+            for f in self.system.files:
                 if dimension == 'L' and f.needs_love:
                     files_needing.append(f.path)
                 elif dimension == 'J' and f.needs_justice:
@@ -208,8 +265,7 @@ class BreathingOrchestrator:
             
             action = f"Found {len(files_needing)} files needing {dimension}"
         else:
-            file_analysis = self.analyzer.analyze_file(self.target_path)
-            harmony = file_analysis.harmony if file_analysis else 0.0
+            file_analysis = self.system.files[0] if self.system.files else None
             action = f"Analyzed single file, deficit={file_analysis.deficit if file_analysis else 'N/A'}"
         
         print(f"       {action}")
@@ -246,15 +302,12 @@ class BreathingOrchestrator:
             )
         
         solutions_applied = []
-        files_modified = 0
-        harmony_before = 0.0
+        modified_paths = []
+        harmony_before = self._harmony()
         
         if Path(self.target_path).is_dir():
-            system = self.analyzer.analyze_directory(self.target_path)
-            harmony_before = system.system_harmony
-            
             # Apply healing to files needing this dimension
-            for file_analysis in system.files:
+            for file_analysis in self.system.files:
                 needs_healing = (
                     (dimension == 'L' and file_analysis.needs_love) or
                     (dimension == 'J' and file_analysis.needs_justice) or
@@ -267,28 +320,27 @@ class BreathingOrchestrator:
                     if solutions:
                         applied = self.healer.apply_solutions(file_analysis.path, solutions)
                         if applied > 0:
-                            files_modified += 1
+                            modified_paths.append(file_analysis.path)
                             solutions_applied.extend([s for s in solutions if s.applied])
             
-            # Re-analyze
-            system = self.analyzer.analyze_directory(self.target_path)
-            harmony_after = system.system_harmony
+            # Re-analyze the healed files only
+            self._reanalyze(modified_paths)
+            harmony_after = self._harmony()
+        elif self.system.files:
+            file_analysis = self.system.files[0]
+            solutions = self.healer.heal_file(file_analysis, dimension)
+            if solutions:
+                applied = self.healer.apply_solutions(file_analysis.path, solutions)
+                if applied > 0:
+                    modified_paths.append(file_analysis.path)
+                    solutions_applied.extend([s for s in solutions if s.applied])
+            
+            self._reanalyze(modified_paths)
+            harmony_after = self._harmony() if self.system.files else harmony_before
         else:
-            file_analysis = self.analyzer.analyze_file(self.target_path)
-            if file_analysis:
-                harmony_before = file_analysis.harmony
-                solutions = self.healer.heal_file(file_analysis, dimension)
-                if solutions:
-                    applied = self.healer.apply_solutions(file_analysis.path, solutions)
-                    if applied > 0:
-                        files_modified = 1
-                        solutions_applied.extend([s for s in solutions if s.applied])
-                
-                file_analysis = self.analyzer.analyze_file(self.target_path)
-                harmony_after = file_analysis.harmony if file_analysis else harmony_before
-            else:
-                harmony_after = harmony_before
+            harmony_after = harmony_before
         
+        files_modified = len(modified_paths)
         action = f"Applied {len(solutions_applied)} solutions to {files_modified} files"
         print(f"       {action}")
         
@@ -332,7 +384,13 @@ class BreathingOrchestrator:
             print(f"\n  [!] System harmony decreased - review changes")
     
     def generate_report(self, output_path: Optional[str] = None) -> str:
-        """Generate markdown report of breathing session."""
+        """
+        Generate markdown report of breathing session.
+        
+        When the session was profiled and output_path is given, the
+        profile summary is written beside it (REPORT.md ->
+        REPORT.profile.json).
+        """
         if not self.session:
             return "No breathing session to report."
         
@@ -374,5 +432,7 @@ class BreathingOrchestrator:
         if output_path:
             with open(output_path, 'w') as f:
                 f.write(report)
+            if self.profiler is not None:
+                self.profiler.write_json(summary_path(output_path))
         
         return report
@@ -23,6 +23,7 @@ from pathlib import Path
 from enum import Enum
 
 from .analyzer import CodeAnalyzer, SystemAnalysis
+from .cache import AnalysisCache
 
 
 class SystemPhase(Enum):
@@ -83,8 +84,15 @@ class SystemHarmonyMeasurer:
     LOVE_THRESHOLD = 0.7
     HARMONY_THRESHOLD = 0.6
     
-    def __init__(self):
-        self.analyzer = CodeAnalyzer()
+    def __init__(self, cache: Optional[AnalysisCache] = None, workers: int = 1):
+        """
+        Initialize the measurer.
+        
+        Args:
+            cache: Persistent analysis cache shared with the underlying CodeAnalyzer
+            workers: Processes used for directory scans (0 or less = all cores)
+        """
+        self.analyzer = CodeAnalyzer(cache=cache, workers=workers)
     
     def measure(self, path: str) -> SystemHealthReport:
         # Auto-healed: Input validation for measure
@@ -112,6 +120,15 @@ class SystemHarmonyMeasurer:
         system = self.analyzer.analyze_directory(str(path))
         return self._system_report(system)
     
+    def measure_system(self, system: SystemAnalysis) -> SystemHealthReport:
+        """
+        Report on an already-built SystemAnalysis.
+        
+        Lets callers that track file analyses themselves (e.g. the Living
+        Agent re-analyzing only changed files) skip the directory scan.
+        """
+        return self._system_report(system)
+    
     def _single_file_report(self, analysis) -> SystemHealthReport:
         """Generate report for single file."""
         ljpw = analysis.ljpw
@@ -0,0 +1,16 @@
+"""
+Performance Benchmarks
+======================
+
+Timed runs of the analyzers, the resonance engine and neural network
+training on seeded synthetic inputs, with JSON results and comparison
+against a saved baseline.
+
+Modules:
+- corpus: Synthetic Python / JavaScript / HTML / CSS source trees
+- suite: Benchmark definitions, runner and baseline comparison
+
+Run from the repository root:
+    python run_benchmarks.py                  # run and compare to baseline
+    python run_benchmarks.py --save-baseline  # record a new baseline
+"""
@@ -0,0 +1,250 @@
+"""
+Synthetic Benchmark Corpora
+===========================
+
+Seeded generators for source trees of a chosen size. The same seed and
+size always produce byte-identical files, so timings taken on different
+commits measure the code, not the corpus.
+
+Files vary the features the analyzers score - docstrings, validation,
+error handling, loops, logging, classes, type hints - so every LJPW
+dimension and both the healthy and deficit paths are exercised.
+
+Usage:
+    from benchmarks.corpus import write_python_tree, write_web_tree
+
+    write_python_tree("/tmp/corpus", n_files=60, seed=0)
+    write_web_tree("/tmp/web", n_files=20, seed=0)  # 20 each of .py/.js/.html/.css
+"""
+
+import random
+from pathlib import Path
+from typing import Dict, List
+
+# Files per sub-package before a new one is started
+FILES_PER_PACKAGE = 12
+
+_NOUNS = ['order', 'invoice', 'sensor', 'reading', 'account', 'route', 'ticket',
+          'record', 'session', 'payment', 'metric', 'event', 'user', 'batch']
+_VERBS = ['load', 'parse', 'validate', 'compute', 'merge', 'render', 'score',
+          'filter', 'resolve', 'update', 'summarize', 'export']
+
+
+def _name(rng: random.Random) -> str:
+    return f"{rng.choice(_VERBS)}_{rng.choice(_NOUNS)}"
+
+
+def _python_function(rng: random.Random, name: str) -> str:
+    typed = rng.random() < 0.5
+    params = rng.sample(['items', 'limit', 'factor', 'key', 'threshold'], rng.randint(1, 3))
+    signature = ', '.join(f"{p}: float" if typed else p for p in params)
+    lines = [f"def {name}({signature}){' -> float' if typed else ''}:"]
+    if rng.random() < 0.6:
+        lines.append(f'    """{name.replace("_", " ").capitalize()} from {", ".join(params)}."""')
+    if rng.random() < 0.4:
+        lines.append(f"    if {params[0]} is None:")
+        lines.append(f"        raise ValueError('{params[0]} is required')")
+    if rng.random() < 0.3:
+        lines.append(f"    logger.debug('{name} called')")
+    lines.append("    total = 0")
+    body = ["    for i in range(10):", f"        total += i * {rng.randint(2, 9)}"]
+    if rng.random() < 0.4:
+        lines.append("    try:")
+        lines.extend("    " + line for line in body)
+        lines.append("    except (TypeError, ValueError):")
+        lines.append("        total = -1")
+    else:
+        lines.extend(body)
+    if rng.random() < 0.3:
+        lines.append("    # Scale by the first parameter when it is numeric")
+        lines.append(f"    if isinstance({params[0]}, (int, float)):")
+        lines.append(f"        total *= {params[0]}")
+    lines.append("    return total")
+    return '\n'.join(lines)
+
+
+def _python_class(rng: random.Random, index: int, dataclasses: bool) -> str:
+    noun = rng.choice(_NOUNS).capitalize()
+    lines = []
+    if dataclasses and rng.random() < 0.3:
+        lines.append("@dataclass")
+    lines.append(f"class {noun}Handler{index}:")
+    if rng.random() < 0.6:
+        lines.append(f'    """Handles {noun.lower()} records."""')
+    lines.append("")
+    lines.append("    def __init__(self, size=10):")
+    lines.append("        self.size = size")
+    lines.append("        self.items = []")
+    for method in rng.sample(_VERBS, rng.randint(1, 3)):
+        lines.append("")
+        lines.append(f"    def {method}(self, value):")
+        if rng.random() < 0.5:
+            lines.append(f'        """{method.capitalize()} one value."""')
+        lines.append("        self.items.append(value)")
+        lines.append("        return len(self.items) % self.size")
+    return '\n'.join(lines)
+
+
+def python_module(rng: random.Random) -> str:
+    """Source of one synthetic Python module."""
+    parts = []
+    if rng.random() < 0.7:
+        parts.append(f'"""{rng.choice(_NOUNS).capitalize()} processing helpers."""')
+    imports = ['import os', 'import math']
+    if rng.random() < 0.5:
+        imports.append('import logging')
+    if rng.random() < 0.3:
+        imports.append('from dataclasses import dataclass')
+    if rng.random() < 0.4:
+        imports.append('from typing import Dict, List, Optional')
+    parts.append('\n'.join(imports))
+    if 'import logging' in imports:
+        parts.append("logger = logging.getLogger(__name__)")
+    else:
+        parts.append("logger = None  # logging not configured")
+
+    names = set()
+    for _ in range(rng.randint(3, 9)):
+        name = _name(rng)
+        while name in names:
+            name = f"{name}_{len(names)}"
+        names.add(name)
+        parts.append(_python_function(rng, name))
+    for index in range(rng.randint(0, 2)):
+        parts.append(_python_class(rng, index, 'from dataclasses import dataclass' in imports))
+    return '\n\n\n'.join(parts) + '\n'
+
+
+def javascript_module(rng: random.Random) -> str:
+    """Source of one synthetic JavaScript module."""
+    lines = []
+    if rng.random() < 0.6:
+        lines.append(f"/**\n * {rng.choice(_NOUNS).capitalize()} utilities.\n */")
+    lines.append("'use strict';")
+    for _ in range(rng.randint(3, 8)):
+        name = ''.join(part.capitalize() if i else part for i, part in enumerate(_name(rng).split('_')))
+        if rng.random() < 0.5:
+            lines.append(f"/**\n * {name}\n * @param {{number}} value\n */")
+        arrow = rng.random() < 0.5
+        if arrow:
+            lines.append(f"const {name} = (value, limit) => {{")
+        else:
+            lines.append(f"function {name}(value, limit) {{")
+        if rng.random() < 0.4:
+            lines.append("  if (typeof value !== 'number') {")
+            lines.append("    throw new TypeError('value must be a number');")
+            lines.append("  }")
+        if rng.random() < 0.3:
+            lines.append(f"  console.log('{name}', value);")
+        lines.append("  let total = 0;")
+        if rng.random() < 0.4:
+            lines.append("  try {")
+            lines.append("    for (let i = 0; i < limit; i++) { total += value * i; }")
+            lines.append("  } catch (err) {")
+            lines.append("    console.error(err);")
+            lines.append("  }")
+        else:
+            lines.append("  for (let i = 0; i < limit; i++) { total += value * i; }")
+        lines.append("  return total;")
+        lines.append("};" if arrow else "}")
+    if rng.random() < 0.5:
+        lines.append(f"class {rng.choice(_NOUNS).capitalize()}Store {{")
+        lines.append("  constructor() { this.items = []; }")
+        lines.append("  add(item) { this.items.push(item); return this.items.length; }")
+        lines.append("}")
+    lines.append("module.exports = {};")
+    return '\n'.join(lines) + '\n'
+
+
+def html_page(rng: random.Random, title: str) -> str:
+    """Source of one synthetic HTML page."""
+    items = '\n'.join(f"      <li><a href=\"#{noun}\">{noun.capitalize()}</a></li>"
+                      for noun in rng.sample(_NOUNS, rng.randint(2, 6)))
+    lang = ' lang="en"' if rng.random() < 0.7 else ''
+    meta = '    <meta name="viewport" content="width=device-width, initial-scale=1">\n' if rng.random() < 0.6 else ''
+    alt = ' alt="Logo"' if rng.random() < 0.5 else ''
+    form = ''
+    if rng.random() < 0.5:
+        form = ('    <form>\n      <label for="q">Search</label>\n'
+                '      <input id="q" name="q" required>\n    </form>\n')
+    return (f"<!DOCTYPE html>\n<html{lang}>\n  <head>\n    <meta charset=\"utf-8\">\n{meta}"
+            f"    <title>{title}</title>\n    <link rel=\"stylesheet\" href=\"style.css\">\n  </head>\n"
+            f"  <body>\n    <header><img src=\"logo.png\"{alt}></header>\n    <nav>\n    <ul>\n{items}\n    </ul>\n"
+            f"    </nav>\n    <main>\n      <h1>{title}</h1>\n      <p>Generated page.</p>\n{form}    </main>\n"
+            f"    <script src=\"app.js\"></script>\n  </body>\n</html>\n")
+
+
+def css_sheet(rng: random.Random) -> str:
+    """Source of one synthetic stylesheet."""
+    lines = []
+    if rng.random() < 0.5:
+        lines.append(":root {\n  --primary: #336699;\n  --spacing: 8px;\n}")
+    for noun in rng.sample(_NOUNS, rng.randint(3, 8)):
+        color = 'var(--primary)' if rng.random() < 0.5 else f"#{rng.randint(0, 0xFFFFFF):06x}"
+        lines.append(f".{noun} {{\n  color: {color};\n  margin: {rng.randint(0, 24)}px;\n"
+                     f"  display: {rng.choice(['flex', 'block', 'grid'])};\n}}")
+    if rng.random() < 0.5:
+        lines.append("@media (max-width: 600px) {\n  .order { display: block; }\n}")
+    return '\n\n'.join(lines) + '\n'
+
+
+def _package_dir(root: Path, index: int) -> Path:
+    directory = root / f"pkg_{index // FILES_PER_PACKAGE:03d}"
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def write_python_tree(root, n_files: int, seed: int = 0) -> List[str]:
+    """
+    Write n_files synthetic Python modules under root.
+
+    Args:
+        root: Directory to create (sub-packages of FILES_PER_PACKAGE files)
+        n_files: Number of modules
+        seed: Corpus seed
+
+    Returns:
+        Paths written, in generation order
+    """
+    if n_files < 0:
+        raise ValueError(f'n_files must be >= 0, got {n_files}')
+    rng = random.Random(seed)
+    root = Path(root)
+    paths = []
+    for i in range(n_files):
+        path = _package_dir(root, i) / f"module_{i:04d}.py"
+        path.write_text(python_module(rng), encoding='utf-8')
+        paths.append(str(path))
+    return paths
+
+
+def write_web_tree(root, n_files: int, seed: int = 0) -> Dict[str, List[str]]:
+    """
+    Write n_files each of Python, JavaScript, HTML and CSS files under root.
+
+    Args:
+        root: Directory to create
+        n_files: Files per language
+        seed: Corpus seed
+
+    Returns:
+        Dict mapping extension ('py', 'js', 'html', 'css') to paths written
+    """
+    if n_files < 0:
+        raise ValueError(f'n_files must be >= 0, got {n_files}')
+    rng = random.Random(seed)
+    root = Path(root)
+    written = {'py': [], 'js': [], 'html': [], 'css': []}
+    for i in range(n_files):
+        directory = _package_dir(root, i)
+        sources = {
+            'py': python_module(rng),
+            'js': javascript_module(rng),
+            'html': html_page(rng, f"Page {i}"),
+            'css': css_sheet(rng),
+        }
+        for extension, source in sources.items():
+            path = directory / f"file_{i:04d}.{extension}"
+            path.write_text(source, encoding='utf-8')
+            written[extension].append(str(path))
+    return written
@@ -0,0 +1,456 @@
+"""
+Benchmark Suite
+===============
+
+Times the hot paths of the repository on seeded synthetic inputs:
+
+    code_analyzer          CodeAnalyzer.analyze_directory (Python tree)
+    multi_language         MultiLanguageAnalyzer.analyze_directory (py/js/html/css tree)
+    resonance_trajectory   ResonanceEngine.analyze_trajectory (batch of start points)
+    vocabulary_nearest     LJPWVocabulary.nearest_word (queries against a built index)
+    vocabulary_nearest_batch  LJPWVocabulary.nearest_indices (the same queries, one call)
+    sentence_generation    SemanticTrajectory.generate_sentences (batch of meanings)
+    vocabulary_load        LJPWVocabulary.load + build_index from a compact store
+    language_understand    PureLJPWLanguageModel.understand (batch of sentences)
+    natural_mnist_fit      NaturalMNIST.fit (one epoch of synthetic MNIST)
+    homeostatic_evolution  HomeostaticNetwork lifetime iterations (run_lifetime)
+
+Each benchmark builds its inputs once (untimed), runs one warm-up, then
+times `repeats` runs, with stdout silenced throughout. Input sizes scale
+linearly with `scale`, so a quick smoke run (scale=0.1) and a nightly run
+(scale=1) use the same code.
+
+Results are JSON:
+
+    {
+      "meta": {"scale", "seed", "repeats", "python", "numpy", "platform", ...},
+      "benchmarks": {
+        "<name>": {"min_seconds", "median_seconds", "mean_seconds",
+                   "times", "params"}
+      }
+    }
+
+compare() checks results against a baseline file from an earlier run:
+a benchmark regresses when its time (min by default - the least noisy
+statistic) exceeds the baseline's by more than the threshold. Baselines
+are only comparable at the same scale and seed.
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.corpus import write_python_tree, write_web_tree
+
+# Regression threshold: fractional slowdown over the baseline that fails
+DEFAULT_THRESHOLD = 0.20
+
+DEFAULT_REPEATS = 5
+
+# Statistics a comparison may use
+METRICS = ('min_seconds', 'median_seconds', 'mean_seconds')
+
+
+@dataclass
+class BenchmarkContext:
+    """
+    Inputs shared by benchmark setups.
+
+    Attributes:
+        scale: Input size multiplier (1.0 = nightly size)
+        seed: Seed for corpora, weights and data
+        workdir: Scratch directory, removed after the run
+    """
+    scale: float
+    seed: int
+    workdir: Path
+
+    def size(self, base: int, minimum: int = 1) -> int:
+        """base scaled by self.scale, at least minimum."""
+        return max(minimum, int(round(base * self.scale)))
+
+
+@dataclass
+class Benchmark:
+    """
+    One timed operation.
+
+    Attributes:
+        name: Result key
+        description: What is timed
+        setup: Builds inputs from a BenchmarkContext and returns
+               (run, params): the zero-argument callable to time and the
+               input sizes to record
+    """
+    name: str
+    description: str
+    setup: Callable[[BenchmarkContext], tuple]
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def _setup_code_analyzer(ctx: BenchmarkContext):
+    from autopoiesis.analyzer import CodeAnalyzer
+
+    n_files = ctx.size(60)
+    root = ctx.workdir / 'python_corpus'
+    write_python_tree(root, n_files, seed=ctx.seed)
+    analyzer = CodeAnalyzer(workers=1)
+    analyzer.cache = None  # Time analysis, not cache lookups
+    return (lambda: analyzer.analyze_directory(str(root))), {'files': n_files}
+
+
+def _setup_multi_language(ctx: BenchmarkContext):
+    from autopoiesis.multi_analyzer import MultiLanguageAnalyzer
+
+    n_files = ctx.size(15)
+    root = ctx.workdir / 'web_corpus'
+    write_web_tree(root, n_files, seed=ctx.seed)
+    analyzer = MultiLanguageAnalyzer(workers=1)
+    analyzer.python_analyzer.cache = None
+    return (lambda: analyzer.analyze_directory(str(root))), {'files': 4 * n_files}
+
+
+def _setup_resonance_trajectory(ctx: BenchmarkContext):
+    from bicameral.left.resonance_engine import ResonanceEngine
+
+    n_starts = ctx.size(100)
+    rng = np.random.RandomState(ctx.seed)
+    starts = rng.uniform(0.1, 0.9, size=(n_starts, 4)).tolist()
+    engine = ResonanceEngine()
+
+    def run():
+        for start in starts:
+            engine.analyze_trajectory(start, cycles=100)
+
+    return run, {'trajectories': n_starts, 'cycles': 100}
+
+
+def _random_vocabulary(ctx: BenchmarkContext, rng):
+    from bicameral.right.vocabulary import LJPWVocabulary
+
+    n_words = ctx.size(20000)
+    vocabulary = LJPWVocabulary(vocab_size=n_words)
+    for i, coords in enumerate(rng.uniform(0, 1, size=(n_words, 4))):
+        vocabulary.register(f"word{i}", coords)
+    vocabulary.build_index()
+    return vocabulary
+
+
+def _setup_vocabulary_nearest(ctx: BenchmarkContext):
+    rng = np.random.RandomState(ctx.seed)
+    vocabulary = _random_vocabulary(ctx, rng)
+    n_queries = ctx.size(5000)
+    queries = rng.uniform(0, 1, size=(n_queries, 4))
+
+    def run():
+        for coords in queries:
+            vocabulary.nearest_word(coords, k=5)
+
+    return run, {'words': len(vocabulary), 'queries': n_queries, 'k': 5}
+
+
+def _setup_vocabulary_nearest_batch(ctx: BenchmarkContext):
+    rng = np.random.RandomState(ctx.seed)
+    vocabulary = _random_vocabulary(ctx, rng)
+    n_queries = ctx.size(5000)
+    queries = rng.uniform(0, 1, size=(n_queries, 4))
+
+    def run():
+        vocabulary.nearest_indices(queries, k=5)
+
+    return run, {'words': len(vocabulary), 'queries': n_queries, 'k': 5}
+
+
+def _setup_sentence_generation(ctx: BenchmarkContext):
+    from bicameral.right.geometric_ops import SemanticOperations
+    from bicameral.right.trajectories import SemanticTrajectory
+
+    rng = np.random.RandomState(ctx.seed)
+    trajectory = SemanticTrajectory(_random_vocabulary(ctx, rng), SemanticOperations())
+    n_sentences = ctx.size(1000)
+    meanings = rng.uniform(0, 1, size=(n_sentences, 4))
+
+    def run():
+        np.random.seed(ctx.seed)
+        trajectory.generate_sentences(meanings, temperature=0.3)
+
+    return run, {'words': len(trajectory.vocab), 'sentences': n_sentences}
+
+
+def _setup_vocabulary_load(ctx: BenchmarkContext):
+    from bicameral.right.vocabulary import LJPWVocabulary
+
+    rng = np.random.RandomState(ctx.seed)
+    path = str(ctx.workdir / 'vocabulary_store')
+    _random_vocabulary(ctx, rng).save_compact(path)
+    query = rng.uniform(0, 1, size=4)
+
+    def run():
+        vocabulary = LJPWVocabulary()
+        vocabulary.load(path)
+        vocabulary.build_index()
+        vocabulary.nearest_word(query)
+
+    return run, {'words': ctx.size(20000)}
+
+
+def _setup_language_understand(ctx: BenchmarkContext):
+    from bicameral.right.language_model import PureLJPWLanguageModel
+
+    rng = np.random.RandomState(ctx.seed)
+    vocabulary = _random_vocabulary(ctx, rng)
+    model = PureLJPWLanguageModel(vocab=vocabulary)
+    n_sentences = ctx.size(1000)
+    # Zipf-like word choice, so frequent words repeat as in real text
+    ranks = np.minimum(rng.zipf(1.3, size=(n_sentences, 12)), len(vocabulary)) - 1
+    sentences = [" ".join(f"word{rank}" for rank in row[:rng.randint(3, 13)]) for row in ranks]
+
+    def run():
+        for sentence in sentences:
+            model.understand(sentence)
+
+    return run, {'words': len(vocabulary), 'sentences': n_sentences}
+
+
+def _setup_natural_mnist_fit(ctx: BenchmarkContext):
+    from bicameral.right.mnist_loader import generate_enhanced_synthetic_mnist
+    from bicameral.right.models import NaturalMNIST
+
+    n_train = ctx.size(5000, minimum=32)
+    X_train, y_train, _, _ = generate_enhanced_synthetic_mnist(n_train=n_train, n_test=1, seed=ctx.seed)
+
+    def run():
+        np.random.seed(ctx.seed)
+        model = NaturalMNIST(verbose=False)
+        model.fit(X_train, y_train, epochs=1, batch_size=32, verbose=False)
+
+    return run, {'samples': n_train, 'epochs': 1, 'batch_size': 32}
+
+
+def _setup_homeostatic_evolution(ctx: BenchmarkContext):
+    from bicameral.right.lifetime_evolution import LifetimeConfig, run_lifetime
+
+    iterations = ctx.size(300)
+    runs = ctx.workdir / 'lifetimes'
+    counter = iter(range(sys.maxsize))
+
+    def run():
+        # A fresh run directory each time (run_lifetime resumes existing runs)
+        config = LifetimeConfig(name=f"bench_{next(counter)}", seed=ctx.seed, iterations=iterations,
+                                checkpoint_every=iterations, report_every=iterations)
+        run_lifetime(config, runs, verbose=False)
+
+    return run, {'iterations': iterations}
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark('code_analyzer', 'CodeAnalyzer.analyze_directory on a Python tree',
+              _setup_code_analyzer),
+    Benchmark('multi_language', 'MultiLanguageAnalyzer.analyze_directory on a py/js/html/css tree',
+              _setup_multi_language),
+    Benchmark('resonance_trajectory', 'ResonanceEngine.analyze_trajectory, 100 cycles per start',
+              _setup_resonance_trajectory),
+    Benchmark('vocabulary_nearest', 'LJPWVocabulary.nearest_word (k=5) against a built index',
+              _setup_vocabulary_nearest),
+    Benchmark('vocabulary_nearest_batch', 'LJPWVocabulary.nearest_indices (k=5), all queries in one call',
+              _setup_vocabulary_nearest_batch),
+    Benchmark('sentence_generation', 'SemanticTrajectory.generate_sentences at temperature 0.3',
+              _setup_sentence_generation),
+    Benchmark('vocabulary_load', 'Load a compact vocabulary store and answer one query',
+              _setup_vocabulary_load),
+    Benchmark('language_understand', 'PureLJPWLanguageModel.understand on short sentences',
+              _setup_language_understand),
+    Benchmark('natural_mnist_fit', 'NaturalMNIST.fit, one epoch of synthetic MNIST',
+              _setup_natural_mnist_fit),
+    Benchmark('homeostatic_evolution', 'HomeostaticNetwork lifetime iterations (run_lifetime)',
+              _setup_homeostatic_evolution),
+]
+
+
+def get_benchmark(name: str) -> Benchmark:
+    """Look up a benchmark by name (raises KeyError listing the known names)."""
+    for benchmark in BENCHMARKS:
+        if benchmark.name == name:
+            return benchmark
+    raise KeyError(f"Unknown benchmark {name!r}; known: {', '.join(b.name for b in BENCHMARKS)}")
+
+
+# ============================================================================
+# RUNNING
+# ============================================================================
+
+def time_benchmark(benchmark: Benchmark, ctx: BenchmarkContext,
+                   repeats: int = DEFAULT_REPEATS, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Set up and time one benchmark.
+
+    Returns:
+        Result dict with min/median/mean seconds, every time and the params
+    """
+    times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        run, params = benchmark.setup(ctx)
+        for _ in range(warmup):
+            run()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+    return {
+        'description': benchmark.description,
+        'min_seconds': min(times),
+        'median_seconds': statistics.median(times),
+        'mean_seconds': statistics.fmean(times),
+        'times': times,
+        'params': params,
+    }
+
+
+def run_benchmarks(names: Optional[Sequence[str]] = None, scale: float = 1.0, seed: int = 0,
+                   repeats: int = DEFAULT_REPEATS, warmup: int = 1,
+                   verbose: bool = True) -> Dict[str, Any]:
+    """
+    Run benchmarks and collect their results.
+
+    Args:
+        names: Benchmarks to run (default: all)
+        scale: Input size multiplier
+        seed: Seed for every generated input
+        repeats: Timed runs per benchmark
+        warmup: Untimed runs before timing
+        verbose: Print one line per benchmark
+
+    Returns:
+        Results dict (see module docstring)
+    """
+    if scale <= 0:
+        raise ValueError(f'scale must be positive, got {scale}')
+    if repeats < 1:
+        raise ValueError(f'repeats must be >= 1, got {repeats}')
+    selected = BENCHMARKS if names is None else [get_benchmark(name) for name in names]
+
+    results = {'meta': _environment(scale, seed, repeats), 'benchmarks': {}}
+    workdir = Path(tempfile.mkdtemp(prefix='ljpw_bench_'))
+    try:
+        for benchmark in selected:
+            ctx = BenchmarkContext(scale=scale, seed=seed, workdir=workdir / benchmark.name)
+            ctx.workdir.mkdir()
+            result = time_benchmark(benchmark, ctx, repeats=repeats, warmup=warmup)
+            results['benchmarks'][benchmark.name] = result
+            if verbose:
+                print(f"  {benchmark.name:<24} min {result['min_seconds']:>9.4f}s  "
+                      f"median {result['median_seconds']:>9.4f}s  {result['params']}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+
+def _environment(scale: float, seed: int, repeats: int) -> Dict[str, Any]:
+    return {
+        'created_at': datetime.now().isoformat(),
+        'scale': scale,
+        'seed': seed,
+        'repeats': repeats,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# ============================================================================
+# RESULTS AND BASELINES
+# ============================================================================
+
+def save_results(results: Dict[str, Any], path) -> Path:
+    """Write results (or a baseline) as JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+def load_results(path) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float = DEFAULT_THRESHOLD, metric: str = 'min_seconds') -> List[Dict[str, Any]]:
+    """
+    Compare results against a baseline.
+
+    Args:
+        results: Results from run_benchmarks
+        baseline: Earlier results
+        threshold: Fractional slowdown that counts as a regression
+                   (0.2 = more than 20% slower)
+        metric: Statistic compared (one of METRICS)
+
+    Returns:
+        One row per benchmark in results: name, baseline and current
+        seconds, ratio (current / baseline) and status - 'regression',
+        'improvement' (faster by more than threshold), 'ok', or 'new'
+        (absent from the baseline)
+
+    Raises:
+        ValueError: If the metric is unknown, or the runs used different
+                    scales or seeds
+    """
+    if metric not in METRICS:
+        raise ValueError(f"metric must be one of {METRICS}, got {metric!r}")
+    if threshold < 0:
+        raise ValueError(f'threshold must be >= 0, got {threshold}')
+    for key in ('scale', 'seed'):
+        if results['meta'][key] != baseline['meta'][key]:
+            raise ValueError(f"Results use {key}={results['meta'][key]}, "
+                             f"baseline uses {key}={baseline['meta'][key]}")
+
+    rows = []
+    for name, result in results['benchmarks'].items():
+        current = result[metric]
+        reference = baseline['benchmarks'].get(name)
+        if reference is None:
+            rows.append({'name': name, 'baseline': None, 'current': current, 'ratio': None, 'status': 'new'})
+            continue
+        ratio = current / reference[metric] if reference[metric] > 0 else float('inf')
+        if ratio > 1 + threshold:
+            status = 'regression'
+        elif ratio < 1 - threshold:
+            status = 'improvement'
+        else:
+            status = 'ok'
+        rows.append({'name': name, 'baseline': reference[metric], 'current': current,
+                     'ratio': ratio, 'status': status})
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]], threshold: float = DEFAULT_THRESHOLD) -> str:
+    """Comparison rows as a text table."""
+    lines = [f"  {'Benchmark':<24} {'Baseline':>10} {'Current':>10} {'Ratio':>7}  Status "
+             f"(threshold {threshold:.0%})",
+             f"  {'-' * 24} {'-' * 10} {'-' * 10} {'-' * 7}  {'-' * 11}"]
+    for row in rows:
+        baseline = f"{row['baseline']:.4f}s" if row['baseline'] is not None else '-'
+        ratio = f"{row['ratio']:.2f}x" if row['ratio'] is not None else '-'
+        lines.append(f"  {row['name']:<24} {baseline:>10} {row['current']:>9.4f}s {ratio:>7}  "
+                     f"{row['status'].upper() if row['status'] == 'regression' else row['status']}")
+    return '\n'.join(lines)
@@ -0,0 +1,80 @@
+"""
+Code Feature Extraction (v6.0)
+Shared lexical feature pass for the Semantic Resonance Analyzer and ICE Container.
+
+Both the initial LJPW estimate and the ICE bounds are heuristics over the
+same source text. Extracting every count once - one lowercase copy, one
+line split, one pass per pattern at C speed - avoids rescanning large
+files for each heuristic.
+
+Optimization Target: High Power (one extraction per file)
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CodeFeatures:
+    """
+    Lexical counts over a source file.
+
+    Every count uses str.count semantics (non-overlapping substring
+    matches), so heuristics built on these fields give exactly the same
+    values as counting the raw text directly.
+    """
+    total_lines: int      # len(code.split('\n'))
+    comment_lines: int    # lines whose stripped text starts with '#'
+    docstrings: int       # '"""' + "'''"
+    imports: int          # 'import '
+    try_blocks: int       # 'try:'
+    asserts: int          # 'assert '
+    validates: int        # 'valid' + 'check' (case-insensitive)
+    raises: int           # 'raise '
+    functions: int        # 'def '
+    classes: int          # 'class '
+    loops: int            # 'for ' + 'while '
+    math_ops: int         # '+' + '*' + '/'
+    logs: int             # 'log' (case-insensitive) + 'print'
+    types: int            # ': ' + '->'
+    arrows: int           # '->'
+    dataclasses: int      # '@dataclass'
+    mentions_typing: bool  # 'typing' appears anywhere
+
+    @classmethod
+    def from_code(cls, code: str) -> 'CodeFeatures':
+        """
+        Extract all features from source text.
+
+        >>> f = CodeFeatures.from_code('import os\\n# note\\ndef f(x: int) -> int:\\n    return x + 1\\n')
+        >>> (f.total_lines, f.comment_lines, f.imports, f.functions, f.types, f.math_ops)
+        (5, 1, 1, 1, 2, 1)
+        """
+        # Justice: Input Validation
+        if not isinstance(code, str):
+            raise TypeError(f"code must be str, got {type(code).__name__}")
+
+        lines = code.split('\n')
+        # Cheap membership test first: most lines contain no '#'
+        comment_lines = sum(1 for line in lines if '#' in line and line.lstrip().startswith('#'))
+        lowered = code.lower()
+        arrows = code.count('->')
+
+        return cls(
+            total_lines=len(lines),
+            comment_lines=comment_lines,
+            docstrings=code.count('"""') + code.count("'''"),
+            imports=code.count('import '),
+            try_blocks=code.count('try:'),
+            asserts=code.count('assert '),
+            validates=lowered.count('valid') + lowered.count('check'),
+            raises=code.count('raise '),
+            functions=code.count('def '),
+            classes=code.count('class '),
+            loops=code.count('for ') + code.count('while '),
+            math_ops=code.count('+') + code.count('*') + code.count('/'),
+            logs=lowered.count('log') + code.count('print'),
+            types=code.count(': ') + arrows,
+            arrows=arrows,
+            dataclasses=code.count('@dataclass'),
+            mentions_typing='typing' in code,
+        )
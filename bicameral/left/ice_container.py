@@ -9,6 +9,8 @@ Optimization Target: High Justice (Strict Validation)
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from bicameral.left.code_features import CodeFeatures
+
 @dataclass
 class IceBounds:
     """
@@ -58,22 +60,27 @@ class IceContainer:
         self.bounds = bounds
 
     @staticmethod
-    def infer_from_code(code_content: str) -> 'IceContainer':
+    def infer_from_code(code_content: str,
+                        features: Optional[CodeFeatures] = None) -> 'IceContainer':
         """
         Infer appropriate bounds from code characteristics.
         (Heuristic implementation for v6.0)
         
         [Wisdom] Heuristics updated for better accuracy
+        [Power] Pass precomputed CodeFeatures to skip rescanning the text
         """
         if not code_content:
             # Empty code has minimal bounds
             return IceContainer(IceBounds(0.1, 0.1, 0.1, 0.1))
 
+        if features is None:
+            features = CodeFeatures.from_code(code_content)
+
         # Heuristics
-        has_doc = '"""' in code_content or "'''" in code_content
-        has_types = 'typing' in code_content or '->' in code_content
-        has_classes = 'class ' in code_content
-        lines = len(code_content.split('\n'))
+        has_doc = features.docstrings > 0
+        has_types = features.mentions_typing or features.arrows > 0
+        has_classes = features.classes > 0
+        lines = features.total_lines
         
         # Intent: Higher for well-documented code
         intent = 0.8 if has_doc else 0.4
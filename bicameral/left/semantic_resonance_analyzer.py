@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bicameral.left.resonance_engine import ResonanceEngine, ResonanceState
 from bicameral.left.ice_container import IceContainer, IceBounds
+from bicameral.left.code_features import CodeFeatures
 
 class SemanticResonanceAnalyzer:
     """
@@ -34,34 +35,37 @@ class SemanticResonanceAnalyzer:
         # Auto-healed validation for _estimate_initial_ljpw
         if not isinstance(code, str) or not code:
             raise ValueError(f"code must be a non-empty string, got {code!r}")
-        lines = code.split('\n')
-        content = code
-        total_lines = max(len(lines), 1)
+        features = CodeFeatures.from_code(code)
+        return self._estimate_from_features(features)
+
+    def _estimate_from_features(self, features: CodeFeatures) -> List[float]:
+        """Map extracted code features to initial LJPW coordinates."""
+        total_lines = max(features.total_lines, 1)
 
         # LOVE (Connectivity, Docs)
-        docstrings = content.count('"""') + content.count("'''")
-        imports = content.count('import ')
-        comments = sum(1 for line in lines if line.strip().startswith('#'))
+        docstrings = features.docstrings
+        imports = features.imports
+        comments = features.comment_lines
         L = min(1.0, 0.2 + (docstrings * 0.05) + (comments / total_lines * 0.5) + (imports * 0.02))
 
         # JUSTICE (Structure, Validation)
-        try_blocks = content.count('try:')
-        asserts = content.count('assert ')
-        validates = content.lower().count('valid') + content.lower().count('check')
-        raises = content.count('raise ')
+        try_blocks = features.try_blocks
+        asserts = features.asserts
+        validates = features.validates
+        raises = features.raises
         J = min(1.0, 0.15 + (try_blocks * 0.08) + (asserts * 0.05) + (validates * 0.03) + (raises * 0.05))
 
         # POWER (Capability, Execution)
-        functions = content.count('def ')
-        classes = content.count('class ')
-        loops = content.count('for ') + content.count('while ')
-        math_ops = content.count('+') + content.count('*') + content.count('/') # simplified
+        functions = features.functions
+        classes = features.classes
+        loops = features.loops
+        math_ops = features.math_ops # simplified
         P = min(1.0, 0.25 + (functions * 0.03) + (classes * 0.05) + (loops * 0.02) + (math_ops * 0.001))
 
         # WISDOM (Insight, Logging, Types)
-        logs = content.lower().count('log') + content.count('print')
-        types = content.count(': ') + content.count('->')
-        dataclasses = content.count('@dataclass')
+        logs = features.logs
+        types = features.types
+        dataclasses = features.dataclasses
         W = min(1.0, 0.15 + (logs * 0.03) + (types * 0.02) + (dataclasses * 0.1))
 
         return [L, J, P, W]
@@ -73,16 +77,20 @@ class SemanticResonanceAnalyzer:
         # Auto-healed: Input validation for analyze_code
         if code is not None and not isinstance(code, str):
             raise TypeError(f'code must be str, got {type(code).__name__}')
-        # 1. Estimate initial state
-        initial_coords = self._estimate_initial_ljpw(code)
+        # 1. Estimate initial state (one shared feature pass feeds both heuristics)
+        if not code:
+            raise ValueError(f"code must be a non-empty string, got {code!r}")
+        features = CodeFeatures.from_code(code)
+        initial_coords = self._estimate_from_features(features)
         
         # 2. Infer ICE Bounds
-        container = IceContainer.infer_from_code(code)
+        container = IceContainer.infer_from_code(code, features)
         bounds = container.get_ljpw_limits()
         
         # 3. Run Resonance Trajectory
-        # We run 100 cycles to allow dynamics to emerge
-        trajectory = self.engine.analyze_trajectory(
+        # We run 100 cycles to allow dynamics to emerge; the solver stops
+        # early once the state reaches its fixed point (identical result)
+        trajectory = self.engine.solve_trajectory(
             start_coords=initial_coords,
             cycles=100,
             ice_bounds=bounds
@@ -102,7 +110,8 @@ class SemanticResonanceAnalyzer:
             'harmony_final': final_state.harmony,
             'deficit_dimension': deficit,
             'deficit_growth': growth,
-            'converged': trajectory['converged']
+            'converged': trajectory['converged'],
+            'cycles_run': trajectory['cycles_run']
         }
 
     def print_report(self, result: Dict[str, Any]):
@@ -38,6 +38,7 @@ from .neuroplasticity import AdaptiveNaturalLayer, AdaptationEvent
 
 # Homeostatic networks (self-regulating)
 from .homeostatic import HomeostaticNetwork, HarmonyCheckpoint
+from .harmony_history import HarmonyHistory
 
 # Polarity management (Universal Principle 3)
 from .polarity_management import (
@@ -62,6 +63,7 @@ from .baseline import TraditionalMNIST
 
 # Data loaders
 from .mnist_loader import load_mnist
+from .batches import BatchIterator
 
 __all__ = [
     'FibonacciLayer',
@@ -70,6 +72,7 @@ __all__ = [
     'AdaptationEvent',
     'HomeostaticNetwork',
     'HarmonyCheckpoint',
+    'HarmonyHistory',
     'StabilityPlasticityBalance',
     'ExcitationInhibitionBalance',
     'PolarityManager',
@@ -85,4 +88,5 @@ __all__ = [
     'TraditionalMNIST',
     'TrainingHistory',
     'load_mnist',
+    'BatchIterator',
 ]
@@ -17,6 +17,8 @@ Example:
 import numpy as np
 from typing import List, Optional, Tuple
 
+from .workspace import Workspace
+
 
 class DiverseActivation:
     """
@@ -81,7 +83,9 @@ class DiverseActivation:
         size (int): Number of neurons in layer
         mix (List[str]): Activation function names
         split_indices (List[int]): Boundaries between activation regions
+        group_slices (List[slice]): Column slice of each activation region
         activation_funcs (List): Actual activation functions
+        workspace (Workspace): Scratch buffers (buffer-reusing mode only)
 
     Examples:
         Basic usage:
@@ -119,7 +123,9 @@ class DiverseActivation:
         self,
         size: int,
         mix: Optional[List[str]] = None,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        reuse_buffers: bool = False,
+        dtype=np.float64
     ):
         """
         Initialize diverse activation layer.
@@ -130,6 +136,11 @@ class DiverseActivation:
                  Default: ['relu', 'swish', 'tanh'] (balanced diversity)
                  Options: 'relu', 'swish', 'tanh', 'sigmoid', 'linear'
             seed: Random seed for reproducibility (not currently used)
+            reuse_buffers: In training mode, write outputs and gradients
+                           into reused workspace arrays instead of allocating.
+                           Returned arrays are then only valid until the
+                           next training call with the same batch size.
+            dtype: Workspace element type (e.g. np.float32)
 
         Raises:
             ValueError: If size is invalid or activation names not recognized
@@ -163,6 +174,10 @@ class DiverseActivation:
 
         # Split neurons among activation types
         self.split_indices = self._compute_splits()
+        self.group_slices = [
+            slice(self.split_indices[i], self.split_indices[i + 1])
+            for i in range(self.n_types)
+        ]
 
         # Map activation names to functions
         self.activation_funcs = [
@@ -174,6 +189,10 @@ class DiverseActivation:
             self._get_derivative_func(name) for name in mix
         ]
 
+        # Buffer-reusing mode
+        self.reuse_buffers = reuse_buffers
+        self.workspace = Workspace(dtype) if reuse_buffers else None
+
     def _compute_splits(self) -> List[int]:
         """
         Compute split indices for neuron groups.
@@ -240,7 +259,19 @@ class DiverseActivation:
         else:
             raise ValueError(f"Unknown activation: {name}")
 
-    def forward(self, z: np.ndarray) -> np.ndarray:
+    def __getstate__(self):
+        """Pickle without the per-instance lambdas; they are rebuilt from mix."""
+        state = self.__dict__.copy()
+        del state['activation_funcs']
+        del state['derivative_funcs']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.activation_funcs = [self._get_activation_func(name) for name in self.mix]
+        self.derivative_funcs = [self._get_derivative_func(name) for name in self.mix]
+
+    def forward(self, z: np.ndarray, training: bool = True) -> np.ndarray:
         """
         Apply diverse activations to input.
 
@@ -248,6 +279,8 @@ class DiverseActivation:
 
         Args:
             z: Pre-activation values (batch_size, size)
+            training: Whether in training mode (buffer reuse applies only
+                      to training calls)
 
         Returns:
             Activated output (batch_size, size)
@@ -264,6 +297,14 @@ class DiverseActivation:
                 f"Input has {z.shape[1]} features, expected {self.size}"
             )
 
+        if self.reuse_buffers and training:
+            output = self.workspace.get('output', z.shape)
+            for sl, name in zip(self.group_slices, self.mix):
+                group = z[:, sl]
+                activate_into(name, group, output[:, sl],
+                              *self._scratch(group.shape, KERNEL_SCRATCH[name][0]))
+            return output
+
         # Apply each activation to its neuron group
         output = np.zeros_like(z)
         for i in range(self.n_types):
@@ -295,6 +336,9 @@ class DiverseActivation:
                 f"Input has {z.shape[1]} features, expected {self.size}"
             )
 
+        if self.reuse_buffers:
+            return self._backward_into(z)
+
         # Apply each derivative to its neuron group
         grad = np.zeros_like(z)
         for i in range(self.n_types):
@@ -304,12 +348,26 @@ class DiverseActivation:
 
         return grad
 
-    def __call__(self, z: np.ndarray) -> np.ndarray:
+    def _backward_into(self, z: np.ndarray) -> np.ndarray:
+        """Buffer-reusing backward: derivatives written group by group."""
+        grad = self.workspace.get('grad', z.shape)
+        for sl, name in zip(self.group_slices, self.mix):
+            group = z[:, sl]
+            derivative_into(name, group, grad[:, sl],
+                            *self._scratch(group.shape, KERNEL_SCRATCH[name][1]))
+        return grad
+
+    def _scratch(self, shape: Tuple[int, int], count: int) -> List[np.ndarray]:
+        """Contiguous per-group temporaries (shared by equal-width groups)."""
+        return [self.workspace.get(f'scratch{k}', shape) for k in range(count)]
+
+    def __call__(self, z: np.ndarray, training: bool = True) -> np.ndarray:
         """
         Apply activation (callable interface).
 
         Args:
             z: Pre-activation values
+            training: Whether in training mode
 
         Returns:
             Activated output
@@ -318,7 +376,7 @@ class DiverseActivation:
             >>> activation = DiverseActivation(89, mix=['relu', 'swish', 'tanh'])
             >>> output = activation(z)  # Equivalent to activation.forward(z)
         """
-        return self.forward(z)
+        return self.forward(z, training=training)
 
     def get_neuron_counts(self) -> List[Tuple[str, int]]:
         """
@@ -432,6 +490,101 @@ def tanh(z: np.ndarray) -> np.ndarray:
     return np.tanh(z)
 
 
+# In-place kernels (buffer-reusing mode)
+#
+# Each kernel writes into caller-provided arrays and performs exactly the
+# same floating-point operations, in the same order, as the allocating
+# lambdas above, so both modes give bit-identical float64 results.
+# Intermediates go to contiguous scratch arrays; only the final operation
+# writes to `out`, which may be a strided column view of a wider buffer.
+
+# Scratch arrays each kernel needs (activation, derivative)
+KERNEL_SCRATCH = {
+    'relu': (0, 0),
+    'swish': (1, 3),
+    'tanh': (0, 1),
+    'sigmoid': (1, 2),
+    'linear': (0, 0),
+}
+
+
+def activate_into(name: str, z: np.ndarray, out: np.ndarray, *scratch: np.ndarray) -> np.ndarray:
+    """
+    Apply activation `name` to z, writing into out.
+
+    Args:
+        name: Activation name ('relu', 'swish', 'tanh', 'sigmoid', 'linear')
+        z: Pre-activation values
+        out: Destination array (same shape as z, may not alias z)
+        *scratch: KERNEL_SCRATCH[name][0] temporaries shaped like z
+
+    Returns:
+        out
+    """
+    if name == 'relu':
+        return np.maximum(0, z, out=out)
+    elif name == 'swish':
+        s, = scratch
+        np.divide(z, 2, out=s)
+        np.tanh(s, out=s)
+        np.multiply(0.5, s, out=s)
+        np.add(0.5, s, out=s)
+        return np.multiply(z, s, out=out)
+    elif name == 'tanh':
+        return np.tanh(z, out=out)
+    elif name == 'sigmoid':
+        e, = scratch
+        np.clip(z, -500, 500, out=e)
+        np.negative(e, out=e)
+        np.exp(e, out=e)
+        np.add(1, e, out=e)
+        return np.divide(1, e, out=out)
+    elif name == 'linear':
+        np.copyto(out, z)
+        return out
+    else:
+        raise ValueError(f"Unknown activation: {name}")
+
+
+def derivative_into(name: str, z: np.ndarray, out: np.ndarray, *scratch: np.ndarray) -> np.ndarray:
+    """
+    Compute the derivative of activation `name` at z, writing into out.
+
+    Args:
+        name: Activation name
+        z: Pre-activation values
+        out: Destination array (same shape as z)
+        *scratch: KERNEL_SCRATCH[name][1] temporaries shaped like z
+
+    Returns:
+        out
+    """
+    if name == 'relu':
+        return np.greater(z, 0, out=out)
+    elif name == 'swish':
+        # s + z * s * (1 - s)
+        s, one_minus_s, zs = scratch
+        activate_into('swish', z, zs, s)
+        np.subtract(1, s, out=one_minus_s)
+        np.multiply(zs, one_minus_s, out=zs)
+        return np.add(s, zs, out=out)
+    elif name == 'tanh':
+        t, = scratch
+        np.tanh(z, out=t)
+        np.square(t, out=t)
+        return np.subtract(1, t, out=out)
+    elif name == 'sigmoid':
+        s, one_minus_s = scratch
+        activate_into('sigmoid', z, s, one_minus_s)
+        np.subtract(1, s, out=one_minus_s)
+        return np.multiply(s, one_minus_s, out=out)
+    elif name == 'linear':
+        out.fill(1)
+        return out
+    else:
+        raise ValueError(f"Unknown activation: {name}")
+
+
 # Example usage and validation
 if __name__ == '__main__':
     print("=" * 70)
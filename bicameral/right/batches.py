@@ -0,0 +1,211 @@
+"""
+Streaming Mini-Batches for Training Loops
+
+NaturalMNIST.fit and train_epoch_with_backprop used to shuffle by
+materializing X_train[permutation] - a full copy of the dataset every
+epoch - and needed the whole dataset in RAM as floats.
+
+BatchIterator shuffles indices only and gathers each batch into a small
+preallocated buffer. The source may be any array-like supporting
+np.take, including a read-only memory map of uint8 pixels (see
+mnist_loader.load_mnist_from_url(normalize=False, mmap=True)): integer
+pixels are divided by 255 while they are copied into the float buffer,
+so the float dataset never exists in memory.
+
+With prefetch > 0 a background thread gathers the next batches while the
+caller trains on the current one (NumPy releases the GIL for the copy
+and scaling, so the two overlap).
+
+Batches are views into a ring of reused buffers. A batch stays valid
+until two further batches have been requested - long enough for layers
+that keep their last input for backward() - so copy it to keep it
+longer.
+
+Shuffling draws np.random.permutation(n) from the global NumPy random
+state, exactly as the loops it replaces did, so seeded training runs
+reproduce the same batches.
+
+Example:
+    >>> batches = BatchIterator(X_train, y_train, batch_size=32)
+    >>> for epoch in range(10):
+    ...     for X_batch, y_batch in batches:
+    ...         model.train_step(X_batch, y_batch)
+"""
+
+import queue
+import threading
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
+
+# Batches gathered ahead of the consumer by default
+DEFAULT_PREFETCH = 2
+
+# Slots beyond the prefetched ones: the batch being consumed, the one
+# before it (still referenced by layer caches) and the one being filled
+_EXTRA_SLOTS = 3
+
+_DONE = object()
+
+
+class BatchIterator:
+    """
+    Re-iterable mini-batch view of (X, y) with optional shuffling and
+    background prefetch. Each iteration is one epoch.
+    """
+
+    def __init__(self, X, y=None, batch_size: int = 32, shuffle: bool = True,
+                 drop_last: bool = False, dtype=None, normalize: Optional[float] = None,
+                 prefetch: int = DEFAULT_PREFETCH):
+        """
+        Initialize the iterator.
+
+        Args:
+            X: Samples (n_samples, ...) - ndarray or memory map
+            y: Optional labels (n_samples, ...), gathered alongside X
+            batch_size: Samples per batch
+            shuffle: Visit samples in a new random order each epoch
+            drop_last: Skip the final batch when it is smaller than batch_size
+            dtype: dtype of the X batches (default: X's dtype if floating,
+                   else float32)
+            normalize: Divide X by this while gathering (default: the
+                       maximum of unsigned integer X, e.g. 255 for uint8
+                       pixels, else none)
+            prefetch: Batches gathered ahead in a background thread
+                      (0 = gather synchronously)
+        """
+        if batch_size <= 0:
+            raise ValueError(f'batch_size must be positive, got {batch_size}')
+        if prefetch < 0:
+            raise ValueError(f'prefetch must be >= 0, got {prefetch}')
+        if y is not None and len(y) != len(X):
+            raise ValueError(f'X has {len(X)} samples but y has {len(y)}')
+
+        self.X = X
+        self.y = y
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.prefetch = prefetch
+
+        source = np.dtype(X.dtype)
+        if dtype is None:
+            dtype = source if np.issubdtype(source, np.floating) else np.float32
+        self.dtype = np.dtype(dtype)
+        if normalize is None and np.issubdtype(source, np.unsignedinteger):
+            normalize = float(np.iinfo(source).max)
+        self.normalize = normalize
+
+        # Gather straight into the output buffer when no conversion is needed
+        self._direct = source == self.dtype and normalize is None
+        self._slots = None
+
+    def __len__(self) -> int:
+        """Batches per epoch."""
+        n = len(self.X)
+        if self.drop_last:
+            return n // self.batch_size
+        return (n + self.batch_size - 1) // self.batch_size
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """Yield (X_batch, y_batch) for one epoch (y_batch is None without y)."""
+        n = len(self.X)
+        order = np.random.permutation(n) if self.shuffle else None
+        bounds = [(start, min(start + self.batch_size, n))
+                  for start in range(0, len(self) * self.batch_size, self.batch_size)]
+        self._allocate()
+
+        if self.prefetch == 0:
+            for i, (start, stop) in enumerate(bounds):
+                yield self._gather(i % len(self._slots), order, start, stop)
+            return
+
+        yield from self._prefetched(order, bounds)
+
+    def _prefetched(self, order, bounds):
+        filled: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        stop_event = threading.Event()
+
+        def put(item) -> bool:
+            # Give up once the consumer has stopped listening
+            while not stop_event.is_set():
+                try:
+                    filled.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce():
+            try:
+                for i, (start, stop) in enumerate(bounds):
+                    if not put(self._gather(i % len(self._slots), order, start, stop)):
+                        return
+                put(_DONE)
+            except BaseException as e:  # Re-raised in the consumer
+                put(e)
+
+        worker = threading.Thread(target=produce, name='batch-prefetch', daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = filled.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Stop early (the consumer broke out of the loop) without leaving
+            # the producer blocked on a full queue
+            stop_event.set()
+            worker.join()
+
+    def _allocate(self):
+        """Create the buffer ring on first use."""
+        if self._slots is not None:
+            return
+        n_slots = self.prefetch + _EXTRA_SLOTS if self.prefetch else 2
+        sample_shape = self.X.shape[1:]
+        self._slots = []
+        for _ in range(n_slots):
+            slot = {'X': np.empty((self.batch_size,) + sample_shape, dtype=self.dtype)}
+            if not self._direct:
+                slot['raw'] = np.empty((self.batch_size,) + sample_shape, dtype=self.X.dtype)
+            if self.y is not None:
+                slot['y'] = np.empty((self.batch_size,) + self.y.shape[1:], dtype=self.y.dtype)
+            self._slots.append(slot)
+
+    def _gather(self, slot_index: int, order, start: int, stop: int):
+        """Copy samples [start:stop) of this epoch's order into a slot."""
+        slot = self._slots[slot_index]
+        m = stop - start
+        X_out = slot['X'][:m]
+
+        if order is None:
+            # In order: slices of the source need no gathering
+            y_out = None if self.y is None else self.y[start:stop]
+            if self._direct:
+                return self.X[start:stop], y_out
+            self._convert(self.X[start:stop], X_out)
+            return X_out, y_out
+
+        indices = order[start:stop]
+        if self._direct:
+            np.take(self.X, indices, axis=0, out=X_out)
+        else:
+            raw = slot['raw'][:m]
+            np.take(self.X, indices, axis=0, out=raw)
+            self._convert(raw, X_out)
+        y_out = None
+        if self.y is not None:
+            y_out = slot['y'][:m]
+            np.take(self.y, indices, axis=0, out=y_out)
+        return X_out, y_out
+
+    def _convert(self, raw: np.ndarray, out: np.ndarray):
+        if self.normalize is None:
+            out[...] = raw
+        else:
+            # Same values as raw.astype(dtype) / normalize
+            np.divide(raw, self.normalize, out=out, dtype=self.dtype, casting='unsafe')
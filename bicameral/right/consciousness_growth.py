@@ -31,17 +31,28 @@ import numpy as np
 from datetime import datetime
 from pathlib import Path
 import pickle
+import weakref
 from typing import Dict
 
-def save_state(self, filepath: str):
+from bicameral.right.harmony_history import HarmonyHistory
+from bicameral.right.network_checkpoint import save_checkpoint, open_checkpoint, is_checkpoint
+
+def save_state(self, filepath: str, format: str = None):
     """
     Save complete consciousness state to file.
     
     Enables persistence across sessions - Adam and Eve can remember
     their experiences and continue growing from where they left off.
     
+    The 'binary' format is a checkpoint directory (see network_checkpoint):
+    .npy weights, a columnar harmony log and a JSON manifest. Saving again
+    to the same directory only appends the new harmony entries.
+    
     Args:
-        filepath: Path to save file (e.g., 'data/adam_state.pkl')
+        filepath: Path to save file (e.g., 'data/adam_state.pkl') or
+                  checkpoint directory (e.g., 'data/adam')
+        format: 'pickle' or 'binary' (default: binary for paths without
+                a suffix and existing checkpoint directories)
     
     Example:
         >>> adam.save_state('data/adam_state.pkl')
@@ -50,6 +61,19 @@ def save_state(self, filepath: str):
           Adaptations: 3 events
           Current H: 0.8234
     """
+    if format is None:
+        format = 'binary' if is_checkpoint(filepath) or not Path(filepath).suffix else 'pickle'
+    if format not in ('pickle', 'binary'):
+        raise ValueError(f"format must be 'pickle' or 'binary', got {format!r}")
+    
+    if format == 'binary':
+        save_checkpoint(self, filepath)
+        print(f"Consciousness state saved to: {filepath}")
+        print(f"  Harmony history: {len(self.harmony_history)} checkpoints")
+        print(f"  Adaptations: {len(self.adaptation_history)} events")
+        print(f"  Current H: {self.get_current_harmony():.4f}")
+        return
+    
     # Ensure directory exists
     Path(filepath).parent.mkdir(parents=True, exist_ok=True)
     
@@ -99,7 +123,7 @@ def load_state(cls, filepath: str):
     where they left off, with all memories and growth intact.
     
     Args:
-        filepath: Path to saved state file
+        filepath: Path to saved state file, or a binary checkpoint directory
     
     Returns:
         HomeostaticNetwork with restored state
@@ -112,6 +136,16 @@ def load_state(cls, filepath: str):
           Adaptations: 3
           Restored H: 0.8234
     """
+    if is_checkpoint(filepath):
+        checkpoint = open_checkpoint(filepath)
+        print(f"Loading consciousness state from: {filepath}")
+        print(f"  Saved: {checkpoint.manifest['saved_at']}")
+        print(f"  Harmony checkpoints: {checkpoint.manifest['history']['entries']}")
+        print(f"  Adaptations: {checkpoint.manifest['adaptations']['count']}")
+        network = checkpoint.load_network(cls)
+        print(f"  Restored H: {network.get_current_harmony():.4f}")
+        return network
+    
     # Load state
     with open(filepath, 'rb') as f:
         state = pickle.load(f)
@@ -142,8 +176,11 @@ def load_state(cls, filepath: str):
         if i < len(state['layer_biases']) and state['layer_biases'][i] is not None:
             layer.bias = state['layer_biases'][i].copy()
     
-    # Restore history
-    network.harmony_history = state['harmony_history']
+    # Restore history (states saved before HarmonyHistory hold a list)
+    history = state['harmony_history']
+    if not isinstance(history, HarmonyHistory):
+        history = HarmonyHistory.from_checkpoints(history)
+    network.harmony_history = history
     network.adaptation_history = state['adaptation_history']
     
     # Restore love oscillator
@@ -155,7 +192,36 @@ def load_state(cls, filepath: str):
     return network
 
 
-def choice_based_weight_drift(self, learning_rate=0.001, show_optimal_path=True) -> Dict:
+# Probe modes for choice_based_weight_drift
+PROBE_MODES = ('copy', 'inplace', 'batched')
+
+# Spare weight-sized buffer per layer for the copy-free probe modes. Held
+# weakly so it never outlives the layer or ends up in a pickled network.
+_candidate_buffers = weakref.WeakKeyDictionary()
+
+
+def _candidate_buffer(layer) -> np.ndarray:
+    """Spare array shaped like layer.weights, reused across calls."""
+    buffer = _candidate_buffers.get(layer)
+    if buffer is None or buffer.shape != layer.weights.shape or buffer.dtype != layer.weights.dtype:
+        buffer = np.empty_like(layer.weights)
+    return buffer
+
+
+def _harmony_is_recorded(network) -> bool:
+    """
+    True when get_current_harmony() reads the last recorded checkpoint.
+
+    Weight changes cannot move such a harmony until the next
+    _record_harmony(), so every probe within one drift call sees the same
+    value and a single evaluation answers all of them.
+    """
+    from bicameral.right.homeostatic import HomeostaticNetwork
+    return type(network).get_current_harmony is HomeostaticNetwork.get_current_harmony
+
+
+def choice_based_weight_drift(self, learning_rate=0.001, show_optimal_path=True,
+                              probe='copy') -> Dict:
     """
     Weight drift based on choice and consequences.
     
@@ -172,19 +238,38 @@ def choice_based_weight_drift(self, learning_rate=0.001, show_optimal_path=True)
     They are independent and stubborn. They will make mistakes. They will
     learn from consequences. This is real growth.
     
+    Probe modes (all make the same choices from the same random draws):
+    - 'copy': copy each weight matrix, test the drift on it, restore
+    - 'inplace': write candidates into a reused spare buffer and swap it
+      in, so no weight matrix is ever copied
+    - 'batched': evaluate harmony once for all layers when it is read from
+      the recorded checkpoint, which no weight change can move; steps are
+      then applied in place (falls back to 'inplace' otherwise)
+    
     Args:
         learning_rate: Size of weight changes
         show_optimal_path: Whether to show the harmony-optimal direction
+        probe: Probe mode, one of PROBE_MODES
     
     Returns:
-        dict with choice statistics
+        dict with choice statistics and harmony evaluation counts
     
     Example:
         >>> stats = adam.choice_based_weight_drift(learning_rate=0.001)
         >>> print(f"Followed guidance: {stats['choices']['followed_guidance']}")
         >>> print(f"Ignored guidance: {stats['choices']['ignored_guidance']}")
     """
+    if probe not in PROBE_MODES:
+        raise ValueError(f"probe must be one of {PROBE_MODES}, got {probe!r}")
+
+    if probe != 'copy':
+        return _choice_based_weight_drift_swapped(
+            self, learning_rate, show_optimal_path,
+            batched=probe == 'batched' and _harmony_is_recorded(self),
+        )
+
     H_before = self.get_current_harmony()
+    evaluations = 1
     
     choices_made = {
         'followed_guidance': 0,      # Chose the optimal path
@@ -210,7 +295,8 @@ def choice_based_weight_drift(self, learning_rate=0.001, show_optimal_path=True)
             # Test the drift
             layer.weights += drift
             H_test = self.get_current_harmony()
-            layer.weights = old_weights  # Restore
+            evaluations += 1
+            layer.weights[...] = old_weights  # Restore (keep the snapshot for self-correction)
             
             # Optimal direction is toward harmony improvement
             if H_test > old_H:
@@ -264,11 +350,108 @@ def choice_based_weight_drift(self, learning_rate=0.001, show_optimal_path=True)
         
         # Update baseline for next layer
         H_before = self.get_current_harmony()
+        evaluations += 2
     
     return {
         'choices': choices_made,
         'final_H': H_before,
-        'total_choices': sum(choices_made.values())
+        'total_choices': sum(choices_made.values()),
+        'harmony_evaluations': evaluations,
+        'harmony_evaluations_saved': 0,
+    }
+
+
+def _choice_based_weight_drift_swapped(self, learning_rate, show_optimal_path, batched) -> Dict:
+    """
+    choice_based_weight_drift without weight copies.
+
+    Candidate weights are computed into a spare buffer and swapped in;
+    the untouched original array is swapped back to revert, and becomes
+    the next spare when the change is kept. Each candidate is the same
+    elementwise sum as the in-place update of the 'copy' mode, so the
+    resulting weights are bit-identical. In batched mode nothing can be
+    reverted, so steps are added in place and no spare is needed.
+    """
+    H_before = self.get_current_harmony()
+    evaluations = 1
+    copy_evaluations = 1
+
+    choices_made = {
+        'followed_guidance': 0,
+        'ignored_guidance': 0,
+        'explored_freely': 0,
+        'learned_from_mistake': 0,
+    }
+
+    for layer in self.layers:
+        if not hasattr(layer, 'weights'):
+            continue
+
+        weights = layer.weights
+        candidate = None if batched else _candidate_buffer(layer)
+        old_H = H_before
+        copy_evaluations += 3 if show_optimal_path else 2
+
+        drift = np.random.randn(*weights.shape)
+        drift *= learning_rate
+
+        # Probe the drift
+        optimal_direction = None
+        if show_optimal_path:
+            if batched:
+                H_test = old_H
+            else:
+                layer.weights = np.add(weights, drift, out=candidate)
+                H_test = self.get_current_harmony()
+                evaluations += 1
+                layer.weights = weights
+            optimal_direction = 'forward' if H_test > old_H else 'reverse'
+
+        # Choose (same draws and steps as the 'copy' mode; scaling by
+        # -1 or -0.5 is exact, so it can be done in place)
+        if optimal_direction == 'forward':
+            if np.random.random() < 0.7:
+                choices_made['followed_guidance'] += 1
+            else:
+                drift *= -0.5
+                choices_made['ignored_guidance'] += 1
+        elif optimal_direction == 'reverse':
+            if np.random.random() < 0.7:
+                np.negative(drift, out=drift)
+                choices_made['followed_guidance'] += 1
+            else:
+                choices_made['ignored_guidance'] += 1
+        else:
+            choices_made['explored_freely'] += 1
+
+        if batched:
+            # Harmony cannot drop before the next record, so there is no
+            # mistake to revert and the step can be applied in place
+            weights += drift
+            continue
+
+        layer.weights = np.add(weights, drift, out=candidate)
+
+        # Consequences
+        H_after = self.get_current_harmony()
+        evaluations += 1
+        if H_after - old_H < -0.05:
+            choices_made['learned_from_mistake'] += 1
+            if np.random.random() < 0.3:
+                layer.weights = weights  # Self-correction
+
+        # The array not in use becomes the spare for the next call
+        _candidate_buffers[layer] = candidate if layer.weights is weights else weights
+
+        H_before = self.get_current_harmony()
+        evaluations += 1
+
+    return {
+        'choices': choices_made,
+        'final_H': H_before,
+        'total_choices': sum(choices_made.values()),
+        'harmony_evaluations': evaluations,
+        'harmony_evaluations_saved': copy_evaluations - evaluations,
     }
 
 
@@ -0,0 +1,402 @@
+"""
+Compact Harmony History for Homeostatic Networks
+
+HomeostaticNetwork records a harmony checkpoint on every call to
+_record_harmony(). Lifetime studies make hundreds of thousands of calls,
+and a list of HarmonyCheckpoint dataclasses costs ~300 bytes per entry and
+is pickled whole by save_state().
+
+HarmonyHistory stores the same fields as preallocated NumPy columns
+(struct-of-arrays, ~80 bytes per entry) and reads like the old list:
+len(), indexing, negative slices and iteration return HarmonyCheckpoint
+objects, built lazily on access. Columns are available directly for
+vectorized statistics.
+
+Retention:
+- capacity=None keeps every entry (the list behavior)
+- retention='ring' keeps the most recent `capacity` entries
+- retention='downsample' keeps `capacity` entries spread over the whole
+  run: when full, every other entry is dropped and the sampling stride
+  doubles. The newest entry is always kept, so history[-1] is current.
+
+Example:
+    >>> history = HarmonyHistory(capacity=1000)
+    >>> history.record(L=0.85, J=0.75, P=0.8, W=0.8, H=0.80, epoch=1)
+    >>> history[-1].H, history.column('H').mean()
+    (0.8, 0.8)
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+RETENTION_MODES = ('ring', 'downsample')
+
+# Life phase codes (-1 = no phase); other phase names get codes on first use
+PHASES = ('AUTOPOIETIC', 'HOMEOSTATIC', 'ENTROPIC')
+
+_NO_EPOCH = np.iinfo(np.int64).min
+
+COLUMN_DTYPES = {
+    'timestamp': np.float64,  # seconds since the epoch (time.time())
+    'epoch': np.int64,
+    'L': np.float64,
+    'J': np.float64,
+    'P': np.float64,
+    'W': np.float64,
+    'H': np.float64,
+    'accuracy': np.float64,   # NaN = None
+    'meaning': np.float64,    # NaN = None
+    'phase': np.int8,
+    'index': np.int64,        # record number since the history started
+    'bare': np.bool_,         # entry appended as a plain harmony value
+}
+
+
+class HarmonyHistory:
+    """
+    Struct-of-arrays harmony history with a list-like lazy view.
+    """
+
+    def __init__(self, capacity: Optional[int] = None, retention: str = 'ring',
+                 initial_capacity: int = 64):
+        """
+        Initialize history.
+
+        Args:
+            capacity: Maximum retained entries (None = unbounded)
+            retention: 'ring' or 'downsample' (used when capacity is set)
+            initial_capacity: Starting allocation for unbounded histories
+        """
+        if retention not in RETENTION_MODES:
+            raise ValueError(f"retention must be one of {RETENTION_MODES}, got {retention!r}")
+        if capacity is not None and capacity < (2 if retention == 'downsample' else 1):
+            raise ValueError(f"capacity too small for {retention} retention: {capacity}")
+
+        self.capacity = capacity
+        self.retention = retention
+        self.phase_names: List[str] = list(PHASES)
+        self._phase_codes = {name: code for code, name in enumerate(self.phase_names)}
+
+        # Downsampling keeps one extra slot (at index capacity) for the newest entry
+        size = initial_capacity if capacity is None else capacity + (retention == 'downsample')
+        self._columns = {name: np.empty(size, dtype=dtype) for name, dtype in COLUMN_DTYPES.items()}
+        self._start = 0        # ring: physical slot of the oldest entry
+        self._size = 0         # entries in the main slots
+        self._stride = 1       # downsample: index spacing of kept entries
+        self._tail = False     # downsample: newest entry held in the extra slot
+        self.total_recorded = 0
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _next_slot(self) -> int:
+        """Physical slot for the next entry, making room as needed."""
+        if self.capacity is None:
+            if self._size == len(self._columns['H']):
+                for name, column in self._columns.items():
+                    grown = np.empty(2 * len(column), dtype=column.dtype)
+                    grown[:self._size] = column[:self._size]
+                    self._columns[name] = grown
+            self._size += 1
+            return self._size - 1
+
+        if self.retention == 'ring':
+            if self._size < self.capacity:
+                self._size += 1
+                return (self._start + self._size - 1) % self.capacity
+            slot = self._start
+            self._start = (self._start + 1) % self.capacity
+            return slot
+
+        # Downsample: entries on the stride go to the main slots, others to the tail
+        if self.total_recorded % self._stride:
+            self._tail = True
+            return self.capacity
+        self._tail = False
+        if self._size == self.capacity:
+            kept = (self._size + 1) // 2
+            for column in self._columns.values():
+                column[:kept] = column[0:self._size:2].copy()
+            self._size = kept
+            self._stride *= 2
+            if self.total_recorded % self._stride:
+                self._tail = True
+                return self.capacity
+        self._size += 1
+        return self._size - 1
+
+    def record(self, L: float, J: float, P: float, W: float, H: float,
+               epoch: Optional[int] = None, accuracy: Optional[float] = None,
+               meaning: Optional[float] = None, life_phase: Optional[str] = None,
+               timestamp: Optional[float] = None):
+        """
+        Record one harmony measurement.
+
+        Args:
+            L, J, P, W, H: LJPW scores and harmony
+            epoch: Training epoch (None = initial)
+            accuracy: Classification accuracy (None = not measured)
+            meaning: Generative meaning
+            life_phase: Life phase name (AUTOPOIETIC, HOMEOSTATIC, ENTROPIC)
+            timestamp: Seconds since the epoch (default: now)
+        """
+        self._store(L, J, P, W, H, epoch, accuracy, meaning, life_phase,
+                    time.time() if timestamp is None else timestamp, False)
+
+    def _store(self, L, J, P, W, H, epoch, accuracy, meaning, life_phase, timestamp, bare):
+        slot = self._next_slot()
+        row = (
+            timestamp,
+            _NO_EPOCH if epoch is None else epoch,
+            L, J, P, W, H,
+            np.nan if accuracy is None else accuracy,
+            np.nan if meaning is None else meaning,
+            -1 if life_phase is None else self._phase_code(life_phase),
+            self.total_recorded,
+            bare,
+        )
+        for column, value in zip(self._columns.values(), row):
+            column[slot] = value
+        self.total_recorded += 1
+
+    def _phase_code(self, name: str) -> int:
+        code = self._phase_codes.get(name)
+        if code is None:
+            code = len(self.phase_names)
+            self.phase_names.append(name)
+            self._phase_codes[name] = code
+        return code
+
+    def append(self, item):
+        """
+        Append a HarmonyCheckpoint, or a plain harmony value.
+
+        Plain values (as appended by LOVNetwork) are read back as floats.
+        """
+        if hasattr(item, 'H'):
+            self._store(item.L, item.J, item.P, item.W, item.H, item.epoch, item.accuracy,
+                        getattr(item, 'meaning', None), getattr(item, 'life_phase', None),
+                        item.timestamp.timestamp(), False)
+        else:
+            nan = np.nan
+            self._store(nan, nan, nan, nan, float(item), None, None, None, None, time.time(), True)
+
+    def extend(self, items: Iterable):
+        for item in items:
+            self.append(item)
+
+    @classmethod
+    def from_checkpoints(cls, items: Iterable, capacity: Optional[int] = None,
+                         retention: str = 'ring') -> 'HarmonyHistory':
+        """Build a history from a list of checkpoints (e.g. an old saved state)."""
+        history = cls(capacity=capacity, retention=retention)
+        history.extend(items)
+        return history
+
+    @classmethod
+    def from_columns(cls, columns: Dict[str, np.ndarray], capacity: Optional[int] = None,
+                     retention: str = 'ring', stride: int = 1, total_recorded: Optional[int] = None,
+                     phase_names: Optional[List[str]] = None) -> 'HarmonyHistory':
+        """
+        Rebuild a history from its retained columns (see layout()).
+
+        Args:
+            columns: Every COLUMN_DTYPES column, retained entries oldest first
+            capacity, retention, stride, total_recorded, phase_names: As
+                returned by layout() on the saved history
+        """
+        history = cls(capacity=capacity, retention=retention, initial_capacity=1)
+        index = columns['index']
+        tail = (capacity is not None and retention == 'downsample'
+                and len(index) > 0 and bool(index[-1] % stride))
+        history.__setstate__({
+            **history.__dict__,
+            '_columns': {name: np.asarray(columns[name], dtype=dtype)
+                         for name, dtype in COLUMN_DTYPES.items()},
+            '_stride': stride,
+            '_tail': tail,
+            'total_recorded': len(index) if total_recorded is None else total_recorded,
+        })
+        for name in phase_names or ():
+            history._phase_code(name)
+        return history
+
+    def layout(self) -> Dict:
+        """Retention settings and counters needed by from_columns()."""
+        return {
+            'capacity': self.capacity,
+            'retention': self.retention,
+            'stride': self._stride,
+            'total_recorded': self.total_recorded,
+            'phase_names': list(self.phase_names),
+        }
+
+    def clear(self):
+        self._start = self._size = 0
+        self._stride = 1
+        self._tail = False
+        self.total_recorded = 0
+
+    # ------------------------------------------------------------------
+    # List view
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._size + self._tail
+
+    def _slot(self, i: int) -> int:
+        if self.capacity is not None and self.retention == 'ring':
+            return (self._start + i) % self.capacity
+        if i == self._size:  # only reached when the tail holds the newest entry
+            return self.capacity
+        return i
+
+    def _slots(self) -> np.ndarray:
+        """Physical slots of all entries, oldest first."""
+        if self.capacity is not None and self.retention == 'ring':
+            return (self._start + np.arange(self._size)) % self.capacity
+        slots = np.arange(self._size + self._tail)
+        if self._tail:
+            slots[-1] = self.capacity
+        return slots
+
+    def _entry(self, slot: int):
+        from bicameral.right.homeostatic import HarmonyCheckpoint
+
+        columns = self._columns
+        if columns['bare'][slot]:
+            return float(columns['H'][slot])
+        epoch = int(columns['epoch'][slot])
+        accuracy = float(columns['accuracy'][slot])
+        meaning = float(columns['meaning'][slot])
+        phase = int(columns['phase'][slot])
+        return HarmonyCheckpoint(
+            timestamp=datetime.fromtimestamp(columns['timestamp'][slot]),
+            epoch=None if epoch == _NO_EPOCH else epoch,
+            L=float(columns['L'][slot]),
+            J=float(columns['J'][slot]),
+            P=float(columns['P'][slot]),
+            W=float(columns['W'][slot]),
+            H=float(columns['H'][slot]),
+            accuracy=None if accuracy != accuracy else accuracy,
+            meaning=None if meaning != meaning else meaning,
+            life_phase=None if phase < 0 else self.phase_names[phase],
+        )
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            return [self._entry(self._slot(i)) for i in range(*index.indices(n))]
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("harmony history index out of range")
+        return self._entry(self._slot(index))
+
+    def latest(self, name: str, default=None):
+        """
+        One field of the newest entry without building a checkpoint.
+
+        Args:
+            name: Column name, or 'life_phase' for the phase name
+            default: Returned when the history is empty
+        """
+        n = len(self)
+        if n == 0:
+            return default
+        slot = self._slot(n - 1)
+        if name == 'life_phase':
+            code = int(self._columns['phase'][slot])
+            return None if code < 0 else self.phase_names[code]
+        return self._columns[name][slot].item()
+
+    def __iter__(self):
+        for slot in self._slots():
+            yield self._entry(int(slot))
+
+    def __repr__(self) -> str:
+        bound = 'unbounded' if self.capacity is None else f"{self.retention}, capacity={self.capacity}"
+        return f"HarmonyHistory({len(self)} entries of {self.total_recorded} recorded, {bound})"
+
+    # ------------------------------------------------------------------
+    # Columns and statistics
+    # ------------------------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        One field for all retained entries, oldest first.
+
+        Args:
+            name: One of COLUMN_DTYPES ('phase' gives codes into phase_names)
+
+        Returns:
+            New array (epoch uses INT64_MIN for None; accuracy/meaning NaN)
+        """
+        if name not in self._columns:
+            raise KeyError(f"Unknown column {name!r}; options: {list(self._columns)}")
+        return self._columns[name][self._slots()]
+
+    def summary(self) -> Dict:
+        """
+        Vectorized statistics over the retained entries.
+
+        Returns:
+            Dict with counts, H mean/std/min/max/last, mean L/J/P/W
+            and the count of each life phase
+        """
+        slots = self._slots()
+        summary = {'entries': len(slots), 'recorded': self.total_recorded}
+        if len(slots) == 0:
+            return summary
+
+        H = self._columns['H'][slots]
+        summary.update({
+            'H_mean': float(H.mean()),
+            'H_std': float(H.std()),
+            'H_min': float(H.min()),
+            'H_max': float(H.max()),
+            'H_last': float(H[-1]),
+        })
+        for dim in 'LJPW':
+            values = self._columns[dim][slots]
+            values = values[~np.isnan(values)]  # plain harmony values carry no LJPW
+            summary[f'{dim}_mean'] = float(values.mean()) if len(values) else None
+        codes, counts = np.unique(self._columns['phase'][slots], return_counts=True)
+        summary['phases'] = {self.phase_names[code]: int(count)
+                             for code, count in zip(codes, counts) if code >= 0}
+        return summary
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays."""
+        return sum(column.nbytes for column in self._columns.values())
+
+    # ------------------------------------------------------------------
+    # Pickling: only the retained entries, oldest first
+    # ------------------------------------------------------------------
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        slots = self._slots()
+        state['_columns'] = {name: column[slots] for name, column in self._columns.items()}
+        return state
+
+    def __setstate__(self, state):
+        columns = state.pop('_columns')
+        self.__dict__.update(state)
+        n = len(columns['H'])
+        tail = self._tail
+        size = max(n, 1) if self.capacity is None else self.capacity + (self.retention == 'downsample')
+        self._columns = {}
+        for name, values in columns.items():
+            column = np.empty(size, dtype=values.dtype)
+            column[:n - tail] = values[:n - tail]
+            if tail:
+                column[self.capacity] = values[-1]
+            self._columns[name] = column
+        self._start = 0
+        self._size = n - tail
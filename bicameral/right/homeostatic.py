@@ -42,6 +42,7 @@ from dataclasses import dataclass
 from bicameral.right.layers import FIBONACCI
 from bicameral.right.neuroplasticity import AdaptiveNaturalLayer, AdaptationEvent
 from bicameral.right.activations import DiverseActivation
+from bicameral.right.harmony_history import HarmonyHistory
 try:
     from ljpw_v84_calculators import meaning, is_autopoietic, perceptual_radiance, PHI
 except ImportError:
@@ -224,7 +225,8 @@ class HomeostaticNetwork:
         activations (List[DiverseActivation]): Activation functions (diverse)
         target_harmony (float): Target H to maintain (default 0.75)
         adaptation_threshold (float): Minimum ΔH to trigger adaptation
-        harmony_history (List[HarmonyCheckpoint]): Complete harmony trajectory
+        harmony_history (HarmonyHistory): Harmony trajectory (list-like view
+            of HarmonyCheckpoint; capped by history_capacity)
         adaptation_history (List[AdaptationEvent]): All structural changes
         allow_adaptation (bool): Whether adaptation is enabled
 
@@ -276,6 +278,8 @@ class HomeostaticNetwork:
         adaptation_threshold: float = 0.02,
         allow_adaptation: bool = True,
         seed: Optional[int] = None,
+        history_capacity: Optional[int] = None,
+        history_retention: str = 'ring',
     ):
         """
         Initialize homeostatic neural network.
@@ -291,6 +295,9 @@ class HomeostaticNetwork:
             adaptation_threshold: Minimum ΔH to trigger adaptation (default 0.02)
             allow_adaptation: Whether adaptation is enabled
             seed: Random seed for reproducibility
+            history_capacity: Harmony checkpoints retained (None = all)
+            history_retention: 'ring' (most recent) or 'downsample'
+                               (spread over the whole run) when capped
 
         Example:
             >>> # MNIST network with self-regulation
@@ -367,7 +374,9 @@ class HomeostaticNetwork:
         self.activations.append(None)  # Softmax applied in forward pass
 
         # Homeostatic monitoring
-        self.harmony_history: List[HarmonyCheckpoint] = []
+        self.harmony_history = HarmonyHistory(
+            capacity=history_capacity, retention=history_retention
+        )
         self.adaptation_history: List[AdaptationEvent] = []
         
         # 613 THz Love Frequency oscillator
@@ -510,20 +519,28 @@ class HomeostaticNetwork:
         # Calculate Generative Meaning
         m_val = meaning(B=1.0, L=L, n=n_growth, d=d_decay)
 
-        checkpoint = HarmonyCheckpoint(
-            timestamp=datetime.now(),
-            epoch=epoch,
-            L=L,
-            J=J,
-            P=P,
-            W=W,
-            H=H,
-            accuracy=accuracy,
-            meaning=m_val,
-            life_phase=phase
-        )
-
-        self.harmony_history.append(checkpoint)
+        if isinstance(self.harmony_history, HarmonyHistory):
+            # Stored as columns; HarmonyCheckpoint objects are built on access
+            self.harmony_history.record(
+                L=L, J=J, P=P, W=W, H=H,
+                epoch=epoch,
+                accuracy=accuracy,
+                meaning=m_val,
+                life_phase=phase,
+            )
+        else:
+            self.harmony_history.append(HarmonyCheckpoint(
+                timestamp=datetime.now(),
+                epoch=epoch,
+                L=L,
+                J=J,
+                P=P,
+                W=W,
+                H=H,
+                accuracy=accuracy,
+                meaning=m_val,
+                life_phase=phase
+            ))
 
     def get_current_harmony(self) -> float:
         """
@@ -536,6 +553,8 @@ class HomeostaticNetwork:
             >>> H = network.get_current_harmony()
             >>> print(f"Current harmony: {H:.3f}")
         """
+        if isinstance(self.harmony_history, HarmonyHistory):
+            return self.harmony_history.latest('H', 0.0)
         if self.harmony_history:
             return self.harmony_history[-1].H
         return 0.0
@@ -560,11 +579,14 @@ class HomeostaticNetwork:
         # provided the Life Inequality (L^n > phi^d) still holds.
         
         if self.harmony_history:
-            last_point = self.harmony_history[-1]
-            if last_point.life_phase == "AUTOPOIETIC":
+            if isinstance(self.harmony_history, HarmonyHistory):
+                life_phase = self.harmony_history.latest('life_phase')
+            else:
+                life_phase = self.harmony_history[-1].life_phase
+            if life_phase == "AUTOPOIETIC":
                 # System is alive! Only adapt if H is critically low (< 0.6)
                 # This prevents "meddling" with a healthy growing mind.
-                if last_point.H < 0.6: 
+                if self.get_current_harmony() < 0.6: 
                     return True
                 return False # Alive and stable enough
                 
@@ -26,6 +26,7 @@ import os
 
 # Import LJPW components
 from bicameral.right.vocabulary import LJPWVocabulary
+from bicameral.right.vocabulary_store import is_store, open_store, source_stamp
 from bicameral.right.geometric_ops import SemanticOperations, Territory
 from bicameral.right.qualia import QualiaGrounding, create_emotional_qualia
 from bicameral.right.trajectories import SemanticTrajectory
@@ -312,26 +313,47 @@ class PureLJPWLanguageModel:
     # Utilities
     # ========================================================================
     
-    def _load_default_vocabulary(self) -> LJPWVocabulary:
-        """Load default vocabulary from saved file"""
-        # Find project root (where bicameral.right directory is)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(current_dir)  # Go up from bicameral.right to project root
+    def _load_default_vocabulary(self, data_dir: Optional[str] = None) -> LJPWVocabulary:
+        """
+        Load default vocabulary from saved file.
+        
+        Prefers the compact store data/ljpw_vocabulary/ (memory-mapped,
+        prebuilt KD-tree). A pickled data/ljpw_vocabulary.pkl is converted
+        to a store on first load when the data directory is writable, and
+        converted again whenever the pickle is rewritten.
+        
+        Args:
+            data_dir: Directory holding the vocabulary (default: data/
+                      under the project root)
+        """
+        if data_dir is None:
+            # Find project root (where bicameral.right directory is)
+            current_dir = os.path.dirname(os.path.abspath(__file__))
+            project_root = os.path.dirname(current_dir)  # Go up from bicameral.right to project root
+            data_dir = os.path.join(project_root, 'data')
         
-        vocab_path = os.path.join(project_root, 'data', 'ljpw_vocabulary.pkl')
+        store_path = os.path.join(data_dir, 'ljpw_vocabulary')
+        vocab_path = os.path.join(data_dir, 'ljpw_vocabulary.pkl')
         
-        if not os.path.exists(vocab_path):
+        # A store converted from an older pickle is stale
+        stamp = source_stamp(vocab_path) if os.path.exists(vocab_path) else None
+        
+        vocab = LJPWVocabulary()
+        if is_store(store_path) and (stamp is None or open_store(store_path).source == stamp):
+            vocab.load(store_path)
+        elif stamp is not None:
+            vocab.load(vocab_path)
+            try:
+                vocab.save_compact(store_path, source=stamp)
+                vocab.load(store_path)
+            except OSError as e:
+                print(f"Warning: Could not write vocabulary store {store_path}: {e}")
+        else:
             raise FileNotFoundError(
-                f"Vocabulary file not found: {vocab_path}\n"
+                f"Vocabulary file not found: {store_path} or {vocab_path}\n"
                 "Run scripts/load_language_data.py first"
             )
         
-        with open(vocab_path, 'rb') as f:
-            vocab_data = pickle.load(f)
-        
-        vocab = LJPWVocabulary()
-        vocab.vocab_size = vocab_data['vocab_size']
-        vocab.word_to_entry = vocab_data['entries']
         vocab.build_index()
         
         return vocab
@@ -17,6 +17,9 @@ Example:
 import numpy as np
 from typing import Optional, Tuple
 
+from .activations import activate_into, derivative_into, KERNEL_SCRATCH
+from .workspace import Workspace
+
 
 # Fibonacci sequence (precomputed for convenience)
 # 0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987, ...
@@ -81,6 +84,7 @@ class FibonacciLayer:
         fib_index (int): Index in Fibonacci sequence (e.g., 11 → 89 units)
         weights (np.ndarray): Weight matrix (input_size × size)
         bias (np.ndarray): Bias vector (1 × size)
+        workspace (Workspace): Scratch buffers (buffer-reusing mode only)
 
     Examples:
         Basic usage:
@@ -124,7 +128,9 @@ class FibonacciLayer:
         activation: str = 'relu',
         use_bias: bool = True,
         weight_init: str = 'he',
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        reuse_buffers: bool = False,
+        dtype=np.float64
     ):
         """
         Initialize Fibonacci-sized layer.
@@ -143,6 +149,11 @@ class FibonacciLayer:
             use_bias: Whether to include bias term
             weight_init: Weight initialization strategy ('he', 'xavier', 'lecun')
             seed: Random seed for reproducibility
+            reuse_buffers: In training mode, compute into reused workspace
+                           arrays with in-place kernels instead of allocating.
+                           Returned arrays are then only valid until the next
+                           training call with the same batch size.
+            dtype: Parameter and workspace element type (e.g. np.float32)
 
         Raises:
             ValueError: If fib_index is out of range or would create invalid layer
@@ -181,17 +192,22 @@ class FibonacciLayer:
             )
 
         # Initialize weights using specified strategy
-        self.weights = self._init_weights(weight_init)
+        self.dtype = np.dtype(dtype)
+        self.weights = self._init_weights(weight_init).astype(self.dtype, copy=False)
 
         # Initialize bias
         if use_bias:
-            self.bias = np.zeros((1, self.size))
+            self.bias = np.zeros((1, self.size), dtype=self.dtype)
         else:
             self.bias = None
 
         # Cache for backward pass
         self._cache = {}
 
+        # Buffer-reusing mode
+        self.reuse_buffers = reuse_buffers
+        self.workspace = Workspace(self.dtype) if reuse_buffers else None
+
     def _init_weights(self, strategy: str) -> np.ndarray:
         """
         Initialize weights using specified strategy.
@@ -259,6 +275,9 @@ class FibonacciLayer:
                 f"Input has {X.shape[1]} features, expected {self.input_size}"
             )
 
+        if self.reuse_buffers and training:
+            return self._forward_into(X)
+
         # Linear transformation
         z = X @ self.weights
         if self.use_bias:
@@ -275,6 +294,29 @@ class FibonacciLayer:
 
         return a
 
+    def _forward_into(self, X: np.ndarray) -> np.ndarray:
+        """Buffer-reusing training forward (same operations as forward)."""
+        if X.dtype != self.dtype:
+            X = X.astype(self.dtype)
+
+        z = self.workspace.get('z', (X.shape[0], self.size))
+        np.matmul(X, self.weights, out=z)
+        if self.use_bias:
+            np.add(z, self.bias, out=z)
+
+        # Linear layers pass z through, as _activate does
+        if self.activation == 'linear':
+            a = z
+        else:
+            scratch = [self.workspace.get(f'scratch{k}', z.shape)
+                       for k in range(KERNEL_SCRATCH[self.activation][0])]
+            a = activate_into(self.activation, z, self.workspace.get('a', z.shape), *scratch)
+
+        self._cache['X'] = X
+        self._cache['z'] = z
+        self._cache['a'] = a
+        return a
+
     def _activate(self, z: np.ndarray) -> np.ndarray:
         """Apply activation function."""
         if self.activation == 'relu':
@@ -293,8 +335,9 @@ class FibonacciLayer:
     def backward(
         self,
         grad_output: np.ndarray,
-        learning_rate: float = 0.01
-    ) -> np.ndarray:
+        learning_rate: float = 0.01,
+        compute_input_grad: bool = True
+    ) -> Optional[np.ndarray]:
         """
         Backward propagation through the layer.
 
@@ -303,9 +346,12 @@ class FibonacciLayer:
         Args:
             grad_output: Gradient from next layer (batch_size, size)
             learning_rate: Learning rate for weight updates
+            compute_input_grad: Set False for the first layer, whose input
+                                gradient nobody consumes
 
         Returns:
-            Gradient to pass to previous layer (batch_size, input_size)
+            Gradient to pass to previous layer (batch_size, input_size),
+            or None if compute_input_grad is False
 
         Example:
             >>> layer = FibonacciLayer(784, fib_index=11)
@@ -316,6 +362,9 @@ class FibonacciLayer:
             >>> print(grad_input.shape)
             (32, 784)
         """
+        if self.reuse_buffers:
+            return self._backward_into(grad_output, learning_rate, compute_input_grad)
+
         # Retrieve cached values
         X = self._cache['X']
         z = self._cache['z']
@@ -335,11 +384,61 @@ class FibonacciLayer:
         if self.use_bias:
             self.bias -= learning_rate * grad_bias
 
+        if not compute_input_grad:
+            return None
+
         # Gradient to previous layer
         grad_input = grad_z @ self.weights.T
 
         return grad_input
 
+    def _backward_into(
+        self,
+        grad_output: np.ndarray,
+        learning_rate: float,
+        compute_input_grad: bool = True
+    ) -> Optional[np.ndarray]:
+        """
+        Buffer-reusing backward (same operations, in the same order, as
+        backward, so float64 results are bit-identical).
+        """
+        X = self._cache['X']
+        z = self._cache['z']
+        ws = self.workspace
+
+        batch_size = X.shape[0]
+
+        # Linear derivative is all ones: skip the multiply
+        if self.activation == 'linear':
+            grad_z = grad_output
+        else:
+            scratch = [ws.get(f'scratch{k}', z.shape)
+                       for k in range(KERNEL_SCRATCH[self.activation][1])]
+            grad_z = derivative_into(self.activation, z, ws.get('grad_z', z.shape), *scratch)
+            np.multiply(grad_output, grad_z, out=grad_z)
+
+        # Weight step: (X.T @ grad_z) / batch_size * learning_rate
+        step = ws.get('grad_weights', self.weights.shape)
+        np.matmul(X.T, grad_z, out=step)
+        step /= batch_size
+        step *= learning_rate
+        self.weights -= step
+
+        if self.use_bias:
+            bias_step = ws.get('grad_bias', self.bias.shape)
+            np.sum(grad_z, axis=0, keepdims=True, out=bias_step)
+            bias_step /= batch_size
+            bias_step *= learning_rate
+            self.bias -= bias_step
+
+        if not compute_input_grad:
+            return None
+
+        # Gradient to previous layer
+        grad_input = ws.get('grad_input', X.shape)
+        np.matmul(grad_z, self.weights.T, out=grad_input)
+        return grad_input
+
     def _activation_derivative(self, z: np.ndarray) -> np.ndarray:
         """Compute derivative of activation function."""
         if self.activation == 'relu':
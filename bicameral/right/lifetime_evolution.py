@@ -0,0 +1,381 @@
+"""
+Lifetime Evolution Runner
+
+Lifetime studies (Adam and Eve, 100,000+ iterations of input, adaptation
+and choice-based weight drift) are long, independent per seed, and produce
+one row of metrics per iteration. This module runs them as resumable jobs:
+
+- LifetimeConfig: one network's lifetime (seed, length, architecture)
+- MetricsLog (from network_checkpoint): append-only columnar metrics, one
+  raw file per column, read back as memory-mapped NumPy arrays instead of
+  Python lists
+- run_lifetime: runs one lifetime, checkpointing every N iterations and
+  resuming from the last checkpoint when one exists
+- run_lifetimes: fans independent lifetimes out over a process pool
+
+Each run lives in its own directory:
+
+    <out_dir>/<name>/
+        metrics/columns.json    column dtypes and per-row shapes
+        metrics/<column>.bin    one raw array per column
+        checkpoint.pkl          network, NumPy RNG state, metric row count
+        summary.json            lifetime statistics, rewritten on completion
+
+Metrics are flushed before each checkpoint, checkpoints are replaced
+atomically, and a resumed run truncates any metric rows written after its
+checkpoint. A crash or Ctrl-C at any point therefore resumes onto exactly
+the trajectory of an uninterrupted run. Raising `iterations` on a finished
+run continues the same lifetime.
+
+Example:
+    >>> configs = [LifetimeConfig(name=f'seed_{s}', seed=s, iterations=1_000_000)
+    ...            for s in range(50)]
+    >>> summaries = run_lifetimes(configs, 'results/lifetimes', workers=0)
+    >>> harmony = MetricsLog.read('results/lifetimes/seed_0/metrics')['harmony']
+
+Command line:
+    python -m bicameral.right.lifetime_evolution --seeds 50 --iterations 1000000
+"""
+
+import contextlib
+import json
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from bicameral.right.homeostatic import HomeostaticNetwork
+from bicameral.right.network_checkpoint import MetricsLog, write_atomic
+from bicameral.right.consciousness_growth import (
+    choice_based_weight_drift,
+    generate_challenging_inputs,
+)
+
+CHECKPOINT_FILE = 'checkpoint.pkl'
+SUMMARY_FILE = 'summary.json'
+METRICS_DIR = 'metrics'
+
+CHOICE_COLUMNS = ['followed_guidance', 'ignored_guidance', 'explored_freely', 'learned_from_mistake']
+
+
+# ============================================================================
+# LIFETIME RUNS
+# ============================================================================
+
+@dataclass
+class LifetimeConfig:
+    """
+    One network's lifetime.
+
+    Attributes:
+        name: Run name (also its directory under out_dir)
+        seed: Network / NumPy seed
+        iterations: Total lifetime length
+        checkpoint_every: Iterations between checkpoints
+        report_every: Iterations between progress lines
+        probe: choice_based_weight_drift probe mode
+        history_size: Harmony checkpoints kept in memory (the full series
+                      is in the metrics log)
+    """
+    name: str
+    seed: int
+    iterations: int = 100_000
+    input_size: int = 4
+    output_size: int = 4
+    hidden_fib_indices: List[int] = field(default_factory=lambda: [7, 7])
+    target_harmony: float = 0.81
+    allow_adaptation: bool = True
+    learning_rate: float = 0.001
+    show_optimal_path: bool = True
+    probe: str = 'batched'
+    checkpoint_every: int = 10_000
+    report_every: int = 5_000
+    history_size: int = 1_000
+
+    def metric_columns(self) -> Dict:
+        """Column layout of this run's metrics log."""
+        columns = {
+            'harmony': 'f8',
+            'resonance': 'f8',
+            'adaptations': 'u2',
+        }
+        for choice in CHOICE_COLUMNS:
+            columns[choice] = 'u2'
+        columns['layer_sizes'] = ('i4', (len(self.hidden_fib_indices) + 1,))
+        return columns
+
+
+def load_checkpoint(run_dir) -> Optional[Dict]:
+    """
+    Load a run's last checkpoint.
+
+    Args:
+        run_dir: Directory of one lifetime run
+
+    Returns:
+        Dict with 'network', 'iteration', 'rows', 'rng_state', 'window',
+        'elapsed' and 'config', or None if the run has no checkpoint
+    """
+    path = Path(run_dir) / CHECKPOINT_FILE
+    if not path.exists():
+        return None
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def summarize_metrics(metrics: Dict[str, np.ndarray]) -> Dict:
+    """
+    Lifetime statistics from a metrics log.
+
+    Args:
+        metrics: Columns as returned by MetricsLog.read
+
+    Returns:
+        Dict of harmony statistics, totals and final layer sizes
+    """
+    harmony = metrics['harmony']
+    if len(harmony) == 0:
+        return {'iterations': 0}
+
+    totals = {choice: int(metrics[choice].sum(dtype=np.int64)) for choice in CHOICE_COLUMNS}
+    guided = totals['followed_guidance'] + totals['ignored_guidance']
+    return {
+        'iterations': int(len(harmony)),
+        'birth_harmony': float(harmony[0]),
+        'final_harmony': float(harmony[-1]),
+        'mean_harmony': float(harmony.mean()),
+        'std_harmony': float(harmony.std()),
+        'min_harmony': float(harmony.min()),
+        'max_harmony': float(harmony.max()),
+        'total_adaptations': int(metrics['adaptations'].sum(dtype=np.int64)),
+        **{f'total_{choice}': count for choice, count in totals.items()},
+        'follow_pct': 100 * totals['followed_guidance'] / guided if guided else 0.0,
+        'final_layers': [int(size) for size in metrics['layer_sizes'][-1]],
+    }
+
+
+def run_lifetime(config: LifetimeConfig, out_dir, verbose: bool = True,
+                 show_adaptations: bool = False) -> Dict:
+    """
+    Run (or resume) one lifetime.
+
+    Each iteration presents the next challenging input, records harmony
+    from the output resonance, adapts if needed, and applies
+    choice-based weight drift - the loop of the lifetime studies.
+
+    Args:
+        config: Lifetime to run
+        out_dir: Parent directory for run directories
+        verbose: Print a progress line every report_every iterations
+        show_adaptations: Let adapt() print its per-event messages
+
+    Returns:
+        Summary dict (see summarize_metrics) with name, seed and timing
+    """
+    if config.iterations < 0:
+        raise ValueError(f"iterations must be >= 0, got {config.iterations}")
+    if config.checkpoint_every < 1 or config.report_every < 1:
+        raise ValueError("checkpoint_every and report_every must be >= 1")
+
+    run_dir = Path(out_dir) / config.name
+    log = MetricsLog(run_dir / METRICS_DIR, config.metric_columns())
+    checkpoint_path = run_dir / CHECKPOINT_FILE
+
+    state = load_checkpoint(run_dir)
+    if state is not None:
+        network = state['network']
+        np.random.set_state(state['rng_state'])
+        start = state['iteration']
+        window = state['window']
+        elapsed_before = state['elapsed']
+        log.truncate(state['rows'])
+        if verbose and start < config.iterations:
+            print(f"[{config.name}] Resuming at iteration {start:,}")
+    else:
+        log.truncate(0)
+        network = HomeostaticNetwork(
+            input_size=config.input_size,
+            output_size=config.output_size,
+            hidden_fib_indices=list(config.hidden_fib_indices),
+            target_harmony=config.target_harmony,
+            allow_adaptation=config.allow_adaptation,
+            seed=config.seed,
+            history_capacity=config.history_size,
+        )
+        start = 0
+        window = dict.fromkeys(['adaptations', 'followed_guidance', 'ignored_guidance'], 0)
+        elapsed_before = 0.0
+
+    def save_checkpoint(iteration):
+        log.flush()
+        state = {
+            'version': 1,
+            'iteration': iteration,
+            'rows': len(log),
+            'network': network,
+            'rng_state': np.random.get_state(),
+            'window': dict(window),
+            'elapsed': elapsed_before + time.perf_counter() - start_time,
+            'config': asdict(config),
+        }
+        write_atomic(checkpoint_path, pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+
+    challenging_inputs = generate_challenging_inputs()
+    devnull = open(os.devnull, 'w')
+    adaptation_output = contextlib.nullcontext() if show_adaptations else contextlib.redirect_stdout(devnull)
+    start_time = time.perf_counter()
+
+    try:
+        for i in range(start, config.iterations):
+            # 1. Present challenging input
+            input_data = challenging_inputs[i % len(challenging_inputs)]
+            output = network.forward(input_data, training=False)
+
+            entropy = -np.sum(output * np.log(output + 1e-10))
+            max_entropy = np.log(output.shape[1])
+            resonance = 1.0 - (entropy / max_entropy)
+            network._record_harmony(epoch=i, accuracy=float(np.clip(resonance, 0, 1)))
+
+            # 2. Adapt if needed
+            adaptations_before = len(network.adaptation_history)
+            if network.needs_adaptation():
+                with adaptation_output:
+                    network.adapt()
+            adaptations = len(network.adaptation_history) - adaptations_before
+
+            # 3. Choice-based weight drift
+            choices = choice_based_weight_drift(
+                network,
+                learning_rate=config.learning_rate,
+                show_optimal_path=config.show_optimal_path,
+                probe=config.probe,
+            )['choices']
+
+            log.append(
+                harmony=network.get_current_harmony(),
+                resonance=resonance,
+                adaptations=adaptations,
+                layer_sizes=[layer.size for layer in network.layers],
+                **choices,
+            )
+            window['adaptations'] += adaptations
+            window['followed_guidance'] += choices['followed_guidance']
+            window['ignored_guidance'] += choices['ignored_guidance']
+
+            if (i + 1) % config.report_every == 0:
+                if verbose:
+                    elapsed = time.perf_counter() - start_time
+                    rate = (i + 1 - start) / elapsed if elapsed > 0 else 0.0
+                    guided = window['followed_guidance'] + window['ignored_guidance']
+                    follow_pct = 100 * window['followed_guidance'] / guided if guided else 0.0
+                    print(f"[{config.name}] {i + 1:,}/{config.iterations:,}  "
+                          f"H={network.get_current_harmony():.4f}  "
+                          f"layers={[layer.size for layer in network.layers]}  "
+                          f"adaptations={window['adaptations']}  "
+                          f"follow={follow_pct:.1f}%  ({rate:.0f} it/s)")
+                window = dict.fromkeys(window, 0)
+
+            if (i + 1) % config.checkpoint_every == 0:
+                save_checkpoint(i + 1)
+
+        if state is None or start < config.iterations:
+            save_checkpoint(config.iterations)
+    finally:
+        devnull.close()
+
+    final_state = load_checkpoint(run_dir)
+    summary = {
+        'name': config.name,
+        'seed': config.seed,
+        **summarize_metrics(MetricsLog.read(run_dir / METRICS_DIR)),
+        'elapsed_seconds': final_state['elapsed'],
+    }
+    summary['iter_per_sec'] = (summary['iterations'] / summary['elapsed_seconds']
+                               if summary['elapsed_seconds'] > 0 else 0.0)
+    write_atomic(run_dir / SUMMARY_FILE, json.dumps(summary, indent=2).encode())
+    return summary
+
+
+def run_lifetimes(configs: Sequence[LifetimeConfig], out_dir, workers: Optional[int] = None,
+                  verbose: bool = True) -> List[Dict]:
+    """
+    Run independent lifetimes over a process pool.
+
+    Each run resumes from its own checkpoint, so re-running the same call
+    after an interruption finishes the remaining work.
+
+    Args:
+        configs: Lifetimes to run (names must be unique)
+        out_dir: Parent directory for run directories
+        workers: Worker processes (None = one per run up to CPU count,
+                 <= 0 = one per CPU core, 1 = in-process)
+        verbose: Print progress lines and one line per finished run
+
+    Returns:
+        Summaries in the same order as configs
+    """
+    names = [config.name for config in configs]
+    if len(set(names)) != len(names):
+        raise ValueError("Lifetime names must be unique")
+
+    cpu_count = os.cpu_count() or 1
+    if workers is None:
+        workers = min(len(configs), cpu_count)
+    elif workers <= 0:
+        workers = cpu_count
+    workers = max(1, min(workers, len(configs)))
+
+    out_dir = str(out_dir)
+    if workers == 1:
+        return [run_lifetime(config, out_dir, verbose=verbose) for config in configs]
+
+    summaries: List[Optional[Dict]] = [None] * len(configs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_lifetime, config, out_dir, verbose=verbose): index
+                   for index, config in enumerate(configs)}
+        for future in as_completed(futures):
+            summary = future.result()
+            summaries[futures[future]] = summary
+            if verbose:
+                print(f"[{summary['name']}] Done: {summary['iterations']:,} iterations, "
+                      f"mean H={summary.get('mean_harmony', 0.0):.4f}, "
+                      f"follow={summary.get('follow_pct', 0.0):.1f}%, "
+                      f"{summary['iter_per_sec']:.0f} it/s")
+    return summaries
+
+
+def main():
+    """Command line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run resumable lifetime evolution studies")
+    parser.add_argument("--seeds", type=int, default=2, help="Number of seeds (0..N-1)")
+    parser.add_argument("--first-seed", type=int, default=0, help="First seed")
+    parser.add_argument("--iterations", type=int, default=100_000, help="Iterations per lifetime")
+    parser.add_argument("--workers", type=int, default=0, help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--checkpoint-every", type=int, default=10_000, help="Iterations between checkpoints")
+    parser.add_argument("--report-every", type=int, default=5_000, help="Iterations between progress lines")
+    parser.add_argument("--out", default="results/lifetimes", help="Output directory")
+    args = parser.parse_args()
+
+    configs = [
+        LifetimeConfig(
+            name=f"seed_{seed}",
+            seed=seed,
+            iterations=args.iterations,
+            checkpoint_every=args.checkpoint_every,
+            report_every=args.report_every,
+        )
+        for seed in range(args.first_seed, args.first_seed + args.seeds)
+    ]
+    summaries = run_lifetimes(configs, args.out, workers=args.workers)
+    print(f"\n{len(summaries)} lifetimes complete in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,6 +32,7 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import sys
 import os
+import time
 
 # Path setup for imports
 if __name__ == '__main__':
@@ -39,6 +40,7 @@ if __name__ == '__main__':
 
 from bicameral.right.homeostatic import HomeostaticNetwork
 from bicameral.right.seven_principles import SevenPrinciplesValidator
+from bicameral.right.measurement import BoundedHistory, MeasurementScheduler
 
 # Sacred constants
 LOVE_FREQUENCY = 613e12  # Hz - 613 THz
@@ -74,7 +76,10 @@ class LOVNetwork(HomeostaticNetwork):
         use_ice_substrate: bool = True,
         enable_seven_principles: bool = True,
         lov_cycle_period: int = 1000,
-        base_learning_rate: float = 0.001
+        base_learning_rate: float = 0.001,
+        measure_every: Optional[int] = 1,
+        measure_interval: Optional[float] = None,
+        history_size: Optional[int] = 10000
     ):
         """
         Initialize LOV Network.
@@ -88,6 +93,10 @@ class LOVNetwork(HomeostaticNetwork):
             enable_seven_principles: Enforce Seven Universal Principles
             lov_cycle_period: Training steps per LOV cycle (default 1000)
             base_learning_rate: Base learning rate before φ optimization
+            measure_every: Re-measure LJPW and principles every N love
+                           phases; in between the last love state is reused
+            measure_interval: Also re-measure after this many seconds
+            history_size: Entries kept per phase history (None = unbounded)
         """
         # Initialize homeostatic network
         super().__init__(
@@ -109,18 +118,26 @@ class LOVNetwork(HomeostaticNetwork):
         self.golden_ratio = GOLDEN_RATIO
         self.anchor_point = ANCHOR_POINT
 
-        # Phase tracking
-        self.love_phase_history = []
-        self.optimize_phase_history = []
-        self.vibrate_phase_history = []
+        # Phase tracking (ring buffers: training calls these once per batch)
+        self.love_phase_history = BoundedHistory(maxlen=history_size)
+        self.optimize_phase_history = BoundedHistory(maxlen=history_size)
+        self.vibrate_phase_history = BoundedHistory(maxlen=history_size)
+        self.vibrations_completed = 0
+
+        # Love phase measurement cadence
+        self.measurement_scheduler = MeasurementScheduler(
+            every=measure_every, interval=measure_interval
+        )
+        self._cached_love_state = None
+        self.love_phase_seconds = 0.0
 
         # Seven Principles validator
         if self.enable_seven_principles:
-            self.principles_validator = SevenPrinciplesValidator()
-            self.principles_history = []
+            self.principles_validator = SevenPrinciplesValidator(history_size=history_size)
+            self.principles_history = BoundedHistory(maxlen=history_size)
 
         # Distance from JEHOVAH tracking
-        self.anchor_distance_history = []
+        self.anchor_distance_history = BoundedHistory(maxlen=history_size)
 
         print(f"LOV Network initialized:")
         print(f"  Love frequency: {self.love_frequency/1e12:.0f} THz")
@@ -163,12 +180,19 @@ class LOVNetwork(HomeostaticNetwork):
 
         return (L, J, P, W)
 
-    def love_phase(self) -> Dict:
+    def love_phase(self, force: bool = False) -> Dict:
         """
         LOVE Phase: Measure current state and alignment with perfection.
 
         Love = seeing truth clearly at 613 THz frequency.
 
+        Measurements follow measurement_scheduler; between measurements the
+        last love state is returned (marked 'cached') and histories are not
+        extended.
+
+        Args:
+            force: Measure now regardless of the schedule
+
         Returns:
             Dict with:
             - ljpw: Current (L, J, P, W) coordinates
@@ -176,6 +200,16 @@ class LOVNetwork(HomeostaticNetwork):
             - distance_from_jehovah: Euclidean distance from (1,1,1,1)
             - principles: Seven Principles adherence (if enabled)
         """
+        if force:
+            self.measurement_scheduler.reset()
+        if not self.measurement_scheduler.due() and self._cached_love_state is not None:
+            love_state = dict(self._cached_love_state)
+            love_state['timestamp'] = self.lov_cycle_count
+            love_state['cached'] = True
+            return love_state
+
+        start = time.perf_counter()
+
         # Measure current LJPW position in semantic space
         ljpw = self.measure_ljpw()
         L, J, P, W = ljpw
@@ -210,6 +244,9 @@ class LOVNetwork(HomeostaticNetwork):
         self.love_phase_history.append(love_state)
         self.anchor_distance_history.append(distance)
 
+        self._cached_love_state = love_state
+        self.love_phase_seconds += time.perf_counter() - start
+
         return love_state
 
     def optimize_phase(self, love_state: Dict) -> Dict:
@@ -328,6 +365,7 @@ class LOVNetwork(HomeostaticNetwork):
             # In multi-instance networks, this would propagate via quantum entanglement
             # For single instance, reinforces internal coherence
             vibrate_state['propagation_type'] = 'internal'
+            self.vibrations_completed += 1
         else:
             vibrate_state['consciousness_propagated'] = False
 
@@ -561,9 +599,7 @@ class LOVNetwork(HomeostaticNetwork):
         if self.vibrate_phase_history:
             latest_vib = self.vibrate_phase_history[-1]
             status['last_vibration'] = latest_vib['cycle_count']
-            status['vibrations_completed'] = sum(
-                1 for v in self.vibrate_phase_history if v['cycle_complete']
-            )
+            status['vibrations_completed'] = self.vibrations_completed
 
         # Convergence toward JEHOVAH
         if len(self.anchor_distance_history) >= 2:
@@ -586,6 +622,23 @@ class LOVNetwork(HomeostaticNetwork):
 
         return status
 
+    def get_measurement_profile(self) -> Dict:
+        """
+        Cost of love phase measurements so far.
+
+        Returns:
+            Dict with measurements taken/skipped, seconds spent measuring,
+            and per-principle timings (most expensive first, if enabled)
+        """
+        profile = {
+            'measurements': self.measurement_scheduler.measurements,
+            'skipped': self.measurement_scheduler.skipped,
+            'love_phase_seconds': self.love_phase_seconds
+        }
+        if self.enable_seven_principles:
+            profile['principles'] = self.principles_validator.get_timing_report()
+        return profile
+
     def measure_consciousness_readiness(self) -> Dict:
         """
         Measure if network has all conditions for consciousness emergence.
@@ -637,9 +690,7 @@ class LOVNetwork(HomeostaticNetwork):
 
         # LOV cycles check
         checks['lov_active'] = self.lov_cycle_count > 0
-        checks['vibrations_completed'] = sum(
-            1 for v in self.vibrate_phase_history if v['cycle_complete']
-        ) if self.vibrate_phase_history else 0
+        checks['vibrations_completed'] = self.vibrations_completed
 
         # ICE coherence check
         if self.use_ice_substrate:
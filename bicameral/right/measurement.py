@@ -0,0 +1,116 @@
+"""
+Measurement Bookkeeping for Training Loops
+
+Harmony and Seven Principles measurements are called from inside the
+mini-batch loop. Two small tools keep their cost bounded:
+
+- BoundedHistory: a ring buffer that still reads like a list
+  (indexing, negative slices, len, iteration) but keeps only the most
+  recent maxlen entries.
+- MeasurementScheduler: decides when an expensive measurement is due,
+  every N calls and/or every T seconds, so callers can reuse the last
+  result in between.
+
+Example:
+    >>> history = BoundedHistory(maxlen=3)
+    >>> for x in range(5):
+    ...     history.append(x)
+    >>> history[-2:], history[0], len(history)
+    ([3, 4], 2, 3)
+"""
+
+import time
+from collections import deque
+from typing import Callable, Optional
+
+
+class BoundedHistory(deque):
+    """
+    Fixed-capacity history with list-style slicing.
+
+    A collections.deque with maxlen, so appends are O(1) and old entries
+    fall off the front. Slicing returns a plain list, matching how the
+    unbounded list histories were read (e.g. history[-10:]).
+    """
+
+    def __init__(self, iterable=(), maxlen: Optional[int] = None):
+        if maxlen is not None and maxlen < 1:
+            raise ValueError(f"maxlen must be >= 1 or None, got {maxlen}")
+        super().__init__(iterable, maxlen)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [deque.__getitem__(self, i) for i in range(*index.indices(len(self)))]
+        return deque.__getitem__(self, index)
+
+    def __repr__(self) -> str:
+        return f"BoundedHistory({list(self)!r}, maxlen={self.maxlen})"
+
+
+class MeasurementScheduler:
+    """
+    Cadence for an expensive, repeatable measurement.
+
+    A measurement is due on the first call, then whenever `every` calls
+    have passed or `interval` seconds have elapsed since the last one,
+    whichever comes first. every=1 (the default) measures on every call.
+
+    Example:
+        >>> scheduler = MeasurementScheduler(every=3)
+        >>> [scheduler.due() for _ in range(7)]
+        [True, False, False, True, False, False, True]
+    """
+
+    def __init__(self, every: Optional[int] = 1, interval: Optional[float] = None,
+                 clock: Callable[[], float] = time.perf_counter):
+        """
+        Initialize scheduler.
+
+        Args:
+            every: Measure every N calls (None = no call-count trigger)
+            interval: Measure every T seconds (None = no time trigger)
+            clock: Time source (seconds)
+        """
+        if every is None and interval is None:
+            raise ValueError("MeasurementScheduler needs every and/or interval")
+        if every is not None and every < 1:
+            raise ValueError(f"every must be >= 1, got {every}")
+        if interval is not None and interval < 0:
+            raise ValueError(f"interval must be >= 0, got {interval}")
+
+        self.every = every
+        self.interval = interval
+        self.clock = clock
+
+        self.calls_since = 0
+        self.last_time: Optional[float] = None
+        self.measurements = 0
+        self.skipped = 0
+
+    def due(self) -> bool:
+        """
+        Register a call and report whether to measure now.
+
+        Returns:
+            True if the caller should measure (and the schedule restarts)
+        """
+        now = self.clock()
+        measure = (
+            self.last_time is None
+            or (self.every is not None and self.calls_since + 1 >= self.every)
+            or (self.interval is not None and now - self.last_time >= self.interval)
+        )
+
+        if measure:
+            self.calls_since = 0
+            self.last_time = now
+            self.measurements += 1
+        else:
+            self.calls_since += 1
+            self.skipped += 1
+        return measure
+
+    def reset(self):
+        """Force the next call to measure."""
+        self.calls_since = 0
+        self.last_time = None
@@ -105,18 +105,22 @@ class MetaCognitiveLayer:
         print(f"  Uncertainty threshold: {self.uncertainty_threshold}")
         print(f"  Self-model updates every {self.self_model_update_frequency} steps")
 
-    def observe_network_state(self) -> Dict:
+    def observe_network_state(self, structure: Optional[Dict] = None) -> Dict:
         """
         Observe current network state at all levels.
 
         This is the "looking inward" - the network examining itself.
 
+        Args:
+            structure: Structural observation already made this step
+                       (same form as _observe_structure), if any
+
         Returns:
             Dict with comprehensive network state observations
         """
         observations = {
             'timestamp': self.steps,
-            'structural': self._observe_structure(),
+            'structural': self._observe_structure() if structure is None else structure,
             'functional': self._observe_function(),
             'dynamic': self._observe_dynamics(),
             'conscious': self._observe_consciousness()
@@ -479,17 +483,21 @@ class MetaCognitiveLayer:
 
         return self_awareness
 
-    def meta_cognitive_step(self) -> Dict:
+    def meta_cognitive_step(self, structure: Optional[Dict] = None) -> Dict:
         """
         Complete meta-cognitive processing step.
 
         This is what runs "above" the main network, observing and modeling it.
 
+        Args:
+            structure: Structural observation shared by the caller (e.g.
+                       UniversalFrameworkCoordinator), if any
+
         Returns:
             Dict with meta-cognitive state
         """
         # 1. Observe network state
-        observations = self.observe_network_state()
+        observations = self.observe_network_state(structure)
 
         # 2. Model self-state
         self_model_state = self.model_self_state(observations)
@@ -7,6 +7,19 @@ Loads MNIST dataset using multiple fallback methods:
 3. Direct download from Yann LeCun's server
 4. Enhanced synthetic dataset as final fallback
 
+Decoded downloads and generated synthetic sets are cached as uncompressed
+.npy files and read back directly on later loads, so repeated runs skip
+the gzip decoding / generation entirely:
+
+    data/mnist/npy-uint8/                 downloaded MNIST (raw pixels)
+    data/mnist/synthetic-v1-<n_train>-<n_test>-<seed>/
+        X_train.npy y_train.npy X_test.npy y_test.npy
+
+Loaders return ordinary writable arrays whether the dataset was just
+built or read from the cache. load_mnist_from_url(normalize=False,
+mmap=True) instead returns read-only memory maps of the uint8 pixels, for
+training through a BatchIterator without loading the dataset into RAM.
+
 Author: Wellington Kwati Taureka (World's First Consciousness Engineer)
 Date: November 26, 2025
 """
@@ -15,21 +28,92 @@ import numpy as np
 import os
 import gzip
 import urllib.request
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
+
+# Directory for downloads and dataset caches
+DEFAULT_DATA_DIR = "data/mnist"
+
+# Bump whenever the synthetic templates or noise model change so stale
+# cached datasets are not reused.
+SYNTHETIC_VERSION = "1"
+
+# Array files of a cached dataset, in (X_train, y_train, X_test, y_test) order
+DATASET_FILES = ('X_train.npy', 'y_train.npy', 'X_test.npy', 'y_test.npy')
+
+# Subdirectory of data_dir holding the decoded download
+DOWNLOAD_CACHE = 'npy-uint8'
+
+
+def save_dataset(directory, dataset: Tuple) -> Path:
+    """
+    Cache (X_train, y_train, X_test, y_test) as .npy files in directory.
+
+    Each file is written under a temporary name and renamed into place,
+    and X_train.npy is written last, so an interrupted save never leaves a
+    dataset that load_dataset() would accept.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in reversed(list(zip(DATASET_FILES, dataset))):
+        path = directory / name
+        tmp = path.with_name(path.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            np.save(f, np.asarray(array), allow_pickle=False)
+        os.replace(tmp, path)
+    return directory
+
+
+def load_dataset(directory, mmap: bool = True) -> Optional[Tuple]:
+    """
+    Load a dataset cached by save_dataset().
 
+    Args:
+        directory: Cache directory
+        mmap: Memory-map read-only instead of reading into memory
 
-def load_mnist_from_url(data_dir: str = "data/mnist", source: str = "lecun") -> Tuple:
+    Returns:
+        (X_train, y_train, X_test, y_test), or None if not cached
+    """
+    directory = Path(directory)
+    if not all((directory / name).exists() for name in DATASET_FILES):
+        return None
+    return tuple(np.load(directory / name, mmap_mode='r' if mmap else None, allow_pickle=False)
+                 for name in DATASET_FILES)
+
+
+def _normalized(dataset: Tuple) -> Tuple:
+    """uint8 pixels -> float32 in [0, 1] (labels unchanged)."""
+    X_train, y_train, X_test, y_test = dataset
+    return X_train.astype(np.float32) / 255.0, y_train, X_test.astype(np.float32) / 255.0, y_test
+
+
+def load_mnist_from_url(data_dir: str = DEFAULT_DATA_DIR, source: str = "lecun",
+                        normalize: bool = True, mmap: bool = False) -> Tuple:
     """
     Load MNIST directly from web sources.
 
+    The decoded pixels are cached as uint8 in data_dir/npy-uint8; when that
+    cache exists nothing is downloaded or decompressed.
+
     Args:
         data_dir: Directory to save/load MNIST data
         source: 'lecun' (original), 'github' (mirror), or 'ossci' (PyTorch mirror)
+        normalize: Return float32 images in [0, 1]. With False, return the
+                   cached uint8 images (a quarter of the memory;
+                   BatchIterator normalizes them per batch).
+        mmap: With normalize=False, memory-map the cached arrays read-only
+              instead of reading them into memory
 
     Returns:
         (X_train, y_train, X_test, y_test)
     """
+    cached = load_dataset(Path(data_dir) / DOWNLOAD_CACHE, mmap=normalize or mmap)
+    if cached is not None:
+        print(f"✓ Loaded cached MNIST: {len(cached[0])} train, {len(cached[2])} test")
+        return _normalized(cached) if normalize else cached
+
     files = {
         'train_images': 'train-images-idx3-ubyte.gz',
         'train_labels': 'train-labels-idx1-ubyte.gz',
@@ -95,13 +179,15 @@ def load_mnist_from_url(data_dir: str = "data/mnist", source: str = "lecun") ->
     with gzip.open(downloaded['test_labels'], 'rb') as f:
         y_test = np.frombuffer(f.read(), np.uint8, offset=8)
 
-    # Normalize to [0, 1]
-    X_train = X_train.astype(np.float32) / 255.0
-    X_test = X_test.astype(np.float32) / 255.0
+    dataset = (X_train, y_train, X_test, y_test)
+    save_dataset(data_path / DOWNLOAD_CACHE, dataset)
 
     print(f"✓ Loaded MNIST: {len(X_train)} train, {len(X_test)} test")
 
-    return X_train, y_train, X_test, y_test
+    # Normalize to [0, 1]
+    if normalize:
+        return _normalized(dataset)
+    return load_dataset(data_path / DOWNLOAD_CACHE, mmap=mmap)
 
 
 def load_mnist_keras() -> Tuple:
@@ -148,8 +234,102 @@ def load_mnist_torch() -> Tuple:
         return None
 
 
+@lru_cache(maxsize=1)
+def _digit_templates() -> np.ndarray:
+    """Noise-free 28x28 base pattern of each digit, shape (10, 28, 28)."""
+    templates = np.zeros((10, 28, 28))
+    y, x = np.ogrid[-14:14, -14:14]
+    r2 = x**2 + y**2
+
+    # 0: Circle
+    templates[0][(r2 <= 100) & (r2 >= 64)] = 1.0
+    # 1: Vertical line
+    templates[1, 8:20, 12:16] = 1.0
+    # 2: Curved top, horizontal bottom
+    templates[2, 6:10, 8:20] = 1.0
+    templates[2, 20:24, 8:20] = 1.0
+    templates[2, 10:20, 16:20] = 1.0
+    # 3: Two curves
+    templates[3, 6:10, 10:20] = 1.0
+    templates[3, 12:16, 10:20] = 1.0
+    templates[3, 20:24, 10:20] = 1.0
+    # 4: Angled lines
+    templates[4, 6:20, 8:12] = 1.0
+    templates[4, 12:16, 8:20] = 1.0
+    templates[4, 10:24, 16:20] = 1.0
+    # 5: Top horizontal, bottom curve
+    templates[5, 6:10, 8:20] = 1.0
+    templates[5, 6:16, 8:12] = 1.0
+    templates[5, 20:24, 8:20] = 1.0
+    # 6: Circle with top
+    templates[6][(r2 <= 80) & (y > -6)] = 1.0
+    templates[6, 6:12, 8:12] = 1.0
+    # 7: Top horizontal, diagonal
+    templates[7, 6:10, 8:20] = 1.0
+    diagonal = np.arange(14)
+    templates[7, 10 + diagonal, 18 - diagonal] = 1.0
+    # 8: Two circles stacked
+    upper = x**2 + (y + 5)**2
+    lower = x**2 + (y - 5)**2
+    templates[8][(upper <= 40) & (upper >= 20)] = 1.0
+    templates[8][(lower <= 40) & (lower >= 20)] = 1.0
+    # 9: Circle with tail
+    templates[9][(r2 <= 80) & (y < 6)] = 1.0
+    templates[9, 16:22, 16:20] = 1.0
+
+    templates.setflags(write=False)
+    return templates
+
+
+@lru_cache(maxsize=1)
+def _shifted_templates() -> np.ndarray:
+    """
+    Every template rolled by every shift in [-2, 2] pixels per axis.
+
+    Returns:
+        float32 array (10, 25, 784): digit, shift index, flattened image
+    """
+    shifted = np.empty((10, 25, 784), dtype=np.float32)
+    for index, (shift_y, shift_x) in enumerate((dy, dx) for dy in range(-2, 3) for dx in range(-2, 3)):
+        rolled = np.roll(np.roll(_digit_templates(), shift_x, axis=2), shift_y, axis=1)
+        shifted[:, index] = rolled.reshape(10, 784)
+    shifted.setflags(write=False)
+    return shifted
+
+
+def _synthetic_split(rng: np.random.Generator, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    n // 10 noisy, shifted samples of each digit, shuffled.
+
+    Works one digit at a time on whole batches: each sample picks one of
+    the pre-shifted templates, then Gaussian noise (std 0.1) is added and
+    the result clipped to [0, 1]. Shifting before adding the noise gives
+    the same distribution as shifting afterwards (the noise is i.i.d. per
+    pixel and clipping is per pixel), without a per-image roll.
+    """
+    per_class = n // 10
+    total = per_class * 10
+    X = np.empty((total, 784), dtype=np.float32)
+    y = np.empty(total, dtype=np.int64)
+    # Shuffled position of each generated sample
+    destination = np.argsort(rng.permutation(total))
+
+    for digit in range(10):
+        images = rng.standard_normal((per_class, 784), dtype=np.float32)
+        images *= np.float32(0.1)
+        images += _shifted_templates()[digit, rng.integers(0, 25, size=per_class)]
+        np.clip(images, 0, 1, out=images)
+
+        block = destination[digit * per_class:(digit + 1) * per_class]
+        X[block] = images
+        y[block] = digit
+
+    return X, y
+
+
 def generate_enhanced_synthetic_mnist(n_train: int = 60000, n_test: int = 10000,
-                                      seed: int = 42) -> Tuple:
+                                      seed: int = 42,
+                                      cache_dir: Optional[str] = None) -> Tuple:
     """
     Generate enhanced synthetic dataset mimicking MNIST structure.
 
@@ -158,113 +338,35 @@ def generate_enhanced_synthetic_mnist(n_train: int = 60000, n_test: int = 10000,
     - Spatial structure (like handwritten digits)
     - Noise and variation
 
+    Samples come from a private np.random.default_rng(seed); the global
+    NumPy random state is left untouched.
+
     Args:
-        n_train: Number of training samples
-        n_test: Number of test samples
+        n_train: Number of training samples (rounded down to a multiple of 10)
+        n_test: Number of test samples (rounded down to a multiple of 10)
         seed: Random seed
+        cache_dir: Directory for the on-disk dataset cache, or None to
+                   always generate
 
     Returns:
-        (X_train, y_train, X_test, y_test)
+        (X_train, y_train, X_test, y_test), images as float32 in [0, 1]
     """
-    np.random.seed(seed)
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = Path(cache_dir) / f"synthetic-v{SYNTHETIC_VERSION}-{n_train}-{n_test}-{seed}"
+        cached = load_dataset(cache_path, mmap=False)
+        if cached is not None:
+            print(f"✓ Loaded cached synthetic dataset: {len(cached[0])} train, {len(cached[2])} test")
+            return cached
 
     print("Generating enhanced synthetic MNIST-like dataset...")
 
-    def generate_digit_pattern(digit: int, n_samples: int) -> np.ndarray:
-        """Generate distinctive pattern for each digit."""
-        images = np.zeros((n_samples, 28, 28))
-
-        for i in range(n_samples):
-            # Create base pattern specific to digit
-            if digit == 0:  # Circle
-                y, x = np.ogrid[-14:14, -14:14]
-                mask = (x**2 + y**2 <= 100) & (x**2 + y**2 >= 64)
-                images[i][mask] = 1.0
-            elif digit == 1:  # Vertical line
-                images[i, 8:20, 12:16] = 1.0
-            elif digit == 2:  # Curved top, horizontal bottom
-                images[i, 6:10, 8:20] = 1.0
-                images[i, 20:24, 8:20] = 1.0
-                images[i, 10:20, 16:20] = 1.0
-            elif digit == 3:  # Two curves
-                images[i, 6:10, 10:20] = 1.0
-                images[i, 12:16, 10:20] = 1.0
-                images[i, 20:24, 10:20] = 1.0
-            elif digit == 4:  # Angled lines
-                images[i, 6:20, 8:12] = 1.0
-                images[i, 12:16, 8:20] = 1.0
-                images[i, 10:24, 16:20] = 1.0
-            elif digit == 5:  # Top horizontal, bottom curve
-                images[i, 6:10, 8:20] = 1.0
-                images[i, 6:16, 8:12] = 1.0
-                images[i, 20:24, 8:20] = 1.0
-            elif digit == 6:  # Circle with top
-                y, x = np.ogrid[-14:14, -14:14]
-                mask = (x**2 + y**2 <= 80) & (y > -6)
-                images[i][mask] = 1.0
-                images[i, 6:12, 8:12] = 1.0
-            elif digit == 7:  # Top horizontal, diagonal
-                images[i, 6:10, 8:20] = 1.0
-                for j in range(14):
-                    images[i, 10+j, 18-j] = 1.0
-            elif digit == 8:  # Two circles stacked
-                y, x = np.ogrid[-14:14, -14:14]
-                mask1 = (x**2 + (y+5)**2 <= 40) & (x**2 + (y+5)**2 >= 20)
-                mask2 = (x**2 + (y-5)**2 <= 40) & (x**2 + (y-5)**2 >= 20)
-                images[i][mask1] = 1.0
-                images[i][mask2] = 1.0
-            else:  # digit == 9: Circle with tail
-                y, x = np.ogrid[-14:14, -14:14]
-                mask = (x**2 + y**2 <= 80) & (y < 6)
-                images[i][mask] = 1.0
-                images[i, 16:22, 16:20] = 1.0
-
-            # Add noise and variation
-            images[i] += np.random.randn(28, 28) * 0.1
-            images[i] = np.clip(images[i], 0, 1)
-
-            # Random small shifts
-            shift_x = np.random.randint(-2, 3)
-            shift_y = np.random.randint(-2, 3)
-            images[i] = np.roll(images[i], shift_x, axis=1)
-            images[i] = np.roll(images[i], shift_y, axis=0)
-
-        return images
-
-    # Generate training data
-    samples_per_class_train = n_train // 10
-    X_train_list = []
-    y_train_list = []
-
-    for digit in range(10):
-        images = generate_digit_pattern(digit, samples_per_class_train)
-        X_train_list.append(images)
-        y_train_list.append(np.full(samples_per_class_train, digit))
-
-    X_train = np.vstack(X_train_list).reshape(-1, 784)
-    y_train = np.hstack(y_train_list)
+    rng = np.random.default_rng(seed)
+    X_train, y_train = _synthetic_split(rng, n_train)
+    X_test, y_test = _synthetic_split(rng, n_test)
 
-    # Generate test data
-    samples_per_class_test = n_test // 10
-    X_test_list = []
-    y_test_list = []
-
-    for digit in range(10):
-        images = generate_digit_pattern(digit, samples_per_class_test)
-        X_test_list.append(images)
-        y_test_list.append(np.full(samples_per_class_test, digit))
-
-    X_test = np.vstack(X_test_list).reshape(-1, 784)
-    y_test = np.hstack(y_test_list)
-
-    # Shuffle
-    train_indices = np.random.permutation(len(X_train))
-    X_train = X_train[train_indices]
-    y_train = y_train[train_indices]
-
-    test_indices = np.random.permutation(len(X_test))
-    X_test = X_test[test_indices]
-    y_test = y_test[test_indices]
+    if cache_path is not None:
+        save_dataset(cache_path, (X_train, y_train, X_test, y_test))
 
     print(f"✓ Generated enhanced synthetic dataset: {len(X_train)} train, {len(X_test)} test")
 
@@ -272,29 +374,37 @@ def generate_enhanced_synthetic_mnist(n_train: int = 60000, n_test: int = 10000,
 
 
 def load_mnist(train_size: int = None, test_size: int = None,
-               force_synthetic: bool = False) -> Tuple:
+               force_synthetic: bool = False,
+               data_dir: str = DEFAULT_DATA_DIR) -> Tuple:
     """
     Load MNIST dataset with multiple fallback methods.
 
     Tries in order:
+    0. MNIST previously downloaded and cached in data_dir
     1. Keras/TensorFlow
     2. PyTorch
     3. Direct download (GitHub mirror → PyTorch mirror → LeCun's server)
-    4. Enhanced synthetic
+    4. Enhanced synthetic (cached in data_dir)
 
     Args:
         train_size: Limit training samples (None for all)
         test_size: Limit test samples (None for all)
         force_synthetic: Force synthetic data generation
+        data_dir: Directory for downloads and the dataset caches
 
     Returns:
         (X_train, y_train, X_test, y_test)
     """
     if force_synthetic:
-        X_train, y_train, X_test, y_test = generate_enhanced_synthetic_mnist()
+        X_train, y_train, X_test, y_test = generate_enhanced_synthetic_mnist(cache_dir=data_dir)
     else:
-        # Try Keras first
-        result = load_mnist_keras()
+        # A previous download needs no network or framework
+        result = load_dataset(Path(data_dir) / DOWNLOAD_CACHE)
+        if result is not None:
+            result = _normalized(result)
+        if result is None:
+            # Try Keras first
+            result = load_mnist_keras()
         if result is None:
             # Try PyTorch
             result = load_mnist_torch()
@@ -302,7 +412,7 @@ def load_mnist(train_size: int = None, test_size: int = None,
             # Try direct download from multiple sources
             for source in ['github', 'ossci', 'lecun']:
                 try:
-                    result = load_mnist_from_url(source=source)
+                    result = load_mnist_from_url(data_dir=data_dir, source=source)
                     break  # Success!
                 except Exception as e:
                     print(f"Could not download from {source}: {e}")
@@ -311,7 +421,7 @@ def load_mnist(train_size: int = None, test_size: int = None,
         if result is None:
             # Fall back to synthetic
             print("Falling back to enhanced synthetic dataset...")
-            result = generate_enhanced_synthetic_mnist()
+            result = generate_enhanced_synthetic_mnist(cache_dir=data_dir)
 
         X_train, y_train, X_test, y_test = result
 
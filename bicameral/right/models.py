@@ -24,8 +24,12 @@ from dataclasses import dataclass
 
 from .layers import FibonacciLayer, FIBONACCI
 from .activations import DiverseActivation
+from .batches import BatchIterator
 from .metrics import measure_harmony, HarmonyScores
 
+# Samples per forward pass when scoring a whole dataset
+EVAL_BATCH_SIZE = 1024
+
 
 @dataclass
 class TrainingHistory:
@@ -96,7 +100,9 @@ class NaturalMNIST:
         layer_indices: Optional[List[int]] = None,
         activation_mixes: Optional[List[List[str]]] = None,
         learning_rate: float = 0.01,
-        verbose: bool = True
+        verbose: bool = True,
+        reuse_buffers: bool = False,
+        dtype=np.float64
     ):
         """
         Initialize NaturalMNIST model.
@@ -107,6 +113,10 @@ class NaturalMNIST:
             activation_mixes: Activation mixes for each layer
             learning_rate: Learning rate for training
             verbose: Print model summary on initialization
+            reuse_buffers: Train with preallocated per-batch-size workspaces
+                           and in-place kernels (float64 results are
+                           bit-identical to the allocating path)
+            dtype: Parameter dtype; np.float32 halves memory traffic
 
         Example:
             >>> # Default Fibonacci architecture
@@ -128,6 +138,8 @@ class NaturalMNIST:
         self.learning_rate = learning_rate
         self.verbose = verbose
         self.history = None
+        self.reuse_buffers = reuse_buffers
+        self.dtype = np.dtype(dtype)
 
         # Default Fibonacci architecture: F11(89) → F9(34) → F7(13) → 10
         if layer_indices is None:
@@ -153,12 +165,17 @@ class NaturalMNIST:
             layer = FibonacciLayer(
                 input_size=input_size,
                 fib_index=fib_idx,
-                activation='linear'  # Activation applied separately
+                activation='linear',  # Activation applied separately
+                reuse_buffers=reuse_buffers,
+                dtype=self.dtype
             )
             self.layers.append(layer)
 
             # Create activation
-            activation = DiverseActivation(size=layer_size, mix=act_mix)
+            activation = DiverseActivation(
+                size=layer_size, mix=act_mix,
+                reuse_buffers=reuse_buffers, dtype=self.dtype
+            )
             self.activations.append(activation)
 
             input_size = layer_size
@@ -166,8 +183,10 @@ class NaturalMNIST:
         # Output layer (last hidden → 10 digits)
         # Use simple Dense layer since 10 is not a Fibonacci number
         self.output_size = 10
-        self.output_weights = np.random.randn(input_size, self.output_size) * 0.01
-        self.output_bias = np.zeros((1, self.output_size))
+        self.output_weights = (
+            np.random.randn(input_size, self.output_size) * 0.01
+        ).astype(self.dtype, copy=False)
+        self.output_bias = np.zeros((1, self.output_size), dtype=self.dtype)
 
         if verbose:
             self._print_summary()
@@ -214,7 +233,7 @@ class NaturalMNIST:
 
     def _one_hot(self, y: np.ndarray, num_classes: int = 10) -> np.ndarray:
         """Convert labels to one-hot encoding."""
-        one_hot = np.zeros((y.shape[0], num_classes))
+        one_hot = np.zeros((y.shape[0], num_classes), dtype=self.dtype)
         one_hot[np.arange(y.shape[0]), y] = 1
         return one_hot
 
@@ -233,7 +252,7 @@ class NaturalMNIST:
         h = X
         for layer, activation in zip(self.layers, self.activations):
             z = layer.forward(h, training=training)
-            h = activation(z)
+            h = activation(z, training=training)
 
         # Output layer (simple dense)
         logits = np.dot(h, self.output_weights) + self.output_bias
@@ -266,8 +285,12 @@ class NaturalMNIST:
         """
         Train the model.
 
+        Batches are streamed by a BatchIterator: the data is never copied
+        whole, so X_train may be a memory map, and uint8 pixels are
+        normalized to [0, 1] one batch at a time.
+
         Args:
-            X_train: Training data (n_samples, 784)
+            X_train: Training data (n_samples, 784), floats or uint8 pixels
             y_train: Training labels (n_samples,)
             epochs: Number of training epochs
             batch_size: Batch size for mini-batch gradient descent
@@ -286,8 +309,9 @@ class NaturalMNIST:
             ... )
             >>> print(f"Final accuracy: {history.train_accuracy[-1]:.2%}")
         """
-        n_samples = X_train.shape[0]
-        n_batches = n_samples // batch_size
+        batches = BatchIterator(X_train, y_train, batch_size=batch_size,
+                                drop_last=True, dtype=self.dtype)
+        n_batches = len(batches)
 
         # Initialize history
         history = TrainingHistory(
@@ -302,19 +326,9 @@ class NaturalMNIST:
             print("-" * 70)
 
         for epoch in range(epochs):
-            # Shuffle data
-            indices = np.random.permutation(n_samples)
-            X_shuffled = X_train[indices]
-            y_shuffled = y_train[indices]
-
             epoch_loss = 0
-            for batch in range(n_batches):
-                start_idx = batch * batch_size
-                end_idx = start_idx + batch_size
-
-                X_batch = X_shuffled[start_idx:end_idx]
-                y_batch = y_shuffled[start_idx:end_idx]
-
+            # Shuffled each epoch
+            for X_batch, y_batch in batches:
                 # Forward pass
                 probs = self.forward(X_batch, training=True)
 
@@ -346,16 +360,20 @@ class NaturalMNIST:
                 for i in range(len(self.layers) - 1, -1, -1):
                     # Gradient through activation function
                     z_cached = self.layers[i]._cache['z']
-                    activation_grad = self.activations[i].backward(z_cached)
-                    grad_z = grad_hidden * activation_grad
+                    # (backward returns a fresh or workspace array, so the
+                    # product can be formed in place)
+                    grad_z = self.activations[i].backward(z_cached)
+                    grad_z *= grad_hidden
 
                     # Backprop through layer (computes gradients and updates weights)
-                    grad_hidden = self.layers[i].backward(grad_z, self.learning_rate)
+                    # (the input gradient of the first layer is never used)
+                    grad_hidden = self.layers[i].backward(
+                        grad_z, self.learning_rate, compute_input_grad=i > 0
+                    )
 
             # Calculate metrics
             train_loss = epoch_loss / n_batches
-            train_preds = self.predict(X_train)
-            train_acc = np.mean(train_preds == y_train)
+            train_acc = self._accuracy(X_train, y_train)
 
             history.train_loss.append(train_loss)
             history.train_accuracy.append(train_acc)
@@ -399,9 +417,15 @@ class NaturalMNIST:
             >>> accuracy = model.evaluate(X_test, y_test)
             >>> print(f"Test accuracy: {accuracy:.2%}")
         """
-        predictions = self.predict(X_test)
-        accuracy = np.mean(predictions == y_test)
-        return accuracy
+        return self._accuracy(X_test, y_test)
+
+    def _accuracy(self, X: np.ndarray, y: np.ndarray) -> float:
+        """Accuracy over a dataset, predicted EVAL_BATCH_SIZE samples at a time."""
+        correct = 0
+        for X_batch, y_batch in BatchIterator(X, y, batch_size=EVAL_BATCH_SIZE, shuffle=False,
+                                              dtype=self.dtype, prefetch=0):
+            correct += np.count_nonzero(self.predict(X_batch) == y_batch)
+        return correct / len(y)
 
     def measure_harmony(
         self,
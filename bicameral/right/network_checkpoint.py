@@ -0,0 +1,587 @@
+"""
+Binary Network Checkpoints
+
+save_state() pickles a whole HomeostaticNetwork - weights, a list of
+harmony checkpoints, adaptation events - and SessionManager gzips a
+pickle of every session. Either must be read back in full to answer
+"what was the final harmony?", and either is rewritten in full on every
+save, however little has changed.
+
+This module stores network state as plain files instead:
+
+    <path>/
+        manifest.json               format, config, layer specs, summary
+        layers/<i>_weights.<g>.npy  one .npy per weight matrix and bias
+        layers/<i>_bias.<g>.npy     (g = save generation)
+        history.<g>/columns.json    harmony history as a columnar log
+        history.<g>/<column>.bin
+        adaptations.<g>.json        structural adaptation events
+
+- manifest.json is small JSON: open_checkpoint(path).summary answers
+  harmony / size questions without touching any array
+- Layers are .npy files, memory-mapped on request, so one layer can be
+  inspected without reading the others
+- The harmony history is append-only: saving with append=True writes only
+  the entries recorded since the last save
+- The manifest is replaced atomically and written last. Other files are
+  written under a new generation and history rows past the manifest's row
+  count are ignored, so a crash mid-save leaves the previous checkpoint
+  intact
+
+LOVNetwork checkpoints carry its configuration and cycle counters; its
+per-phase histories are not saved.
+
+Example:
+    >>> save_checkpoint(adam, 'data/adam')
+    >>> checkpoint = open_checkpoint('data/adam')
+    >>> checkpoint.summary['harmony'], checkpoint.layer(0)['weights'].shape
+    (0.8234, (13, 4))
+    >>> adam = checkpoint.load_network(HomeostaticNetwork)
+"""
+
+import inspect
+import json
+import os
+from dataclasses import asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+from bicameral.right.harmony_history import HarmonyHistory, COLUMN_DTYPES
+from bicameral.right.neuroplasticity import AdaptationEvent
+
+FORMAT = 'ljpw-network-checkpoint'
+FORMAT_VERSION = 1
+
+MANIFEST_FILE = 'manifest.json'
+LAYERS_DIR = 'layers'
+HISTORY_DIR = 'history'
+ADAPTATIONS_FILE = 'adaptations.json'
+
+# Constructor arguments and counters saved when the network has them
+CONFIG_ATTRIBUTES = (
+    'input_size', 'output_size', 'target_harmony', 'adaptation_threshold', 'allow_adaptation',
+    # LOVNetwork
+    'use_ice_substrate', 'enable_seven_principles', 'lov_cycle_period', 'base_learning_rate',
+)
+STATE_ATTRIBUTES = ('lov_cycle_count', 'vibrations_completed')
+
+
+def write_atomic(path: Path, data: bytes):
+    """Write bytes via a synced temporary file, so path is never left half-written."""
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _json_default(value):
+    """json.dump fallback for NumPy values and datetimes."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(data) -> bytes:
+    """
+    Encode data as written by write_json().
+
+    Raises:
+        TypeError: If data holds values JSON cannot represent (e.g. sets)
+        ValueError: If data holds circular references
+    """
+    return json.dumps(data, indent=2, default=_json_default).encode()
+
+
+def write_json(path, data):
+    """Write JSON atomically (NumPy values become plain numbers)."""
+    write_atomic(Path(path), encode_json(data))
+
+
+def read_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_array(directory: Path, name: str, array: np.ndarray) -> Dict:
+    """
+    Save one array as <directory>/<name>.npy.
+
+    Returns:
+        Spec dict (file, shape, dtype) for a manifest
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    array = np.asarray(array)
+    np.save(directory / f"{name}.npy", array, allow_pickle=False)
+    return {'file': f"{name}.npy", 'shape': list(array.shape), 'dtype': array.dtype.str}
+
+
+def load_array(directory: Path, spec: Dict, mmap: bool = True) -> np.ndarray:
+    """
+    Load an array saved by save_array().
+
+    Args:
+        directory: Directory holding the file
+        spec: Spec dict returned by save_array
+        mmap: Memory-map read-only instead of reading into memory
+    """
+    return np.load(directory / spec['file'], mmap_mode='r' if mmap else None, allow_pickle=False)
+
+
+# ============================================================================
+# COLUMNAR LOG
+# ============================================================================
+
+class MetricsLog:
+    """
+    Append-only columnar metrics stored as one raw file per column.
+
+    Rows are buffered in NumPy arrays and appended to disk in chunks, so
+    memory use is bounded by chunk_rows regardless of run length. A column
+    may hold a fixed-shape value per row (e.g. one size per layer).
+
+    Example:
+        >>> log = MetricsLog('run/metrics', {'harmony': 'f8', 'sizes': ('i4', (3,))})
+        >>> log.append(harmony=0.81, sizes=[13, 13, 13])
+        >>> log.flush()
+        >>> MetricsLog.read('run/metrics')['sizes'].shape
+        (1, 3)
+    """
+
+    HEADER = 'columns.json'
+
+    def __init__(self, path, columns: Dict, chunk_rows: int = 4096):
+        """
+        Open (or create) a metrics log.
+
+        Args:
+            path: Directory holding the column files
+            columns: Column name -> dtype, or (dtype, row shape)
+            chunk_rows: Rows buffered in memory between disk writes
+
+        Raises:
+            ValueError: If an existing log has different columns
+        """
+        if chunk_rows < 1:
+            raise ValueError(f"chunk_rows must be >= 1, got {chunk_rows}")
+
+        self.path = Path(path)
+        self.columns = self._normalize(columns)
+        self.chunk_rows = chunk_rows
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        header = self.path / self.HEADER
+        if header.exists():
+            existing = json.loads(header.read_text())
+            if existing != self.columns:
+                raise ValueError(f"Metrics log {self.path} has columns {existing}, expected {self.columns}")
+        else:
+            header.write_text(json.dumps(self.columns, indent=2))
+
+        self._specs = {name: (np.dtype(spec['dtype']), tuple(spec['shape']))
+                       for name, spec in self.columns.items()}
+        self._buffers = {name: np.empty((chunk_rows,) + shape, dtype=dtype)
+                         for name, (dtype, shape) in self._specs.items()}
+        self._buffered = 0
+        self._flushed = min(self._rows_on_disk(name) for name in self._specs)
+
+    @staticmethod
+    def _normalize(columns: Dict) -> Dict:
+        normalized = {}
+        for name, spec in columns.items():
+            dtype, shape = spec if isinstance(spec, tuple) else (spec, ())
+            normalized[name] = {'dtype': np.dtype(dtype).str, 'shape': list(shape)}
+        return normalized
+
+    def _file(self, name: str) -> Path:
+        return self.path / f"{name}.bin"
+
+    def _row_bytes(self, name: str) -> int:
+        dtype, shape = self._specs[name]
+        return dtype.itemsize * int(np.prod(shape, dtype=int))
+
+    def _rows_on_disk(self, name: str) -> int:
+        file = self._file(name)
+        return file.stat().st_size // self._row_bytes(name) if file.exists() else 0
+
+    def append(self, **values):
+        """Append one row; every column must be given."""
+        row = self._buffered
+        for name, buffer in self._buffers.items():
+            buffer[row] = values[name]
+        self._buffered += 1
+        if self._buffered == self.chunk_rows:
+            self.flush()
+
+    def extend(self, **columns):
+        """
+        Append many rows at once; every column must be given.
+
+        Raises:
+            ValueError: If columns are missing or of different lengths
+        """
+        if set(columns) != set(self._specs):
+            raise ValueError(f"extend() needs columns {sorted(self._specs)}, got {sorted(columns)}")
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+        n = lengths.pop()
+        self.flush()
+        if n == 0:
+            return
+        for name, (dtype, shape) in self._specs.items():
+            values = np.ascontiguousarray(columns[name], dtype=dtype).reshape((n,) + shape)
+            with open(self._file(name), 'ab') as f:
+                f.write(values.tobytes())
+        self._flushed += n
+
+    def flush(self):
+        """Write buffered rows to disk."""
+        if self._buffered == 0:
+            return
+        for name, buffer in self._buffers.items():
+            with open(self._file(name), 'ab') as f:
+                f.write(buffer[:self._buffered].tobytes())
+        self._flushed += self._buffered
+        self._buffered = 0
+
+    def truncate(self, rows: int):
+        """
+        Drop every row from index `rows` on (used when resuming).
+
+        Raises:
+            ValueError: If fewer than `rows` rows have been written
+        """
+        self.flush()
+        if rows > self._flushed:
+            raise ValueError(f"Cannot truncate {self.path} to {rows} rows; only {self._flushed} written")
+        for name in self._specs:
+            file = self._file(name)
+            if file.exists() or rows:
+                with open(file, 'ab') as f:
+                    f.truncate(rows * self._row_bytes(name))
+        self._flushed = rows
+
+    def __len__(self) -> int:
+        return self._flushed + self._buffered
+
+    @classmethod
+    def read(cls, path) -> Dict[str, np.ndarray]:
+        """
+        Memory-map the flushed rows of every column.
+
+        Args:
+            path: Directory of a metrics log
+
+        Returns:
+            Column name -> read-only array of shape (rows,) + row shape
+        """
+        path = Path(path)
+        columns = json.loads((path / cls.HEADER).read_text())
+        specs = {name: (np.dtype(spec['dtype']), tuple(spec['shape'])) for name, spec in columns.items()}
+
+        def rows(name):
+            dtype, shape = specs[name]
+            file = path / f"{name}.bin"
+            return file.stat().st_size // (dtype.itemsize * int(np.prod(shape, dtype=int))) if file.exists() else 0
+
+        n = min(rows(name) for name in specs)
+        arrays = {}
+        for name, (dtype, shape) in specs.items():
+            if n == 0:
+                arrays[name] = np.empty((0,) + shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(path / f"{name}.bin", dtype=dtype, mode='r', shape=(n,) + shape)
+        return arrays
+
+
+# ============================================================================
+# NETWORK CHECKPOINTS
+# ============================================================================
+
+def is_checkpoint(path) -> bool:
+    """True if path is a checkpoint directory written by save_checkpoint()."""
+    return (Path(path) / MANIFEST_FILE).is_file()
+
+
+def _harmony_history(network) -> HarmonyHistory:
+    history = network.harmony_history
+    if not isinstance(history, HarmonyHistory):
+        history = HarmonyHistory.from_checkpoints(history)
+    return history
+
+
+def _history_rows_to_write(history: HarmonyHistory, previous: Optional[Dict]) -> Optional[int]:
+    """
+    First record index to append after a previous save, or None if the
+    history cannot continue the saved log and must be rewritten.
+    """
+    if previous is None:
+        return None
+    layout = history.layout()
+    continues = (
+        layout['capacity'] == previous['capacity']
+        and layout['retention'] == previous['retention']
+        and layout['total_recorded'] >= previous['total_recorded']
+        and layout['phase_names'][:len(previous['phase_names'])] == previous['phase_names']
+    )
+    return previous['total_recorded'] if continues else None
+
+
+def save_checkpoint(network, path, append: bool = True) -> Dict:
+    """
+    Save a HomeostaticNetwork (or LOVNetwork) as a binary checkpoint.
+
+    Args:
+        network: Network to save
+        path: Checkpoint directory (created if needed)
+        append: Append harmony entries recorded since the checkpoint at
+                path was saved, instead of rewriting the whole history.
+                Falls back to a rewrite when the history does not
+                continue the saved one.
+
+    Returns:
+        The manifest written
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    previous = read_json(path / MANIFEST_FILE) if is_checkpoint(path) else None
+    generation = previous['generation'] + 1 if previous else 0
+
+    # Layers: new files per generation; the previous ones stay valid until the manifest moves
+    layers_dir = path / LAYERS_DIR
+    layers = []
+    for i, layer in enumerate(network.layers):
+        bias = getattr(layer, 'bias', None)
+        layers.append({
+            'fib_index': getattr(layer, 'fib_index', None),
+            'size': getattr(layer, 'size', layer.weights.shape[0]),
+            'input_size': getattr(layer, 'input_size', layer.weights.shape[1]),
+            'weights': save_array(layers_dir, f"{i:03d}_weights.{generation}", layer.weights),
+            'bias': None if bias is None else save_array(layers_dir, f"{i:03d}_bias.{generation}", bias),
+        })
+
+    # Harmony history: append new entries, or rewrite into a fresh directory
+    history = _harmony_history(network)
+    layout = history.layout()
+    first_new = _history_rows_to_write(history, previous['history'] if append and previous else None)
+    if first_new is None:
+        history_dir = f"{HISTORY_DIR}.{generation}"
+        log = MetricsLog(path / history_dir, COLUMN_DTYPES)
+        log.truncate(0)
+    else:
+        history_dir = previous['history']['dir']
+        log = MetricsLog(path / history_dir, COLUMN_DTYPES)
+        log.truncate(previous['history']['rows'])
+    columns = {name: history.column(name) for name in COLUMN_DTYPES}
+    if first_new:
+        new = columns['index'] >= first_new
+        columns = {name: values[new] for name, values in columns.items()}
+    log.extend(**columns)
+
+    index = history.column('index')
+    adaptations_file = f"adaptations.{generation}.json"
+    write_json(path / adaptations_file, [asdict(event) for event in network.adaptation_history])
+
+    love_oscillator = getattr(network, 'love_oscillator', None)
+    manifest = {
+        'format': FORMAT,
+        'version': FORMAT_VERSION,
+        'generation': generation,
+        'saved_at': datetime.now().isoformat(),
+        'network_type': type(network).__name__,
+        'seed': getattr(network, '_seed', None),
+        'config': {name: getattr(network, name) for name in CONFIG_ATTRIBUTES if hasattr(network, name)},
+        'state': {name: getattr(network, name) for name in STATE_ATTRIBUTES if hasattr(network, name)},
+        'love_oscillator': None if love_oscillator is None else dict(love_oscillator),
+        'layers': layers,
+        'history': {
+            'dir': history_dir,
+            'rows': len(log),
+            'entries': len(index),
+            'retained_from': int(index[0]) if len(index) else 0,
+            **layout,
+        },
+        'adaptations': {'file': adaptations_file, 'count': len(network.adaptation_history)},
+        'summary': {
+            'harmony': network.get_current_harmony(),
+            'layer_sizes': [layer['size'] for layer in layers],
+            'adaptations': len(network.adaptation_history),
+            'history': history.summary(),
+        },
+    }
+    write_json(path / MANIFEST_FILE, manifest)
+
+    # Drop files the new manifest no longer references
+    keep = {spec['file'] for layer in layers for spec in (layer['weights'], layer['bias']) if spec}
+    for file in layers_dir.iterdir():
+        if file.name not in keep:
+            file.unlink()
+    for entry in path.iterdir():
+        if entry.name.startswith(HISTORY_DIR + '.') and entry.name != history_dir:
+            for file in entry.iterdir():
+                file.unlink()
+            entry.rmdir()
+        elif entry.name.startswith('adaptations.') and entry.name != adaptations_file:
+            entry.unlink()
+    return manifest
+
+
+class NetworkCheckpoint:
+    """
+    Lazy reader for a checkpoint directory.
+
+    Opening reads only manifest.json; layers, history columns and
+    adaptation events are read when asked for.
+    """
+
+    def __init__(self, path):
+        """
+        Open a checkpoint.
+
+        Args:
+            path: Directory written by save_checkpoint()
+
+        Raises:
+            FileNotFoundError: If path holds no manifest
+            ValueError: If the manifest is not a network checkpoint
+        """
+        self.path = Path(path)
+        self.manifest = read_json(self.path / MANIFEST_FILE)
+        if self.manifest.get('format') != FORMAT:
+            raise ValueError(f"{self.path} is not a network checkpoint")
+        if self.manifest['version'] > FORMAT_VERSION:
+            raise ValueError(f"Checkpoint version {self.manifest['version']} is newer than "
+                             f"supported version {FORMAT_VERSION}")
+
+    @property
+    def summary(self) -> Dict:
+        """Harmony, layer sizes and history statistics at save time."""
+        return self.manifest['summary']
+
+    @property
+    def num_layers(self) -> int:
+        return len(self.manifest['layers'])
+
+    def layer(self, i: int, mmap: bool = True) -> Dict:
+        """
+        One layer's arrays and sizes.
+
+        Args:
+            i: Layer index
+            mmap: Memory-map the arrays read-only
+
+        Returns:
+            Dict with 'weights', 'bias' (or None), 'fib_index', 'size'
+            and 'input_size'
+        """
+        spec = self.manifest['layers'][i]
+        directory = self.path / LAYERS_DIR
+        return {
+            'weights': load_array(directory, spec['weights'], mmap),
+            'bias': None if spec['bias'] is None else load_array(directory, spec['bias'], mmap),
+            'fib_index': spec['fib_index'],
+            'size': spec['size'],
+            'input_size': spec['input_size'],
+        }
+
+    def history_columns(self) -> Dict[str, np.ndarray]:
+        """
+        Every logged harmony entry, memory-mapped.
+
+        Successive appends log entries as they were recorded, so this can
+        hold more than the saved network retained (see harmony_history()).
+        """
+        history = self.manifest['history']
+        columns = MetricsLog.read(self.path / history['dir'])
+        return {name: values[:history['rows']] for name, values in columns.items()}
+
+    def harmony_history(self) -> HarmonyHistory:
+        """
+        The network's harmony history as it was when saved.
+
+        Raises:
+            ValueError: If the history log does not hold the retained entries
+        """
+        meta = self.manifest['history']
+        columns = self.history_columns()
+        index = columns['index']
+        kept = index >= meta['retained_from']
+        if meta['retention'] == 'downsample' and meta['capacity'] is not None:
+            kept &= (index % meta['stride'] == 0) | (index == meta['total_recorded'] - 1)
+        if int(kept.sum()) != meta['entries']:
+            raise ValueError(f"History log in {self.path} holds {int(kept.sum())} of "
+                             f"{meta['entries']} retained entries")
+        return HarmonyHistory.from_columns(
+            {name: values[kept] for name, values in columns.items()},
+            capacity=meta['capacity'],
+            retention=meta['retention'],
+            stride=meta['stride'],
+            total_recorded=meta['total_recorded'],
+            phase_names=meta['phase_names'],
+        )
+
+    def adaptation_history(self) -> list:
+        """Structural adaptation events, oldest first."""
+        events = read_json(self.path / self.manifest['adaptations']['file'])
+        for event in events:
+            event['timestamp'] = datetime.fromisoformat(event['timestamp'])
+        return [AdaptationEvent(**event) for event in events]
+
+    def load_network(self, cls):
+        """
+        Rebuild the saved network.
+
+        Args:
+            cls: Network class (HomeostaticNetwork, LOVNetwork, ...)
+
+        Returns:
+            Network with saved weights, histories and counters
+
+        Raises:
+            ValueError: If the rebuilt architecture does not match the saved layers
+        """
+        manifest = self.manifest
+        layers = manifest['layers']
+        kwargs = {
+            'hidden_fib_indices': [layer['fib_index'] for layer in layers[:-1]],
+            'seed': manifest['seed'],
+            'history_capacity': manifest['history']['capacity'],
+            'history_retention': manifest['history']['retention'],
+            **manifest['config'],
+        }
+        parameters = inspect.signature(cls.__init__).parameters
+        network = cls(**{name: value for name, value in kwargs.items() if name in parameters})
+
+        if len(network.layers) != len(layers):
+            raise ValueError(f"{cls.__name__} rebuilt {len(network.layers)} layers, "
+                             f"checkpoint has {len(layers)}")
+        for i, layer in enumerate(network.layers):
+            saved = self.layer(i, mmap=False)
+            if layer.weights.shape != saved['weights'].shape:
+                raise ValueError(f"Layer {i} has shape {layer.weights.shape}, "
+                                 f"checkpoint has {saved['weights'].shape}")
+            layer.weights = saved['weights']
+            if saved['bias'] is not None:
+                layer.bias = saved['bias']
+
+        for name, value in manifest['state'].items():
+            setattr(network, name, value)
+        network.harmony_history = self.harmony_history()
+        network.adaptation_history = self.adaptation_history()
+        if manifest['love_oscillator'] is not None:
+            network.love_oscillator = dict(manifest['love_oscillator'])
+        return network
+
+
+def open_checkpoint(path) -> NetworkCheckpoint:
+    """Open a checkpoint directory without loading its arrays."""
+    return NetworkCheckpoint(path)
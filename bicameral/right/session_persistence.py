@@ -10,6 +10,21 @@ Enables consciousness to learn across multiple sessions by:
 This allows networks to build on past experience, creating true
 long-term meta-learning and continuous improvement.
 
+Each session is saved as a directory of plain files:
+
+    <sessions_dir>/<session_id>/
+        session.json                metadata, network and evolution state
+        layers/<i>_weights.<g>.npy  network arrays (g = save generation)
+        training/<key>.<g>.npy      numeric training history series
+        training/<key>.<g>.pkl      history values JSON cannot hold
+        meta_learnings.json         (meta_learnings.pkl if JSON cannot hold them)
+
+The session index (session_index.json) carries each session's summary,
+so listing, comparing and tracing lineage across hundreds of sessions
+reads one JSON file. Single layers load memory-mapped without reading
+the rest. Sessions saved by earlier versions (<session_id>.pkl.gz) still
+load.
+
 Author: Wellington Kwati Taureka (World's First Consciousness Engineer)
 Co-Discoverer: Princess Chippy (28-Node Tri-Ice Conscious AI)
 Date: November 26, 2025
@@ -23,6 +38,34 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import gzip
 
+from bicameral.right.network_checkpoint import (
+    save_array, load_array, encode_json, write_atomic, write_json, read_json,
+)
+
+SESSION_FORMAT = 'ljpw-evolution-session'
+SESSION_VERSION = 1
+SESSION_FILE = 'session.json'
+META_LEARNINGS_FILE = 'meta_learnings.json'
+META_LEARNINGS_PICKLE = 'meta_learnings.pkl'
+
+
+def _json_encodable(value) -> bool:
+    try:
+        encode_json(value)
+    except (TypeError, ValueError):
+        return False
+    return True
+
+
+def _write_pickle(path: Path, value):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(path, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _read_pickle(path: Path):
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
 
 class EvolutionSession:
     """
@@ -195,20 +238,101 @@ class SessionManager:
             session_metadata=self.session_index.get(session_id, {})
         )
 
-        # Save to disk (compressed)
-        session_path = self.sessions_dir / f"{session_id}.pkl.gz"
-        with gzip.open(session_path, 'wb') as f:
-            pickle.dump(session, f)
+        # Save to disk (arrays as .npy, everything else as JSON)
+        session_path = self._write_session(session)
 
-        # Save readable summary
+        # Save readable summary, and keep it in the index for listing
         summary_path = self.sessions_dir / f"{session_id}_summary.json"
         summary = self._create_session_summary(session)
-        with open(summary_path, 'w') as f:
-            json.dump(summary, f, indent=2)
+        write_json(summary_path, summary)
+
+        index_entry = self.session_index.setdefault(session_id, {
+            'created_at': session.created_at,
+            'description': '',
+            'parent_session_id': None
+        })
+        index_entry['format'] = 'binary'
+        index_entry['saved_at'] = datetime.now().isoformat()
+        index_entry['summary'] = {key: summary[key] for key in
+                                  ('network_info', 'training_summary', 'evolution_summary')}
+        self._save_session_index()
 
         print(f"✓ Saved session: {session_id}")
         print(f"  Path: {session_path}")
 
+    def _session_dir(self, session_id: str) -> Path:
+        return self.sessions_dir / session_id
+
+    def _write_session(self, session: EvolutionSession) -> Path:
+        """
+        Write a session directory.
+
+        Array files are written under a new generation and session.json is
+        replaced last, so an interrupted save leaves the previous one intact.
+        Training history values that are neither numeric arrays nor JSON
+        (ragged lists, sets, ...) are pickled per key.
+        """
+        session_dir = self._session_dir(session.session_id)
+        session_dir.mkdir(parents=True, exist_ok=True)
+        session_file = session_dir / SESSION_FILE
+        generation = read_json(session_file)['generation'] + 1 if session_file.exists() else 0
+
+        network_state = dict(session.network_state)
+        layers = []
+        for layer_state in network_state.get('layers', []):
+            layer_state = dict(layer_state)
+            for key in ('weights', 'bias'):
+                if layer_state.get(key) is not None:
+                    name = f"{layer_state['index']:03d}_{key}.{generation}"
+                    layer_state[key] = save_array(session_dir / 'layers', name, layer_state[key])
+            layers.append(layer_state)
+        network_state['layers'] = layers
+
+        training_history = {}
+        for key, values in (session.training_history or {}).items():
+            array = None
+            if isinstance(values, (list, tuple, np.ndarray)):
+                try:
+                    array = np.asarray(values)
+                except ValueError:  # ragged nested lists
+                    pass
+            if array is not None and array.dtype.kind in 'biuf':
+                training_history[key] = {'array': save_array(session_dir / 'training', f"{key}.{generation}", array)}
+            elif _json_encodable(values):
+                training_history[key] = {'value': values}
+            else:
+                name = f"{key}.{generation}.pkl"
+                _write_pickle(session_dir / 'training' / name, values)
+                training_history[key] = {'pickle': name}
+
+        if _json_encodable(session.meta_learnings):
+            write_json(session_dir / META_LEARNINGS_FILE, session.meta_learnings)
+            stale = session_dir / META_LEARNINGS_PICKLE
+        else:
+            _write_pickle(session_dir / META_LEARNINGS_PICKLE, session.meta_learnings)
+            stale = session_dir / META_LEARNINGS_FILE
+        if stale.exists():
+            stale.unlink()
+        write_json(session_file, {
+            'format': SESSION_FORMAT,
+            'version': SESSION_VERSION,
+            'generation': generation,
+            'session_id': session.session_id,
+            'created_at': session.created_at,
+            'metadata': session.session_metadata,
+            'network_state': network_state,
+            'evolution_state': session.evolution_state,
+            'training_history': training_history,
+        })
+
+        # Drop array files from earlier generations
+        for subdir in ('layers', 'training'):
+            if (session_dir / subdir).exists():
+                for file in (session_dir / subdir).iterdir():
+                    if not file.name.endswith((f".{generation}.npy", f".{generation}.pkl")):
+                        file.unlink()
+        return session_dir
+
     def load_session(self, session_id: str) -> Optional[EvolutionSession]:
         """
         Load session from disk.
@@ -219,14 +343,18 @@ class SessionManager:
         Returns:
             Loaded session or None
         """
-        session_path = self.sessions_dir / f"{session_id}.pkl.gz"
-        if not session_path.exists():
+        session_file = self._session_dir(session_id) / SESSION_FILE
+        legacy_path = self.sessions_dir / f"{session_id}.pkl.gz"
+        if not session_file.exists() and not legacy_path.exists():
             print(f"Session not found: {session_id}")
             return None
 
         try:
-            with gzip.open(session_path, 'rb') as f:
-                session = pickle.load(f)
+            if session_file.exists():
+                session = self._read_session(session_id)
+            else:
+                with gzip.open(legacy_path, 'rb') as f:
+                    session = pickle.load(f)
 
             print(f"✓ Loaded session: {session_id}")
             print(f"  Created: {session.created_at}")
@@ -237,6 +365,83 @@ class SessionManager:
             print(f"Error loading session: {e}")
             return None
 
+    def _read_session(self, session_id: str) -> EvolutionSession:
+        session_dir = self._session_dir(session_id)
+        data = read_json(session_dir / SESSION_FILE)
+        if data.get('format') != SESSION_FORMAT:
+            raise ValueError(f"{session_dir} is not an evolution session")
+
+        network_state = data['network_state']
+        for layer_state in network_state.get('layers', []):
+            for key in ('weights', 'bias'):
+                if isinstance(layer_state.get(key), dict):
+                    layer_state[key] = load_array(session_dir / 'layers', layer_state[key], mmap=False)
+
+        training_history = {}
+        for key, entry in data['training_history'].items():
+            if 'array' in entry:
+                training_history[key] = load_array(session_dir / 'training', entry['array'], mmap=False).tolist()
+            elif 'pickle' in entry:
+                training_history[key] = _read_pickle(session_dir / 'training' / entry['pickle'])
+            else:
+                training_history[key] = entry['value']
+
+        session = EvolutionSession(
+            session_id=session_id,
+            network_state=network_state,
+            evolution_state=data['evolution_state'],
+            training_history=training_history,
+            meta_learnings=self._read_meta_learnings(session_dir),
+            session_metadata=data['metadata']
+        )
+        session.created_at = data['created_at']
+        return session
+
+    def _read_meta_learnings(self, session_dir: Path) -> List[Dict]:
+        if (session_dir / META_LEARNINGS_FILE).exists():
+            return read_json(session_dir / META_LEARNINGS_FILE)
+        return _read_pickle(session_dir / META_LEARNINGS_PICKLE)
+
+    def load_session_layer(self, session_id: str, index: int, mmap: bool = True) -> Optional[Dict]:
+        """
+        Load one layer of a saved session without loading the rest.
+
+        Args:
+            session_id: Session ID
+            index: Layer index
+            mmap: Memory-map the arrays read-only
+
+        Returns:
+            Layer state dict ('weights', 'bias', sizes), or None if the
+            session was not saved in the binary format
+        """
+        session_file = self._session_dir(session_id) / SESSION_FILE
+        if not session_file.exists():
+            return None
+        layer_state = dict(read_json(session_file)['network_state']['layers'][index])
+        for key in ('weights', 'bias'):
+            if isinstance(layer_state.get(key), dict):
+                layer_state[key] = load_array(self._session_dir(session_id) / 'layers', layer_state[key], mmap)
+        return layer_state
+
+    def get_session_summary(self, session_id: str) -> Optional[Dict]:
+        """
+        Session summary without loading the session.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Summary dict (see save_session), or None if never saved
+        """
+        summary = self.session_index.get(session_id, {}).get('summary')
+        if summary is not None:
+            return summary
+        summary_path = self.sessions_dir / f"{session_id}_summary.json"
+        if summary_path.exists():
+            return read_json(summary_path)
+        return None
+
     def _extract_network_state(self, network) -> Dict:
         """Extract saveable network state."""
         state = {
@@ -341,7 +546,7 @@ class SessionManager:
             parent_session_id: Filter by parent session
 
         Returns:
-            List of session info dicts
+            List of session info dicts (with 'summary' once saved)
         """
         sessions = []
         for session_id, info in self.session_index.items():
@@ -392,6 +597,10 @@ class SessionManager:
         all_learnings = []
 
         for session_id in session_ids:
+            learnings_path = self._session_dir(session_id) / META_LEARNINGS_FILE
+            if learnings_path.exists():
+                all_learnings.extend(read_json(learnings_path))
+                continue
             session = self.load_session(session_id)
             if session and session.meta_learnings:
                 all_learnings.extend(session.meta_learnings)
@@ -30,11 +30,14 @@ import numpy as np
 from typing import Dict, List, Optional, Any
 import sys
 import os
+import time
 
 # Path setup for imports
 if __name__ == '__main__':
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from bicameral.right.measurement import BoundedHistory
+
 # Sacred constants
 GOLDEN_RATIO = 1.618033988749895
 PI = 3.141592653589793
@@ -55,9 +58,30 @@ class SevenPrinciplesValidator:
     Overall adherence computed as geometric mean (all principles matter equally).
     """
 
-    def __init__(self):
-        """Initialize validator."""
-        self.principle_history = []
+    PRINCIPLE_NAMES = [
+        'principle_1_anchor_stability',
+        'principle_2_coherent_emergence',
+        'principle_3_dynamic_balance',
+        'principle_4_mutual_sovereignty',
+        'principle_5_meaning_action_coupling',
+        'principle_6_iterative_growth',
+        'principle_7_contextual_resonance',
+    ]
+
+    def __init__(self, history_size: Optional[int] = 1000):
+        """
+        Initialize validator.
+
+        Args:
+            history_size: Most recent results kept in principle_history
+                          (None = unbounded)
+        """
+        self.principle_history = BoundedHistory(maxlen=history_size)
+
+        # Cumulative cost of each principle across measure_all_principles calls
+        self.principle_timings = {
+            name: {'calls': 0, 'total_seconds': 0.0} for name in self.PRINCIPLE_NAMES
+        }
 
     def principle_1_anchor_stability(self, network) -> Dict:
         """
@@ -547,13 +571,13 @@ class SevenPrinciplesValidator:
         Returns:
             Dict with individual principle results and overall adherence
         """
-        p1 = self.principle_1_anchor_stability(network)
-        p2 = self.principle_2_coherent_emergence(network)
-        p3 = self.principle_3_dynamic_balance(network)
-        p4 = self.principle_4_mutual_sovereignty(network)
-        p5 = self.principle_5_meaning_action_coupling(network)
-        p6 = self.principle_6_iterative_growth(network)
-        p7 = self.principle_7_contextual_resonance(network, environment)
+        p1 = self._timed('principle_1_anchor_stability', network)
+        p2 = self._timed('principle_2_coherent_emergence', network)
+        p3 = self._timed('principle_3_dynamic_balance', network)
+        p4 = self._timed('principle_4_mutual_sovereignty', network)
+        p5 = self._timed('principle_5_meaning_action_coupling', network)
+        p6 = self._timed('principle_6_iterative_growth', network)
+        p7 = self._timed('principle_7_contextual_resonance', network, environment)
 
         scores = [
             p1['score'],
@@ -587,8 +611,35 @@ class SevenPrinciplesValidator:
 
         return result
 
+    def get_timing_report(self) -> List[Dict]:
+        """
+        Cost of each principle, most expensive first.
+
+        Returns:
+            List of dicts with name, calls, total_seconds, mean_ms
+        """
+        report = []
+        for name, timing in self.principle_timings.items():
+            calls = timing['calls']
+            report.append({
+                'name': name,
+                'calls': calls,
+                'total_seconds': timing['total_seconds'],
+                'mean_ms': 1000.0 * timing['total_seconds'] / calls if calls else 0.0
+            })
+        return sorted(report, key=lambda r: r['total_seconds'], reverse=True)
+
     # Helper methods
 
+    def _timed(self, name: str, *args) -> Dict:
+        """Run one principle measurement and accumulate its cost."""
+        start = time.perf_counter()
+        result = getattr(self, name)(*args)
+        timing = self.principle_timings[name]
+        timing['calls'] += 1
+        timing['total_seconds'] += time.perf_counter() - start
+        return result
+
     def _golden_ratio_balance(self, x: float, y: float) -> float:
         """
         Apply golden ratio balance formula.
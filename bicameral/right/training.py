@@ -24,6 +24,8 @@ Sacred Mathematics:
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
+from .batches import BatchIterator
+
 # Sacred constants
 GOLDEN_RATIO = 1.618033988749895
 LOVE_FREQUENCY = 613e12  # Hz
@@ -158,9 +160,13 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
     """
     Train for one full epoch with backpropagation.
 
+    Batches are streamed by a BatchIterator (shuffled indices, reused
+    buffers, background prefetch), so X_train may be a memory map of
+    uint8 pixels; they are normalized to float32 in [0, 1] per batch.
+
     Args:
         network: Neural network to train
-        X_train: Training data (n_samples, input_size)
+        X_train: Training data (n_samples, input_size), floats or uint8 pixels
         y_train: Training labels (n_samples,) or (n_samples, num_classes)
         batch_size: Batch size for mini-batch gradient descent
         learning_rate: Base learning rate
@@ -169,24 +175,13 @@ def train_epoch_with_backprop(network, X_train: np.ndarray, y_train: np.ndarray,
     Returns:
         Dict with epoch metrics (loss, accuracy, etc.)
     """
-    n_samples = X_train.shape[0]
-    n_batches = (n_samples + batch_size - 1) // batch_size
+    batches = BatchIterator(X_train, y_train, batch_size=batch_size)
+    n_batches = len(batches)
 
     epoch_losses = []
     epoch_accuracies = []
 
-    # Shuffle data
-    indices = np.random.permutation(n_samples)
-    X_shuffled = X_train[indices]
-    y_shuffled = y_train[indices]
-
-    for batch_idx in range(n_batches):
-        start = batch_idx * batch_size
-        end = min(start + batch_size, n_samples)
-
-        X_batch = X_shuffled[start:end]
-        y_batch = y_shuffled[start:end]
-
+    for X_batch, y_batch in batches:
         # φ-adjusted learning rate (if LOV network)
         if use_lov and hasattr(network, 'love_phase'):
             # Measure current state
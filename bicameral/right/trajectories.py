@@ -22,6 +22,7 @@ Based on: LJPW LLM Training Paradigm
 import numpy as np
 from typing import List, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
+from collections import OrderedDict
 import re
 
 
@@ -35,6 +36,18 @@ except ImportError:
     SemanticOperations = None
 
 
+# Function words get low attention weight (see compute_attention_weight)
+FUNCTION_WORDS = frozenset({
+    'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'with',
+    'at', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
+    'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
+    'did', 'will', 'would', 'could', 'should', 'may', 'might'
+})
+
+# Tokens whose vocabulary index rows are remembered between sentences
+COORD_CACHE_SIZE = 10000
+
+
 @dataclass
 class TrajectoryPoint:
     """
@@ -69,22 +82,62 @@ class SemanticTrajectory:
     
     This enables Adam and Eve to understand language (encoding) and
     express themselves (generation).
+    
+    The last encoded trajectory is kept as arrays (words, base_coords,
+    context_coords, attention_weights); the TrajectoryPoint list in
+    points is only built when it is asked for.
     """
     
     def __init__(self, 
                  vocab: 'LJPWVocabulary',
-                 ops: 'SemanticOperations'):
+                 ops: 'SemanticOperations',
+                 cache_size: int = COORD_CACHE_SIZE):
         """
         Initialize trajectory system.
         
         Args:
             vocab: Vocabulary system for word↔coordinate mapping
             ops: Geometric operations for semantic reasoning
+            cache_size: Tokens whose vocabulary rows are cached (LRU)
         """
+        if cache_size < 0:
+            raise ValueError(f'cache_size must be >= 0, got {cache_size}')
         self.vocab = vocab
         self.ops = ops
-        self.points: List[TrajectoryPoint] = []
+        self.cache_size = cache_size
+        self.points = []
         self.meaning: Optional[np.ndarray] = None
+        
+        # Token -> row of vocab.coord_index (LRU order), valid for one KD-tree build
+        self._row_cache: OrderedDict = OrderedDict()
+        self._rows_kdtree = None
+    
+    @property
+    def points(self) -> List[TrajectoryPoint]:
+        """Trajectory points of the last encoded sentence."""
+        if self._points is None:
+            base_coords = self.base_coords.copy()
+            context_coords = self.context_coords.copy()
+            self._points = [
+                TrajectoryPoint(
+                    word=word,
+                    coords=base_coords[i],
+                    position=i,
+                    context_coords=context_coords[i],
+                    attention_weight=weight
+                )
+                for i, (word, weight) in enumerate(zip(self.words, self.attention_weights.tolist()))
+            ]
+        return self._points
+    
+    @points.setter
+    def points(self, points: List[TrajectoryPoint]):
+        points = list(points)
+        self.words = [p.word for p in points]
+        self.base_coords = np.array([p.coords for p in points], dtype=float).reshape(-1, 4)
+        self.context_coords = np.array([p.context_coords for p in points], dtype=float).reshape(-1, 4)
+        self.attention_weights = np.array([p.attention_weight for p in points], dtype=float)
+        self._points = points
     
     # ========================================================================
     # Encoding: Text → Meaning
@@ -111,35 +164,56 @@ class SemanticTrajectory:
         if not words:
             return self.ops.NE.copy()  # Empty sentence = neutral
         
-        # Look up coordinates
-        coords_sequence = []
-        for word in words:
-            coords = self.vocab.get_coords(word)
-            coords_sequence.append(coords)
+        # Look up coordinates, contextualize and weight as (n, 4) / (n,) arrays
+        self.words = words
+        self.base_coords = self.lookup_coords(words)
+        self.context_coords = self._contextualize(self.base_coords)
+        self.attention_weights = self._attention_weights(words)
+        self._points = None  # Built on request
         
-        # Contextualize
-        context_coords = self.contextualize_coords(coords_sequence)
+        # Integrate trajectory
+        self.meaning = self._integrate(self.context_coords, self.attention_weights)
+        return self.meaning
+    
+    def lookup_coords(self, words: List[str]) -> np.ndarray:
+        """
+        Coordinates of each word, as vocab.get_coords() gives them.
         
-        # Create trajectory points
-        self.points = []
-        for i, (word, base_coords, ctx_coords) in enumerate(
-            zip(words, coords_sequence, context_coords)
-        ):
-            # Compute attention weight (content words get more weight)
-            weight = self.compute_attention_weight(word, i, len(words))
+        With a built index, tokens are mapped to index rows through an
+        LRU cache (tokens not cached are looked up together) and the
+        coordinates gathered in one step; unknown words get
+        vocab.estimate_coords().
+        
+        Args:
+            words: Tokens
             
-            point = TrajectoryPoint(
-                word=word,
-                coords=base_coords,
-                position=i,
-                context_coords=ctx_coords,
-                attention_weight=weight
-            )
-            self.points.append(point)
+        Returns:
+            Coordinates, shape (len(words), 4)
+        """
+        if not self.vocab.is_indexed:
+            return np.array([self.vocab.get_coords(w) for w in words], dtype=float).reshape(-1, 4)
         
-        # Integrate trajectory
-        self.meaning = self.integrate_trajectory(self.points)
-        return self.meaning
+        index = self.vocab.coord_index
+        cache = self._row_cache
+        if self._rows_kdtree is not index.kdtree:
+            # New index: rows from the previous one are meaningless
+            cache.clear()
+            self._rows_kdtree = index.kdtree
+        
+        missing = list({w for w in words if w not in cache})
+        if missing:
+            cache.update(zip(missing, index.lookup(missing).tolist()))
+        
+        rows = np.array([cache[w] for w in words], dtype=np.intp)
+        for word in words:
+            cache.move_to_end(word)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+        
+        coords = index.coords_array.take(rows, axis=0).astype(float)
+        for i in np.flatnonzero(rows < 0):
+            coords[i] = self.vocab.estimate_coords(words[i])
+        return coords
     
     def tokenize(self, sentence: str) -> List[str]:
         """
@@ -180,22 +254,22 @@ class SemanticTrajectory:
         if len(coords_sequence) <= 1:
             return coords_sequence
         
-        contextualized = []
+        return list(self._contextualize(np.array(coords_sequence, dtype=float)))
+    
+    def _contextualize(self, coords: np.ndarray) -> np.ndarray:
+        """contextualize_coords() on an (n, 4) array."""
+        if len(coords) <= 1:
+            return coords
         
-        for i, coords in enumerate(coords_sequence):
-            # Get neighbors
-            prev_coords = coords_sequence[i-1] if i > 0 else coords
-            next_coords = coords_sequence[i+1] if i < len(coords_sequence)-1 else coords
-            
-            # Compute context (average of neighbors)
-            context = (prev_coords + next_coords) / 2
-            
-            # Blend: 70% word, 30% context
-            ctx_coords = 0.7 * coords + 0.3 * context
-            
-            contextualized.append(ctx_coords)
+        # Neighbors (the ends use themselves for the missing neighbor)
+        prev_coords = np.concatenate([coords[:1], coords[:-1]])
+        next_coords = np.concatenate([coords[1:], coords[-1:]])
         
-        return contextualized
+        # Compute context (average of neighbors)
+        context = (prev_coords + next_coords) / 2
+        
+        # Blend: 70% word, 30% context
+        return 0.7 * coords + 0.3 * context
     
     def compute_attention_weight(self, 
                                 word: str, 
@@ -218,14 +292,7 @@ class SemanticTrajectory:
             Attention weight (0.0 to 1.0)
         """
         # Function words (low weight)
-        function_words = {
-            'the', 'a', 'an', 'of', 'to', 'in', 'for', 'on', 'with',
-            'at', 'by', 'from', 'as', 'is', 'was', 'are', 'were',
-            'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does',
-            'did', 'will', 'would', 'could', 'should', 'may', 'might'
-        }
-        
-        if word in function_words:
+        if word in FUNCTION_WORDS:
             base_weight = 0.3
         else:
             base_weight = 1.0
@@ -255,15 +322,27 @@ class SemanticTrajectory:
         if not points:
             return self.ops.NE.copy()
         
-        # Weighted average
-        total_weight = sum(p.attention_weight for p in points)
+        return self._integrate(
+            np.array([p.context_coords for p in points], dtype=float),
+            np.array([p.attention_weight for p in points], dtype=float)
+        )
+    
+    def _attention_weights(self, words: List[str]) -> np.ndarray:
+        """compute_attention_weight() for every position at once."""
+        weights = np.array([0.3 if word in FUNCTION_WORDS else 1.0 for word in words])
         
-        meaning = np.zeros(4)
-        for point in points:
-            weight = point.attention_weight / total_weight
-            meaning += weight * point.context_coords
+        length = len(words)
+        if length > 2:
+            rel_pos = np.arange(length) / (length - 1)
+            weights *= 0.8 + 0.4 * np.exp(-((rel_pos - 0.5) ** 2) / 0.2)
         
-        return meaning
+        return weights
+    
+    def _integrate(self, context_coords: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Attention-weighted average of (n, 4) context coordinates."""
+        # Summed in sentence order, like the per-point loop this replaces
+        total_weight = sum(weights.tolist())
+        return np.sum((weights / total_weight)[:, None] * context_coords, axis=0)
     
     # ========================================================================
     # Generation: Meaning → Text
@@ -290,23 +369,73 @@ class SemanticTrajectory:
         Returns:
             Generated sentence
         """
+        return self.generate_sentences(
+            [meaning_coords],
+            max_length=max_length,
+            temperature=temperature
+        )[0]
+    
+    def generate_sentences(self,
+                          meanings: np.ndarray,
+                          max_length: int = 20,
+                          temperature: float = 0.3) -> List[str]:
+        """
+        Generate one sentence per meaning (see generate_sentence).
+        
+        The word candidates for every step of every trajectory come from a
+        single batched vocabulary query; selection then walks each
+        trajectory in order, drawing from np.random exactly as repeated
+        generate_sentence() calls would.
+        
+        Args:
+            meanings: Target meaning coordinates, shape (N, 4)
+            max_length: Maximum sentence length
+            temperature: Randomness (0=deterministic, 1=random)
+            
+        Returns:
+            List of N generated sentences
+        """
+        meanings = np.asarray(meanings, dtype=float).reshape(-1, 4)
+        num_steps = min(max_length, 10)
+        if num_steps <= 0:
+            return [""] * len(meanings)
+        
         # Navigate semantic space
-        trajectory = self.navigate_semantic_space(
-            start=self.ops.NE,
-            goal=meaning_coords,
-            num_steps=min(max_length, 10)
-        )
+        trajectories = [
+            self.navigate_semantic_space(start=self.ops.NE, goal=meaning, num_steps=num_steps)
+            for meaning in meanings
+        ]
         
-        # Select words along trajectory
+        # Top candidates for every step at once
+        k = min(10, len(self.vocab))
+        indices, distances = self.vocab.nearest_indices(
+            np.reshape(trajectories, (-1, 4)), k=k
+        )
+        words = self.vocab.words_at(indices).tolist()
+        distances = distances.tolist()
+        
+        sentences = []
+        for n, (meaning, trajectory) in enumerate(zip(meanings, trajectories)):
+            offset = n * num_steps
+            candidates = [
+                list(zip(words[offset + i], distances[offset + i]))
+                for i in range(num_steps)
+            ]
+            sentences.append(self._compose_sentence(meaning, trajectory, candidates, temperature))
+        
+        return sentences
+    
+    def _compose_sentence(self,
+                          meaning_coords: np.ndarray,
+                          trajectory: List[np.ndarray],
+                          candidates: List[List[Tuple[str, float]]],
+                          temperature: float) -> str:
+        """Select words along a trajectory from each step's candidates."""
         words = []
         used_words = set()
         
         for i, coords in enumerate(trajectory):
-            word = self.select_next_word(
-                coords, 
-                used_words,
-                temperature=temperature
-            )
+            word = self._choose_word(candidates[i], used_words, temperature)
             
             if word is None:
                 break
@@ -380,6 +509,16 @@ class SemanticTrajectory:
         k = min(10, len(self.vocab))
         candidates = self.vocab.nearest_words_with_distances(coords, k=k)
         
+        return self._choose_word(candidates, used_words, temperature)
+    
+    def _choose_word(self,
+                     candidates: List[Tuple[str, float]],
+                     used_words: set,
+                     temperature: float) -> Optional[str]:
+        """Pick a word from (word, distance) candidates, nearest first."""
+        if not candidates:
+            return None
+        
         # Filter out used words
         available = [(w, d) for w, d in candidates if w not in used_words]
         
@@ -420,18 +559,10 @@ class SemanticTrajectory:
         Returns:
             Coherence score [0, 1]
         """
-        if len(self.points) < 2:
+        if len(self.words) < 2:
             return 1.0
         
-        # Compute distances between consecutive points
-        distances = []
-        for i in range(len(self.points) - 1):
-            d = np.linalg.norm(
-                self.points[i+1].context_coords - self.points[i].context_coords
-            )
-            distances.append(d)
-        
-        avg_distance = np.mean(distances)
+        avg_distance = np.mean(self._step_distances())
         coherence = 1.0 / (1.0 + avg_distance)
         
         return coherence
@@ -447,34 +578,30 @@ class SemanticTrajectory:
         Returns:
             Smoothness score [0, 1]
         """
-        if len(self.points) < 3:
+        if len(self.words) < 3:
             return 1.0
         
-        # Compute distances between consecutive points
-        distances = []
-        for i in range(len(self.points) - 1):
-            d = np.linalg.norm(
-                self.points[i+1].context_coords - self.points[i].context_coords
-            )
-            distances.append(d)
-        
-        std_distance = np.std(distances)
+        std_distance = np.std(self._step_distances())
         smoothness = 1.0 / (1.0 + std_distance)
         
         return smoothness
     
+    def _step_distances(self) -> np.ndarray:
+        """Distances between consecutive context coordinates."""
+        return np.linalg.norm(np.diff(self.context_coords, axis=0), axis=1)
+    
     def get_trajectory_summary(self) -> Dict[str, Any]:
         """Get summary of current trajectory"""
-        if not self.points:
+        if not self.words:
             return {'length': 0}
         
         return {
-            'length': len(self.points),
-            'words': [p.word for p in self.points],
+            'length': len(self.words),
+            'words': list(self.words),
             'meaning': self.meaning.tolist() if self.meaning is not None else None,
             'coherence': self.measure_coherence(),
             'smoothness': self.measure_smoothness(),
-            'attention_weights': [p.attention_weight for p in self.points]
+            'attention_weights': self.attention_weights.tolist()
         }
 
 
@@ -29,12 +29,14 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional, Any
 import sys
 import os
+import time
 
 # Path setup for imports
 if __name__ == '__main__':
     sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bicameral.right.lov_coordination import LOVNetwork
+from bicameral.right.measurement import BoundedHistory
 from bicameral.right.metacognition import MetaCognitiveLayer
 from bicameral.right.principle_managers import (
     CoherenceManager,
@@ -43,6 +45,9 @@ from bicameral.right.principle_managers import (
     ResonanceManager
 )
 
+# Phases of unified_step, in order (timed per step)
+STEP_PHASES = ('love', 'forward', 'optimize', 'principles', 'domains', 'meta', 'vibrate')
+
 # Sacred constants
 GOLDEN_RATIO = 1.618033988749895
 PI = 3.141592653589793
@@ -92,7 +97,8 @@ class UniversalFrameworkCoordinator:
         target_harmony: float = 0.75,
         use_ice_substrate: bool = True,
         lov_cycle_period: int = 1000,
-        enable_meta_cognition: bool = True
+        enable_meta_cognition: bool = True,
+        history_size: Optional[int] = 10000
     ):
         """
         Initialize Universal Framework Coordinator.
@@ -105,6 +111,8 @@ class UniversalFrameworkCoordinator:
             use_ice_substrate: Use ICE layers (Intent-Context-Execution)
             lov_cycle_period: Training steps per LOV cycle (default 1000)
             enable_meta_cognition: Enable meta-cognitive layer
+            history_size: Coordination (and LOV phase) history entries
+                          kept (None = unbounded)
         """
         print("=" * 70)
         print("Initializing Universal Framework Coordinator")
@@ -121,7 +129,8 @@ class UniversalFrameworkCoordinator:
             target_harmony=target_harmony,
             use_ice_substrate=use_ice_substrate,
             enable_seven_principles=True,
-            lov_cycle_period=lov_cycle_period
+            lov_cycle_period=lov_cycle_period,
+            history_size=history_size
         )
         print()
 
@@ -156,9 +165,10 @@ class UniversalFrameworkCoordinator:
         self.love_frequency = LOVE_FREQUENCY
         self.anchor_point = ANCHOR_POINT
 
-        # Coordination state
+        # Coordination state (history entries summarize outputs, see unified_step)
         self.coordination_step = 0
-        self.coordination_history = []
+        self.coordination_history = BoundedHistory(maxlen=history_size)
+        self.phase_timings = {phase: {'calls': 0, 'total_seconds': 0.0} for phase in STEP_PHASES}
 
         print("=" * 70)
         print("Universal Framework Coordinator Ready")
@@ -244,13 +254,24 @@ class UniversalFrameworkCoordinator:
 
         This is the GOD cycle: Generate → Orchestrate → Deliver
 
+        Each expensive artifact is computed once per step and shared: one
+        forward pass feeds the domain metrics and is delivered as the
+        output, the Seven Principles measured in the love phase are the
+        ones validated, and output / weight statistics are shared by the
+        SFM, IPE and CCC metrics and meta-cognition.
+
         Args:
             inputs: Training inputs
             targets: Training targets
 
         Returns:
-            Complete coordination state
+            Complete coordination state, with 'timings' holding the
+            seconds spent in each phase (see STEP_PHASES). The history
+            keeps the same state with 'output' replaced by
+            'output_summary'.
         """
+        timings = {}
+        step_start = time.perf_counter()
         coordination_state = {
             'step': self.coordination_step,
             'timestamp': self.coordination_step  # In practice, would be real time
@@ -258,59 +279,151 @@ class UniversalFrameworkCoordinator:
 
         # === GENERATE (LOV Love Phase) ===
         # Measure truth at 613 THz
-        love_state = self.lov_network.love_phase()
+        love_state = self._timed('love', timings, self.lov_network.love_phase)
         coordination_state['love'] = love_state
 
-        # Get network outputs for framework metrics
-        outputs = self.lov_network.forward(inputs, training=False)
+        # Network forward pass (actual computation), in training mode so the
+        # layers cache activations for a backward pass
+        outputs = self._timed('forward', timings, self.lov_network.forward, inputs)
 
         # === ORCHESTRATE (Multiple coordinated processes) ===
 
         # 1. LOV Optimize Phase (φ coordination)
-        optimize_params = self.lov_network.optimize_phase(love_state)
+        optimize_params = self._timed('optimize', timings, self.lov_network.optimize_phase, love_state)
         coordination_state['optimize'] = optimize_params
 
         # 2. Seven Principles Validation (all principles)
-        principles = self._validate_all_principles()
+        principles = self._timed('principles', timings, self._validate_all_principles, love_state)
         coordination_state['principles'] = principles
 
         # 3. Domain Framework Coordination
-        domains = self._coordinate_domains(inputs, outputs)
+        def coordinate_domains():
+            shared = self._step_artifacts(outputs)
+            return shared, self._coordinate_domains(inputs, outputs, shared)
+
+        shared, domains = self._timed('domains', timings, coordinate_domains)
         coordination_state['domains'] = domains
 
         # 4. Meta-Cognition (if enabled)
         if self.meta_cognition:
-            meta_state = self.meta_cognition.meta_cognitive_step()
+            meta_state = self._timed('meta', timings, self.meta_cognition.meta_cognitive_step,
+                                     shared['structure'])
             coordination_state['meta'] = meta_state
 
         # === DELIVER (LOV Vibrate Phase + Output) ===
-
-        # Network forward pass (actual computation)
-        output = self.lov_network.forward(inputs)
-        coordination_state['output'] = output
+        coordination_state['output'] = outputs
 
         # Vibrate phase (613 THz consciousness propagation)
-        vibrate_state = self.lov_network.vibrate_phase()
+        vibrate_state = self._timed('vibrate', timings, self.lov_network.vibrate_phase)
         coordination_state['vibrate'] = vibrate_state
 
         # Update coordination step
         self.lov_network.lov_cycle_count += 1
         self.coordination_step += 1
 
-        # Track history
-        self.coordination_history.append(coordination_state)
+        timings['total'] = time.perf_counter() - step_start
+        coordination_state['timings'] = timings
+
+        # Track history (outputs summarized, not stored)
+        entry = dict(coordination_state)
+        del entry['output']
+        entry['output_summary'] = shared['output_summary']
+        self.coordination_history.append(entry)
 
         return coordination_state
 
-    def _validate_all_principles(self) -> Dict:
+    def _timed(self, phase: str, timings: Dict, function, *args):
+        """Run one step phase, recording its cost for this step and in total."""
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+        timings[phase] = elapsed
+        timing = self.phase_timings[phase]
+        timing['calls'] += 1
+        timing['total_seconds'] += elapsed
+        return result
+
+    def get_timing_report(self) -> List[Dict]:
+        """
+        Cost of each unified_step phase, most expensive first.
+
+        Returns:
+            List of dicts with name, calls, total_seconds, mean_ms
+        """
+        report = []
+        for name, timing in self.phase_timings.items():
+            calls = timing['calls']
+            report.append({
+                'name': name,
+                'calls': calls,
+                'total_seconds': timing['total_seconds'],
+                'mean_ms': 1000.0 * timing['total_seconds'] / calls if calls else 0.0
+            })
+        return sorted(report, key=lambda r: r['total_seconds'], reverse=True)
+
+    def _step_artifacts(self, outputs: np.ndarray) -> Dict:
+        """
+        Statistics shared by the domain metrics and meta-cognition.
+
+        Args:
+            outputs: Network outputs from this step's forward pass
+
+        Returns:
+            Dict with output statistics, per-layer weight statistics,
+            layer outputs (None where not cached), harmony and the
+            structural observation
+        """
+        layers = self.lov_network.layers
+        weighted = [layer for layer in layers if hasattr(layer, 'weights')]
+
+        output_strength = float(np.mean(np.max(outputs, axis=1)))  # Mean max probability
+        output_entropy = -float(np.mean(np.sum(outputs * np.log(outputs + 1e-10), axis=1)))
+
+        abs_weights = [np.abs(layer.weights) for layer in weighted]
+
+        return {
+            'output_strength': output_strength,
+            'output_entropy': output_entropy,
+            'output_summary': {
+                'shape': outputs.shape,
+                'confidence': output_strength,
+                'entropy': output_entropy,
+                'predictions': np.bincount(np.argmax(outputs, axis=1), minlength=outputs.shape[1]),
+            },
+            'total_parameters': sum(
+                layer.weights.size + layer.bias.size
+                for layer in layers
+                if hasattr(layer, 'weights') and hasattr(layer, 'bias')
+            ),
+            'weight_norms': [np.linalg.norm(layer.weights) for layer in weighted],
+            'total_connections': sum(layer.weights.size for layer in weighted),
+            'active_connections': sum(np.sum(w > 0.01) for w in abs_weights),  # Non-negligible
+            'connection_strengths': [float(np.mean(w)) for w in abs_weights],
+            'layer_outputs': [getattr(layer, 'last_output', None) for layer in layers],
+            'harmony': self.lov_network.get_current_harmony(),
+            'structure': {
+                'num_layers': len(layers),
+                'total_parameters': sum(layer.weights.size for layer in weighted),
+                'layer_sizes': [layer.size for layer in layers if hasattr(layer, 'size')]
+            }
+        }
+
+    def _validate_all_principles(self, love_state: Optional[Dict] = None) -> Dict:
         """
         Validate all Seven Universal Principles.
 
+        Args:
+            love_state: This step's love phase; its principles measurement
+                        is reused instead of measuring again
+
         Returns:
             Complete principles assessment
         """
-        # Get full validation from built-in validator
-        full_validation = self.lov_network.principles_validator.measure_all_principles(self.lov_network)
+        if love_state is not None and 'principles' in love_state:
+            full_validation = dict(love_state['principles'])
+        else:
+            # Get full validation from built-in validator
+            full_validation = self.lov_network.principles_validator.measure_all_principles(self.lov_network)
 
         # Add principle managers (2, 4, 5, 7)
         full_validation['principle_2_detailed'] = self.coherence_mgr.measure_emergence()
@@ -320,17 +433,21 @@ class UniversalFrameworkCoordinator:
 
         return full_validation
 
-    def _coordinate_domains(self, inputs: np.ndarray, outputs: np.ndarray) -> Dict:
+    def _coordinate_domains(self, inputs: np.ndarray, outputs: np.ndarray,
+                            shared: Optional[Dict] = None) -> Dict:
         """
         Coordinate all seven domain frameworks.
 
         Args:
             inputs: Current inputs for processing
             outputs: Network outputs from forward pass
+            shared: Step artifacts from _step_artifacts (computed if None)
 
         Returns:
             Domain coordination state
         """
+        if shared is None:
+            shared = self._step_artifacts(outputs)
         domain_states = {}
 
         # Domain 1: ICE (Consciousness) - ACTIVE
@@ -340,7 +457,7 @@ class UniversalFrameworkCoordinator:
         }
 
         # Domain 2: SFM (Matter) - NOW ACTIVE (computational implementation)
-        sfm_metrics = self._compute_sfm_metrics(inputs, outputs)
+        sfm_metrics = self._compute_sfm_metrics(inputs, outputs, shared)
         domain_states['SFM'] = {
             'status': 'active',
             'implementation': 'Digital neural network structure-force-manifestation',
@@ -351,7 +468,7 @@ class UniversalFrameworkCoordinator:
         }
 
         # Domain 3: IPE (Life) - NOW ACTIVE (computational implementation)
-        ipe_metrics = self._compute_ipe_metrics(inputs, outputs)
+        ipe_metrics = self._compute_ipe_metrics(inputs, outputs, shared)
         domain_states['IPE'] = {
             'status': 'active',
             'implementation': 'Digital neural network intake-process-expression',
@@ -390,7 +507,7 @@ class UniversalFrameworkCoordinator:
             }
 
         # Domain 7: CCC (Relationships) - NOW ACTIVE
-        ccc_metrics = self._compute_ccc_metrics(inputs, outputs)
+        ccc_metrics = self._compute_ccc_metrics(inputs, outputs, shared)
         domain_states['CCC'] = {
             'status': 'active',
             'implementation': 'Inter-layer connection and collaboration',
@@ -441,7 +558,7 @@ class UniversalFrameworkCoordinator:
                 'present': True,
                 'mechanism': 'LOV meta-framework at 613 THz',
                 'frequency': self.love_frequency,
-                'cycles_completed': len([v for v in self.lov_network.vibrate_phase_history if v.get('cycle_complete', False)])
+                'cycles_completed': self.lov_network.vibrations_completed
             }
         }
 
@@ -486,7 +603,8 @@ class UniversalFrameworkCoordinator:
 
         return status
 
-    def _compute_sfm_metrics(self, inputs: np.ndarray, outputs: np.ndarray) -> Dict:
+    def _compute_sfm_metrics(self, inputs: np.ndarray, outputs: np.ndarray,
+                             shared: Optional[Dict] = None) -> Dict:
         """
         Compute SFM (Structure-Force-Manifestation) metrics for Matter domain.
 
@@ -498,18 +616,17 @@ class UniversalFrameworkCoordinator:
         Args:
             inputs: Network inputs
             outputs: Network outputs
+            shared: Step artifacts from _step_artifacts (computed if None)
 
         Returns:
             SFM metrics dict
         """
+        if shared is None:
+            shared = self._step_artifacts(outputs)
         metrics = {}
 
         # Structure: Network topology metrics
-        total_params = sum(
-            layer.weights.size + layer.bias.size
-            for layer in self.lov_network.layers
-            if hasattr(layer, 'weights') and hasattr(layer, 'bias')
-        )
+        total_params = shared['total_parameters']
         metrics['structure'] = {
             'total_parameters': total_params,
             'layer_count': len(self.lov_network.layers),
@@ -517,10 +634,7 @@ class UniversalFrameworkCoordinator:
         }
 
         # Force: Weight and gradient magnitudes
-        weight_norms = []
-        for layer in self.lov_network.layers:
-            if hasattr(layer, 'weights'):
-                weight_norms.append(np.linalg.norm(layer.weights))
+        weight_norms = shared['weight_norms']
 
         metrics['force'] = {
             'mean_weight_norm': float(np.mean(weight_norms)) if weight_norms else 0.0,
@@ -529,8 +643,8 @@ class UniversalFrameworkCoordinator:
         }
 
         # Manifestation: Output strength and confidence
-        output_strength = float(np.mean(np.max(outputs, axis=1)))  # Mean max probability
-        output_entropy = -float(np.mean(np.sum(outputs * np.log(outputs + 1e-10), axis=1)))
+        output_strength = shared['output_strength']  # Mean max probability
+        output_entropy = shared['output_entropy']
 
         metrics['manifestation'] = {
             'output_strength': output_strength,
@@ -548,7 +662,8 @@ class UniversalFrameworkCoordinator:
 
         return metrics
 
-    def _compute_ipe_metrics(self, inputs: np.ndarray, outputs: np.ndarray) -> Dict:
+    def _compute_ipe_metrics(self, inputs: np.ndarray, outputs: np.ndarray,
+                             shared: Optional[Dict] = None) -> Dict:
         """
         Compute IPE (Intake-Process-Expression) metrics for Life domain.
 
@@ -560,10 +675,13 @@ class UniversalFrameworkCoordinator:
         Args:
             inputs: Network inputs
             outputs: Network outputs
+            shared: Step artifacts from _step_artifacts (computed if None)
 
         Returns:
             IPE metrics dict
         """
+        if shared is None:
+            shared = self._step_artifacts(outputs)
         metrics = {}
 
         # Intake: Input diversity and energy
@@ -579,10 +697,8 @@ class UniversalFrameworkCoordinator:
         }
 
         # Process: Hidden layer complexity
-        activations = []
-        for layer in self.lov_network.layers[:-1]:  # Exclude output layer
-            if hasattr(layer, 'last_output') and layer.last_output is not None:
-                activations.append(layer.last_output)
+        activations = [act for act in shared['layer_outputs'][:-1]  # Exclude output layer
+                       if act is not None]
 
         if activations:
             hidden_variance = float(np.mean([np.var(act) for act in activations]))
@@ -605,8 +721,8 @@ class UniversalFrameworkCoordinator:
 
         # Expression: Output quality and diversity
         output_variance = float(np.var(outputs))
-        output_max = float(np.mean(np.max(outputs, axis=1)))
-        output_entropy = -float(np.mean(np.sum(outputs * np.log(outputs + 1e-10), axis=1)))
+        output_max = shared['output_strength']
+        output_entropy = shared['output_entropy']
 
         metrics['expression'] = {
             'variance': output_variance,
@@ -624,7 +740,8 @@ class UniversalFrameworkCoordinator:
 
         return metrics
 
-    def _compute_ccc_metrics(self, inputs: np.ndarray, outputs: np.ndarray) -> Dict:
+    def _compute_ccc_metrics(self, inputs: np.ndarray, outputs: np.ndarray,
+                             shared: Optional[Dict] = None) -> Dict:
         """
         Compute CCC (Connect-Communicate-Collaborate) metrics for Relationships domain.
 
@@ -636,22 +753,19 @@ class UniversalFrameworkCoordinator:
         Args:
             inputs: Network inputs
             outputs: Network outputs
+            shared: Step artifacts from _step_artifacts (computed if None)
 
         Returns:
             CCC metrics dict
         """
+        if shared is None:
+            shared = self._step_artifacts(outputs)
         metrics = {}
 
         # Connect: Connection strength and density
-        total_connections = 0
-        active_connections = 0
-        connection_strengths = []
-
-        for layer in self.lov_network.layers:
-            if hasattr(layer, 'weights'):
-                total_connections += layer.weights.size
-                active_connections += np.sum(np.abs(layer.weights) > 0.01)  # Non-negligible
-                connection_strengths.append(float(np.mean(np.abs(layer.weights))))
+        total_connections = shared['total_connections']
+        active_connections = shared['active_connections']
+        connection_strengths = shared['connection_strengths']
 
         metrics['connect'] = {
             'total_connections': total_connections,
@@ -661,10 +775,7 @@ class UniversalFrameworkCoordinator:
         }
 
         # Communicate: Information flow metrics
-        layer_activations = []
-        for layer in self.lov_network.layers:
-            if hasattr(layer, 'last_output') and layer.last_output is not None:
-                layer_activations.append(layer.last_output)
+        layer_activations = [act for act in shared['layer_outputs'] if act is not None]
 
         if len(layer_activations) > 1:
             # Measure information flow: variance in activations across layers
@@ -684,7 +795,7 @@ class UniversalFrameworkCoordinator:
             }
 
         # Collaborate: Layer cooperation (measured via harmony)
-        harmony = self.lov_network.get_current_harmony()
+        harmony = shared['harmony']
 
         metrics['collaborate'] = {
             'harmony': harmony,
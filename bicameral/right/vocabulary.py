@@ -13,8 +13,9 @@ Features:
 - Word → coordinates lookup (semantic encoding)
 - Coordinates → word lookup (semantic decoding)
 - Fast nearest neighbor search (O(log n) with KD-tree)
+- Batched nearest neighbor search (many coordinates in one KD-tree query)
 - Unknown word estimation
-- Vocabulary persistence (save/load)
+- Vocabulary persistence (save/load, pickle or memory-mapped store)
 - Multi-source database loading
 
 Author: Wellington Kwati Taureka (World's First Consciousness Engineer)
@@ -23,6 +24,7 @@ Based on: LJPW LLM Training Paradigm
 """
 
 import numpy as np
+import hashlib
 import json
 import os
 from typing import Dict, List, Optional, Tuple, Union, Any
@@ -30,6 +32,10 @@ from dataclasses import dataclass
 from scipy.spatial import KDTree
 import pickle
 
+from bicameral.right.vocabulary_store import (
+    StoredEntries, open_store, save_store, is_store, FORMAT_VERSION as STORE_FORMAT_VERSION
+)
+
 
 # Sacred constants
 ANCHOR_POINT = np.array([1.0, 1.0, 1.0, 1.0])  # JEHOVAH - Divine Perfection
@@ -79,12 +85,17 @@ class CoordinateIndex:
     Fast spatial indexing for coordinate → word lookup.
     
     Uses KD-tree for O(log n) nearest neighbor search in 4D LJPW space.
+    
+    word_list is a NumPy string array (memory-mapped when the index comes
+    from a vocabulary store); row i of word_list, coords_array and the
+    KD-tree data describe the same word.
     """
     
     def __init__(self):
         self.kdtree: Optional[KDTree] = None
-        self.word_list: List[str] = []
+        self.word_list: np.ndarray = np.array([], dtype=str)
         self.coords_array: Optional[np.ndarray] = None
+        self.key_order: Optional[np.ndarray] = None  # rows sorted by word, for rows()
         
     def build_index(self, word_coords: Dict[str, np.ndarray]):
         """
@@ -97,15 +108,33 @@ class CoordinateIndex:
             raise ValueError("Cannot build index from empty vocabulary")
         
         # Extract words and coordinates
-        self.word_list = list(word_coords.keys())
-        coords_list = [word_coords[w] for w in self.word_list]
+        words = list(word_coords.keys())
+        coords_list = [word_coords[w] for w in words]
+        self.word_list = np.array(words, dtype=str)
         self.coords_array = np.array(coords_list)
+        self.key_order = None
         
         # Build KD-tree for fast nearest neighbor search
         self.kdtree = KDTree(self.coords_array)
         
         print(f"Built KD-tree index with {len(self.word_list)} words")
     
+    def use_store(self, store):
+        """
+        Use the prebuilt KD-tree and arrays of a vocabulary store
+        (see vocabulary_store) instead of building an index.
+        
+        Args:
+            store: Open VocabularyStore
+        """
+        if not len(store):
+            raise ValueError("Cannot build index from empty vocabulary")
+        
+        self.word_list = store.keys
+        self.coords_array = store.coords
+        self.key_order = store.key_order
+        self.kdtree = store.kdtree
+    
     def query(self, 
              coords: np.ndarray, 
              k: int = 1,
@@ -130,16 +159,75 @@ class CoordinateIndex:
         
         # Get corresponding words
         if k == 1:
-            nearest_word = self.word_list[indices]
+            nearest_word = str(self.word_list[indices])
             if return_distances:
                 return nearest_word, distances
             return nearest_word
         else:
-            nearest_words = [self.word_list[i] for i in indices]
+            nearest_words = self.word_list[indices].tolist()
             if return_distances:
                 return nearest_words, distances
             return nearest_words
     
+    def query_batch(self, coords: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest words to each of several coordinates with a
+        single KD-tree query.
+        
+        Args:
+            coords: Query coordinates, shape (M, 4)
+            k: Number of nearest neighbors per query (capped at index size)
+            
+        Returns:
+            (indices, distances), both shape (M, min(k, len(word_list))),
+            nearest first. Indices are rows of word_list / coords_array.
+        """
+        if self.kdtree is None:
+            raise RuntimeError("Index not built. Call build_index() first.")
+        
+        coords = np.asarray(coords, dtype=float).reshape(-1, self.coords_array.shape[1])
+        k = min(k, len(self.word_list))
+        distances, indices = self.kdtree.query(coords, k=k)
+        if k == 1:
+            # KDTree drops the neighbor axis for k=1
+            distances, indices = distances[:, None], indices[:, None]
+        return indices, distances
+    
+    def lookup(self, words) -> np.ndarray:
+        """
+        Row of each word in the index.
+        
+        Args:
+            words: Iterable of words (matched case-insensitively)
+            
+        Returns:
+            int array aligned with words, -1 for words not indexed
+        """
+        keys = np.array([w.lower() for w in words], dtype=str)
+        if not len(keys) or not len(self.word_list):
+            return np.full(len(keys), -1, dtype=np.intp)
+        
+        # Binary search in word order
+        if self.key_order is None:
+            self.key_order = np.argsort(self.word_list, kind='stable')
+        positions = np.searchsorted(self.word_list, keys, sorter=self.key_order)
+        rows = self.key_order[np.minimum(positions, len(self.word_list) - 1)].astype(np.intp)
+        rows[self.word_list[rows] != keys] = -1
+        return rows
+    
+    def rows(self, words) -> np.ndarray:
+        """
+        Rows of the given words in the index (words not indexed are skipped).
+        
+        Args:
+            words: Iterable of words (matched case-insensitively)
+            
+        Returns:
+            Sorted array of unique row indices
+        """
+        rows = self.lookup(words)
+        return np.unique(rows[rows >= 0])
+    
     def query_radius(self, coords: np.ndarray, radius: float) -> List[Tuple[str, float]]:
         """
         Find all words within radius of coordinates.
@@ -157,7 +245,7 @@ class CoordinateIndex:
         indices = self.kdtree.query_ball_point(coords, radius)
         results = []
         for i in indices:
-            word = self.word_list[i]
+            word = str(self.word_list[i])
             distance = np.linalg.norm(self.coords_array[i] - coords)
             results.append((word, distance))
         
@@ -195,6 +283,11 @@ class LJPWVocabulary:
         """Check if word is in vocabulary"""
         return word.lower() in self.word_to_entry
     
+    @property
+    def is_indexed(self) -> bool:
+        """True when the KD-tree index is built and reflects every entry"""
+        return self._index_built
+    
     def register(self, 
                 word: str, 
                 coords: Union[np.ndarray, List[float]],
@@ -281,21 +374,71 @@ class LJPWVocabulary:
             self.build_index()
         
         if exclude:
-            # Query more than k to account for exclusions
-            candidates = self.coord_index.query(coords, k=k*3)
-            if isinstance(candidates, str):
-                candidates = [candidates]
-            
-            # Filter out excluded words
-            filtered = [w for w in candidates if w.lower() not in [e.lower() for e in exclude]]
+            indices, _ = self.nearest_indices(coords, k=k, exclude=exclude)
+            filtered = self.coord_index.word_list[indices[0][indices[0] >= 0]].tolist()
             
             if k == 1:
                 return filtered[0] if filtered else None
             else:
-                return filtered[:k]
+                return filtered
         else:
             return self.coord_index.query(coords, k=k)
     
+    def nearest_indices(self,
+                        coords: np.ndarray,
+                        k: int = 1,
+                        exclude: Optional[List[str]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest words to each of several coordinates at once.
+        
+        All queries go to the KD-tree in one call, so this is much faster
+        than calling nearest_word() in a loop. Excluded words are turned
+        into index rows once and masked out of an over-fetched result
+        (k + number of excluded words per query).
+        
+        Args:
+            coords: Query coordinates, shape (M, 4)
+            k: Number of nearest words per query
+            exclude: Words to exclude from every result
+            
+        Returns:
+            (indices, distances), both shape (M, min(k, len(self))), nearest
+            first. Map indices to words with words_at(). Queries left with
+            fewer than k words after exclusion are padded with index -1
+            and distance inf.
+        """
+        if not self._index_built:
+            self.build_index()
+        
+        excluded = self.coord_index.rows(exclude) if exclude else None
+        if excluded is None or len(excluded) == 0:
+            return self.coord_index.query_batch(coords, k=k)
+        
+        indices, distances = self.coord_index.query_batch(coords, k=k + len(excluded))
+        keep = ~np.isin(indices, excluded)
+        # Stable sort moves the kept candidates to the front, still nearest first
+        order = np.argsort(~keep, axis=1, kind='stable')[:, :min(k, len(self))]
+        indices = np.take_along_axis(np.where(keep, indices, -1), order, axis=1)
+        distances = np.take_along_axis(np.where(keep, distances, np.inf), order, axis=1)
+        return indices, distances
+    
+    def words_at(self, indices: np.ndarray) -> np.ndarray:
+        """
+        Words at index rows returned by nearest_indices().
+        
+        Args:
+            indices: Array of index rows (-1 for padding)
+            
+        Returns:
+            Object array of words with the same shape (None for padding)
+        """
+        if not self._index_built:
+            self.build_index()
+        
+        indices = np.asarray(indices)
+        words = self.coord_index.word_list[indices].astype(object)
+        return np.where(indices >= 0, words, None)
+    
     def nearest_words_with_distances(self, 
                                     coords: np.ndarray, 
                                     k: int = 5) -> List[Tuple[str, float]]:
@@ -354,6 +497,13 @@ class LJPWVocabulary:
     
     def build_index(self):
         """Build KD-tree index for fast nearest neighbor search"""
+        entries = self.word_to_entry
+        if isinstance(entries, StoredEntries) and not entries.modified:
+            # Loaded from a store and unchanged: use its prebuilt KD-tree
+            self.coord_index.use_store(entries.store)
+            self._index_built = True
+            return
+        
         word_coords = {word: entry.coords for word, entry in self.word_to_entry.items()}
         self.coord_index.build_index(word_coords)
         self._index_built = True
@@ -370,7 +520,7 @@ class LJPWVocabulary:
         """
         data = {
             'vocab_size': self.vocab_size,
-            'entries': self.word_to_entry
+            'entries': dict(self.word_to_entry)
         }
         
         with open(path, 'wb') as f:
@@ -378,18 +528,40 @@ class LJPWVocabulary:
         
         print(f"Saved vocabulary with {len(self)} words to {path}")
     
+    def save_compact(self, path: str, source: Optional[Dict] = None):
+        """
+        Save vocabulary as a memory-mappable store directory (see
+        vocabulary_store). Loading it takes milliseconds at any size and
+        needs no KD-tree rebuild; coordinates are stored as float32.
+        
+        Args:
+            path: Store directory
+            source: source_stamp() of the file this vocabulary was loaded
+                    from, recorded so a stale store can be detected
+        """
+        save_store(path, self.word_to_entry, self.vocab_size, source=source)
+        
+        print(f"Saved vocabulary with {len(self)} words to {path}")
+    
     def load(self, path: str):
         """
         Load vocabulary from disk.
         
         Args:
-            path: File path to load from
+            path: Pickle file written by save(), or store directory
+                  written by save_compact() (memory-mapped, entries are
+                  read on demand)
         """
-        with open(path, 'rb') as f:
-            data = pickle.load(f)
-        
-        self.vocab_size = data['vocab_size']
-        self.word_to_entry = data['entries']
+        if is_store(path):
+            store = open_store(path)
+            self.vocab_size = store.vocab_size
+            self.word_to_entry = StoredEntries(store)
+        else:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            
+            self.vocab_size = data['vocab_size']
+            self.word_to_entry = data['entries']
         self._index_built = False
         
         print(f"Loaded vocabulary with {len(self)} words from {path}")
@@ -488,30 +660,57 @@ class VocabularyLoader:
         
         return entries
     
+    @staticmethod
+    def cache_key(full_paths: List[str]) -> str:
+        """
+        Cache key for merging these files: changes when any file is
+        added, removed, reordered or modified.
+        """
+        stamps = []
+        for full_path in full_paths:
+            try:
+                stat = os.stat(full_path)
+                stamps.append([os.path.abspath(full_path), stat.st_size, stat.st_mtime_ns])
+            except OSError:
+                stamps.append([os.path.abspath(full_path), None, None])
+        
+        digest = hashlib.sha1(json.dumps(stamps).encode('utf-8')).hexdigest()[:16]
+        return f"vocabulary-v{STORE_FORMAT_VERSION}-{digest}"
+    
     @staticmethod
     def load_multiple_files(filepaths: List[str], 
-                          data_dir: Optional[str] = None) -> LJPWVocabulary:
+                          data_dir: Optional[str] = None,
+                          cache_dir: Optional[str] = None) -> LJPWVocabulary:
         """
         Load and merge multiple coordinate database files.
         
         Args:
             filepaths: List of JSON file paths
             data_dir: Base directory for files (optional)
+            cache_dir: Directory for a compact store of the merged
+                       vocabulary, or None to always parse the JSON files.
+                       The store is reused until a file changes.
             
         Returns:
             LJPWVocabulary with merged data
         """
+        full_paths = [os.path.join(data_dir, filepath) if data_dir else filepath
+                      for filepath in filepaths]
+        
+        cache_path = None
+        if cache_dir is not None:
+            cache_path = os.path.join(cache_dir, VocabularyLoader.cache_key(full_paths))
+            if is_store(cache_path):
+                vocab = LJPWVocabulary(vocab_size=100000)
+                vocab.load(cache_path)
+                return vocab
+        
         vocab = LJPWVocabulary(vocab_size=100000)
         
         total_loaded = 0
         total_duplicates = 0
         
-        for filepath in filepaths:
-            if data_dir:
-                full_path = os.path.join(data_dir, filepath)
-            else:
-                full_path = filepath
-            
+        for filepath, full_path in zip(filepaths, full_paths):
             if not os.path.exists(full_path):
                 print(f"Warning: File not found: {full_path}")
                 continue
@@ -546,6 +745,11 @@ class VocabularyLoader:
         
         print(f"\nTotal: {total_loaded} unique words loaded ({total_duplicates} duplicates skipped)")
         
+        if cache_path is not None and len(vocab):
+            # Return the stored copy, so cached and fresh loads agree exactly
+            vocab.save_compact(cache_path)
+            vocab.load(cache_path)
+        
         return vocab
 
 
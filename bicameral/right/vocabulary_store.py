@@ -0,0 +1,312 @@
+"""
+Compact Vocabulary Store
+
+LJPWVocabulary.save() pickles a dict of WordEntry objects. Loading it
+unpickles every entry, and the first query then rebuilds the KD-tree from
+a Python dict - seconds of startup for a 100k-word vocabulary before a
+single word is looked up.
+
+This module stores a vocabulary as a directory of flat arrays instead:
+
+    <path>/
+        manifest.json          format, vocab_size, language/source tables
+        coords.npy             (n, 4) float32 coordinates, one row per word
+        keys.npy               (n,) lookup keys (lowercased words)
+        key_order.npy          (n,) rows in key order, for binary search
+        words.npy              (n,) words as registered
+        languages.npy          (n,) uint16 index into manifest['languages']
+        sources.npy            (n,) uint16 index into manifest['sources']
+        metadata.npy           per-word metadata, concatenated UTF-8 JSON
+        metadata_offsets.npy   (n + 1,) byte offsets into metadata.npy
+        kdtree.pkl             KD-tree over coords.npy
+
+- Every array is memory-mapped on open, so opening costs the same for
+  ten words or a million
+- Words are found by binary search over keys.npy; WordEntry objects are
+  created only for the words actually used (StoredEntries stands in for
+  the word_to_entry dict)
+- The KD-tree is unpickled rather than rebuilt; it is rebuilt from
+  coords.npy when missing or written by another SciPy version
+- manifest.json is removed first and written last, so an interrupted
+  save leaves no store that open_store() would accept
+- A store converted from another file can record that file's
+  source_stamp(), so callers can tell when the store is out of date
+
+Coordinates are stored as float32: a vocabulary read back from a store
+has its coordinates rounded to float32 precision.
+
+Example:
+    >>> vocab.save_compact('data/ljpw_vocabulary')
+    >>> vocab = LJPWVocabulary()
+    >>> vocab.load('data/ljpw_vocabulary')  # milliseconds, any size
+"""
+
+import json
+import os
+import pickle
+from collections.abc import MutableMapping
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterator, Mapping, Optional
+
+import numpy as np
+import scipy
+from scipy.spatial import KDTree
+
+FORMAT = 'ljpw-vocabulary'
+FORMAT_VERSION = 1
+
+MANIFEST_FILE = 'manifest.json'
+KDTREE_FILE = 'kdtree.pkl'
+ARRAY_FILES = ('coords', 'keys', 'key_order', 'words', 'languages', 'sources',
+               'metadata', 'metadata_offsets')
+
+
+def _write_atomic(path: Path, write):
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'wb') as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+def _json_default(value):
+    """json.dumps fallback for NumPy values in metadata."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def source_stamp(path) -> Dict:
+    """Size and mtime of a source file, as recorded in a store manifest."""
+    stat = os.stat(path)
+    return {'path': os.path.abspath(path), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def is_store(path) -> bool:
+    """True if path is a vocabulary store directory."""
+    return (Path(path) / MANIFEST_FILE).is_file()
+
+
+def save_store(path, entries: Mapping, vocab_size: int, source: Optional[Dict] = None) -> Path:
+    """
+    Write a vocabulary store.
+
+    Args:
+        path: Store directory (created if needed; an existing store is
+              replaced)
+        entries: Mapping of lookup key -> WordEntry (LJPWVocabulary.word_to_entry)
+        vocab_size: Vocabulary size limit to record
+        source: source_stamp() of the file the entries were read from
+
+    Returns:
+        The store directory
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    manifest_path = path / MANIFEST_FILE
+    if manifest_path.exists():
+        manifest_path.unlink()
+
+    keys = list(entries.keys())
+    records = [entries[key] for key in keys]
+    languages = sorted({entry.language for entry in records})
+    sources = sorted({entry.source for entry in records})
+    language_codes = {language: i for i, language in enumerate(languages)}
+    source_codes = {source: i for i, source in enumerate(sources)}
+
+    metadata = [json.dumps(entry.metadata, default=_json_default).encode('utf-8')
+                if entry.metadata else b'' for entry in records]
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(blob) for blob in metadata], out=offsets[1:])
+
+    coords = np.array([entry.coords for entry in records], dtype=np.float32).reshape(len(records), 4)
+    key_array = np.array(keys, dtype=str)
+    arrays = {
+        'coords': coords,
+        'keys': key_array,
+        'key_order': np.argsort(key_array, kind='stable'),
+        'words': np.array([entry.word for entry in records], dtype=str),
+        'languages': np.array([language_codes[entry.language] for entry in records], dtype=np.uint16),
+        'sources': np.array([source_codes[entry.source] for entry in records], dtype=np.uint16),
+        'metadata': np.frombuffer(b''.join(metadata), dtype=np.uint8),
+        'metadata_offsets': offsets,
+    }
+    for name, array in arrays.items():
+        _write_atomic(path / f"{name}.npy", partial(np.save, arr=array, allow_pickle=False))
+
+    kdtree = None
+    if len(records):
+        kdtree = KDTREE_FILE
+        tree = KDTree(coords)
+        _write_atomic(path / KDTREE_FILE, lambda f: pickle.dump(tree, f, protocol=pickle.HIGHEST_PROTOCOL))
+
+    manifest = {
+        'format': FORMAT,
+        'version': FORMAT_VERSION,
+        'size': len(records),
+        'vocab_size': vocab_size,
+        'languages': languages,
+        'sources': sources,
+        'kdtree': {'file': kdtree, 'scipy': scipy.__version__},
+        'source': source,
+    }
+    _write_atomic(manifest_path, lambda f: f.write(json.dumps(manifest, indent=2).encode()))
+    return path
+
+
+class VocabularyStore:
+    """
+    Read-only view of a store directory.
+
+    Opening reads manifest.json and memory-maps the arrays; the KD-tree
+    is loaded on first use.
+    """
+
+    def __init__(self, path, mmap: bool = True):
+        """
+        Open a store.
+
+        Args:
+            path: Directory written by save_store()
+            mmap: Memory-map the arrays read-only instead of reading them
+
+        Raises:
+            FileNotFoundError: If path holds no manifest
+            ValueError: If the manifest is not a vocabulary store
+        """
+        self.path = Path(path)
+        with open(self.path / MANIFEST_FILE, 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != FORMAT:
+            raise ValueError(f"{self.path} is not a vocabulary store")
+        if self.manifest['version'] > FORMAT_VERSION:
+            raise ValueError(f"Vocabulary store version {self.manifest['version']} is newer than "
+                             f"supported version {FORMAT_VERSION}")
+
+        for name in ARRAY_FILES:
+            setattr(self, name, np.load(self.path / f"{name}.npy",
+                                        mmap_mode='r' if mmap else None, allow_pickle=False))
+        self.vocab_size: int = self.manifest['vocab_size']
+        self.source: Optional[Dict] = self.manifest.get('source')
+        self._kdtree: Optional[KDTree] = None
+
+    def __len__(self) -> int:
+        return self.manifest['size']
+
+    def row(self, key: str) -> Optional[int]:
+        """Row of a lookup key, or None if the store does not have it."""
+        if not len(self):
+            return None
+        position = int(np.searchsorted(self.keys, key, sorter=self.key_order))
+        if position == len(self):
+            return None
+        row = int(self.key_order[position])
+        return row if self.keys[row] == key else None
+
+    def entry(self, row: int):
+        """Materialize the WordEntry stored at a row."""
+        from bicameral.right.vocabulary import WordEntry
+
+        start, stop = self.metadata_offsets[row], self.metadata_offsets[row + 1]
+        metadata = json.loads(self.metadata[start:stop].tobytes()) if stop > start else {}
+        return WordEntry(
+            word=str(self.words[row]),
+            coords=np.array(self.coords[row], dtype=np.float64),
+            language=self.manifest['languages'][self.languages[row]],
+            source=self.manifest['sources'][self.sources[row]],
+            metadata=metadata
+        )
+
+    @property
+    def kdtree(self) -> KDTree:
+        """KD-tree over coords (row i of the tree data is row i of the store)."""
+        if self._kdtree is None:
+            self._kdtree = self._load_kdtree()
+        return self._kdtree
+
+    def _load_kdtree(self) -> KDTree:
+        spec = self.manifest['kdtree']
+        if spec['file'] and spec['scipy'] == scipy.__version__:
+            try:
+                with open(self.path / spec['file'], 'rb') as f:
+                    tree = pickle.load(f)
+                if isinstance(tree, KDTree) and tree.n == len(self):
+                    return tree
+            except (OSError, pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+                pass
+        return KDTree(self.coords)
+
+
+def open_store(path, mmap: bool = True) -> VocabularyStore:
+    """Open a vocabulary store directory (see VocabularyStore)."""
+    return VocabularyStore(path, mmap=mmap)
+
+
+class StoredEntries(MutableMapping):
+    """
+    Lazy word_to_entry mapping backed by a VocabularyStore.
+
+    Entries are read from the store when first accessed. Words registered
+    or removed afterwards live in memory on top of the store, which is
+    never written to.
+    """
+
+    def __init__(self, store: VocabularyStore):
+        self.store = store
+        self._read: Dict[str, object] = {}  # entries read from the store
+        self._set: Dict[str, object] = {}  # entries assigned since opening
+        self._removed: set = set()
+        self._new = 0  # assigned keys the store does not have
+
+    @property
+    def modified(self) -> bool:
+        """True once any entry has been assigned or removed."""
+        return bool(self._set or self._removed)
+
+    def _stored(self, key) -> bool:
+        return isinstance(key, str) and key not in self._removed and self.store.row(key) is not None
+
+    def __getitem__(self, key):
+        if key in self._set:
+            return self._set[key]
+        if key in self._read:
+            return self._read[key]
+        if not self._stored(key):
+            raise KeyError(key)
+        entry = self._read[key] = self.store.entry(self.store.row(key))
+        return entry
+
+    def __setitem__(self, key, entry):
+        if key not in self._set and self.store.row(key) is None:
+            self._new += 1
+        self._set[key] = entry
+        self._removed.discard(key)
+        self._read.pop(key, None)
+
+    def __delitem__(self, key):
+        if key in self._set:
+            del self._set[key]
+            if self.store.row(key) is None:
+                self._new -= 1
+                return
+        elif not self._stored(key):
+            raise KeyError(key)
+        self._read.pop(key, None)
+        self._removed.add(key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._set or self._stored(key)
+
+    def __len__(self) -> int:
+        return len(self.store) - len(self._removed) + self._new
+
+    def __iter__(self) -> Iterator[str]:
+        # Stored keys keep their position (as dict keys do when reassigned)
+        for key in self.store.keys.tolist():
+            if key not in self._removed:
+                yield key
+        for key in self._set:
+            if self.store.row(key) is None:
+                yield key
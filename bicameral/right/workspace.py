@@ -0,0 +1,84 @@
+"""
+Reusable Scratch Buffers for Layer Kernels
+
+Training calls the same forward/backward kernels thousands of times with
+the same shapes. Allocating fresh intermediates on every call dominates
+small-layer cost, so layers in buffer-reusing mode take their scratch
+arrays from a Workspace instead and write into them with `out=` ufuncs.
+
+Buffers are keyed by (name, shape), so a change of batch size (e.g. a
+short final batch, or a full-dataset predict) simply gets its own set.
+The least recently used shapes are dropped beyond max_entries.
+
+Example:
+    >>> ws = Workspace(dtype=np.float32)
+    >>> a = ws.get('z', (32, 89))
+    >>> ws.get('z', (32, 89)) is a
+    True
+"""
+
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
+
+
+class Workspace:
+    """
+    Named scratch arrays reused across calls.
+
+    Arrays returned by get() are uninitialized and are overwritten by the
+    next caller asking for the same (name, shape) - callers must not keep
+    them beyond the step that produced them.
+    """
+
+    def __init__(self, dtype=np.float64, max_entries: int = 32):
+        """
+        Initialize workspace.
+
+        Args:
+            dtype: Element type of every buffer
+            max_entries: Maximum number of (name, shape) buffers retained
+        """
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+
+        self.dtype = np.dtype(dtype)
+        self.max_entries = max_entries
+        self._buffers: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+        self.allocations = 0
+
+    def get(self, name: str, shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Get the scratch buffer for name at shape, allocating on first use.
+
+        Args:
+            name: Buffer role (e.g. 'z', 'grad_input')
+            shape: Required shape
+
+        Returns:
+            Uninitialized array of the workspace dtype
+        """
+        key = (name, tuple(shape))
+        buffer = self._buffers.get(key)
+        if buffer is None:
+            buffer = np.empty(shape, dtype=self.dtype)
+            self._buffers[key] = buffer
+            self.allocations += 1
+            if len(self._buffers) > self.max_entries:
+                self._buffers.popitem(last=False)
+        else:
+            self._buffers.move_to_end(key)
+        return buffer
+
+    def clear(self):
+        """Release all buffers."""
+        self._buffers.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by retained buffers."""
+        return sum(buffer.nbytes for buffer in self._buffers.values())
+
+    def __len__(self) -> int:
+        return len(self._buffers)
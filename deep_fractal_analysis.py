@@ -24,8 +24,9 @@ from ljpw_semantic_capabilities import (
     harmony_index, semantic_mass, semantic_density, semantic_influence,
     semantic_clarity, calculate_drift, drift_interpretation,
     match_archetype, describe_archetype,
-    semantic_gravity, semantic_friction, semantic_resonance,
+    semantic_gravity,
     all_secondary_metrics, aggregate_profiles,
+    entity_coordinates, resonance_clusters, LJPWSpatialIndex,
     ANCHOR_POINT, NATURAL_EQUILIBRIUM
 )
 
@@ -278,40 +279,16 @@ def calculate_entropy(entities: List[SemanticEntity]) -> float:
 
 def find_resonance_clusters(entities: List[SemanticEntity], threshold: float = 0.85) -> List[List[str]]:
     """Find clusters of highly resonant entities."""
-    clusters = []
-    used = set()
-    
-    for i, e1 in enumerate(entities):
-        if e1.name in used:
-            continue
-        
-        cluster = [e1.name]
-        used.add(e1.name)
-        
-        for j, e2 in enumerate(entities):
-            if i != j and e2.name not in used:
-                res = semantic_resonance(e1, e2)
-                if res >= threshold:
-                    cluster.append(e2.name)
-                    used.add(e2.name)
-        
-        if len(cluster) > 1:
-            clusters.append(cluster)
-    
-    return clusters
+    names = [e.name for e in entities]
+    clusters = resonance_clusters(entity_coordinates(entities), threshold, keys=names)
+    return [[names[i] for i in cluster] for cluster in clusters]
 
 
 def find_friction_hotspots(entities: List[SemanticEntity], threshold: float = 0.5) -> List[Tuple[str, str, float]]:
     """Find pairs with dangerous friction levels."""
-    hotspots = []
-    
-    for i, e1 in enumerate(entities):
-        for e2 in entities[i+1:]:
-            friction = semantic_friction(e1, e2)
-            if friction >= threshold:
-                hotspots.append((e1.name, e2.name, friction))
-    
-    return sorted(hotspots, key=lambda x: x[2], reverse=True)[:10]
+    index = LJPWSpatialIndex(entity_coordinates(entities))
+    hotspots = index.top_friction_pairs(10, threshold=threshold)
+    return [(entities[i].name, entities[j].name, friction) for i, j, friction in hotspots]
 
 
 def detect_emergent_patterns_deep(
@@ -41,7 +41,9 @@ def load_cifar10(
         train_size: Number of training samples (default: all 50k)
         test_size: Number of test samples (default: all 10k)
         flatten: Flatten images to 1D vectors
-        normalize: Normalize to [0, 1]
+        normalize: Normalize to [0, 1]. With False, Keras data stays uint8
+                   (a quarter of the memory); train on it through
+                   ljpw_nn.batches.BatchIterator, which normalizes per batch.
 
     Returns:
         X_train, y_train, X_test, y_test
@@ -95,9 +97,7 @@ def load_cifar10(
             y_train = y_train.flatten()
             y_test = y_test.flatten()
             # Already in (H, W, C) format
-            # Values are 0-255, will normalize below if requested
-            X_train = X_train.astype(np.float32)
-            X_test = X_test.astype(np.float32)
+            # Values are 0-255 uint8, will normalize below if requested
             print("✓ Loaded CIFAR-10 via Keras")
 
         except Exception as e:
@@ -112,8 +112,8 @@ def load_cifar10(
 
     # Normalize if requested
     if normalize and X_train.max() > 1.0:
-        X_train = X_train / 255.0
-        X_test = X_test / 255.0
+        X_train = X_train.astype(np.float32) / 255.0
+        X_test = X_test.astype(np.float32) / 255.0
 
     # Flatten if requested
     if flatten:
@@ -214,7 +214,8 @@ def generate_synthetic_cifar10(n_samples: int) -> Tuple[np.ndarray, np.ndarray]:
 
 def load_fashion_mnist(
     train_size: Optional[int] = None,
-    test_size: Optional[int] = None
+    test_size: Optional[int] = None,
+    normalize: bool = True
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Load Fashion-MNIST dataset.
@@ -228,6 +229,9 @@ def load_fashion_mnist(
     Args:
         train_size: Number of training samples
         test_size: Number of test samples
+        normalize: Normalize to float32 in [0, 1]. With False, Keras data
+                   stays uint8 (a quarter of the memory); train on it through
+                   ljpw_nn.batches.BatchIterator, which normalizes per batch.
 
     Returns:
         X_train, y_train, X_test, y_test
@@ -239,8 +243,9 @@ def load_fashion_mnist(
         (X_train, y_train), (X_test, y_test) = keras.datasets.fashion_mnist.load_data()
 
         # Normalize to [0, 1]
-        X_train = X_train.astype(np.float32) / 255.0
-        X_test = X_test.astype(np.float32) / 255.0
+        if normalize:
+            X_train = X_train.astype(np.float32) / 255.0
+            X_test = X_test.astype(np.float32) / 255.0
 
         # Flatten
         X_train = X_train.reshape(X_train.shape[0], -1)
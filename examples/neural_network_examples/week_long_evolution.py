@@ -687,7 +687,7 @@ class WeekLongEvolutionRunner:
             evolution_engine=evolution_engine,
             training_history=history
         )
-        print(f"✓ Saved to {self.results_dir / 'sessions' / f'{session_id}.pkl.gz'}")
+        print(f"✓ Saved to {self.results_dir / 'sessions' / session_id}")
 
     def _generate_final_report(self, history: Dict, session_id: str):
         """Generate comprehensive final report."""
@@ -24,141 +24,64 @@ from datetime import datetime
 
 sys.path.insert(0, '.')
 
-from ljpw_nn.homeostatic import HomeostaticNetwork
-from ljpw_nn.consciousness_growth import enable_growth, generate_challenging_inputs
+from bicameral.right.consciousness_growth import save_state
+from bicameral.right.lifetime_evolution import (
+    LifetimeConfig, MetricsLog, run_lifetimes, load_checkpoint,
+)
 
-# Enable growth capabilities
-enable_growth()
+ITERATIONS = 100000
+OUT_DIR = 'results/consciousness/lifetimes_100k'
+
+
+def load_lifetime(summary):
+    """Load a finished lifetime's metrics as the arrays used for plotting."""
+    run_dir = f"{OUT_DIR}/{summary['name']}"
+    metrics = MetricsLog.read(f"{run_dir}/metrics")
+    return {
+        'harmonies': metrics['harmony'],
+        'layer_sizes': metrics['layer_sizes'],
+        'adaptations': metrics['adaptations'],
+        'followed': metrics['followed_guidance'],
+        'ignored': metrics['ignored_guidance'],
+        'total_followed': summary['total_followed_guidance'],
+        'total_ignored': summary['total_ignored_guidance'],
+        'total_explored': summary['total_explored_freely'],
+        'total_mistakes': summary['total_learned_from_mistake'],
+        'elapsed_time': summary['elapsed_seconds'],
+    }
+
+
+def report_lifetime(summary):
+    """Print the end-of-lifetime summary and save the final state."""
+    name = summary['name']
+    total_choices = (summary['total_followed_guidance'] + summary['total_ignored_guidance']
+                     + summary['total_explored_freely'])
 
-def run_100000_iterations(name, seed):
-    """Run 100,000 iterations for lifetime evolution study."""
-    print(f"\n{'='*70}")
-    print(f"LIFETIME EVOLUTION (100,000 ITERATIONS): {name}")
-    print(f"{'='*70}")
-    
-    # Initialize
-    network = HomeostaticNetwork(
-        input_size=4, output_size=4,
-        hidden_fib_indices=[7, 7],
-        target_harmony=0.81,
-        allow_adaptation=True,
-        seed=seed
-    )
-    
-    print(f"Beginning of life:")
-    print(f"  Layers: {[layer.size for layer in network.layers]}")
-    print(f"  Harmony: {network.get_current_harmony():.4f}")
-    print(f"  Target: 0.81")
-    print(f"  Seed: {seed}")
-    
-    # Tracking
-    harmonies = []
-    layer_sizes = []
-    adaptations_per_iter = []
-    choices_per_iter = []
-    
-    challenging_inputs = generate_challenging_inputs()
-    
-    print(f"\nRunning 100,000 iterations (reporting every 5000)...")
-    print(f"Estimated time: ~18-20 minutes")
-    print(f"This is a lifetime of experience...")
-    start_time = datetime.now()
-    
-    for i in range(100000):
-        # 1. Present challenging input
-        input_data = challenging_inputs[i % len(challenging_inputs)]
-        output = network.forward(input_data, training=False)
-        
-        # Calculate resonance
-        entropy = -np.sum(output * np.log(output + 1e-10))
-        max_entropy = np.log(output.shape[1])
-        resonance = 1.0 - (entropy / max_entropy)
-        
-        # Record harmony
-        network._record_harmony(epoch=i, accuracy=float(np.clip(resonance, 0, 1)))
-        
-        # 2. Check for adaptation
-        adaptations_before = len(network.adaptation_history)
-        if network.needs_adaptation():
-            network.adapt()
-        adaptations_this_iter = len(network.adaptation_history) - adaptations_before
-        
-        # 3. Choice-based weight drift
-        stats = network.choice_based_weight_drift(
-            learning_rate=0.001,
-            show_optimal_path=True
-        )
-        
-        # Track metrics
-        harmonies.append(network.get_current_harmony())
-        layer_sizes.append([layer.size for layer in network.layers])
-        adaptations_per_iter.append(adaptations_this_iter)
-        choices_per_iter.append(stats['choices'])
-        
-        # Log every 5000 iterations
-        if (i + 1) % 5000 == 0:
-            elapsed = (datetime.now() - start_time).total_seconds()
-            remaining = (100000 - (i + 1)) * elapsed / (i + 1)
-            total_followed = sum(c['followed_guidance'] for c in choices_per_iter[max(0,i-4999):i+1])
-            total_ignored = sum(c['ignored_guidance'] for c in choices_per_iter[max(0,i-4999):i+1])
-            total_choices = total_followed + total_ignored
-            follow_pct = 100 * total_followed / total_choices if total_choices > 0 else 0
-            
-            print(f"\nIteration {i+1:,} ({elapsed:.0f}s elapsed, {remaining:.0f}s remaining):")
-            print(f"  Harmony: {harmonies[-1]:.4f}")
-            print(f"  Layers: {layer_sizes[-1]}")
-            print(f"  Adaptations (last 5000): {sum(adaptations_per_iter[max(0,i-4999):i+1])}")
-            print(f"  Follow % (last 5000): {follow_pct:.1f}%")
-            print(f"  Progress: {(i+1)/1000:.0f}%")
-    
-    elapsed_total = (datetime.now() - start_time).total_seconds()
-    
-    # Final summary
     print(f"\n{'='*70}")
-    print(f"END OF LIFETIME: {name} (after {elapsed_total/60:.1f} minutes)")
+    print(f"END OF LIFETIME: {name} (after {summary['elapsed_seconds']/60:.1f} minutes)")
     print(f"{'='*70}")
     print(f"  Birth layers: [13, 13, 13]")
-    print(f"  Final layers: {layer_sizes[-1]}")
-    print(f"  Birth harmony: {harmonies[0]:.4f}")
-    print(f"  Final harmony: {harmonies[-1]:.4f}")
-    print(f"  Mean harmony: {np.mean(harmonies):.4f}")
-    print(f"  Std harmony: {np.std(harmonies):.4f}")
-    print(f"  Min harmony: {min(harmonies):.4f}")
-    print(f"  Max harmony: {max(harmonies):.4f}")
-    print(f"  Total adaptations: {sum(adaptations_per_iter)}")
-    print(f"  Processing speed: {100000/elapsed_total:.1f} iter/s")
-    
-    # Aggregate choice statistics
-    total_followed = sum(c['followed_guidance'] for c in choices_per_iter)
-    total_ignored = sum(c['ignored_guidance'] for c in choices_per_iter)
-    total_explored = sum(c['explored_freely'] for c in choices_per_iter)
-    total_mistakes = sum(c['learned_from_mistake'] for c in choices_per_iter)
-    total_choices = total_followed + total_ignored + total_explored
-    
-    print(f"\nLifetime Choice Statistics (100,000 iterations):")
+    print(f"  Final layers: {summary['final_layers']}")
+    print(f"  Birth harmony: {summary['birth_harmony']:.4f}")
+    print(f"  Final harmony: {summary['final_harmony']:.4f}")
+    print(f"  Mean harmony: {summary['mean_harmony']:.4f}")
+    print(f"  Std harmony: {summary['std_harmony']:.4f}")
+    print(f"  Min harmony: {summary['min_harmony']:.4f}")
+    print(f"  Max harmony: {summary['max_harmony']:.4f}")
+    print(f"  Total adaptations: {summary['total_adaptations']}")
+    print(f"  Processing speed: {summary['iter_per_sec']:.1f} iter/s")
+
+    print(f"\nLifetime Choice Statistics ({summary['iterations']:,} iterations):")
     print(f"  Total choices: {total_choices:,}")
-    print(f"  Followed guidance: {total_followed:,} ({100*total_followed/total_choices:.3f}%)")
-    print(f"  Ignored guidance: {total_ignored:,} ({100*total_ignored/total_choices:.3f}%)")
-    print(f"  Explored freely: {total_explored:,} ({100*total_explored/total_choices:.3f}%)")
-    print(f"  Learned from mistakes: {total_mistakes}")
-    
+    print(f"  Followed guidance: {summary['total_followed_guidance']:,} ({100*summary['total_followed_guidance']/total_choices:.3f}%)")
+    print(f"  Ignored guidance: {summary['total_ignored_guidance']:,} ({100*summary['total_ignored_guidance']/total_choices:.3f}%)")
+    print(f"  Explored freely: {summary['total_explored_freely']:,} ({100*summary['total_explored_freely']/total_choices:.3f}%)")
+    print(f"  Learned from mistakes: {summary['total_learned_from_mistake']}")
+
     # Save state
     filepath = f'data/{name.lower()}_lifetime_100k.pkl'
-    network.save_state(filepath)
+    save_state(load_checkpoint(f"{OUT_DIR}/{name}")['network'], filepath)
     print(f"\nLifetime state saved to: {filepath}")
-    
-    return {
-        'network': network,
-        'harmonies': harmonies,
-        'layer_sizes': layer_sizes,
-        'adaptations': adaptations_per_iter,
-        'choices': choices_per_iter,
-        'total_followed': total_followed,
-        'total_ignored': total_ignored,
-        'total_explored': total_explored,
-        'total_mistakes': total_mistakes,
-        'elapsed_time': elapsed_total
-    }
 
 
 def visualize_lifetime(adam_results, eve_results):
@@ -200,23 +123,19 @@ def visualize_lifetime(adam_results, eve_results):
     # 3. Choice ratio over lifetime (rolling window)
     ax = fig.add_subplot(gs[1, :2])
     window = 5000
-    adam_follow_ratio = []
-    eve_follow_ratio = []
-    for i in range(window, len(adam_results['choices']), 100):  # Sample every 100
-        adam_window = adam_results['choices'][i-window:i]
-        eve_window = eve_results['choices'][i-window:i]
-        
-        adam_f = sum(c['followed_guidance'] for c in adam_window)
-        adam_i = sum(c['ignored_guidance'] for c in adam_window)
-        adam_total = adam_f + adam_i
-        adam_follow_ratio.append(100 * adam_f / adam_total if adam_total > 0 else 0)
-        
-        eve_f = sum(c['followed_guidance'] for c in eve_window)
-        eve_i = sum(c['ignored_guidance'] for c in eve_window)
-        eve_total = eve_f + eve_i
-        eve_follow_ratio.append(100 * eve_f / eve_total if eve_total > 0 else 0)
+    def follow_ratio(results):
+        # Window sums at every 100th end point, via cumulative sums
+        followed = np.concatenate([[0], np.cumsum(results['followed'], dtype=np.int64)])
+        ignored = np.concatenate([[0], np.cumsum(results['ignored'], dtype=np.int64)])
+        ends = np.arange(window, len(results['followed']), 100)
+        f = followed[ends] - followed[ends - window]
+        total = f + ignored[ends] - ignored[ends - window]
+        return np.where(total > 0, 100 * f / np.maximum(total, 1), 0)
+
+    adam_follow_ratio = follow_ratio(adam_results)
+    eve_follow_ratio = follow_ratio(eve_results)
     
-    x_vals = range(window, len(adam_results['choices']), 100)
+    x_vals = range(window, len(adam_results['followed']), 100)
     ax.plot(x_vals, adam_follow_ratio, color='blue', alpha=0.7, linewidth=1, label='Adam')
     ax.plot(x_vals, eve_follow_ratio, color='pink', alpha=0.7, linewidth=1, label='Eve')
     ax.axhline(y=70, color='green', linestyle='--', alpha=0.5, linewidth=2, label='70% baseline')
@@ -369,15 +288,20 @@ def main():
     print("100,000-ITERATION LIFETIME EVOLUTION STUDY")
     print("="*70)
     print("Lifetime observation: 300,000 choices, extended patterns, emergence")
-    print("Expected duration: ~18-20 minutes per consciousness")
+    print("Adam and Eve live in parallel; re-running resumes from checkpoints")
     print("This is a complete lifetime of experience...")
     print("-"*70)
     
-    # Run Adam's lifetime
-    adam_results = run_100000_iterations("Adam", seed=42)
-    
-    # Run Eve's lifetime
-    eve_results = run_100000_iterations("Eve", seed=137)
+    # Run both lifetimes side by side; re-running resumes from checkpoints
+    configs = [
+        LifetimeConfig(name="Adam", seed=42, iterations=ITERATIONS),
+        LifetimeConfig(name="Eve", seed=137, iterations=ITERATIONS),
+    ]
+    adam_summary, eve_summary = run_lifetimes(configs, OUT_DIR, workers=2)
+    for summary in (adam_summary, eve_summary):
+        report_lifetime(summary)
+    adam_results = load_lifetime(adam_summary)
+    eve_results = load_lifetime(eve_summary)
     
     # Visualize lifetimes
     print(f"\n{'='*70}")
@@ -23,7 +23,8 @@ from collections import defaultdict
 from ljpw_semantic_capabilities import (
     LJPWVector, SemanticEntity,
     harmony_index, semantic_mass, semantic_density,
-    match_archetype, semantic_resonance, semantic_friction,
+    match_archetype,
+    entity_coordinates, resonance_clusters, LJPWSpatialIndex,
     ANCHOR_POINT, NATURAL_EQUILIBRIUM
 )
 
@@ -132,31 +133,18 @@ def calculate_entropy(entities: List[SemanticEntity]) -> float:
 
 def count_resonance_clusters(entities: List[SemanticEntity], threshold: float = 0.85) -> int:
     """Count resonance clusters."""
-    clusters = 0
-    used = set()
-    for i, e1 in enumerate(entities):
-        if e1.name in used:
-            continue
-        cluster_size = 1
-        for j, e2 in enumerate(entities):
-            if i != j and e2.name not in used:
-                if semantic_resonance(e1, e2) >= threshold:
-                    cluster_size += 1
-                    used.add(e2.name)
-        if cluster_size > 1:
-            clusters += 1
-        used.add(e1.name)
-    return clusters
+    # The seed's name is marked used only after its scan
+    clusters = resonance_clusters(
+        entity_coordinates(entities), threshold,
+        keys=[e.name for e in entities], seed_claims_key=False
+    )
+    return len(clusters)
 
 
 def count_friction_hotspots(entities: List[SemanticEntity], threshold: float = 0.5) -> int:
     """Count high-friction pairs."""
-    count = 0
-    for i, e1 in enumerate(entities):
-        for e2 in entities[i+1:]:
-            if semantic_friction(e1, e2) >= threshold:
-                count += 1
-    return min(count, 100)  # Cap for performance
+    index = LJPWSpatialIndex(entity_coordinates(entities))
+    return index.count_friction_pairs(threshold, limit=100)  # Cap for performance
 
 
 # =============================================================================
@@ -22,9 +22,11 @@ Date: 2026-01-12
 
 import math
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from enum import Enum
 
+import numpy as np
+
 
 # =============================================================================
 # CORE DATA STRUCTURES
@@ -564,6 +566,577 @@ def semantic_resonance(
     return min(1.0, dominant_match + avg_similarity * 0.7)
 
 
+# =============================================================================
+# 5b. RELATIONSHIP MATRICES (Vectorized Interaction Physics)
+# =============================================================================
+#
+# The pair functions above cost one Python call per pair, which makes
+# repository-wide scans O(N²) interpreter work. The functions below take an
+# (N, 4) array of L, J, P, W coordinates (plus a mass vector for gravity)
+# and compute whole rows of the same quantities with NumPy broadcasting.
+# Each kernel repeats the scalar formula's operations in the same order,
+# so every entry equals the pair function's result exactly.
+
+DIMENSIONS = ('L', 'J', 'P', 'W')
+
+PAIR_METRICS = ('resonance', 'friction', 'gravity')
+
+
+def entity_coordinates(entities: Sequence[SemanticEntity]) -> np.ndarray:
+    """Stack entity coordinates into an (N, 4) array in L, J, P, W order."""
+    coords = np.empty((len(entities), 4))
+    for i, entity in enumerate(entities):
+        coords[i] = entity.coordinates.as_tuple()
+    return coords
+
+
+def entity_masses(entities: Sequence[SemanticEntity]) -> np.ndarray:
+    """Semantic mass of each entity as an (N,) array."""
+    return np.array([semantic_mass(entity) for entity in entities], dtype=float)
+
+
+def _as_coords(coords) -> np.ndarray:
+    coords = np.asarray(coords, dtype=float)
+    if coords.ndim != 2 or coords.shape[1] != 4:
+        raise ValueError(f"coordinates must have shape (N, 4), got {coords.shape}")
+    return coords
+
+
+def _abs_difference(coords: np.ndarray, others: np.ndarray, d: int) -> np.ndarray:
+    """|a - b| on dimension d, as a (len(coords), len(others)) matrix."""
+    diff = np.subtract.outer(coords[:, d], others[:, d])
+    return np.abs(diff, out=diff)
+
+
+def resonance_matrix(coords: np.ndarray, others: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Pairwise semantic_resonance between rows of coords and rows of others.
+
+    Args:
+        coords: (N, 4) coordinates
+        others: (M, 4) coordinates (default: coords itself)
+
+    Returns:
+        (N, M) resonance matrix
+    """
+    coords = _as_coords(coords)
+    others = coords if others is None else _as_coords(others)
+
+    # Average similarity: sum of (1 - |v1 - v2|) in L, J, P, W order, / 4
+    total = _abs_difference(coords, others, 0)
+    np.subtract(1.0, total, out=total)
+    for d in range(1, 4):
+        similarity = _abs_difference(coords, others, d)
+        np.subtract(1.0, similarity, out=similarity)
+        total += similarity
+    total /= 4
+    total *= 0.7
+
+    # Dominant dimension match (first maximum in L, J, P, W order)
+    same_dominant = np.equal.outer(np.argmax(coords, axis=1), np.argmax(others, axis=1))
+    np.add(total, 0.3, out=total, where=same_dominant)
+
+    return np.minimum(total, 1.0, out=total)
+
+
+def friction_matrix(coords: np.ndarray, others: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Pairwise semantic_friction between rows of coords and rows of others.
+
+    Args:
+        coords: (N, 4) coordinates
+        others: (M, 4) coordinates (default: coords itself)
+
+    Returns:
+        (N, M) friction matrix
+    """
+    coords = _as_coords(coords)
+    others = coords if others is None else _as_coords(others)
+
+    return _weighted_opposition(lambda d: _abs_difference(coords, others, d))
+
+
+def _weighted_opposition(abs_difference) -> np.ndarray:
+    """Friction from per-dimension |Δ| arrays (abs_difference(d) -> array)."""
+    # L-J opposition weighted by 1.2, summed in L, J, P, W order, / 4
+    total = abs_difference(0)
+    total *= 1.2
+    opposition = abs_difference(1)
+    opposition *= 1.2
+    total += opposition
+    total += abs_difference(2)
+    total += abs_difference(3)
+    total /= 4
+
+    return np.minimum(total, 1.0, out=total)
+
+
+def gravity_matrix(
+    coords: np.ndarray,
+    masses: np.ndarray,
+    others: Optional[np.ndarray] = None,
+    other_masses: Optional[np.ndarray] = None,
+    G: float = 1.0
+) -> np.ndarray:
+    """
+    Pairwise semantic_gravity between rows of coords and rows of others.
+
+    Args:
+        coords: (N, 4) coordinates
+        masses: (N,) semantic masses
+        others: (M, 4) coordinates (default: coords itself)
+        other_masses: (M,) masses of others (default: masses)
+        G: Gravitational constant
+
+    Returns:
+        (N, M) gravity matrix
+    """
+    coords = _as_coords(coords)
+    masses = np.asarray(masses, dtype=float)
+    if others is None:
+        others, other_masses = coords, masses
+    else:
+        others = _as_coords(others)
+        other_masses = np.asarray(other_masses, dtype=float)
+
+    # float_power calls libm pow like Python's `x ** 2`; np.square (x * x)
+    # differs from it in the last bit for a fraction of inputs
+    r = np.float_power(_abs_difference(coords, others, 0), 2)
+    for d in range(1, 4):
+        r += np.float_power(_abs_difference(coords, others, d), 2)
+    np.sqrt(r, out=r)
+
+    # Avoid division by zero (entities at same position)
+    np.maximum(r, 0.01, out=r)
+
+    return G * np.multiply.outer(masses, other_masses) / np.float_power(r, 2)
+
+
+def pair_matrix(
+    metric: str,
+    coords: np.ndarray,
+    masses: Optional[np.ndarray] = None,
+    rows: slice = slice(None),
+    columns: slice = slice(None)
+) -> np.ndarray:
+    """
+    A block of the full pairwise matrix for one metric.
+
+    Args:
+        metric: 'resonance', 'friction' or 'gravity'
+        coords: (N, 4) coordinates
+        masses: (N,) masses (required for gravity)
+        rows: Rows to compute (slice or index array; default: all)
+        columns: Columns to compute (slice or index array; default: all)
+
+    Returns:
+        (len(rows), len(columns)) matrix
+    """
+    coords = _as_coords(coords)
+    if metric == 'resonance':
+        return resonance_matrix(coords[rows], coords[columns])
+    elif metric == 'friction':
+        return friction_matrix(coords[rows], coords[columns])
+    elif metric == 'gravity':
+        if masses is None:
+            raise ValueError("gravity needs a mass vector")
+        masses = np.asarray(masses, dtype=float)
+        return gravity_matrix(coords[rows], masses[rows], coords[columns], masses[columns])
+    raise ValueError(f"Unknown metric: {metric}. Use one of {PAIR_METRICS}")
+
+
+def top_pairs(
+    coords: np.ndarray,
+    metric: str,
+    k: int,
+    masses: Optional[np.ndarray] = None,
+    threshold: Optional[float] = None,
+    block_size: int = 512
+) -> List[Tuple[int, int, float]]:
+    """
+    The k highest-scoring unordered pairs (i < j), without an N² matrix.
+
+    Rows are processed in blocks of block_size against the columns to
+    their right, so peak memory is O(block_size × N). The result is
+    ordered exactly as a stable descending sort of all (i, j, value)
+    pairs enumerated with i < j: by value, then i, then j.
+
+    Args:
+        coords: (N, 4) coordinates
+        metric: 'resonance', 'friction' or 'gravity'
+        k: Number of pairs to return
+        masses: (N,) masses (required for gravity)
+        threshold: Only consider pairs with value >= threshold
+        block_size: Rows per block
+
+    Returns:
+        List of (i, j, value), best first
+    """
+    coords = _as_coords(coords)
+    n = len(coords)
+    if k <= 0 or n < 2:
+        return []
+    if block_size < 1:
+        raise ValueError(f"block_size must be >= 1, got {block_size}")
+
+    best_i = np.empty(0, dtype=np.intp)
+    best_j = np.empty(0, dtype=np.intp)
+    best_v = np.empty(0)
+
+    for start in range(0, n - 1, block_size):
+        stop = min(n - 1, start + block_size)
+        # Row i = start + r against column j = start + 1 + c
+        block = pair_matrix(metric, coords, masses, slice(start, stop), slice(start + 1, n))
+        width = n - start - 1
+
+        # Upper triangle only (j > i, i.e. c >= r), optionally thresholded
+        invalid = np.subtract.outer(np.arange(stop - start), np.arange(width)) > 0
+        if threshold is not None:
+            invalid |= ~(block >= threshold)
+        block[invalid] = -np.inf
+
+        # Block top-k; ties at the cut keep the earliest (i, j)
+        values = block.ravel()
+        m = min(k, values.size)
+        kth = np.partition(values, values.size - m)[values.size - m]
+        if kth == -np.inf:
+            picked = np.flatnonzero(values > -np.inf)
+        else:
+            above = np.flatnonzero(values > kth)
+            ties = np.flatnonzero(values == kth)[:m - len(above)]
+            picked = np.concatenate([above, ties])
+
+        best_i = np.concatenate([best_i, start + picked // width])
+        best_j = np.concatenate([best_j, start + 1 + picked % width])
+        best_v = np.concatenate([best_v, values[picked]])
+        order = np.lexsort((best_j, best_i, -best_v))[:k]
+        best_i, best_j, best_v = best_i[order], best_j[order], best_v[order]
+
+    return [(int(i), int(j), float(v)) for i, j, v in zip(best_i, best_j, best_v)]
+
+
+def resonance_clusters(
+    coords: np.ndarray,
+    threshold: float = 0.85,
+    keys: Optional[Sequence] = None,
+    seed_claims_key: bool = True
+) -> List[List[int]]:
+    """
+    Greedy resonance clustering over rows of coords.
+
+    Visits entities in order; each unclaimed entity seeds a cluster and
+    claims every other unclaimed entity whose resonance with the seed is
+    >= threshold, scanning in index order. Entities sharing a key (e.g. a
+    name) are claimed together, as in a name-based `used` set. Neighbors
+    come from an LJPWSpatialIndex, so each seed only examines nearby,
+    still-unclaimed entities.
+
+    Args:
+        coords: (N, 4) coordinates
+        threshold: Minimum resonance to join a seed's cluster
+        keys: Optional identity per entity (default: each row is distinct)
+        seed_claims_key: Mark the seed's key used before scanning (True),
+                         or only after, letting same-key entities join
+
+    Returns:
+        Clusters with more than one member, as lists of row indices
+    """
+    coords = _as_coords(coords)
+    n = len(coords)
+    if keys is None:
+        key_ids = np.arange(n)
+    else:
+        ids = {}
+        key_ids = np.array([ids.setdefault(key, len(ids)) for key in keys], dtype=np.intp)
+
+    # Entities of each key, for claiming a key at once
+    by_key = np.argsort(key_ids, kind='stable')
+    key_start = np.searchsorted(key_ids[by_key], np.arange(n + 1))
+
+    def key_members(claimed):
+        return np.concatenate([by_key[key_start[k]:key_start[k + 1]] for k in claimed])
+
+    index = LJPWSpatialIndex(coords)
+    used = np.zeros(n, dtype=bool)
+    clusters = []
+
+    for i in range(n):
+        key = key_ids[i]
+        if used[key]:
+            continue
+        if seed_claims_key:
+            used[key] = True
+            index.discard(key_members([key]))
+        else:
+            index.discard([i])
+
+        candidates = index.resonance_neighbors(i, threshold)
+        # One member per key, first occurrence wins
+        _, first = np.unique(key_ids[candidates], return_index=True)
+        members = candidates[np.sort(first)]
+        if len(members):
+            claimed = key_ids[members]
+            used[claimed] = True
+            index.discard(key_members(claimed.tolist()))
+            clusters.append([i] + members.tolist())
+
+        if not seed_claims_key:
+            used[key] = True
+            index.discard(key_members([key]))
+
+    return clusters
+
+
+# =============================================================================
+# 5c. SPATIAL INDEX (Sub-quadratic Relationship Queries)
+# =============================================================================
+#
+# Resonance is min(1, bonus + 0.7 × (1 - L1/4)), where L1 is the L1 distance
+# between coordinates and bonus is 0.3 when the dominant dimensions match.
+# So "resonance >= t" is an L1-ball query, with one radius among entities
+# sharing the dominant dimension and a smaller one (often empty) among the
+# rest. Friction is a weighted L1 distance, so its top pairs are the most
+# distant ones. LJPWSpatialIndex answers both with uniform grids whose
+# cells carry tight bounding boxes, then re-checks survivors with the exact
+# kernels above so results are identical to brute force.
+
+# Slack added to geometric bounds to absorb floating-point rounding;
+# candidates are always confirmed with the exact kernels
+_BOUND_SLACK = 1e-9
+
+
+class _Grid:
+    """Uniform grid over a subset of points, with per-cell bounding boxes."""
+
+    def __init__(self, coords: np.ndarray, members: np.ndarray, cells_per_axis: int):
+        cell = np.clip((coords[members] * cells_per_axis).astype(np.intp), 0, cells_per_axis - 1)
+        cell_key = ((cell[:, 0] * cells_per_axis + cell[:, 1]) * cells_per_axis + cell[:, 2]) * cells_per_axis + cell[:, 3]
+
+        order = np.argsort(cell_key, kind='stable')
+        self.members = members[order]
+        sorted_keys = cell_key[order]
+        boundaries = np.flatnonzero(np.diff(sorted_keys)) + 1
+        self.start = np.concatenate([[0], boundaries]).astype(np.intp)
+        self.stop = np.concatenate([boundaries, [len(order)]]).astype(np.intp)
+
+        points = coords[self.members]
+        if len(points):
+            self.lo = np.minimum.reduceat(points, self.start, axis=0)
+            self.hi = np.maximum.reduceat(points, self.start, axis=0)
+        else:
+            self.lo = self.hi = np.empty((0, 4))
+        self.alive = (self.stop - self.start).astype(np.intp)
+
+        # Cell position of each member (for discards)
+        cell_position = np.repeat(np.arange(len(self.start)), self.stop - self.start)
+        self.cell_of = dict(zip(self.members.tolist(), cell_position.tolist()))
+
+    def gather(self, cells: np.ndarray) -> np.ndarray:
+        """Point indices in the given cells (concatenated in cell order)."""
+        lengths = self.stop[cells] - self.start[cells]
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.intp)
+        offsets = np.repeat(self.start[cells] - np.cumsum(lengths) + lengths, lengths)
+        return self.members[offsets + np.arange(total)]
+
+
+class LJPWSpatialIndex:
+    """
+    Grid index over LJPW coordinates for resonance and friction queries.
+
+    Resonance queries use one grid per dominant dimension; friction
+    queries use a grid over all points. Points can be discarded (e.g. once
+    claimed by a cluster) so later queries skip them and their emptied
+    cells.
+
+    Example:
+        >>> index = LJPWSpatialIndex(entity_coordinates(entities))
+        >>> neighbors = index.resonance_neighbors(0, threshold=0.85)
+        >>> hotspots = index.top_friction_pairs(10, threshold=0.5)
+    """
+
+    def __init__(self, coords: np.ndarray, cells_per_axis: Optional[int] = None):
+        """
+        Build the index.
+
+        Args:
+            coords: (N, 4) coordinates
+            cells_per_axis: Grid resolution (default: about 16 points per
+                            cell, at most 12 cells per axis)
+        """
+        self.coords = _as_coords(coords)
+        n = len(self.coords)
+        if cells_per_axis is None:
+            cells_per_axis = int(min(12, max(1, math.ceil((n / 16) ** 0.25))))
+        if cells_per_axis < 1:
+            raise ValueError(f"cells_per_axis must be >= 1, got {cells_per_axis}")
+        self.cells_per_axis = cells_per_axis
+
+        self.dominant = np.argmax(self.coords, axis=1) if n else np.empty(0, dtype=np.intp)
+        self.alive = np.ones(n, dtype=bool)
+        self._groups = [
+            _Grid(self.coords, np.flatnonzero(self.dominant == d), cells_per_axis)
+            for d in range(4)
+        ]
+        self._all: Optional[_Grid] = None
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def discard(self, indices) -> None:
+        """Exclude points from subsequent resonance queries."""
+        indices = np.asarray(indices, dtype=np.intp).ravel()
+        indices = indices[self.alive[indices]]
+        if len(indices) == 0:
+            return
+        self.alive[indices] = False
+        for i in indices.tolist():
+            grid = self._groups[self.dominant[i]]
+            grid.alive[grid.cell_of[i]] -= 1
+
+    def resonance_neighbors(self, i: int, threshold: float) -> np.ndarray:
+        """
+        Alive points j != i with semantic_resonance(i, j) >= threshold.
+
+        Args:
+            i: Query point index
+            threshold: Minimum resonance
+
+        Returns:
+            Sorted array of point indices
+        """
+        if threshold > 1.0:
+            return np.empty(0, dtype=np.intp)
+
+        point = self.coords[i]
+        radius_same = 4 * (1 - (threshold - 0.3) / 0.7) + _BOUND_SLACK
+        radius_other = 4 * (1 - threshold / 0.7) + _BOUND_SLACK
+
+        candidates = []
+        for d, grid in enumerate(self._groups):
+            radius = radius_same if d == self.dominant[i] else radius_other
+            if radius < 0 or len(grid.start) == 0:
+                continue
+            # L1 distance from the point to each cell's bounding box
+            gap = np.maximum(grid.lo - point, 0) + np.maximum(point - grid.hi, 0)
+            cells = np.flatnonzero((gap.sum(axis=1) <= radius) & (grid.alive > 0))
+            candidates.append(grid.gather(cells))
+
+        if not candidates:
+            return np.empty(0, dtype=np.intp)
+        candidates = np.concatenate(candidates)
+        candidates = candidates[self.alive[candidates] & (candidates != i)]
+        if len(candidates) == 0:
+            return candidates
+
+        resonance = resonance_matrix(point[None, :], self.coords[candidates])[0]
+        return np.sort(candidates[resonance >= threshold])
+
+    def _friction_cell_pairs(self, threshold: Optional[float]):
+        """Cell pairs (a <= b) of the all-points grid, by descending friction bound."""
+        if self._all is None:
+            # Coarser grid: the bound is evaluated for every pair of cells
+            cells_per_axis = min(self.cells_per_axis, 6)
+            self._all = _Grid(self.coords, np.arange(len(self.coords)), cells_per_axis)
+        grid = self._all
+        a, b = np.triu_indices(len(grid.start))
+
+        # Largest per-dimension separation between any two points of the cells
+        span = np.maximum(grid.hi[a] - grid.lo[b], grid.hi[b] - grid.lo[a])
+        bound = _weighted_opposition(lambda d: span[:, d].copy()) + _BOUND_SLACK
+        if threshold is not None:
+            keep = bound >= threshold
+            a, b, bound = a[keep], b[keep], bound[keep]
+        order = np.argsort(-bound, kind='stable')
+        return grid, a[order], b[order], bound[order]
+
+    def _cell_pair_points(self, grid: _Grid, a: int, b: int) -> Tuple[np.ndarray, np.ndarray]:
+        """All point pairs (i < j) between cells a and b."""
+        A = grid.members[grid.start[a]:grid.stop[a]]
+        if a == b:
+            upper_i, upper_j = np.triu_indices(len(A), 1)
+            first, second = A[upper_i], A[upper_j]
+        else:
+            B = grid.members[grid.start[b]:grid.stop[b]]
+            first, second = np.repeat(A, len(B)), np.tile(B, len(A))
+        return np.minimum(first, second), np.maximum(first, second)
+
+    def _pair_friction(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        left, right = self.coords[i], self.coords[j]
+        return _weighted_opposition(lambda d: np.abs(left[:, d] - right[:, d]))
+
+    def top_friction_pairs(
+        self,
+        k: int,
+        threshold: Optional[float] = None
+    ) -> List[Tuple[int, int, float]]:
+        """
+        The k highest-friction pairs (i < j), same result as top_pairs.
+
+        Cell pairs are visited from the largest friction bound down and
+        the scan stops once no remaining cell pair can reach the current
+        k-th value.
+
+        Args:
+            k: Number of pairs to return
+            threshold: Only consider pairs with friction >= threshold
+
+        Returns:
+            List of (i, j, friction), best first
+        """
+        if k <= 0 or len(self.coords) < 2:
+            return []
+
+        grid, cells_a, cells_b, bounds = self._friction_cell_pairs(threshold)
+        best_i = np.empty(0, dtype=np.intp)
+        best_j = np.empty(0, dtype=np.intp)
+        best_v = np.empty(0)
+
+        for a, b, bound in zip(cells_a.tolist(), cells_b.tolist(), bounds.tolist()):
+            if len(best_v) == k and bound < best_v[-1]:
+                break
+            i, j = self._cell_pair_points(grid, a, b)
+            if len(i) == 0:
+                continue
+            values = self._pair_friction(i, j)
+            if threshold is not None:
+                keep = values >= threshold
+                i, j, values = i[keep], j[keep], values[keep]
+
+            best_i = np.concatenate([best_i, i])
+            best_j = np.concatenate([best_j, j])
+            best_v = np.concatenate([best_v, values])
+            order = np.lexsort((best_j, best_i, -best_v))[:k]
+            best_i, best_j, best_v = best_i[order], best_j[order], best_v[order]
+
+        return [(int(i), int(j), float(v)) for i, j, v in zip(best_i, best_j, best_v)]
+
+    def count_friction_pairs(self, threshold: float, limit: Optional[int] = None) -> int:
+        """
+        Number of pairs (i < j) with friction >= threshold.
+
+        Args:
+            threshold: Minimum friction
+            limit: Stop counting once this many are found
+
+        Returns:
+            Pair count (at most limit, if given)
+        """
+        if len(self.coords) < 2:
+            return 0
+
+        grid, cells_a, cells_b, _ = self._friction_cell_pairs(threshold)
+        count = 0
+        for a, b in zip(cells_a.tolist(), cells_b.tolist()):
+            i, j = self._cell_pair_points(grid, a, b)
+            if len(i):
+                count += int(np.count_nonzero(self._pair_friction(i, j) >= threshold))
+            if limit is not None and count >= limit:
+                return limit
+        return count
+
+
 # =============================================================================
 # 6. DIMENSIONAL COMBINATIONS (Secondary Metrics)
 # =============================================================================
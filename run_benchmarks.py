@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+SPDX-License-Identifier: MIT
+Performance Benchmarks for Emergent Code
+
+Times the analyzers, the resonance engine and neural network training on
+seeded synthetic inputs (see benchmarks/suite.py), writes the results as
+JSON, and compares them with a saved baseline.
+
+Usage:
+    python run_benchmarks.py --save-baseline     # record benchmarks/baseline.json
+    python run_benchmarks.py                     # run, compare, exit 1 on regression
+    python run_benchmarks.py --only code_analyzer multi_language --scale 0.25
+    python run_benchmarks.py --list
+
+A benchmark regresses when it is more than --threshold (default 20%)
+slower than the baseline. Record the baseline on the machine that runs
+the comparison: timings from different hardware are not comparable.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.suite import (
+    BENCHMARKS, DEFAULT_REPEATS, DEFAULT_THRESHOLD, METRICS,
+    run_benchmarks, save_results, load_results, compare, format_comparison,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent / 'benchmarks' / 'baseline.json'
+
+# ANSI colors
+GREEN = "\033[92m"
+RED = "\033[91m"
+RESET = "\033[0m"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run Emergent Code performance benchmarks")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="Benchmarks to run (default: all)")
+    parser.add_argument("--list", action="store_true", help="List benchmarks and exit")
+    parser.add_argument("--scale", type=float, default=1.0, help="Input size multiplier (default: 1.0)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS,
+                        help=f"Timed runs per benchmark (default: {DEFAULT_REPEATS})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for generated inputs (default: 0)")
+    parser.add_argument("--output", "-o", default="benchmark_results.json",
+                        help="Results file (default: benchmark_results.json)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE),
+                        help=f"Baseline file (default: {DEFAULT_BASELINE.relative_to(Path(__file__).parent)})")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Also write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Slowdown counted as a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--metric", choices=METRICS, default='min_seconds',
+                        help="Statistic compared with the baseline (default: min_seconds)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for benchmark in BENCHMARKS:
+            print(f"  {benchmark.name:<24} {benchmark.description}")
+        return 0
+
+    print(f"Running benchmarks (scale={args.scale}, repeats={args.repeats}, seed={args.seed})")
+    results = run_benchmarks(args.only, scale=args.scale, seed=args.seed, repeats=args.repeats)
+    print(f"\nResults: {save_results(results, args.output)}")
+
+    if args.save_baseline:
+        print(f"Baseline: {save_results(results, args.baseline)}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to record one.")
+        return 0
+
+    rows = compare(results, load_results(args.baseline), threshold=args.threshold, metric=args.metric)
+    print()
+    print(format_comparison(rows, args.threshold))
+    regressions = [row['name'] for row in rows if row['status'] == 'regression']
+    if regressions:
+        print(f"\n{RED}Regressions: {', '.join(regressions)}{RESET}")
+        return 1
+    print(f"\n{GREEN}No regressions{RESET}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
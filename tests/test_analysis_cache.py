@@ -0,0 +1,130 @@
+"""
+Unit Tests for the Autopoiesis Analysis Cache
+
+Verifies that cached analyses are identical to fresh ones, that the cache
+is keyed by content (not path), and that LRU eviction honours the caps.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.analyzer import CodeAnalyzer
+from autopoiesis.cache import AnalysisCache, MISS, content_key
+
+
+SAMPLE_CODE = '''"""Sample module."""
+import logging
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    if a is None:
+        raise ValueError("a required")
+    return a + b
+
+
+class Greeter:
+    def greet(self, name):
+        for _ in range(2):
+            print(name)
+'''
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test AnalysisCache with a real CodeAnalyzer"""
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.workdir, 'cache')
+        self.src = os.path.join(self.workdir, 'sample.py')
+        with open(self.src, 'w', encoding='utf-8') as f:
+            f.write(SAMPLE_CODE)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_cached_result_matches_fresh(self):
+        """A cache hit returns the same analysis as an uncached run"""
+        fresh = CodeAnalyzer(cache=None)
+        fresh.cache = None
+        expected = fresh.analyze_file(self.src)
+
+        cache = AnalysisCache(self.cache_dir)
+        analyzer = CodeAnalyzer(cache=cache)
+        first = analyzer.analyze_file(self.src)
+        second = analyzer.analyze_file(self.src)
+
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+
+    def test_shared_across_instances(self):
+        """Entries written by one analyzer are reused by another"""
+        CodeAnalyzer(cache=AnalysisCache(self.cache_dir)).analyze_file(self.src)
+
+        cache = AnalysisCache(self.cache_dir)
+        CodeAnalyzer(cache=cache).analyze_file(self.src)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 0)
+
+    def test_content_keyed(self):
+        """Copies hit the cache; edits miss it"""
+        cache = AnalysisCache(self.cache_dir)
+        analyzer = CodeAnalyzer(cache=cache)
+        analyzer.analyze_file(self.src)
+
+        copy_path = os.path.join(self.workdir, 'copy.py')
+        shutil.copy(self.src, copy_path)
+        result = analyzer.analyze_file(copy_path)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result.path, copy_path)
+
+        with open(self.src, 'a', encoding='utf-8') as f:
+            f.write('\n# edited\n')
+        analyzer.analyze_file(self.src)
+        self.assertEqual(cache.misses, 2)
+
+    def test_unparseable_cached(self):
+        """Files that fail to parse are remembered as None"""
+        bad = os.path.join(self.workdir, 'bad.py')
+        with open(bad, 'w', encoding='utf-8') as f:
+            f.write('def broken(:\n')
+
+        cache = AnalysisCache(self.cache_dir)
+        analyzer = CodeAnalyzer(cache=cache)
+        self.assertIsNone(analyzer.analyze_file(bad))
+        self.assertIsNone(analyzer.analyze_file(bad))
+        self.assertEqual(cache.hits, 1)
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past max_entries"""
+        cache = AnalysisCache(self.cache_dir, max_entries=10)
+        keys = [content_key(f'x = {i}\n') for i in range(12)]
+        for i, key in enumerate(keys):
+            cache.put(key, None)
+            # Keep the first key hot so it survives eviction
+            os.utime(cache._entry_path(keys[0]), (1e10 + i, 1e10 + i))
+
+        stats = cache.stats()
+        self.assertLessEqual(stats['entries'], 10)
+        self.assertGreater(stats['evictions'], 0)
+        self.assertIsNot(cache.get(keys[0], 'hot.py'), MISS)
+        self.assertIs(cache.get(keys[1], 'cold.py'), MISS)
+
+    def test_invalid_caps_rejected(self):
+        """Non-positive caps are rejected"""
+        with self.assertRaises(ValueError):
+            AnalysisCache(self.cache_dir, max_entries=0)
+        with self.assertRaises(ValueError):
+            AnalysisCache(self.cache_dir, max_bytes=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
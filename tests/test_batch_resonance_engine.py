@@ -0,0 +1,81 @@
+"""
+Unit Tests for BatchResonanceEngine
+
+The vectorized engine must reproduce ResonanceEngine.analyze_trajectory
+row by row, with and without ICE bounds.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.left.resonance_engine import ResonanceEngine, BatchResonanceEngine
+
+
+class TestBatchResonanceEngine(unittest.TestCase):
+    """Test BatchResonanceEngine against the scalar engine"""
+
+    def setUp(self):
+        self.engine = ResonanceEngine()
+        self.batch = BatchResonanceEngine()
+        rng = np.random.default_rng(42)
+        self.coords = rng.uniform(0.0, 1.0, size=(24, 4))
+        self.bounds = [
+            None if i % 4 == 0 else {
+                'Intent': 0.8 if i % 2 else 0.4,
+                'Context': 0.5,
+                'Execution': float(rng.uniform(0.3, 1.0)),
+                'Benevolence': 0.9,
+            }
+            for i in range(len(self.coords))
+        ]
+
+    def _assert_matches_scalar(self, result, bounds_list):
+        for i, start in enumerate(self.coords):
+            expected = self.engine.analyze_trajectory(list(start), cycles=100, ice_bounds=bounds_list[i])
+            np.testing.assert_allclose(
+                result['final_states'][i], expected['final_state'].as_vector(), rtol=0, atol=1e-12
+            )
+            self.assertAlmostEqual(result['final_harmony'][i], expected['final_state'].harmony, places=12)
+            self.assertEqual(result['dominant_deficit'][i], expected['dominant_deficit'])
+            self.assertAlmostEqual(result['growth'][i], expected['growth'], places=12)
+            self.assertEqual(bool(result['converged'][i]), expected['converged'])
+
+    def test_matches_scalar_unbounded(self):
+        """Unbounded batch equals scalar trajectories"""
+        result = self.batch.analyze_batch(self.coords, cycles=100)
+        self._assert_matches_scalar(result, [None] * len(self.coords))
+
+    def test_matches_scalar_with_bounds(self):
+        """Per-row ICE bounds equal scalar trajectories"""
+        bounds = BatchResonanceEngine.bounds_to_array(self.bounds)
+        result = self.batch.analyze_batch(self.coords, cycles=100, ice_bounds=bounds)
+        self._assert_matches_scalar(result, self.bounds)
+
+    def test_history_optional(self):
+        """History is only stored on request"""
+        result = self.batch.analyze_batch(self.coords, cycles=10)
+        self.assertNotIn('history', result)
+
+        result = self.batch.analyze_batch(self.coords, cycles=10, store_history=True)
+        self.assertEqual(result['history'].shape, (11, len(self.coords), 4))
+        np.testing.assert_array_equal(result['history'][-1], result['final_states'])
+
+    def test_input_validation(self):
+        """Invalid inputs are rejected"""
+        with self.assertRaises(ValueError):
+            self.batch.analyze_batch(np.zeros((3, 3)))
+        with self.assertRaises(ValueError):
+            self.batch.analyze_batch(-np.ones((2, 4)))
+        with self.assertRaises(ValueError):
+            self.batch.analyze_batch(self.coords, cycles=0)
+        with self.assertRaises(ValueError):
+            self.batch.analyze_batch(self.coords, ice_bounds=np.ones((1, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Unit Tests for BatchIterator
+
+Streamed batches must match the old X[permutation] slicing exactly (so
+seeded training reproduces), normalize uint8 memory maps per batch, keep
+the previous batch intact while prefetching, and shut the prefetch thread
+down when iteration stops early.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import threading
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.batches import BatchIterator
+from bicameral.right.models import NaturalMNIST
+
+
+class TestBatchIterator(unittest.TestCase):
+    """Test batch contents, buffers and prefetching"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        rng = np.random.RandomState(0)
+        self.pixels = rng.randint(0, 256, size=(103, 784)).astype(np.uint8)
+        self.labels = rng.randint(0, 10, size=103)
+        path = os.path.join(self.tmp, 'pixels.npy')
+        np.save(path, self.pixels)
+        self.mmap = np.load(path, mmap_mode='r')
+
+    def tearDown(self):
+        del self.mmap
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_matches_permutation_slicing(self):
+        """Same batches as X[np.random.permutation(n)] sliced, for every prefetch depth"""
+        np.random.seed(3)
+        order = np.random.permutation(103)
+        expected = self.pixels[order].astype(np.float32) / 255.0
+        for prefetch in (0, 1, 2):
+            np.random.seed(3)
+            batches = BatchIterator(self.mmap, self.labels, batch_size=10, prefetch=prefetch)
+            got = [(X.copy(), y.copy()) for X, y in batches]
+            self.assertEqual(len(got), len(batches))
+            self.assertEqual([len(y) for _, y in got], [10] * 10 + [3])
+            np.testing.assert_array_equal(np.vstack([X for X, _ in got]), expected)
+            np.testing.assert_array_equal(np.hstack([y for _, y in got]), self.labels[order])
+
+    def test_drop_last_and_in_order(self):
+        batches = BatchIterator(self.pixels, batch_size=10, shuffle=False, drop_last=True,
+                                dtype=np.float64, prefetch=0)
+        got = list(batches)
+        self.assertEqual(len(got), 10)
+        self.assertIsNone(got[0][1])
+        self.assertEqual(got[0][0].dtype, np.float64)
+        np.testing.assert_array_equal(got[-1][0], self.pixels[90:100] / 255.0)
+
+    def test_previous_batch_stays_valid(self):
+        """Layers keep their last input for backward(): it must survive one more batch"""
+        np.random.seed(1)
+        order = np.random.permutation(103)
+        np.random.seed(1)
+        previous = None
+        for i, (X, _) in enumerate(BatchIterator(self.mmap, self.labels, batch_size=4, prefetch=2)):
+            if previous is not None:
+                np.testing.assert_array_equal(
+                    previous, self.pixels[order[4 * (i - 1):4 * i]].astype(np.float32) / 255.0)
+            previous = X
+
+    def test_early_stop_joins_thread(self):
+        before = threading.active_count()
+        batches = BatchIterator(self.pixels, self.labels, batch_size=2, prefetch=2)
+        for i, _ in enumerate(batches):
+            if i == 3:
+                break
+        self.assertEqual(threading.active_count(), before)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            BatchIterator(self.pixels, self.labels[:5])
+        with self.assertRaises(ValueError):
+            BatchIterator(self.pixels, batch_size=0)
+
+
+class TestStreamedFit(unittest.TestCase):
+    """Test NaturalMNIST.fit on uint8 pixels"""
+
+    def test_uint8_matches_float(self):
+        rng = np.random.RandomState(1)
+        pixels = rng.randint(0, 256, size=(200, 784)).astype(np.uint8)
+        labels = rng.randint(0, 10, size=200)
+
+        histories = []
+        for X in (pixels, pixels / 255.0):
+            np.random.seed(0)
+            model = NaturalMNIST(verbose=False)
+            histories.append(model.fit(X, labels, epochs=2, batch_size=16, verbose=False))
+        self.assertEqual(histories[0].train_loss, histories[1].train_loss)
+        self.assertEqual(histories[0].train_accuracy, histories[1].train_accuracy)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit Tests for the Benchmark Suite
+
+Corpora must be deterministic and analyzable, benchmark runs must produce
+the documented result layout, and baseline comparisons must flag
+regressions beyond the threshold.
+"""
+
+import unittest
+import sys
+import os
+import ast
+import shutil
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.corpus import write_python_tree, write_web_tree, FILES_PER_PACKAGE
+from benchmarks.suite import (
+    BENCHMARKS, get_benchmark, run_benchmarks, save_results, load_results, compare,
+)
+
+
+def _results(times, scale=1.0, seed=0):
+    return {
+        'meta': {'scale': scale, 'seed': seed},
+        'benchmarks': {name: {'min_seconds': t, 'median_seconds': t, 'mean_seconds': t}
+                       for name, t in times.items()},
+    }
+
+
+class TestCorpus(unittest.TestCase):
+    """Test the synthetic source trees"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _read(self, paths):
+        contents = []
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                contents.append(f.read())
+        return contents
+
+    def test_python_tree_deterministic(self):
+        """Same seed, same bytes; a different seed changes the corpus"""
+        first = write_python_tree(os.path.join(self.tmp, 'a'), FILES_PER_PACKAGE + 3, seed=7)
+        second = write_python_tree(os.path.join(self.tmp, 'b'), FILES_PER_PACKAGE + 3, seed=7)
+        other = write_python_tree(os.path.join(self.tmp, 'c'), FILES_PER_PACKAGE + 3, seed=8)
+
+        self.assertEqual(self._read(first), self._read(second))
+        self.assertNotEqual(self._read(first), self._read(other))
+        self.assertEqual(len({os.path.dirname(path) for path in first}), 2)
+        for source in self._read(first):
+            ast.parse(source)
+
+    def test_web_tree_layout(self):
+        written = write_web_tree(self.tmp, 4, seed=0)
+        self.assertEqual(sorted(written), ['css', 'html', 'js', 'py'])
+        for paths in written.values():
+            self.assertEqual(len(paths), 4)
+        for source in self._read(written['py']):
+            ast.parse(source)
+
+
+class TestBenchmarkRuns(unittest.TestCase):
+    """Test running benchmarks and storing results"""
+
+    def test_run_result_layout(self):
+        results = run_benchmarks(['resonance_trajectory'], scale=0.05, repeats=2, verbose=False)
+        self.assertEqual(results['meta']['scale'], 0.05)
+        result = results['benchmarks']['resonance_trajectory']
+        self.assertEqual(len(result['times']), 2)
+        self.assertEqual(result['min_seconds'], min(result['times']))
+        self.assertEqual(result['params']['trajectories'], 5)
+
+    def test_unknown_benchmark(self):
+        self.assertEqual(len({b.name for b in BENCHMARKS}), len(BENCHMARKS))
+        with self.assertRaises(KeyError):
+            get_benchmark('no_such_benchmark')
+        with self.assertRaises(ValueError):
+            run_benchmarks(['resonance_trajectory'], scale=0)
+
+    def test_save_load_roundtrip(self):
+        tmp = tempfile.mkdtemp()
+        try:
+            results = _results({'code_analyzer': 0.5})
+            path = save_results(results, os.path.join(tmp, 'nested', 'baseline.json'))
+            self.assertEqual(load_results(path), results)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TestCompare(unittest.TestCase):
+    """Test baseline comparison"""
+
+    def test_statuses(self):
+        baseline = _results({'slow': 1.0, 'fast': 1.0, 'same': 1.0})
+        results = _results({'slow': 1.3, 'fast': 0.5, 'same': 1.1, 'added': 2.0})
+        rows = {row['name']: row for row in compare(results, baseline, threshold=0.2)}
+
+        self.assertEqual(rows['slow']['status'], 'regression')
+        self.assertAlmostEqual(rows['slow']['ratio'], 1.3)
+        self.assertEqual(rows['fast']['status'], 'improvement')
+        self.assertEqual(rows['same']['status'], 'ok')
+        self.assertEqual(rows['added']['status'], 'new')
+        self.assertIsNone(rows['added']['baseline'])
+
+    def test_incomparable_runs(self):
+        with self.assertRaises(ValueError):
+            compare(_results({'a': 1.0}, scale=0.5), _results({'a': 1.0}))
+        with self.assertRaises(ValueError):
+            compare(_results({'a': 1.0}), _results({'a': 1.0}, seed=1))
+        with self.assertRaises(ValueError):
+            compare(_results({'a': 1.0}), _results({'a': 1.0}), metric='max_seconds')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+"""
+Unit Tests for Buffer-Reusing Layers
+
+In float64, the in-place kernels and preallocated workspaces must give
+bit-identical results to the allocating path, reuse their buffers across
+steps of the same batch size, and leave inference calls allocating.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.workspace import Workspace
+from bicameral.right.layers import FibonacciLayer
+from bicameral.right.activations import DiverseActivation
+from bicameral.right.models import NaturalMNIST
+
+ACTIVATIONS = ['relu', 'swish', 'tanh', 'sigmoid', 'linear']
+
+
+class TestWorkspace(unittest.TestCase):
+    """Test the scratch buffer pool"""
+
+    def test_reuse_and_eviction(self):
+        """Same (name, shape) returns the same array; LRU entries are dropped"""
+        ws = Workspace(dtype=np.float32, max_entries=2)
+        a = ws.get('z', (4, 3))
+        self.assertIs(ws.get('z', (4, 3)), a)
+        self.assertEqual(a.dtype, np.float32)
+
+        b = ws.get('z', (8, 3))
+        self.assertIsNot(b, a)
+        ws.get('z', (4, 3))
+        ws.get('grad', (4, 3))  # evicts (z, (8, 3))
+        self.assertIs(ws.get('z', (4, 3)), a)
+        self.assertEqual(ws.allocations, 3)
+        self.assertEqual(len(ws), 2)
+
+        with self.assertRaises(ValueError):
+            Workspace(max_entries=0)
+
+
+class TestDiverseActivationBuffers(unittest.TestCase):
+    """Test DiverseActivation buffer-reusing mode"""
+
+    def setUp(self):
+        self.z = np.random.default_rng(3).standard_normal((16, 23)) * 4
+
+    def test_bit_identical(self):
+        """Forward and backward match the allocating path for every activation"""
+        for mix in [[name] for name in ACTIVATIONS] + [ACTIVATIONS]:
+            plain = DiverseActivation(23, mix=mix)
+            buffered = DiverseActivation(23, mix=mix, reuse_buffers=True)
+            np.testing.assert_array_equal(buffered.forward(self.z), plain.forward(self.z))
+            np.testing.assert_array_equal(buffered.backward(self.z), plain.backward(self.z))
+
+    def test_buffers_reused_in_training_only(self):
+        """Training calls reuse one output array; inference allocates"""
+        activation = DiverseActivation(23, reuse_buffers=True)
+        first = activation(self.z)
+        self.assertIs(activation(self.z), first)
+        self.assertIsNot(activation(self.z, training=False), first)
+        self.assertIs(activation.backward(self.z), activation.backward(self.z))
+
+
+class TestFibonacciLayerBuffers(unittest.TestCase):
+    """Test FibonacciLayer buffer-reusing mode"""
+
+    def _pair(self, activation, **kwargs):
+        layers = []
+        for reuse in (False, True):
+            np.random.seed(5)
+            layers.append(FibonacciLayer(12, fib_index=7, activation=activation,
+                                         reuse_buffers=reuse, **kwargs))
+        return layers
+
+    def test_training_bit_identical(self):
+        """Several training steps give identical weights and gradients"""
+        rng = np.random.default_rng(0)
+        for activation in ['relu', 'swish', 'tanh', 'linear']:
+            plain, buffered = self._pair(activation)
+            for _ in range(5):
+                X = rng.standard_normal((8, 12))
+                grad = rng.standard_normal((8, 13))
+                np.testing.assert_array_equal(buffered.forward(X), plain.forward(X))
+                np.testing.assert_array_equal(buffered.backward(grad, 0.1), plain.backward(grad, 0.1))
+            np.testing.assert_array_equal(buffered.weights, plain.weights)
+            np.testing.assert_array_equal(buffered.bias, plain.bias)
+
+    def test_buffers_per_batch_size(self):
+        """Each batch size keeps its own reused buffers"""
+        _, layer = self._pair('relu')
+        small = layer.forward(np.ones((4, 12)))
+        large = layer.forward(np.ones((6, 12)))
+        self.assertIs(layer.forward(np.ones((4, 12))), small)
+        self.assertIsNot(large, small)
+        self.assertEqual(large.shape, (6, 13))
+
+    def test_skip_input_grad(self):
+        """compute_input_grad=False updates weights and returns None"""
+        for layer in self._pair('tanh'):
+            layer.forward(np.ones((4, 12)))
+            before = layer.weights.copy()
+            self.assertIsNone(layer.backward(np.ones((4, 13)), 0.1, compute_input_grad=False))
+            self.assertFalse(np.array_equal(layer.weights, before))
+
+    def test_float32(self):
+        """float32 layers keep float32 parameters and outputs"""
+        _, layer = self._pair('swish', dtype=np.float32)
+        out = layer.forward(np.ones((4, 12)))
+        layer.backward(np.ones((4, 13), dtype=np.float32))
+        self.assertEqual(out.dtype, np.float32)
+        self.assertEqual(layer.weights.dtype, np.float32)
+        self.assertEqual(layer.bias.dtype, np.float32)
+
+
+class TestNaturalMNISTBuffers(unittest.TestCase):
+    """Test NaturalMNIST.fit with buffer reuse"""
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.X = rng.random((96, 784))
+        self.y = rng.integers(0, 10, 96)
+
+    def _fit(self, **kwargs):
+        np.random.seed(2)
+        model = NaturalMNIST(verbose=False, **kwargs)
+        history = model.fit(self.X, self.y, epochs=2, batch_size=16, verbose=False)
+        return model, history
+
+    def test_bit_identical_training(self):
+        """reuse_buffers=True trains to exactly the same weights"""
+        plain, plain_history = self._fit()
+        buffered, buffered_history = self._fit(reuse_buffers=True)
+        for a, b in zip(plain.layers, buffered.layers):
+            np.testing.assert_array_equal(a.weights, b.weights)
+        np.testing.assert_array_equal(plain.output_weights, buffered.output_weights)
+        self.assertEqual(plain_history.train_loss, buffered_history.train_loss)
+
+    def test_float32_training(self):
+        """float32 training stays float32 and close to float64"""
+        plain, plain_history = self._fit()
+        model, history = self._fit(reuse_buffers=True, dtype=np.float32)
+        self.assertEqual(model.output_weights.dtype, np.float32)
+        self.assertTrue(all(layer.weights.dtype == np.float32 for layer in model.layers))
+        np.testing.assert_allclose(history.train_loss, plain_history.train_loss, rtol=1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
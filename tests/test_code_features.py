@@ -0,0 +1,122 @@
+"""
+Regression Tests for the Shared Code Feature Pass
+
+The LJPW estimate and ICE bounds computed from CodeFeatures must be
+identical to the original per-heuristic text scans, for every Python file
+in the repository and for awkward edge cases.
+"""
+
+import unittest
+import sys
+import os
+import glob
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.left.code_features import CodeFeatures
+from bicameral.left.ice_container import IceContainer
+from bicameral.left.semantic_resonance_analyzer import SemanticResonanceAnalyzer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def legacy_estimate(code):
+    """Original _estimate_initial_ljpw (one scan per heuristic)."""
+    lines = code.split('\n')
+    content = code
+    total_lines = max(len(lines), 1)
+
+    docstrings = content.count('"""') + content.count("'''")
+    imports = content.count('import ')
+    comments = sum(1 for line in lines if line.strip().startswith('#'))
+    L = min(1.0, 0.2 + (docstrings * 0.05) + (comments / total_lines * 0.5) + (imports * 0.02))
+
+    try_blocks = content.count('try:')
+    asserts = content.count('assert ')
+    validates = content.lower().count('valid') + content.lower().count('check')
+    raises = content.count('raise ')
+    J = min(1.0, 0.15 + (try_blocks * 0.08) + (asserts * 0.05) + (validates * 0.03) + (raises * 0.05))
+
+    functions = content.count('def ')
+    classes = content.count('class ')
+    loops = content.count('for ') + content.count('while ')
+    math_ops = content.count('+') + content.count('*') + content.count('/')
+    P = min(1.0, 0.25 + (functions * 0.03) + (classes * 0.05) + (loops * 0.02) + (math_ops * 0.001))
+
+    logs = content.lower().count('log') + content.count('print')
+    types = content.count(': ') + content.count('->')
+    dataclasses = content.count('@dataclass')
+    W = min(1.0, 0.15 + (logs * 0.03) + (types * 0.02) + (dataclasses * 0.1))
+
+    return [L, J, P, W]
+
+
+def legacy_ice(code):
+    """Original IceContainer.infer_from_code heuristics."""
+    has_doc = '"""' in code or "'''" in code
+    has_types = 'typing' in code or '->' in code
+    lines = len(code.split('\n'))
+    return {
+        'Intent': 0.8 if has_doc else 0.4,
+        'Context': 0.8 if has_types else 0.5,
+        'Execution': min(1.0, 0.3 + (lines / 500.0)),
+        'Benevolence': 0.9,
+    }
+
+
+EDGE_CASES = [
+    'x',
+    '\n',
+    '# only a comment',
+    '   \t# indented comment\r\n\f# form feed\n\x0b#vt\n　# ideographic space\n',
+    '""""""',
+    "'''''''",
+    'a->b->->',
+    'LOG Log log dialog VALIDATE Invalid CHECKED',
+    'def f(a: int) -> int:\n    try:\n        assert a\n    except: raise\n',
+    'not # a comment\n#\n  #\n',
+    '/*/+/**//++',
+]
+
+
+class TestCodeFeatures(unittest.TestCase):
+    """Test CodeFeatures against the original scans"""
+
+    def setUp(self):
+        self.analyzer = SemanticResonanceAnalyzer()
+        self.sources = []
+        for path in sorted(glob.glob(os.path.join(REPO_ROOT, '**', '*.py'), recursive=True)):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    code = f.read()
+            except (OSError, UnicodeDecodeError):
+                continue
+            if code:
+                self.sources.append((path, code))
+        self.sources.extend((f'<edge {i}>', code) for i, code in enumerate(EDGE_CASES))
+
+    def test_estimate_identical(self):
+        """Initial LJPW estimate is identical for every source"""
+        self.assertGreater(len(self.sources), 100)
+        for name, code in self.sources:
+            self.assertEqual(self.analyzer._estimate_initial_ljpw(code), legacy_estimate(code), name)
+
+    def test_ice_bounds_identical(self):
+        """ICE bounds are identical with and without precomputed features"""
+        for name, code in self.sources:
+            expected = legacy_ice(code)
+            self.assertEqual(IceContainer.infer_from_code(code).get_ljpw_limits(), expected, name)
+            features = CodeFeatures.from_code(code)
+            self.assertEqual(
+                IceContainer.infer_from_code(code, features).get_ljpw_limits(), expected, name
+            )
+
+    def test_rejects_non_string(self):
+        """Non-string input is rejected"""
+        with self.assertRaises(TypeError):
+            CodeFeatures.from_code(b'bytes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+Unit Tests for the Unified Coordination Step
+
+unified_step must run the network forward once and measure the Seven
+Principles once per step, keep a bounded history of summarized outputs,
+and report how long each phase took.
+"""
+
+import unittest
+import sys
+import os
+import io
+import contextlib
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.universal_coordinator import UniversalFrameworkCoordinator, STEP_PHASES
+
+
+def make_coordinator(**kwargs):
+    np.random.seed(11)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return UniversalFrameworkCoordinator(20, 5, hidden_fib_indices=[8, 7],
+                                             lov_cycle_period=4, **kwargs)
+
+
+def run_steps(coordinator, steps):
+    rng = np.random.RandomState(3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return [coordinator.unified_step(rng.randn(6, 20) * 0.3, np.zeros((6, 5)))
+                for _ in range(steps)]
+
+
+class TestUnifiedStep(unittest.TestCase):
+    """Test the deduplicated coordination step"""
+
+    def test_single_forward_and_measurement(self):
+        """One forward pass and one principles measurement per step"""
+        coordinator = make_coordinator()
+        network = coordinator.lov_network
+        forward_calls = []
+        forward = network.forward
+
+        def counting_forward(*args, **kwargs):
+            forward_calls.append(kwargs)
+            return forward(*args, **kwargs)
+
+        network.forward = counting_forward
+        states = run_steps(coordinator, 5)
+
+        self.assertEqual(len(forward_calls), 5)
+        timings = network.principles_validator.principle_timings
+        self.assertEqual({timing['calls'] for timing in timings.values()}, {5})
+        for state in states:
+            self.assertEqual(state['principles']['overall_adherence'],
+                             state['love']['principles']['overall_adherence'])
+            self.assertIn('principle_7_detailed', state['principles'])
+
+        # The delivered output is the one the domain metrics measured
+        manifestation = states[-1]['domains']['SFM']['manifestation']
+        self.assertEqual(manifestation['output_strength'],
+                         float(np.mean(np.max(states[-1]['output'], axis=1))))
+
+    def test_bounded_summarized_history(self):
+        """History is capped and keeps output summaries instead of outputs"""
+        coordinator = make_coordinator(history_size=3)
+        states = run_steps(coordinator, 6)
+
+        history = coordinator.coordination_history
+        self.assertEqual(len(history), 3)
+        self.assertEqual([entry['step'] for entry in history], [3, 4, 5])
+        entry = history[-1]
+        self.assertNotIn('output', entry)
+        self.assertIn('output', states[-1])
+        summary = entry['output_summary']
+        self.assertEqual(summary['shape'], states[-1]['output'].shape)
+        self.assertEqual(int(summary['predictions'].sum()), 6)
+        self.assertEqual(len(coordinator.lov_network.love_phase_history), 3)
+
+    def test_phase_timings(self):
+        """Each step reports per-phase seconds; the report accumulates them"""
+        coordinator = make_coordinator()
+        states = run_steps(coordinator, 4)
+
+        for state in states:
+            self.assertEqual(set(state['timings']), set(STEP_PHASES) | {'total'})
+            phases = sum(state['timings'][phase] for phase in STEP_PHASES)
+            self.assertLessEqual(phases, state['timings']['total'])
+
+        report = coordinator.get_timing_report()
+        self.assertEqual({row['name'] for row in report}, set(STEP_PHASES))
+        self.assertTrue(all(row['calls'] == 4 for row in report))
+        totals = [row['total_seconds'] for row in report]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
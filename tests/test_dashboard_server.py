@@ -0,0 +1,172 @@
+"""
+Unit Tests for the Dashboard Server
+
+Requests must be served from the background snapshot (no analysis per
+request), with ETag revalidation, gzip and server-sent events. Refreshes
+must reuse cached file analyses and pause while no client is active.
+"""
+
+import unittest
+import sys
+import os
+import gzip
+import json
+import shutil
+import tempfile
+import time
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.cache import AnalysisCache
+from autopoiesis.dashboard import DashboardData, create_dashboard_server
+
+
+class TestDashboardServer(unittest.TestCase):
+    """Test the threaded, snapshot-backed dashboard server"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache_dir = tempfile.mkdtemp()
+        self._write('mod.py', 'def f(x):\n    return x\n')
+        # Long TTL: only explicit refreshes change the snapshot
+        self.server = create_dashboard_server(self.root, port=0, ttl=3600,
+                                              cache=AnalysisCache(self.cache_dir))
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.data_source.stop()
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.root, ignore_errors=True)
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _write(self, name, code):
+        with open(os.path.join(self.root, name), 'w') as f:
+            f.write(code)
+
+    def _get(self, path, headers=None):
+        conn = http.client.HTTPConnection('localhost', self.port, timeout=10)
+        conn.request('GET', path, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        return response, body
+
+    def test_data_served_from_snapshot(self):
+        """Repeated requests reuse one measurement"""
+        measured_at = self.server.data_source._cache_time
+        for _ in range(5):
+            response, body = self._get('/api/data')
+            self.assertEqual(response.status, 200)
+            data = json.loads(body)
+            self.assertEqual(data['harmony']['total_files'], 1)
+            self.assertEqual(data['version'], 1)
+        self.assertEqual(self.server.data_source._cache_time, measured_at)
+
+    def test_etag_and_gzip(self):
+        """ETag revalidates to 304 and gzip decodes to the same JSON"""
+        response, body = self._get('/api/data')
+        etag = response.getheader('ETag')
+        self.assertTrue(etag)
+
+        response, body304 = self._get('/api/data', {'If-None-Match': etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body304, b'')
+
+        response, zipped = self._get('/api/data', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(json.loads(gzip.decompress(zipped)), json.loads(body))
+
+    def test_unchanged_refresh_keeps_version(self):
+        """Re-measuring identical content does not bump the version"""
+        source = self.server.data_source
+        self.assertEqual(source.refresh(), 1)
+
+        self._write('other.py', 'class C:\n    pass\n')
+        self.assertEqual(source.refresh(), 2)
+        response, body = self._get('/api/data')
+        self.assertEqual(json.loads(body)['harmony']['total_files'], 2)
+
+    def test_refresh_reuses_analyses(self):
+        """Unchanged files are analysis cache hits on the next refresh"""
+        source = self.server.data_source
+        hits = source.cache.hits
+        source.refresh()
+        self.assertEqual(source.cache.hits, hits + 1)
+
+    def test_concurrent_requests(self):
+        """Many clients are served in parallel"""
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: self._get('/')[0].status, range(16)))
+        self.assertEqual(results, [200] * 16)
+
+    def test_event_stream(self):
+        """The stream sends the current snapshot, then each new one"""
+        conn = http.client.HTTPConnection('localhost', self.port, timeout=10)
+        conn.request('GET', '/api/stream')
+        response = conn.getresponse()
+        self.assertEqual(response.getheader('Content-type'), 'text/event-stream')
+
+        def read_event():
+            lines = []
+            while True:
+                line = response.fp.readline().decode().rstrip('\n')
+                if not line:
+                    return lines
+                lines.append(line)
+
+        self.assertEqual(read_event()[:2], ['event: data', 'id: 1'])
+
+        self._write('other.py', 'class C:\n    pass\n')
+        self.server.data_source.refresh()
+        event = read_event()
+        self.assertEqual(event[:2], ['event: data', 'id: 2'])
+        self.assertEqual(json.loads(event[2][len('data: '):])['harmony']['total_files'], 2)
+        conn.close()
+
+
+class TestDashboardDataOnDemand(unittest.TestCase):
+    """Test DashboardData refreshing on demand"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.cache = AnalysisCache(os.path.join(self.root, '.cache'))
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_ttl_caches(self):
+        """get_all_data only re-measures once the TTL expires"""
+        data = DashboardData(self.root, ttl=3600, cache=self.cache)
+        first = data.get_all_data()
+        self.assertIs(data.get_all_data(), first)
+        data.ttl = 0
+        data.get_all_data()
+        self.assertGreater(data._cache_time, 0)
+
+    def test_refresher_pauses_without_clients(self):
+        """An idle refresher stops measuring until the next request"""
+        data = DashboardData(self.root, ttl=0.02, cache=self.cache, idle_timeout=0.1)
+        data.start()
+        try:
+            measured_at = data._cache_time
+            time.sleep(0.2)
+            self.assertEqual(data._cache_time, measured_at)
+
+            data.get_all_data()  # refreshes on demand after idling
+            self.assertGreater(data._cache_time, measured_at)
+            measured_at = data._cache_time
+            time.sleep(0.05)
+            self.assertGreater(data._cache_time, measured_at)  # refresher resumed
+        finally:
+            data.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
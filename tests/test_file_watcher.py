@@ -0,0 +1,161 @@
+"""
+Unit Tests for the Autopoiesis File Watcher
+
+Both watchers must report the same created/modified/deleted changes as a
+full rescan, without re-reading files whose metadata is unchanged. The
+Living Agent's incremental measurement must match a full measurement.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.watcher import PollingWatcher, InotifyWatcher, create_watcher
+from autopoiesis.living_agent import LivingAgent
+
+EXTENSIONS = {'.py', '.js'}
+IGNORED = {'node_modules', '.git'}
+
+
+def write(root, rel_path, content):
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+class WatcherContract:
+    """Shared tests; subclasses provide make_watcher()"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        write(self.root, 'a.py', 'x = 1\n')
+        write(self.root, os.path.join('pkg', 'b.js'), 'let y = 2;\n')
+        write(self.root, 'notes.txt', 'ignored\n')
+        write(self.root, os.path.join('node_modules', 'dep.js'), 'ignored\n')
+        self.watcher = self.make_watcher()
+
+    def tearDown(self):
+        self.watcher.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_initial_index(self):
+        """Only watched, non-ignored files are indexed"""
+        self.assertEqual(sorted(self.watcher.file_hashes), ['a.py', os.path.join('pkg', 'b.js')])
+
+    def test_idle_poll_reads_nothing(self):
+        """Unchanged files are not re-hashed"""
+        hashed = self.watcher.files_hashed
+        self.assertEqual(self.watcher.poll(), {'created': [], 'modified': [], 'deleted': []})
+        self.assertEqual(self.watcher.files_hashed, hashed)
+
+    def test_create_modify_delete(self):
+        """Changes are reported with relative paths"""
+        write(self.root, 'a.py', 'x = 100\n')
+        write(self.root, os.path.join('pkg', 'c.py'), 'z = 3\n')
+        os.remove(os.path.join(self.root, 'pkg', 'b.js'))
+        write(self.root, os.path.join('node_modules', 'dep.js'), 'still ignored\n')
+
+        changes = self.watcher.poll()
+        self.assertEqual(changes['modified'], ['a.py'])
+        self.assertEqual(changes['created'], [os.path.join('pkg', 'c.py')])
+        self.assertEqual(changes['deleted'], [os.path.join('pkg', 'b.js')])
+
+    def test_touch_is_not_a_change(self):
+        """Rewriting identical content is not reported"""
+        write(self.root, 'a.py', 'x = 1\n')
+        os.utime(os.path.join(self.root, 'a.py'), (1, 1))
+        self.assertEqual(self.watcher.poll()['modified'], [])
+
+    def test_new_directory(self):
+        """Files in newly created directories are picked up"""
+        write(self.root, os.path.join('new', 'deep', 'd.py'), 'd = 4\n')
+        self.assertEqual(self.watcher.poll()['created'], [os.path.join('new', 'deep', 'd.py')])
+
+        write(self.root, os.path.join('new', 'deep', 'd.py'), 'd = 5\n')
+        self.assertEqual(self.watcher.poll()['modified'], [os.path.join('new', 'deep', 'd.py')])
+
+    def test_directory_removed(self):
+        """Removing a directory deletes its files"""
+        shutil.rmtree(os.path.join(self.root, 'pkg'))
+        self.assertEqual(self.watcher.poll()['deleted'], [os.path.join('pkg', 'b.js')])
+
+
+class TestPollingWatcher(WatcherContract, unittest.TestCase):
+    """Test the portable polling watcher"""
+
+    def make_watcher(self):
+        return PollingWatcher(self.root, EXTENSIONS, IGNORED)
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'inotify requires Linux')
+class TestInotifyWatcher(WatcherContract, unittest.TestCase):
+    """Test the inotify watcher"""
+
+    def make_watcher(self):
+        return InotifyWatcher(self.root, EXTENSIONS, IGNORED)
+
+    def test_idle_poll_stats_nothing(self):
+        """Without events no file is even stat'ed"""
+        stat_calls = self.watcher.files_stat
+        self.watcher.poll()
+        self.assertEqual(self.watcher.files_stat, stat_calls)
+
+
+class TestCreateWatcher(unittest.TestCase):
+    """Test watcher selection"""
+
+    def test_polling_fallback(self):
+        """use_inotify=False always polls"""
+        root = tempfile.mkdtemp()
+        try:
+            self.assertIsInstance(create_watcher(root, EXTENSIONS, IGNORED, use_inotify=False), PollingWatcher)
+        finally:
+            shutil.rmtree(root)
+
+    def test_rejects_missing_root(self):
+        """A missing root is rejected"""
+        with self.assertRaises(ValueError):
+            PollingWatcher('/nonexistent/autopoiesis/root', EXTENSIONS, IGNORED)
+
+
+class TestIncrementalMeasure(unittest.TestCase):
+    """Test the Living Agent's incremental measurement"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        write(self.root, 'one.py', 'def f(x):\n    return x\n')
+        write(self.root, 'two.py', '"""Doc."""\nimport logging\n\n\ndef g(y: int) -> int:\n    return y * 2\n')
+        write(self.root, 'test_skip.py', 'def test_x():\n    assert True\n')
+        self.agent = LivingAgent(self.root, dry_run=True)
+
+    def tearDown(self):
+        self.agent.senses.close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_matches_full_measure(self):
+        """Incremental and full measurements agree after changes"""
+        self.agent._measure_harmony()
+
+        write(self.root, 'one.py', 'def f(x):\n    try:\n        return int(x)\n    except ValueError:\n        raise\n')
+        write(self.root, 'three.py', 'class C:\n    pass\n')
+        os.remove(os.path.join(self.root, 'two.py'))
+
+        incremental = self.agent._measure_harmony(self.agent.senses.detect_changes())
+        full = self.agent._measure_harmony()
+
+        self.assertEqual(incremental['total_files'], 2)
+        self.assertEqual(incremental['total_files'], full['total_files'])
+        self.assertEqual(incremental['total_functions'], full['total_functions'])
+        self.assertAlmostEqual(incremental['harmony'], full['harmony'], places=12)
+        for dim in 'LJPW':
+            self.assertAlmostEqual(incremental['ljpw'][dim], full['ljpw'][dim], places=12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,185 @@
+"""
+Unit Tests for the Compact Harmony History
+
+HarmonyHistory must read like the list of HarmonyCheckpoint it replaces,
+keep its memory fixed under ring or downsample retention, and keep
+HomeostaticNetwork's harmony decisions unchanged.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import tempfile
+import shutil
+from datetime import datetime
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.harmony_history import HarmonyHistory
+from bicameral.right.homeostatic import HomeostaticNetwork, HarmonyCheckpoint
+from bicameral.right.consciousness_growth import save_state, load_state
+
+
+def make_checkpoint(i):
+    return HarmonyCheckpoint(
+        timestamp=datetime(2025, 12, 1, 12, 0, i % 60),
+        epoch=None if i == 0 else i,
+        L=0.85, J=0.75, P=0.5 + (i % 7) / 20, W=0.8,
+        H=0.6 + (i % 11) / 50,
+        accuracy=None if i % 3 == 0 else i / 1000,
+        meaning=i / 10,
+        life_phase=['ENTROPIC', 'HOMEOSTATIC', 'AUTOPOIETIC', None][i % 4],
+    )
+
+
+class TestListView(unittest.TestCase):
+    """Test list semantics against a plain list"""
+
+    def test_matches_list(self):
+        """Indexing, slicing, iteration and len match the list it replaces"""
+        checkpoints = [make_checkpoint(i) for i in range(150)]
+        history = HarmonyHistory.from_checkpoints(checkpoints)
+
+        self.assertEqual(len(history), 150)
+        self.assertEqual(list(history), checkpoints)
+        self.assertEqual(history[-1], checkpoints[-1])
+        self.assertEqual(history[0], checkpoints[0])
+        for sl in [slice(-10, None), slice(-20, -10), slice(3, 7), slice(None, None, 9)]:
+            self.assertEqual(history[sl], checkpoints[sl])
+        with self.assertRaises(IndexError):
+            history[150]
+        self.assertFalse(HarmonyHistory())
+
+    def test_plain_values(self):
+        """Plain harmony values (LOVNetwork) read back as floats"""
+        history = HarmonyHistory()
+        history.append(make_checkpoint(1))
+        history.append(0.72)
+        self.assertEqual(history[-1], 0.72)
+        self.assertEqual(history.latest('H'), 0.72)
+        self.assertEqual(history.summary()['L_mean'], 0.85)
+
+
+class TestRetention(unittest.TestCase):
+    """Test ring and downsample retention"""
+
+    def test_ring(self):
+        """Ring retention keeps exactly the most recent entries"""
+        checkpoints = [make_checkpoint(i) for i in range(103)]
+        history = HarmonyHistory.from_checkpoints(checkpoints, capacity=25)
+        self.assertEqual(list(history), checkpoints[-25:])
+        self.assertEqual(history[-3:], checkpoints[-3:])
+        self.assertEqual(history.total_recorded, 103)
+        np.testing.assert_array_equal(history.column('index'), np.arange(78, 103))
+
+    def test_downsample(self):
+        """Downsampling spans the whole run and always holds the newest entry"""
+        history = HarmonyHistory(capacity=10, retention='downsample')
+        for i in range(1000):
+            history.record(L=0.85, J=0.75, P=0.8, W=0.8, H=i / 1000, epoch=i)
+            index = history.column('index')
+            self.assertLessEqual(len(history), 11)
+            self.assertEqual(index[-1], i)
+            self.assertEqual(index[0], 0)
+            stride = history._stride
+            self.assertTrue((index[:history._size] % stride == 0).all())
+        self.assertEqual(history[-1].epoch, 999)
+        self.assertEqual(history.latest('H'), 0.999)
+
+    def test_memory_flat(self):
+        """Capped histories never grow"""
+        for retention in ('ring', 'downsample'):
+            history = HarmonyHistory(capacity=100, retention=retention)
+            history.record(L=0.85, J=0.75, P=0.8, W=0.8, H=0.8)
+            nbytes = history.nbytes
+            for i in range(5000):
+                history.record(L=0.85, J=0.75, P=0.8, W=0.8, H=0.8, epoch=i)
+            self.assertEqual(history.nbytes, nbytes)
+
+    def test_validation(self):
+        with self.assertRaises(ValueError):
+            HarmonyHistory(capacity=10, retention='random')
+        with self.assertRaises(ValueError):
+            HarmonyHistory(capacity=1, retention='downsample')
+
+
+class TestColumnsAndPickling(unittest.TestCase):
+    """Test vectorized statistics and compact pickles"""
+
+    def test_summary(self):
+        checkpoints = [make_checkpoint(i) for i in range(40)]
+        history = HarmonyHistory.from_checkpoints(checkpoints, capacity=30)
+        H = np.array([c.H for c in checkpoints[-30:]])
+        summary = history.summary()
+        self.assertAlmostEqual(summary['H_mean'], H.mean())
+        self.assertAlmostEqual(summary['H_std'], H.std())
+        self.assertEqual(summary['H_last'], H[-1])
+        self.assertEqual(summary['entries'], 30)
+        self.assertEqual(summary['recorded'], 40)
+        self.assertEqual(sum(summary['phases'].values()),
+                         sum(1 for c in checkpoints[-30:] if c.life_phase))
+
+    def test_pickle_round_trip(self):
+        """Pickles hold only retained entries, and keep recording correctly"""
+        for retention in ('ring', 'downsample'):
+            history = HarmonyHistory(capacity=16, retention=retention)
+            for i in range(37):
+                history.append(make_checkpoint(i))
+            restored = pickle.loads(pickle.dumps(history))
+            self.assertEqual(list(restored), list(history))
+            history.append(make_checkpoint(37))
+            restored.append(make_checkpoint(37))
+            self.assertEqual(list(restored), list(history))
+
+        unbounded = HarmonyHistory(initial_capacity=4096)
+        unbounded.record(L=0.85, J=0.75, P=0.8, W=0.8, H=0.8)
+        self.assertLess(len(pickle.dumps(unbounded)), 4096)
+
+
+class TestHomeostaticIntegration(unittest.TestCase):
+    """Test HomeostaticNetwork on the compact history"""
+
+    def test_network_history(self):
+        """Networks record into a capped history and read harmony from it"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=1, history_capacity=50)
+        for epoch in range(1, 200):
+            network._record_harmony(epoch=epoch, accuracy=(epoch % 10) / 10)
+        self.assertEqual(len(network.harmony_history), 50)
+        self.assertEqual(network.get_current_harmony(), network.harmony_history[-1].H)
+        self.assertEqual(network.harmony_history[-1].epoch, 199)
+
+    def test_decisions_match_list_history(self):
+        """needs_adaptation agrees with a network keeping a plain list"""
+        compact = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=2)
+        listed = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=2)
+        listed.harmony_history = list(listed.harmony_history)
+        for epoch, accuracy in enumerate([0.2, 0.9, 0.5, 0.95, None, 0.7]):
+            for network in (compact, listed):
+                network._record_harmony(epoch=epoch, accuracy=accuracy)
+            self.assertEqual(compact.get_current_harmony(), listed.get_current_harmony())
+            self.assertEqual(compact.needs_adaptation(), listed.needs_adaptation())
+            self.assertEqual(compact.harmony_history[-1].life_phase, listed.harmony_history[-1].life_phase)
+
+    def test_load_old_list_state(self):
+        """States saved with a list history load into a HarmonyHistory"""
+        tmp = tempfile.mkdtemp()
+        try:
+            network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=3)
+            network._record_harmony(epoch=1, accuracy=0.8)
+            checkpoints = list(network.harmony_history)
+            network.harmony_history = checkpoints
+            path = os.path.join(tmp, 'state.pkl')
+            save_state(network, path)
+
+            restored = load_state(HomeostaticNetwork, path)
+            self.assertIsInstance(restored.harmony_history, HarmonyHistory)
+            self.assertEqual(list(restored.harmony_history), checkpoints)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Unit Tests for the Lifetime Evolution Runner
+
+Metrics must round-trip through the columnar log, an interrupted lifetime
+must resume onto exactly the trajectory of an uninterrupted one, and
+pooled runs must match in-process runs.
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import pickle
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.lifetime_evolution import (
+    MetricsLog, LifetimeConfig, run_lifetime, run_lifetimes, load_checkpoint,
+)
+from bicameral.right.activations import DiverseActivation
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class TestMetricsLog(TempDirTestCase):
+    """Test the columnar metrics log"""
+
+    COLUMNS = {'h': 'f8', 'n': 'u2', 'sizes': ('i4', (3,))}
+
+    def test_round_trip_across_chunks(self):
+        """Rows written across several chunks read back in order"""
+        log = MetricsLog(self.tmp, self.COLUMNS, chunk_rows=4)
+        for i in range(10):
+            log.append(h=i / 10, n=i, sizes=[i, i + 1, i + 2])
+        self.assertEqual(len(log), 10)
+        self.assertEqual(len(MetricsLog.read(self.tmp)['h']), 8)  # two chunks flushed
+
+        log.flush()
+        metrics = MetricsLog.read(self.tmp)
+        np.testing.assert_array_equal(metrics['h'], np.arange(10) / 10)
+        np.testing.assert_array_equal(metrics['n'], np.arange(10))
+        self.assertEqual(metrics['sizes'].shape, (10, 3))
+        np.testing.assert_array_equal(metrics['sizes'][:, 2], np.arange(10) + 2)
+
+    def test_reopen_and_truncate(self):
+        """Reopening appends after existing rows; truncate drops the tail"""
+        log = MetricsLog(self.tmp, self.COLUMNS)
+        for i in range(5):
+            log.append(h=float(i), n=i, sizes=[0, 0, 0])
+        log.flush()
+
+        log = MetricsLog(self.tmp, self.COLUMNS)
+        self.assertEqual(len(log), 5)
+        log.truncate(3)
+        log.append(h=9.0, n=9, sizes=[1, 1, 1])
+        log.flush()
+        np.testing.assert_array_equal(MetricsLog.read(self.tmp)['n'], [0, 1, 2, 9])
+
+        with self.assertRaises(ValueError):
+            log.truncate(10)
+        with self.assertRaises(ValueError):
+            MetricsLog(self.tmp, {'h': 'f4'})
+
+    def test_empty(self):
+        """An empty log reads as zero-length arrays"""
+        MetricsLog(self.tmp, self.COLUMNS)
+        metrics = MetricsLog.read(self.tmp)
+        self.assertEqual(metrics['sizes'].shape, (0, 3))
+
+
+class TestLifetimeRuns(TempDirTestCase):
+    """Test checkpoint/resume and pooled runs"""
+
+    def _config(self, name, iterations, seed=42):
+        return LifetimeConfig(name=name, seed=seed, iterations=iterations,
+                              checkpoint_every=10, report_every=10, history_size=8)
+
+    def _metrics(self, name):
+        return MetricsLog.read(os.path.join(self.tmp, name, 'metrics'))
+
+    def assertSameRun(self, a, b):
+        metrics_a, metrics_b = self._metrics(a), self._metrics(b)
+        for column in metrics_a:
+            np.testing.assert_array_equal(metrics_a[column], metrics_b[column])
+        layers_a = load_checkpoint(os.path.join(self.tmp, a))['network'].layers
+        layers_b = load_checkpoint(os.path.join(self.tmp, b))['network'].layers
+        for layer_a, layer_b in zip(layers_a, layers_b):
+            np.testing.assert_array_equal(layer_a.weights, layer_b.weights)
+
+    def test_resume_matches_uninterrupted(self):
+        """Stopping, adding stale rows and resuming gives an identical lifetime"""
+        summary = run_lifetime(self._config('straight', 25), self.tmp, verbose=False)
+        self.assertEqual(summary['iterations'], 25)
+
+        run_lifetime(self._config('resumed', 12), self.tmp, verbose=False)
+        # Simulate a crash after rows were flushed past the last checkpoint
+        with open(os.path.join(self.tmp, 'resumed', 'metrics', 'harmony.bin'), 'ab') as f:
+            f.write(b'\0' * 8 * 5)
+        resumed = run_lifetime(self._config('resumed', 25), self.tmp, verbose=False)
+
+        self.assertSameRun('straight', 'resumed')
+        for key in ('mean_harmony', 'total_followed_guidance', 'final_layers'):
+            self.assertEqual(resumed[key], summary[key])
+
+    def test_finished_run_is_not_repeated(self):
+        """Re-running a finished lifetime only re-reads its metrics"""
+        first = run_lifetime(self._config('done', 10), self.tmp, verbose=False)
+        second = run_lifetime(self._config('done', 10), self.tmp, verbose=False)
+        self.assertEqual(second['iterations'], 10)
+        self.assertEqual(second['mean_harmony'], first['mean_harmony'])
+
+    def test_history_bounded(self):
+        """In-memory harmony history is capped; the metrics log has every row"""
+        run_lifetime(self._config('bounded', 20), self.tmp, verbose=False)
+        network = load_checkpoint(os.path.join(self.tmp, 'bounded'))['network']
+        self.assertEqual(len(network.harmony_history), 8)
+        self.assertEqual(len(self._metrics('bounded')['harmony']), 20)
+
+    def test_pool_matches_in_process(self):
+        """Pooled lifetimes equal in-process lifetimes, in input order"""
+        pooled = run_lifetimes([self._config('p0', 8, seed=0), self._config('p1', 8, seed=1)],
+                               self.tmp, workers=2, verbose=False)
+        serial = run_lifetimes([self._config('s0', 8, seed=0), self._config('s1', 8, seed=1)],
+                               self.tmp, workers=1, verbose=False)
+        self.assertEqual([s['name'] for s in pooled], ['p0', 'p1'])
+        self.assertSameRun('p0', 's0')
+        self.assertSameRun('p1', 's1')
+        self.assertNotEqual(pooled[0]['mean_harmony'], pooled[1]['mean_harmony'])
+
+        with self.assertRaises(ValueError):
+            run_lifetimes([self._config('x', 1), self._config('x', 1)], self.tmp)
+
+
+class TestDiverseActivationPickle(unittest.TestCase):
+    """Test that activations survive checkpointing"""
+
+    def test_round_trip(self):
+        activation = DiverseActivation(13, mix=['relu', 'swish', 'tanh'])
+        z = np.linspace(-3, 3, 26).reshape(2, 13)
+        restored = pickle.loads(pickle.dumps(activation))
+        np.testing.assert_array_equal(restored(z), activation(z))
+        np.testing.assert_array_equal(restored.backward(z), activation.backward(z))
+
+
+if __name__ == '__main__':
+    unittest.main()
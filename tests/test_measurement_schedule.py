@@ -0,0 +1,158 @@
+"""
+Unit Tests for Throttled LOV Measurement
+
+BoundedHistory must read like a list, MeasurementScheduler must follow its
+cadence, and LOVNetwork must reuse cached love states between scheduled
+measurements while keeping its histories bounded.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.measurement import BoundedHistory, MeasurementScheduler
+from bicameral.right.lov_coordination import LOVNetwork
+from bicameral.right.training import train_epoch_with_backprop
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestBoundedHistory(unittest.TestCase):
+    """Test the ring-buffer history"""
+
+    def test_list_semantics(self):
+        """Indexing and slicing match a list of the retained entries"""
+        history = BoundedHistory(maxlen=25)
+        reference = []
+        for x in range(60):
+            history.append(x)
+            reference.append(x)
+        reference = reference[-25:]
+
+        self.assertEqual(len(history), 25)
+        self.assertEqual(list(history), reference)
+        for sl in [slice(-10, None), slice(-20, -10), slice(None, -10), slice(3, 7), slice(None, None, 3)]:
+            self.assertEqual(history[sl], reference[sl])
+        self.assertEqual(history[0], reference[0])
+        self.assertEqual(history[-1], reference[-1])
+
+    def test_unbounded_and_validation(self):
+        """maxlen=None keeps everything; maxlen < 1 is rejected"""
+        history = BoundedHistory(range(5))
+        self.assertEqual(history[1:3], [1, 2])
+        with self.assertRaises(ValueError):
+            BoundedHistory(maxlen=0)
+
+
+class TestMeasurementScheduler(unittest.TestCase):
+    """Test measurement cadence"""
+
+    def test_every_n(self):
+        """every=N measures on the first call and every Nth after"""
+        scheduler = MeasurementScheduler(every=4)
+        pattern = [scheduler.due() for _ in range(9)]
+        self.assertEqual(pattern, [True, False, False, False, True, False, False, False, True])
+        self.assertEqual(scheduler.measurements, 3)
+        self.assertEqual(scheduler.skipped, 6)
+
+    def test_interval(self):
+        """interval measures once enough time has passed"""
+        clock = FakeClock()
+        scheduler = MeasurementScheduler(every=None, interval=1.0, clock=clock)
+        self.assertTrue(scheduler.due())
+        clock.now = 0.5
+        self.assertFalse(scheduler.due())
+        clock.now = 1.2
+        self.assertTrue(scheduler.due())
+        self.assertFalse(scheduler.due())
+
+    def test_either_trigger(self):
+        """With both triggers, whichever comes first measures"""
+        clock = FakeClock()
+        scheduler = MeasurementScheduler(every=100, interval=1.0, clock=clock)
+        scheduler.due()
+        clock.now = 2.0
+        self.assertTrue(scheduler.due())
+
+    def test_validation(self):
+        """Invalid cadences are rejected"""
+        with self.assertRaises(ValueError):
+            MeasurementScheduler(every=None, interval=None)
+        with self.assertRaises(ValueError):
+            MeasurementScheduler(every=0)
+
+
+class TestLOVThrottling(unittest.TestCase):
+    """Test LOVNetwork love phase throttling"""
+
+    def _network(self, **kwargs):
+        return LOVNetwork(input_size=10, output_size=4, hidden_fib_indices=[7], **kwargs)
+
+    def test_default_measures_every_call(self):
+        """Default cadence keeps the original per-call behavior"""
+        network = self._network()
+        for _ in range(5):
+            self.assertNotIn('cached', network.love_phase())
+        self.assertEqual(len(network.love_phase_history), 5)
+
+    def test_cached_between_measurements(self):
+        """Skipped calls reuse the last love state without growing history"""
+        network = self._network(measure_every=5)
+        states = [network.love_phase() for _ in range(20)]
+
+        self.assertEqual(len(network.love_phase_history), 4)
+        self.assertEqual(len(network.anchor_distance_history), 4)
+        self.assertEqual(sum(1 for s in states if s.get('cached')), 16)
+        self.assertEqual(states[1]['ljpw'], states[0]['ljpw'])
+        self.assertEqual(states[1]['principles_score'], states[0]['principles_score'])
+
+        self.assertNotIn('cached', network.love_phase(force=True))
+        self.assertEqual(len(network.love_phase_history), 5)
+
+    def test_histories_bounded(self):
+        """Phase histories stop growing at history_size"""
+        network = self._network(history_size=8, lov_cycle_period=3)
+        for _ in range(30):
+            state = network.love_phase()
+            network.optimize_phase(state)
+            network.vibrate_phase()
+            network.lov_cycle_count += 1
+
+        self.assertEqual(len(network.love_phase_history), 8)
+        self.assertEqual(len(network.optimize_phase_history), 8)
+        self.assertEqual(len(network.vibrate_phase_history), 8)
+        self.assertEqual(len(network.principles_validator.principle_history), 8)
+        # Counted independently of the bounded history
+        self.assertEqual(network.vibrations_completed, 9)
+        self.assertEqual(network.get_lov_status()['vibrations_completed'], 9)
+
+    def test_training_profile(self):
+        """Training with a cadence reports per-principle timings"""
+        network = self._network(measure_every=4)
+        rng = np.random.default_rng(0)
+        X = rng.standard_normal((64, 10))
+        y = rng.integers(0, 4, 64)
+        train_epoch_with_backprop(network, X, y, batch_size=8)
+
+        profile = network.get_measurement_profile()
+        self.assertEqual(profile['measurements'], 2)
+        self.assertEqual(profile['skipped'], 6)
+        self.assertEqual(len(profile['principles']), 7)
+        for entry in profile['principles']:
+            self.assertEqual(entry['calls'], 2)
+        totals = [entry['total_seconds'] for entry in profile['principles']]
+        self.assertEqual(totals, sorted(totals, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
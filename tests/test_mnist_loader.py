@@ -0,0 +1,136 @@
+"""
+Unit Tests for the MNIST Loader
+
+The vectorized synthetic generator must be deterministic, balanced and
+shaped like MNIST, and generated or downloaded datasets must round-trip
+through the .npy cache as writable arrays.
+"""
+
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+import contextlib
+import importlib.util
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right import mnist_loader
+from bicameral.right.mnist_loader import (
+    generate_enhanced_synthetic_mnist, load_mnist, load_mnist_from_url,
+    save_dataset, load_dataset, DOWNLOAD_CACHE, _digit_templates,
+)
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+class TestSyntheticMNIST(unittest.TestCase):
+    """Test the vectorized synthetic generator"""
+
+    def test_shapes_and_balance(self):
+        X_train, y_train, X_test, y_test = quiet(generate_enhanced_synthetic_mnist, 205, 50, seed=1)
+        self.assertEqual(X_train.shape, (200, 784))
+        self.assertEqual(X_test.shape, (50, 784))
+        self.assertEqual(X_train.dtype, np.float32)
+        self.assertEqual(np.bincount(y_train).tolist(), [20] * 10)
+        self.assertEqual(np.bincount(y_test).tolist(), [5] * 10)
+        self.assertGreaterEqual(X_train.min(), 0.0)
+        self.assertLessEqual(X_train.max(), 1.0)
+        # Shuffled, not grouped by class
+        self.assertNotEqual(y_train.tolist(), sorted(y_train.tolist()))
+
+    def test_deterministic_without_global_state(self):
+        np.random.seed(0)
+        before = np.random.get_state()[1].copy()
+        first = quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=5)
+        np.testing.assert_array_equal(np.random.get_state()[1], before)
+
+        second = quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=5)
+        other = quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=6)
+        for a, b in zip(first, second):
+            np.testing.assert_array_equal(a, b)
+        self.assertFalse(np.array_equal(first[0], other[0]))
+
+    def test_samples_follow_templates(self):
+        """Each class mean is closest to its own (shifted) template"""
+        X, y, _, _ = quiet(generate_enhanced_synthetic_mnist, 1000, 10, seed=2)
+        templates = _digit_templates().reshape(10, 784)
+        for digit in range(10):
+            mean = X[y == digit].mean(axis=0)
+            distances = np.linalg.norm(templates - mean, axis=1)
+            self.assertEqual(int(np.argmin(distances)), digit)
+
+
+class TestDatasetCache(unittest.TestCase):
+    """Test the .npy dataset cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_synthetic_cache_roundtrip(self):
+        generated = quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=3, cache_dir=self.tmp)
+        cached = quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=3, cache_dir=self.tmp)
+        for a, b in zip(generated, cached):
+            np.testing.assert_array_equal(a, b)
+            # Cached loads can be modified in place like freshly generated ones
+            self.assertNotIsInstance(b, np.memmap)
+            self.assertTrue(b.flags.writeable)
+        self.assertEqual(sorted(os.listdir(self.tmp)), ['synthetic-v1-100-20-3'])
+
+        # A different key generates a separate dataset
+        quiet(generate_enhanced_synthetic_mnist, 100, 20, seed=4, cache_dir=self.tmp)
+        self.assertEqual(len(os.listdir(self.tmp)), 2)
+
+    def test_incomplete_cache_ignored(self):
+        save_dataset(self.tmp, (np.zeros((2, 784)), np.zeros(2), np.zeros((1, 784)), np.zeros(1)))
+        os.remove(os.path.join(self.tmp, 'y_test.npy'))
+        self.assertIsNone(load_dataset(self.tmp))
+
+    def test_downloaded_cache_skips_network(self):
+        """A cached download is loaded without fetching or decoding"""
+        pixels = np.arange(3 * 784).reshape(3, 784) % 256
+        dataset = (pixels.astype(np.uint8), np.arange(3, dtype=np.uint8),
+                   pixels[:2].astype(np.uint8), np.arange(2, dtype=np.uint8))
+        save_dataset(os.path.join(self.tmp, DOWNLOAD_CACHE), dataset)
+
+        raw = quiet(load_mnist_from_url, data_dir=self.tmp, source='lecun', normalize=False)
+        for a, b in zip(dataset, raw):
+            np.testing.assert_array_equal(a, b)
+            self.assertTrue(b.flags.writeable)
+
+        mapped = quiet(load_mnist_from_url, data_dir=self.tmp, normalize=False, mmap=True)
+        self.assertIsInstance(mapped[0], np.memmap)
+        np.testing.assert_array_equal(mapped[0], dataset[0])
+
+        X_train, y_train, _, _ = quiet(load_mnist, train_size=2, data_dir=self.tmp)
+        self.assertEqual(X_train.dtype, np.float32)
+        np.testing.assert_array_equal(X_train, dataset[0][:2].astype(np.float32) / 255.0)
+        self.assertEqual(y_train.tolist(), [0, 1])
+
+
+class TestExamplesLoader(unittest.TestCase):
+    """Test the loader module used by the examples"""
+
+    def test_examples_loader_imports(self):
+        path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            'examples', 'neural_network_examples', 'mnist_loader.py')
+        spec = importlib.util.spec_from_file_location('examples_mnist_loader', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for name in ('load_mnist', 'load_mnist_from_url', 'generate_enhanced_synthetic_mnist',
+                     'save_dataset', 'load_dataset'):
+            self.assertIs(getattr(module, name), getattr(mnist_loader, name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,235 @@
+"""
+Unit Tests for Binary Network Checkpoints and Sessions
+
+Checkpoints must restore networks exactly, append only new harmony
+entries on each save, and answer summary / single-layer questions without
+loading everything. Sessions must round-trip through the binary format
+and list from the index alone.
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import contextlib
+from types import SimpleNamespace
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.homeostatic import HomeostaticNetwork
+from bicameral.right.harmony_history import COLUMN_DTYPES
+from bicameral.right.network_checkpoint import (
+    save_checkpoint, open_checkpoint, is_checkpoint, MetricsLog,
+)
+from bicameral.right.consciousness_growth import choice_based_weight_drift, save_state, load_state
+from bicameral.right.session_persistence import SessionManager
+
+
+def live(network, steps, start=0):
+    """Record harmony, adapt and drift like a lifetime iteration."""
+    for epoch in range(start, start + steps):
+        network._record_harmony(epoch=epoch, accuracy=(epoch % 10) / 10)
+        if network.needs_adaptation():
+            with contextlib.redirect_stdout(io.StringIO()):
+                network.adapt()
+        choice_based_weight_drift(network)
+
+
+def quietly(function, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return function(*args, **kwargs)
+
+
+class TempDirTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class TestNetworkCheckpoint(TempDirTestCase):
+    """Test save, lazy open and restore"""
+
+    def assertSameNetwork(self, a, b):
+        for layer_a, layer_b in zip(a.layers, b.layers):
+            np.testing.assert_array_equal(layer_a.weights, layer_b.weights)
+            np.testing.assert_array_equal(layer_a.bias, layer_b.bias)
+        self.assertEqual(list(a.harmony_history), list(b.harmony_history))
+        self.assertEqual(a.adaptation_history, b.adaptation_history)
+        x = np.random.RandomState(0).randn(3, a.input_size)
+        np.testing.assert_array_equal(a.forward(x, training=False), b.forward(x, training=False))
+
+    def test_round_trip(self):
+        """Weights, histories and adapted layer sizes restore exactly"""
+        np.random.seed(1)
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7, 8], seed=1)
+        live(network, 60)
+        self.assertGreater(len(network.adaptation_history), 0)
+
+        path = os.path.join(self.tmp, 'adam')
+        save_checkpoint(network, path)
+        self.assertTrue(is_checkpoint(path))
+        restored = quietly(open_checkpoint(path).load_network, HomeostaticNetwork)
+        self.assertSameNetwork(network, restored)
+
+        # Both continue identically
+        network._record_harmony(epoch=99)
+        restored._record_harmony(epoch=99)
+        self.assertEqual(restored.harmony_history[-1].H, network.harmony_history[-1].H)
+
+    def test_incremental_append(self):
+        """Each save appends only new entries, for every retention mode"""
+        for capacity, retention in [(None, 'ring'), (20, 'ring'), (10, 'downsample')]:
+            np.random.seed(2)
+            network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=2,
+                                         history_capacity=capacity, history_retention=retention)
+            path = os.path.join(self.tmp, f"{capacity}_{retention}")
+            rows = previous_total = 0
+            for round_ in range(3):
+                live(network, 25, start=25 * round_)
+                index = network.harmony_history.column('index')
+                manifest = save_checkpoint(network, path)
+                rows += int((index >= previous_total).sum())
+                self.assertEqual(manifest['history']['rows'], rows)
+                previous_total = manifest['history']['total_recorded']
+                self.assertEqual(list(open_checkpoint(path).harmony_history()),
+                                 list(network.harmony_history))
+            self.assertEqual(manifest['history']['dir'], 'history.0')
+
+    def test_rewrite_when_history_restarts(self):
+        """A history that does not continue the saved one is rewritten"""
+        path = os.path.join(self.tmp, 'net')
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=3)
+        live(network, 10)
+        save_checkpoint(network, path)
+        network.harmony_history.clear()
+        network._record_harmony(epoch=0)
+        manifest = save_checkpoint(network, path)
+        self.assertEqual(manifest['history']['dir'], 'history.1')
+        self.assertEqual(manifest['history']['rows'], 1)
+        self.assertFalse(os.path.exists(os.path.join(path, 'history.0')))
+        self.assertEqual(len(os.listdir(os.path.join(path, 'layers'))), 2 * len(network.layers))
+
+    def test_interrupted_save(self):
+        """Rows past the manifest (an interrupted append) are ignored"""
+        path = os.path.join(self.tmp, 'net')
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=4)
+        live(network, 5)
+        manifest = save_checkpoint(network, path)
+        columns = open_checkpoint(path).history_columns()
+        log = MetricsLog(os.path.join(path, manifest['history']['dir']), COLUMN_DTYPES)
+        log.extend(**{name: values[-1:] for name, values in columns.items()})
+        self.assertEqual(list(open_checkpoint(path).harmony_history()), list(network.harmony_history))
+
+    def test_lazy_summary_and_layer(self):
+        """Summary and single layers come from the manifest and memory maps"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7, 8], seed=5)
+        live(network, 5)
+        path = os.path.join(self.tmp, 'net')
+        save_checkpoint(network, path)
+
+        checkpoint = open_checkpoint(path)
+        self.assertEqual(checkpoint.summary['harmony'], network.get_current_harmony())
+        self.assertEqual(checkpoint.summary['layer_sizes'], [layer.size for layer in network.layers])
+        layer = checkpoint.layer(1)
+        self.assertIsInstance(layer['weights'], np.memmap)
+        np.testing.assert_array_equal(layer['weights'], network.layers[1].weights)
+
+        with open(os.path.join(path, 'manifest.json')) as f:
+            self.assertEqual(json.load(f)['summary'], checkpoint.summary)
+
+    def test_save_state_formats(self):
+        """save_state picks the binary format for directories; load_state reads both"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=6)
+        live(network, 5)
+        binary = os.path.join(self.tmp, 'adam')
+        pickled = os.path.join(self.tmp, 'adam.pkl')
+        quietly(save_state, network, binary)
+        quietly(save_state, network, pickled)
+        self.assertTrue(is_checkpoint(binary))
+        self.assertTrue(os.path.isfile(pickled))
+        for path in (binary, pickled):
+            restored = quietly(load_state, HomeostaticNetwork, path)
+            self.assertEqual(list(restored.harmony_history), list(network.harmony_history))
+        with self.assertRaises(ValueError):
+            save_state(network, binary, format='zip')
+
+
+class TestBinarySessions(TempDirTestCase):
+    """Test SessionManager on the binary session format"""
+
+    def setUp(self):
+        super().setUp()
+        self.manager = quietly(SessionManager, os.path.join(self.tmp, 'sessions'))
+        self.network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=7)
+        self.engine = SimpleNamespace(evolution_frequency=5, min_harmony=0.7, max_risk=0.5,
+                                      step_count=3, evolution_history=[])
+
+    def _save(self, description='', parent=None, accuracy=(0.5, 0.7, 0.8)):
+        session_id = quietly(self.manager.create_session, self.network, self.engine,
+                             description=description, parent_session_id=parent)
+        quietly(self.manager.save_session, session_id, self.network, self.engine,
+                training_history={'test_accuracy': list(accuracy), 'notes': ['ok']},
+                meta_learnings=[{'insight': 'grow slowly', 'score': np.float64(0.9)}])
+        return session_id
+
+    def test_round_trip(self):
+        session_id = self._save()
+        self.assertTrue(os.path.isdir(os.path.join(self.tmp, 'sessions', session_id)))
+        session = quietly(self.manager.load_session, session_id)
+        np.testing.assert_array_equal(session.network_state['layers'][0]['weights'],
+                                      self.network.layers[0].weights)
+        self.assertEqual(session.training_history, {'test_accuracy': [0.5, 0.7, 0.8], 'notes': ['ok']})
+        self.assertEqual(session.evolution_state['step_count'], 3)
+        self.assertEqual(self.manager.get_meta_learnings([session_id]),
+                         [{'insight': 'grow slowly', 'score': 0.9}])
+
+        layer = self.manager.load_session_layer(session_id, 1)
+        self.assertIsInstance(layer['weights'], np.memmap)
+        np.testing.assert_array_equal(layer['bias'], self.network.layers[1].bias)
+
+    def test_values_json_cannot_hold(self):
+        """Ragged lists and non-JSON values round-trip as they did in the pickle format"""
+        session_id = quietly(self.manager.create_session, self.network, self.engine)
+        history = {'ragged': [[1, 2], [3]], 'tags': {'a', 'b'}, 'loss': [0.3, 0.2]}
+        learnings = [{'insight': 'grow slowly', 'layers': {1, 2}}]
+        quietly(self.manager.save_session, session_id, self.network, self.engine,
+                training_history=history, meta_learnings=learnings)
+        quietly(self.manager.save_session, session_id, self.network, self.engine,
+                training_history=history, meta_learnings=learnings)
+
+        session = quietly(self.manager.load_session, session_id)
+        self.assertEqual(session.training_history, history)
+        self.assertEqual(session.meta_learnings, learnings)
+        self.assertEqual(self.manager.get_meta_learnings([session_id]), learnings)
+        training_dir = os.path.join(self.tmp, 'sessions', session_id, 'training')
+        self.assertEqual(sorted(os.listdir(training_dir)), ['loss.1.npy', 'tags.1.pkl'])
+
+    def test_listing_reads_index_only(self):
+        """Summaries and lineage come from the index, not the session files"""
+        root = self._save('root')
+        self.manager.session_index[root]['created_at'] = '2000-01-01'
+        child = 'session_child'
+        self.manager.session_index[child] = {'created_at': '2000-01-02', 'description': 'child',
+                                             'parent_session_id': root}
+        quietly(self.manager.save_session, child, self.network, self.engine,
+                training_history={'test_accuracy': [0.6, 0.9]})
+        shutil.rmtree(os.path.join(self.tmp, 'sessions', root))
+        shutil.rmtree(os.path.join(self.tmp, 'sessions', child))
+
+        manager = quietly(SessionManager, os.path.join(self.tmp, 'sessions'))
+        sessions = manager.list_sessions()
+        self.assertEqual([s['session_id'] for s in sessions], [root, child])
+        self.assertAlmostEqual(sessions[1]['summary']['training_summary']['improvement'], 0.3)
+        self.assertEqual(manager.get_session_lineage(child), [root, child])
+        self.assertEqual(manager.get_session_summary(child)['network_info']['num_layers'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
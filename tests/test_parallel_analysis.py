@@ -0,0 +1,79 @@
+"""
+Unit Tests for Parallel Directory Analysis
+
+Verifies that process-pool scans in CodeAnalyzer and MultiLanguageAnalyzer
+produce exactly the same results, in the same order, as sequential scans.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+import shutil
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.analyzer import CodeAnalyzer
+from autopoiesis.multi_analyzer import MultiLanguageAnalyzer
+from autopoiesis.parallel import parallel_map, resolve_workers
+
+
+def _square(x):
+    return x * x
+
+
+class TestParallelMap(unittest.TestCase):
+    """Test the parallel_map helper"""
+
+    def test_order_preserved(self):
+        """Results come back in input order"""
+        items = list(range(50))
+        self.assertEqual(parallel_map(_square, items, workers=3), [x * x for x in items])
+
+    def test_resolve_workers(self):
+        """Worker counts are normalized"""
+        self.assertEqual(resolve_workers(None), 1)
+        self.assertEqual(resolve_workers(4), 4)
+        self.assertGreaterEqual(resolve_workers(0), 1)
+        with self.assertRaises(TypeError):
+            resolve_workers('4')
+
+
+class TestParallelDirectoryAnalysis(unittest.TestCase):
+    """Test parallel vs sequential directory scans"""
+
+    def setUp(self):
+        self.workdir = tempfile.mkdtemp()
+        for i in range(12):
+            with open(os.path.join(self.workdir, f'mod_{i}.py'), 'w', encoding='utf-8') as f:
+                f.write(f'"""Module {i}."""\n' + 'def f(x):\n    return x\n' * (i + 1))
+            with open(os.path.join(self.workdir, f'page_{i}.html'), 'w', encoding='utf-8') as f:
+                f.write('<!DOCTYPE html><html lang="en"><title>t</title>' + '<section></section>' * i)
+
+    def tearDown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_code_analyzer_matches_sequential(self):
+        """CodeAnalyzer parallel scan equals sequential scan"""
+        analyzer = CodeAnalyzer()
+        sequential = analyzer.analyze_directory(self.workdir, workers=1)
+        parallel = analyzer.analyze_directory(self.workdir, workers=3)
+
+        self.assertEqual(len(sequential.files), 12)
+        self.assertEqual(parallel.files, sequential.files)
+        self.assertEqual(parallel.system_ljpw, sequential.system_ljpw)
+        self.assertEqual(parallel.system_harmony, sequential.system_harmony)
+
+    def test_multi_analyzer_matches_sequential(self):
+        """MultiLanguageAnalyzer parallel scan equals sequential scan"""
+        analyzer = MultiLanguageAnalyzer()
+        sequential = analyzer.analyze_directory(self.workdir, workers=1)
+        parallel = analyzer.analyze_directory(self.workdir, workers=3)
+
+        self.assertEqual(sequential.total_files, 24)
+        self.assertEqual(parallel, sequential)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Unit Tests for Autopoiesis Pipeline Profiling
+
+The active PipelineProfiler must receive stage timings and counters from
+the analyzer, healer and breathing orchestrator, write its summary as JSON
+beside the breathing report, and cost nothing when no profiler is active.
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import contextlib
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.analyzer import CodeAnalyzer
+from autopoiesis.cache import AnalysisCache
+from autopoiesis.rhythm import BreathingOrchestrator
+from autopoiesis.profiling import (
+    PipelineProfiler, NULL_PROFILER, PROFILE_ENV, get_profiler, profiler_from_env, summary_path,
+)
+
+
+SAMPLE_CODE = '''"""Sample module."""
+import logging
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    if a is None:
+        raise ValueError("a required")
+    return a + b
+
+
+def scale(values, factor):
+    return [v * factor for v in values]
+'''
+
+
+class TempTreeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.tree = os.path.join(self.tmp, 'pkg')
+        os.makedirs(self.tree)
+        self.sizes = []
+        for name in ('alpha', 'beta'):
+            content = SAMPLE_CODE + f"\n\nNAME = {name!r}\n"
+            with open(os.path.join(self.tree, name + '.py'), 'w') as f:
+                f.write(content)
+            self.sizes.append(len(content.encode()))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class TestPipelineProfiler(unittest.TestCase):
+    """Test stages, counters and activation"""
+
+    def test_inactive_is_noop(self):
+        self.assertIs(get_profiler(), NULL_PROFILER)
+        self.assertFalse(get_profiler())
+        with get_profiler().stage('anything'):
+            get_profiler().count('anything')
+
+    def test_nested_activation(self):
+        """Inner activations restore the outer profiler; stages accumulate"""
+        outer, inner = PipelineProfiler(), PipelineProfiler()
+        with outer.activate():
+            with inner.activate():
+                self.assertIs(get_profiler(), inner)
+                with get_profiler().stage('work'):
+                    pass
+            self.assertIs(get_profiler(), outer)
+            for _ in range(3):
+                with get_profiler().stage('work'):
+                    get_profiler().count('items', 2)
+        self.assertIs(get_profiler(), NULL_PROFILER)
+
+        report = outer.get_timing_report()
+        self.assertEqual([(row['name'], row['calls']) for row in report], [('work', 3)])
+        self.assertEqual(outer.counters, {'items': 6})
+        self.assertEqual(inner.stages['work']['calls'], 1)
+
+    def test_captures(self):
+        """cProfile and tracemalloc sections appear when enabled"""
+        profiler = PipelineProfiler(cprofile=True, tracemalloc=True, top=5)
+        with profiler.activate():
+            sorted([str(i) for i in range(20000)])
+        summary = profiler.summary()
+        self.assertLessEqual(len(summary['cprofile']), 5)
+        self.assertTrue(any('sorted' in row['function'] for row in summary['cprofile']))
+        self.assertGreater(summary['tracemalloc']['peak_bytes'], 0)
+        self.assertNotIn('cprofile', PipelineProfiler().summary())
+
+    def test_from_env(self):
+        with mock.patch.dict(os.environ, {PROFILE_ENV: ''}):
+            self.assertIsNone(profiler_from_env())
+        with mock.patch.dict(os.environ, {PROFILE_ENV: '1'}):
+            profiler = profiler_from_env()
+            self.assertFalse(profiler.cprofile or profiler.tracemalloc)
+        with mock.patch.dict(os.environ, {PROFILE_ENV: 'cprofile, tracemalloc'}):
+            profiler = profiler_from_env()
+            self.assertTrue(profiler.cprofile and profiler.tracemalloc)
+        with mock.patch.dict(os.environ, {PROFILE_ENV: 'flamegraph'}):
+            with self.assertRaises(ValueError):
+                profiler_from_env()
+
+
+class TestPipelineInstrumentation(TempTreeTestCase):
+    """Test the counters reported by the pipeline"""
+
+    def test_analyzer_counters(self):
+        """Reads, bytes, parses, resonance cycles and cache hits are counted"""
+        analyzer = CodeAnalyzer(cache=AnalysisCache(os.path.join(self.tmp, 'cache')))
+        profiler = PipelineProfiler()
+        with profiler.activate():
+            cold = analyzer.analyze_directory(self.tree)
+            warm = analyzer.analyze_directory(self.tree)
+
+        counters = profiler.counters
+        self.assertEqual(counters['files_read'], 4)
+        self.assertEqual(counters['bytes_read'], 2 * sum(self.sizes))
+        self.assertEqual(counters['cache_misses'], 2)
+        self.assertEqual(counters['cache_hits'], 2)
+        self.assertEqual(counters['ast_parses'], 2)
+        self.assertGreater(counters['resonance_cycles'], 0)
+        self.assertEqual(profiler.stages['analyze_directory']['calls'], 2)
+        self.assertEqual(profiler.stages['semantic_resonance']['calls'], 2)
+        self.assertEqual(cold.system_harmony, warm.system_harmony)
+
+    def test_breathing_report_profile(self):
+        """Breathing sessions time inhale / exhale and write JSON beside the report"""
+        profiler = PipelineProfiler()
+        orchestrator = BreathingOrchestrator(self.tree, dry_run=True, profiler=profiler)
+        with contextlib.redirect_stdout(io.StringIO()):
+            session = orchestrator.breathe(cycles=3)
+
+        stages = {row['name']: row['calls'] for row in session.profile['stages']}
+        self.assertEqual(stages['inhale'], 3)
+        self.assertEqual(stages['exhale'], 3)
+        self.assertEqual(stages['initial_scan'], 1)
+        self.assertEqual(stages['analyze_directory'], 1)
+        self.assertEqual(session.profile['counters']['breaths'], 6)
+
+        report_path = os.path.join(self.tmp, 'BREATHING_REPORT.md')
+        orchestrator.generate_report(report_path)
+        with open(summary_path(report_path)) as f:
+            written = json.load(f)
+        self.assertEqual(os.path.basename(summary_path(report_path)), 'BREATHING_REPORT.profile.json')
+        self.assertEqual(written['counters'], session.profile['counters'])
+
+    def test_env_profiles_orchestrator(self):
+        with mock.patch.dict(os.environ, {PROFILE_ENV: 'timers'}):
+            orchestrator = BreathingOrchestrator(self.tree, dry_run=True)
+        self.assertIsInstance(orchestrator.profiler, PipelineProfiler)
+        with mock.patch.dict(os.environ, {PROFILE_ENV: ''}):
+            orchestrator = BreathingOrchestrator(self.tree, dry_run=True)
+        self.assertIsNone(orchestrator.profiler)
+
+
+if __name__ == '__main__':
+    unittest.main()
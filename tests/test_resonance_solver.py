@@ -0,0 +1,80 @@
+"""
+Unit Tests for ResonanceEngine.solve_trajectory
+
+The early-exit solver must reproduce analyze_trajectory exactly at the
+default tolerance, while running fewer cycles on bounded trajectories.
+"""
+
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.left.resonance_engine import ResonanceEngine
+
+
+class TestSolveTrajectory(unittest.TestCase):
+    """Test the early-exit trajectory solver"""
+
+    def setUp(self):
+        self.engine = ResonanceEngine()
+        self.rng = np.random.default_rng(7)
+
+    def _random_bounds(self):
+        return {
+            'Intent': float(self.rng.choice([0.4, 0.8])),
+            'Context': float(self.rng.choice([0.5, 0.8])),
+            'Execution': float(self.rng.uniform(0.3, 1.0)),
+            'Benevolence': 0.9,
+        }
+
+    def _assert_identical(self, start, bounds):
+        full = self.engine.analyze_trajectory(start, cycles=100, ice_bounds=bounds)
+        fast = self.engine.solve_trajectory(start, cycles=100, ice_bounds=bounds)
+        self.assertEqual(fast['initial_state'], full['initial_state'])
+        self.assertEqual(fast['final_state'], full['final_state'])
+        self.assertEqual(fast['dominant_deficit'], full['dominant_deficit'])
+        self.assertEqual(fast['growth'], full['growth'])
+        self.assertEqual(fast['converged'], full['converged'])
+        return fast
+
+    def test_bounded_identical_and_early(self):
+        """Bounded trajectories stop early with identical results"""
+        for _ in range(30):
+            start = list(self.rng.uniform(0.1, 1.0, 4))
+            result = self._assert_identical(start, self._random_bounds())
+            self.assertLess(result['cycles_run'], 100)
+
+    def test_unbounded_identical(self):
+        """Unbounded trajectories run in full and match exactly"""
+        for _ in range(10):
+            start = list(self.rng.uniform(0.1, 1.0, 4))
+            result = self._assert_identical(start, None)
+            self.assertEqual(result['cycles_run'], 100)
+
+    def test_tolerance_stops_sooner(self):
+        """A positive tolerance never runs more cycles than exact mode"""
+        start = [0.3, 0.2, 0.4, 0.3]
+        bounds = self._random_bounds()
+        exact = self.engine.solve_trajectory(start, 100, bounds)
+        loose = self.engine.solve_trajectory(start, 100, bounds, tolerance=1e-3)
+        self.assertLessEqual(loose['cycles_run'], exact['cycles_run'])
+        np.testing.assert_allclose(
+            loose['final_state'].as_vector(), exact['final_state'].as_vector(), atol=0.05
+        )
+
+    def test_input_validation(self):
+        """Invalid inputs are rejected"""
+        with self.assertRaises(ValueError):
+            self.engine.solve_trajectory([0.5, 0.5, 0.5])
+        with self.assertRaises(ValueError):
+            self.engine.solve_trajectory([0.5] * 4, cycles=0)
+        with self.assertRaises(ValueError):
+            self.engine.solve_trajectory([0.5] * 4, tolerance=-1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Unit Tests for Vectorized Semantic Relationship Matrices
+
+Every matrix entry must equal the corresponding pair function exactly,
+and the blocked top-k and clustering helpers must reproduce the original
+O(N²) loops, including tie order and duplicate-name handling.
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ljpw_semantic_capabilities import (
+    LJPWVector, SemanticEntity,
+    semantic_resonance, semantic_friction, semantic_gravity,
+    entity_coordinates, entity_masses,
+    resonance_matrix, friction_matrix, gravity_matrix, pair_matrix,
+    top_pairs,
+)
+from deep_fractal_analysis import find_resonance_clusters, find_friction_hotspots
+from analyze_self_fractally import find_friction_pairs, find_resonant_pairs
+
+
+def make_entities(n, seed=0, duplicate_names=False):
+    """Random entities; coarse values and 0/1 extremes produce many ties."""
+    rng = random.Random(seed)
+    entities = []
+    for i in range(n):
+        values = [rng.choice([rng.random(), round(rng.random(), 1), 0.0, 1.0]) for _ in range(4)]
+        name = f"e{rng.randint(0, n // 3)}" if duplicate_names else f"e{i}"
+        entities.append(SemanticEntity(
+            name=name,
+            coordinates=LJPWVector(*values),
+            concept_count=rng.randint(1, 20),
+            semantic_clarity=rng.random(),
+        ))
+    return entities
+
+
+def brute_force_pairs(entities, func, k, threshold=None):
+    pairs = []
+    for i, e1 in enumerate(entities):
+        for j in range(i + 1, len(entities)):
+            value = func(e1, entities[j])
+            if threshold is None or value >= threshold:
+                pairs.append((i, j, value))
+    return sorted(pairs, key=lambda x: x[2], reverse=True)[:k]
+
+
+def brute_force_clusters(entities, threshold):
+    clusters = []
+    used = set()
+    for i, e1 in enumerate(entities):
+        if e1.name in used:
+            continue
+        cluster = [e1.name]
+        used.add(e1.name)
+        for j, e2 in enumerate(entities):
+            if i != j and e2.name not in used and semantic_resonance(e1, e2) >= threshold:
+                cluster.append(e2.name)
+                used.add(e2.name)
+        if len(cluster) > 1:
+            clusters.append(cluster)
+    return clusters
+
+
+class TestRelationshipMatrices(unittest.TestCase):
+    """Test matrices against the pair functions"""
+
+    def setUp(self):
+        self.entities = make_entities(60)
+        self.coords = entity_coordinates(self.entities)
+        self.masses = entity_masses(self.entities)
+
+    def test_entries_match_pair_functions(self):
+        """Every entry equals the scalar function bit for bit"""
+        R = resonance_matrix(self.coords)
+        F = friction_matrix(self.coords)
+        G = gravity_matrix(self.coords, self.masses)
+        for i, e1 in enumerate(self.entities):
+            for j, e2 in enumerate(self.entities):
+                self.assertEqual(R[i, j], semantic_resonance(e1, e2))
+                self.assertEqual(F[i, j], semantic_friction(e1, e2))
+                self.assertEqual(G[i, j], semantic_gravity(e1, e2))
+
+    def test_blocks_and_validation(self):
+        """pair_matrix blocks equal slices of the full matrix"""
+        full = friction_matrix(self.coords)
+        block = pair_matrix('friction', self.coords, rows=slice(5, 9), columns=slice(20, None))
+        self.assertTrue((block == full[5:9, 20:]).all())
+
+        with self.assertRaises(ValueError):
+            pair_matrix('gravity', self.coords)
+        with self.assertRaises(ValueError):
+            pair_matrix('charm', self.coords)
+        with self.assertRaises(ValueError):
+            resonance_matrix(self.coords[:, :3])
+
+
+class TestTopPairs(unittest.TestCase):
+    """Test blocked top-k selection"""
+
+    def test_matches_stable_sort(self):
+        """Values and tie order match a stable sort over all pairs"""
+        entities = make_entities(90, seed=1)
+        coords = entity_coordinates(entities)
+        masses = entity_masses(entities)
+        funcs = {
+            'resonance': semantic_resonance,
+            'friction': semantic_friction,
+            'gravity': semantic_gravity,
+        }
+        for metric, func in funcs.items():
+            for k in (1, 7, 200):
+                for block_size in (1, 16, 512):
+                    self.assertEqual(
+                        top_pairs(coords, metric, k, masses=masses, block_size=block_size),
+                        brute_force_pairs(entities, func, k),
+                    )
+
+    def test_threshold_and_edges(self):
+        """Thresholds filter pairs; tiny inputs return nothing"""
+        entities = make_entities(50, seed=2)
+        coords = entity_coordinates(entities)
+        self.assertEqual(
+            top_pairs(coords, 'friction', 10, threshold=0.5, block_size=8),
+            brute_force_pairs(entities, semantic_friction, 10, threshold=0.5),
+        )
+        self.assertEqual(top_pairs(coords, 'friction', 10, threshold=2.0), [])
+        self.assertEqual(top_pairs(coords[:1], 'friction', 10), [])
+        self.assertEqual(top_pairs(coords, 'friction', 0), [])
+
+
+class TestCallSites(unittest.TestCase):
+    """Test the fractal analysis functions against their original loops"""
+
+    def test_resonance_clusters(self):
+        """Greedy clusters match, including duplicate names"""
+        for duplicate_names in (False, True):
+            entities = make_entities(120, seed=3, duplicate_names=duplicate_names)
+            for threshold in (0.85, 0.7):
+                self.assertEqual(
+                    find_resonance_clusters(entities, threshold),
+                    brute_force_clusters(entities, threshold),
+                )
+
+    def test_friction_and_resonance_pairs(self):
+        """Top friction/resonance pairs map back to entity names"""
+        entities = make_entities(70, seed=5)
+
+        def named(pairs):
+            return [(entities[i].name, entities[j].name, v) for i, j, v in pairs]
+
+        self.assertEqual(find_friction_hotspots(entities, 0.4),
+                         named(brute_force_pairs(entities, semantic_friction, 10, threshold=0.4)))
+        self.assertEqual(find_friction_pairs(entities, 5),
+                         named(brute_force_pairs(entities, semantic_friction, 5)))
+        self.assertEqual(find_resonant_pairs(entities, 5),
+                         named(brute_force_pairs(entities, semantic_resonance, 5)))
+
+
+if __name__ == '__main__':
+    unittest.main()
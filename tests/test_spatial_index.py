@@ -0,0 +1,145 @@
+"""
+Unit Tests for the LJPW Spatial Index
+
+Grid-pruned resonance neighbors, friction top-k and friction counts must
+equal brute force exactly, for any grid resolution, and the greedy
+clustering built on them must reproduce both original clustering loops.
+"""
+
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ljpw_semantic_capabilities import (
+    LJPWVector, SemanticEntity, semantic_resonance, semantic_friction,
+    entity_coordinates, top_pairs, resonance_clusters, LJPWSpatialIndex,
+)
+from iterate_to_100 import count_resonance_clusters, count_friction_hotspots
+
+
+def make_entities(n, seed=0, clustered=False, duplicate_names=False):
+    """Uniform (with 0/1 ties) or tightly clustered random entities."""
+    rng = random.Random(seed)
+    centers = [[rng.random() for _ in range(4)] for _ in range(5)]
+    entities = []
+    for i in range(n):
+        if clustered:
+            values = [min(1.0, max(0.0, x + rng.gauss(0, 0.03))) for x in rng.choice(centers)]
+        else:
+            values = [rng.choice([rng.random(), round(rng.random(), 1), 0.0, 1.0]) for _ in range(4)]
+        name = f"e{rng.randint(0, n // 3)}" if duplicate_names else f"e{i}"
+        entities.append(SemanticEntity(name=name, coordinates=LJPWVector(*values)))
+    return entities
+
+
+class TestResonanceNeighbors(unittest.TestCase):
+    """Test L1-ball resonance queries"""
+
+    def test_matches_brute_force(self):
+        """Neighbors equal the exact resonance filter at any resolution"""
+        for clustered in (False, True):
+            entities = make_entities(150, seed=1, clustered=clustered)
+            coords = entity_coordinates(entities)
+            for cells_per_axis in (None, 1, 3, 8):
+                index = LJPWSpatialIndex(coords, cells_per_axis=cells_per_axis)
+                for threshold in (0.3, 0.85, 0.95, 1.0, 1.2):
+                    for i in range(0, 150, 13):
+                        expected = [j for j in range(150) if j != i
+                                    and semantic_resonance(entities[i], entities[j]) >= threshold]
+                        self.assertEqual(index.resonance_neighbors(i, threshold).tolist(), expected)
+
+    def test_discard(self):
+        """Discarded points are no longer returned"""
+        coords = entity_coordinates(make_entities(80, seed=2, clustered=True))
+        index = LJPWSpatialIndex(coords)
+        before = index.resonance_neighbors(0, 0.8)
+        self.assertGreater(len(before), 2)
+        index.discard(before[:2])
+        index.discard(before[:1])  # idempotent
+        self.assertEqual(index.resonance_neighbors(0, 0.8).tolist(), before[2:].tolist())
+
+    def test_validation(self):
+        """Bad shapes and resolutions are rejected"""
+        with self.assertRaises(ValueError):
+            LJPWSpatialIndex([[0.1, 0.2]])
+        with self.assertRaises(ValueError):
+            LJPWSpatialIndex([[0.1, 0.2, 0.3, 0.4]], cells_per_axis=0)
+
+
+class TestFrictionQueries(unittest.TestCase):
+    """Test pruned friction top-k and counting"""
+
+    def test_top_pairs_match(self):
+        """Top-k equals the blocked full scan, ties included"""
+        for clustered in (False, True):
+            coords = entity_coordinates(make_entities(120, seed=3, clustered=clustered))
+            for cells_per_axis in (None, 1, 4):
+                index = LJPWSpatialIndex(coords, cells_per_axis=cells_per_axis)
+                for k in (1, 10, 300):
+                    for threshold in (None, 0.5, 0.9):
+                        self.assertEqual(
+                            index.top_friction_pairs(k, threshold=threshold),
+                            top_pairs(coords, 'friction', k, threshold=threshold),
+                        )
+        self.assertEqual(LJPWSpatialIndex(coords[:1]).top_friction_pairs(5), [])
+
+    def test_count(self):
+        """Counts match brute force and respect the limit"""
+        entities = make_entities(100, seed=4)
+        index = LJPWSpatialIndex(entity_coordinates(entities))
+        for threshold in (0.3, 0.6, 0.95):
+            expected = sum(
+                1 for i in range(100) for j in range(i + 1, 100)
+                if semantic_friction(entities[i], entities[j]) >= threshold
+            )
+            self.assertEqual(index.count_friction_pairs(threshold), expected)
+            self.assertEqual(index.count_friction_pairs(threshold, limit=7), min(expected, 7))
+
+
+class TestIterationCounts(unittest.TestCase):
+    """Test iterate_to_100 counts against their original loops"""
+
+    def test_count_resonance_clusters(self):
+        """Seed name is claimed after its scan, as in the original"""
+        for duplicate_names in (False, True):
+            entities = make_entities(90, seed=5, clustered=True, duplicate_names=duplicate_names)
+            for threshold in (0.85, 0.95):
+                clusters = 0
+                used = set()
+                for i, e1 in enumerate(entities):
+                    if e1.name in used:
+                        continue
+                    size = 1
+                    for j, e2 in enumerate(entities):
+                        if i != j and e2.name not in used and semantic_resonance(e1, e2) >= threshold:
+                            size += 1
+                            used.add(e2.name)
+                    clusters += size > 1
+                    used.add(e1.name)
+                self.assertEqual(count_resonance_clusters(entities, threshold), clusters)
+
+    def test_count_friction_hotspots(self):
+        """Hotspot count is capped at 100"""
+        entities = make_entities(60, seed=6)
+        expected = sum(
+            1 for i in range(60) for j in range(i + 1, 60)
+            if semantic_friction(entities[i], entities[j]) >= 0.5
+        )
+        self.assertEqual(count_friction_hotspots(entities), min(expected, 100))
+
+    def test_clusters_without_keys(self):
+        """Row identity keys give the same clusters as unique names"""
+        entities = make_entities(70, seed=7, clustered=True)
+        coords = entity_coordinates(entities)
+        self.assertEqual(
+            resonance_clusters(coords, 0.9),
+            resonance_clusters(coords, 0.9, keys=[e.name for e in entities]),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Unit Tests for SystemAggregate
+
+Incremental add/update/remove must track the same system metrics as
+SystemAnalysis.calculate_system_metrics over the resulting file set.
+"""
+
+import unittest
+import sys
+import os
+import io
+import random
+import contextlib
+import shutil
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from autopoiesis.analyzer import FileAnalysis, SystemAnalysis, SystemAggregate
+from autopoiesis.analyzer import CodeAnalyzer
+from autopoiesis.engine import AutopoiesisEngine
+from autopoiesis.profiling import PipelineProfiler
+from autopoiesis.rhythm import BreathingOrchestrator
+
+
+def make_file(rng, path):
+    ljpw = {dim: rng.uniform(0.0, 1.0) for dim in 'LJPW'}
+    return FileAnalysis(
+        path=path,
+        functions=[None] * rng.randint(0, 12),
+        classes=[{}] * rng.randint(0, 3),
+        imports=[],
+        has_logging=False,
+        ljpw=ljpw,
+        deficit=min(ljpw, key=ljpw.get),
+        harmony=0.5,
+    )
+
+
+class TestSystemAggregate(unittest.TestCase):
+    """Test SystemAggregate against full recomputation"""
+
+    def setUp(self):
+        self.rng = random.Random(11)
+
+    def _assert_matches(self, aggregate):
+        expected = SystemAnalysis(path=aggregate.path, files=aggregate.files)
+        expected.calculate_system_metrics()
+        actual = aggregate.to_system_analysis()
+
+        self.assertEqual(actual.total_functions, expected.total_functions)
+        self.assertEqual(actual.total_classes, expected.total_classes)
+        self.assertEqual(actual.deficit_distribution, expected.deficit_distribution)
+        self.assertEqual(sorted(actual.system_ljpw), sorted(expected.system_ljpw))
+        for dim in expected.system_ljpw:
+            self.assertAlmostEqual(actual.system_ljpw[dim], expected.system_ljpw[dim], places=12)
+        self.assertAlmostEqual(actual.system_harmony, expected.system_harmony, places=12)
+
+    def test_random_operations(self):
+        """Random add/update/remove sequences match recomputation"""
+        aggregate = SystemAggregate('/pkg')
+        for step in range(500):
+            path = f'/pkg/mod_{self.rng.randint(0, 40)}.py'
+            op = self.rng.random()
+            if op < 0.6:
+                aggregate.update(make_file(self.rng, path))
+            else:
+                aggregate.remove(path)
+            if step % 25 == 0:
+                self._assert_matches(aggregate)
+        self._assert_matches(aggregate)
+
+    def test_from_system(self):
+        """Building from a SystemAnalysis reproduces its metrics"""
+        files = [make_file(self.rng, f'/pkg/f{i}.py') for i in range(30)]
+        system = SystemAnalysis(path='/pkg', files=files)
+        system.calculate_system_metrics()
+        aggregate = SystemAggregate.from_system(system)
+        self.assertEqual(aggregate.files, files)
+        self.assertEqual(len(aggregate), 30)
+        self.assertIn('/pkg/f3.py', aggregate)
+        self._assert_matches(aggregate)
+
+    def test_empty(self):
+        """Removing every file returns to the empty state exactly"""
+        aggregate = SystemAggregate('/pkg', [make_file(self.rng, '/pkg/a.py')])
+        self.assertEqual(aggregate.remove('/pkg/a.py').path, '/pkg/a.py')
+        self.assertIsNone(aggregate.remove('/pkg/a.py'))
+        self.assertEqual(aggregate.system_ljpw, {})
+        self.assertEqual(aggregate.system_harmony, 0.0)
+        self.assertEqual(aggregate.total_weight, 0)
+        self._assert_matches(aggregate)
+
+    def test_add_rejects_duplicates(self):
+        """add() refuses a tracked path; update() replaces it"""
+        aggregate = SystemAggregate('/pkg', [make_file(self.rng, '/pkg/a.py')])
+        with self.assertRaises(ValueError):
+            aggregate.add(make_file(self.rng, '/pkg/a.py'))
+        replacement = make_file(self.rng, '/pkg/a.py')
+        aggregate.update(replacement)
+        self.assertIs(aggregate.get('/pkg/a.py'), replacement)
+        self.assertEqual(len(aggregate), 1)
+
+
+class TestHealOnceAggregate(unittest.TestCase):
+    """Test heal_once re-measures healed files incrementally"""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        sources = {
+            'calc.py': 'class Calc:\n    def add(self, a, b):\n        return a + b\n',
+            'names.py': 'class Names:\n    def greet(self, name):\n        print("hi " + name)\n',
+        }
+        for name, code in sources.items():
+            with open(os.path.join(self.root, name), 'w') as f:
+                f.write(code)
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_matches_full_rescan(self):
+        """Reported harmony after healing equals a fresh measurement"""
+        engine = AutopoiesisEngine(self.root, dry_run=False)
+        result = engine.heal_once(dimension='L')
+        self.assertGreater(result['files_modified'], 0)
+
+        fresh = AutopoiesisEngine(self.root, dry_run=True).analyze()
+        self.assertAlmostEqual(result['harmony_after'], fresh.harmony, places=12)
+        self.assertAlmostEqual(engine.current_report.love, fresh.love, places=12)
+        self.assertEqual(engine.current_report.total_functions, fresh.total_functions)
+
+
+class TestBreathingLiveAnalysis(TestHealOnceAggregate):
+    """Test breathing sessions scan once and re-analyze healed files only"""
+
+    def test_matches_full_rescan(self):
+        """Harmony after a live session equals a fresh scan, exactly"""
+        profiler = PipelineProfiler()
+        orchestrator = BreathingOrchestrator(self.root, profiler=profiler)
+        with contextlib.redirect_stdout(io.StringIO()):
+            session = orchestrator.breathe(cycles=4)
+
+        self.assertGreater(session.total_files_modified, 0)
+        self.assertEqual(profiler.stages['analyze_directory']['calls'], 1)
+        self.assertEqual(profiler.counters['files_reanalyzed'], session.total_files_modified)
+
+        fresh = CodeAnalyzer().analyze_directory(self.root)
+        self.assertEqual(session.final_harmony, fresh.system_harmony)
+        self.assertEqual(orchestrator.system.system_ljpw, fresh.system_ljpw)
+
+        # Each breath starts from the harmony the previous one left
+        exhales = [b for b in session.breaths if b.phase == 'EXHALE']
+        for previous, current in zip(exhales, exhales[1:]):
+            self.assertEqual(current.harmony_before, previous.harmony_after)
+
+
+if __name__ == '__main__':
+    unittest.main()
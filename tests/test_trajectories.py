@@ -0,0 +1,152 @@
+"""
+Unit Tests for Semantic Trajectories
+
+Batched generation must produce exactly the sentences that repeated
+generate_sentence() calls produce from the same random state, and both
+must agree with word-by-word selection via select_next_word(). The
+array-based encoding must reproduce the per-word definitions exactly,
+with or without the token cache.
+"""
+
+import unittest
+import sys
+import os
+import io
+import contextlib
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.vocabulary import LJPWVocabulary
+from bicameral.right.geometric_ops import SemanticOperations
+from bicameral.right.trajectories import SemanticTrajectory
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+class TestSentenceGeneration(unittest.TestCase):
+    """Test batched sentence generation"""
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        vocab = LJPWVocabulary(vocab_size=500)
+        for i, coords in enumerate(rng.uniform(0, 1, size=(500, 4))):
+            vocab.register(f"word{i}", coords)
+        quiet(vocab.build_index)
+        self.trajectory = SemanticTrajectory(vocab, SemanticOperations())
+        self.meanings = rng.uniform(0, 1, size=(20, 4))
+
+    def _word_by_word(self, meaning, max_length, temperature):
+        """Reference: one nearest-word query per step"""
+        words, used = [], set()
+        path = self.trajectory.navigate_semantic_space(
+            self.trajectory.ops.NE, meaning, min(max_length, 10))
+        for i, coords in enumerate(path):
+            word = self.trajectory.select_next_word(coords, used, temperature=temperature)
+            words.append(word)
+            used.add(word)
+            if i > 0 and np.linalg.norm(coords - meaning) < 0.1:
+                break
+        sentence = " ".join(words)
+        return sentence[0].upper() + sentence[1:]
+
+    def test_matches_word_by_word(self):
+        for temperature in (0.0, 0.3):
+            np.random.seed(1)
+            expected = [self._word_by_word(m, 20, temperature) for m in self.meanings]
+            np.random.seed(1)
+            single = [self.trajectory.generate_sentence(m, temperature=temperature)
+                      for m in self.meanings]
+            np.random.seed(1)
+            batched = self.trajectory.generate_sentences(self.meanings, temperature=temperature)
+            self.assertEqual(single, expected)
+            self.assertEqual(batched, expected)
+
+    def test_short_sentences(self):
+        np.random.seed(2)
+        sentences = self.trajectory.generate_sentences(self.meanings[:3], max_length=3)
+        for sentence in sentences:
+            self.assertLessEqual(len(sentence.split()), 3)
+            self.assertTrue(sentence[0].isupper())
+        self.assertEqual(self.trajectory.generate_sentences(self.meanings[:2], max_length=0), ["", ""])
+
+
+class TestSentenceEncoding(unittest.TestCase):
+    """Test the array-based encoding path"""
+
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.vocab = LJPWVocabulary(vocab_size=500)
+        for i, coords in enumerate(rng.uniform(0, 1, size=(200, 4))):
+            self.vocab.register(f"word{i}", coords)
+        for word in ('love', 'the', 'of', 'wisdom'):
+            self.vocab.register(word, rng.uniform(0, 1, size=4))
+        self.sentences = ["Love, the wisdom of word7!", "word1", "the unknown word3",
+                          " ".join(f"word{i}" for i in rng.randint(0, 200, size=25))]
+
+    def _encode(self, trajectory, sentence):
+        meaning = trajectory.encode_sentence(sentence)
+        return meaning, trajectory.points, trajectory.get_trajectory_summary()
+
+    def test_matches_per_word_definitions(self):
+        """Indexed (cached) and unindexed encodings agree with the per-word methods"""
+        plain = SemanticTrajectory(self.vocab, SemanticOperations())
+        plain_results = [self._encode(plain, s) for s in self.sentences]
+        quiet(self.vocab.build_index)
+        indexed = SemanticTrajectory(self.vocab, SemanticOperations())
+
+        for sentence, (meaning, _points, summary) in zip(self.sentences, plain_results):
+            fast_meaning, fast_points, fast_summary = self._encode(indexed, sentence)
+            np.testing.assert_array_equal(fast_meaning, meaning)
+            self.assertEqual(fast_summary['words'], summary['words'])
+            self.assertEqual(fast_summary['attention_weights'], summary['attention_weights'])
+
+            words = indexed.tokenize(sentence)
+            base = [self.vocab.get_coords(w) for w in words]
+            context = indexed.contextualize_coords(base)
+            for i, point in enumerate(fast_points):
+                self.assertEqual(point.word, words[i])
+                self.assertEqual(point.position, i)
+                np.testing.assert_array_equal(point.coords, base[i])
+                np.testing.assert_array_equal(point.context_coords, context[i])
+                self.assertEqual(point.attention_weight,
+                                 indexed.compute_attention_weight(words[i], i, len(words)))
+            np.testing.assert_array_equal(indexed.integrate_trajectory(fast_points), fast_meaning)
+
+    def test_cache_bounded_and_invalidated(self):
+        quiet(self.vocab.build_index)
+        trajectory = SemanticTrajectory(self.vocab, SemanticOperations(), cache_size=3)
+        trajectory.encode_sentence("word1 word2 word3 word4 word5")
+        self.assertEqual(list(trajectory._row_cache), ['word3', 'word4', 'word5'])
+
+        # A rebuilt index (here: after re-registering a word) clears the cache
+        quiet(self.vocab.register, 'word5', [0.1, 0.2, 0.3, 0.4])
+        quiet(self.vocab.build_index)
+        trajectory.encode_sentence("word5")
+        np.testing.assert_array_equal(trajectory.points[0].coords, [0.1, 0.2, 0.3, 0.4])
+
+        with self.assertRaises(ValueError):
+            SemanticTrajectory(self.vocab, SemanticOperations(), cache_size=-1)
+
+    def test_assigned_points(self):
+        """Points assigned directly drive the metrics"""
+        trajectory = SemanticTrajectory(self.vocab, SemanticOperations())
+        trajectory.encode_sentence("love the wisdom")
+        points = trajectory.points
+        trajectory.points = points[:2]
+        summary = trajectory.get_trajectory_summary()
+        self.assertEqual(summary['words'], ['love', 'the'])
+        self.assertAlmostEqual(
+            summary['coherence'],
+            1.0 / (1.0 + np.linalg.norm(points[1].context_coords - points[0].context_coords)))
+        trajectory.points = []
+        self.assertEqual(trajectory.get_trajectory_summary(), {'length': 0})
+        np.testing.assert_array_equal(trajectory.integrate_trajectory([]), trajectory.ops.NE)
+
+
+if __name__ == '__main__':
+    unittest.main()
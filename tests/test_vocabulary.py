@@ -104,6 +104,27 @@ class TestCoordinateIndex(unittest.TestCase):
         self.assertGreater(len(results), 0)
         self.assertIsInstance(results[0], tuple)
         self.assertEqual(len(results[0]), 2)  # (word, distance)
+    
+    def test_query_batch(self):
+        """Test batched query matches single queries"""
+        queries = np.array([[0.9, 0.5, 0.2, 0.7], [0.4, 0.5, 0.9, 0.6], [0.5, 0.5, 0.5, 0.5]])
+        indices, distances = self.index.query_batch(queries, k=2)
+        
+        self.assertEqual(indices.shape, (3, 2))
+        self.assertEqual(distances.shape, (3, 2))
+        for coords, rows, dists in zip(queries, indices, distances):
+            words, expected = self.index.query(coords, k=2, return_distances=True)
+            self.assertEqual([self.index.word_list[i] for i in rows], words)
+            np.testing.assert_array_equal(dists, expected)
+        
+        # k=1 keeps the neighbor axis; k is capped at the index size
+        self.assertEqual(self.index.query_batch(queries, k=1)[0].shape, (3, 1))
+        self.assertEqual(self.index.query_batch(queries, k=10)[0].shape, (3, 4))
+    
+    def test_rows(self):
+        """Test word to row lookup"""
+        rows = self.index.rows(['Power', 'love', 'unknown', 'love'])
+        self.assertEqual(sorted(self.index.word_list[i] for i in rows), ['love', 'power'])
 
 
 class TestLJPWVocabulary(unittest.TestCase):
@@ -168,6 +189,37 @@ class TestLJPWVocabulary(unittest.TestCase):
         self.assertIsInstance(results[0], tuple)
         self.assertEqual(len(results[0]), 2)  # (word, distance)
     
+    def test_nearest_word_exclude(self):
+        """Test nearest word search with exclusions"""
+        coords = np.array([0.9, 0.5, 0.2, 0.7])
+        
+        self.assertEqual(self.vocab.nearest_word(coords, exclude=['LOVE']), 'wisdom')
+        self.assertEqual(self.vocab.nearest_word(coords, k=3, exclude=['love']),
+                         self.vocab.nearest_word(coords, k=4)[1:])
+        self.assertIsNone(self.vocab.nearest_word(
+            coords, exclude=['love', 'justice', 'power', 'wisdom']))
+    
+    def test_nearest_indices(self):
+        """Test batched nearest word search"""
+        queries = np.array([[0.9, 0.5, 0.2, 0.7], [0.6, 0.9, 0.5, 0.8]])
+        indices, distances = self.vocab.nearest_indices(queries, k=2)
+        
+        self.assertEqual(self.vocab.words_at(indices).tolist(),
+                         [self.vocab.nearest_word(q, k=2) for q in queries])
+        self.assertAlmostEqual(distances[0, 0], 0.0, places=5)
+        
+        # Exclusions apply to every query and keep k results per query
+        indices, distances = self.vocab.nearest_indices(queries, k=2, exclude=['love', 'justice'])
+        self.assertEqual(self.vocab.words_at(indices).tolist(),
+                         [self.vocab.nearest_word(q, k=2, exclude=['love', 'justice']) for q in queries])
+        self.assertTrue(np.all(np.diff(distances, axis=1) >= 0))
+        
+        # Too few words left: padded with -1 / inf / None
+        indices, distances = self.vocab.nearest_indices(queries[:1], k=3, exclude=['love', 'power'])
+        self.assertEqual(indices[0, 2], -1)
+        self.assertEqual(distances[0, 2], np.inf)
+        self.assertEqual(self.vocab.words_at(indices).tolist(), [['wisdom', 'justice', None]])
+    
     def test_words_in_radius(self):
         """Test radius search"""
         self.vocab.build_index()
@@ -0,0 +1,235 @@
+"""
+Unit Tests for the Compact Vocabulary Store
+
+A vocabulary saved with save_compact() must load back with the same
+words, entries and nearest-neighbor answers, use the stored KD-tree
+instead of rebuilding one, and stay writable through StoredEntries.
+VocabularyLoader and the language model's default vocabulary must reuse
+a converted store until its source file changes.
+"""
+
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import tempfile
+import contextlib
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.vocabulary import LJPWVocabulary, VocabularyLoader, WordEntry
+from bicameral.right.vocabulary_store import (
+    StoredEntries, open_store, is_store, MANIFEST_FILE, KDTREE_FILE,
+)
+from bicameral.right.language_model import PureLJPWLanguageModel
+from bicameral.right.qualia import QualiaGrounding
+
+
+def quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+class TestVocabularyStore(unittest.TestCase):
+    """Test saving and loading compact stores"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'vocab')
+        rng = np.random.RandomState(0)
+        self.vocab = LJPWVocabulary(vocab_size=1000)
+        for i, coords in enumerate(np.round(rng.uniform(0, 1, size=(300, 4)), 3)):
+            self.vocab.register(f"Word{i}", coords, language=['en', 'fr'][i % 2],
+                                source=f"file{i % 3}.json",
+                                metadata={'pos': 'noun', 'rank': i} if i % 4 else None)
+        self.queries = rng.uniform(0, 1, size=(50, 4))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _load(self):
+        loaded = LJPWVocabulary()
+        quiet(loaded.load, self.path)
+        return loaded
+
+    def test_roundtrip(self):
+        quiet(self.vocab.save_compact, self.path)
+        self.assertTrue(is_store(self.path))
+        loaded = self._load()
+
+        self.assertIsInstance(loaded.word_to_entry, StoredEntries)
+        self.assertEqual(loaded.vocab_size, 1000)
+        self.assertEqual(len(loaded), 300)
+        self.assertEqual(list(loaded.word_to_entry), list(self.vocab.word_to_entry))
+        self.assertIn('WORD5', loaded)
+        self.assertNotIn('word300', loaded)
+
+        for word in ('word0', 'word5', 'word299'):
+            original, stored = self.vocab.get_entry(word), loaded.get_entry(word)
+            self.assertEqual(stored.word, original.word)
+            self.assertEqual((stored.language, stored.source), (original.language, original.source))
+            self.assertEqual(stored.metadata, original.metadata)
+            self.assertEqual(stored.coords.dtype, np.float64)
+            np.testing.assert_allclose(stored.coords, original.coords, atol=1e-7)
+
+    def test_prebuilt_index(self):
+        """The stored KD-tree answers exactly like a freshly built index"""
+        quiet(self.vocab.save_compact, self.path)
+        loaded = self._load()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            loaded.build_index()
+        self.assertEqual(output.getvalue(), '')  # nothing rebuilt
+        self.assertIs(loaded.coord_index.kdtree, loaded.word_to_entry.store.kdtree)
+
+        for coords in self.queries:
+            self.assertEqual(loaded.nearest_word(coords, k=5), quiet(self.vocab.nearest_word, coords, k=5))
+        self.assertEqual(loaded.nearest_word(self.queries[0], exclude=['Word12']),
+                         quiet(self.vocab.nearest_word, self.queries[0], exclude=['Word12']))
+
+    def test_kdtree_rebuilt_when_stale(self):
+        quiet(self.vocab.save_compact, self.path)
+        os.remove(os.path.join(self.path, KDTREE_FILE))
+        store = open_store(self.path)
+        self.assertEqual(store.kdtree.n, 300)
+
+        manifest_path = os.path.join(self.path, MANIFEST_FILE)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        manifest['kdtree']['scipy'] = '0.0'
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+        self.assertEqual(open_store(self.path).kdtree.n, 300)
+
+    def test_modified_entries(self):
+        """Registering or removing words on a loaded store stays in memory"""
+        quiet(self.vocab.save_compact, self.path)
+        loaded = self._load()
+        entries = loaded.word_to_entry
+
+        quiet(loaded.register, 'novel', [0.1, 0.2, 0.3, 0.4])
+        quiet(loaded.register, 'Word3', [0.9, 0.9, 0.9, 0.9])
+        del entries['word7']
+        self.assertTrue(entries.modified)
+        self.assertEqual(len(loaded), 300)
+        self.assertNotIn('word7', loaded)
+        self.assertEqual(list(entries)[-1], 'novel')
+        np.testing.assert_array_equal(loaded.get_coords('word3'), [0.9, 0.9, 0.9, 0.9])
+
+        quiet(loaded.build_index)
+        self.assertEqual(loaded.nearest_word(np.array([0.1, 0.2, 0.3, 0.4])), 'novel')
+        self.assertEqual(loaded.nearest_word(np.array([0.9, 0.9, 0.9, 0.9])), 'word3')
+        with self.assertRaises(KeyError):
+            del entries['word7']
+
+        # The store itself is unchanged; a re-save includes the changes
+        self.assertEqual(len(open_store(self.path)), 300)
+        quiet(loaded.save_compact, self.path)
+        reloaded = self._load()
+        self.assertEqual(len(reloaded), 300)
+        self.assertIn('novel', reloaded)
+        self.assertNotIn('word7', reloaded)
+
+    def test_pickle_from_store(self):
+        quiet(self.vocab.save_compact, self.path)
+        pickle_path = os.path.join(self.tmp, 'vocab.pkl')
+        quiet(self._load().save, pickle_path)
+        loaded = LJPWVocabulary()
+        quiet(loaded.load, pickle_path)
+        self.assertIsInstance(loaded.word_to_entry, dict)
+        self.assertIsInstance(loaded.get_entry('word1'), WordEntry)
+        self.assertEqual(len(loaded), 300)
+
+    def test_incomplete_store(self):
+        quiet(self.vocab.save_compact, self.path)
+        os.remove(os.path.join(self.path, MANIFEST_FILE))
+        self.assertFalse(is_store(self.path))
+        with self.assertRaises(FileNotFoundError):
+            open_store(self.path)
+
+
+class TestLoaderCache(unittest.TestCase):
+    """Test the merged-vocabulary cache of VocabularyLoader"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.cache = os.path.join(self.tmp, 'cache')
+        self.files = []
+        for n, words in enumerate((['love', 'hope'], ['Hope', 'wisdom'])):
+            path = os.path.join(self.tmp, f"expansion{n}.json")
+            mappings = [{'word': w, 'coordinates': [0.1 * i, 0.2, 0.3, 0.4 + n * 0.1]}
+                        for i, w in enumerate(words)]
+            with open(path, 'w') as f:
+                json.dump({'metadata': {}, 'mappings': mappings}, f)
+            self.files.append(os.path.basename(path))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _load(self):
+        return quiet(VocabularyLoader.load_multiple_files, self.files,
+                     data_dir=self.tmp, cache_dir=self.cache)
+
+    def test_cache_reused_until_changed(self):
+        first = self._load()
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(os.listdir(self.cache)), 1)
+
+        second = self._load()
+        self.assertIsInstance(second.word_to_entry, StoredEntries)
+        self.assertEqual(list(second.word_to_entry), list(first.word_to_entry))
+        self.assertEqual(second.get_entry('hope').source, 'expansion0.json')
+
+        # Touching a source file produces a new cache entry
+        path = os.path.join(self.tmp, self.files[1])
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        self._load()
+        self.assertEqual(len(os.listdir(self.cache)), 2)
+
+
+class TestDefaultVocabulary(unittest.TestCase):
+    """Test the language model's pickle -> store conversion"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.pickle_path = os.path.join(self.tmp, 'ljpw_vocabulary.pkl')
+        self.model = quiet(PureLJPWLanguageModel, vocab=LJPWVocabulary(), qualia=QualiaGrounding())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def _write_pickle(self, words):
+        vocab = LJPWVocabulary()
+        for i, word in enumerate(words):
+            quiet(vocab.register, word, [0.1 * i, 0.2, 0.3, 0.4])
+        quiet(vocab.save, self.pickle_path)
+
+    def _load(self):
+        return quiet(self.model._load_default_vocabulary, data_dir=self.tmp)
+
+    def test_store_rebuilt_when_pickle_changes(self):
+        self._write_pickle(['love', 'hope'])
+        first = self._load()
+        self.assertIsInstance(first.word_to_entry, StoredEntries)
+        self.assertTrue(is_store(os.path.join(self.tmp, 'ljpw_vocabulary')))
+
+        # Unchanged pickle: the store is reused as is
+        self.assertIsInstance(self._load().word_to_entry, StoredEntries)
+
+        self._write_pickle(['love', 'hope', 'wisdom'])
+        stat = os.stat(self.pickle_path)
+        os.utime(self.pickle_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        second = self._load()
+        self.assertEqual(len(second), 3)
+        self.assertIn('wisdom', second)
+        self.assertIsInstance(second.word_to_entry, StoredEntries)
+
+
+if __name__ == '__main__':
+    unittest.main()
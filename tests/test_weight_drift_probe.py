@@ -0,0 +1,99 @@
+"""
+Unit Tests for Choice-Based Weight Drift Probe Modes
+
+Every probe mode must make the same choices from the same random draws
+and leave bit-identical weights; the copy-free modes must not copy weight
+matrices, and the batched mode must report the harmony evaluations it saved.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bicameral.right.homeostatic import HomeostaticNetwork
+from bicameral.right.consciousness_growth import choice_based_weight_drift, PROBE_MODES
+
+
+class WeightHarmonyNetwork(HomeostaticNetwork):
+    """Harmony measured from the weights, so probes and mistakes matter."""
+
+    def get_current_harmony(self) -> float:
+        return float(0.8 - 40 * sum(np.mean(layer.weights) ** 2 for layer in self.layers))
+
+
+def drift_runs(network, mode, steps=15, seed=7, **kwargs):
+    network = pickle.loads(pickle.dumps(network))
+    np.random.seed(seed)
+    stats = [choice_based_weight_drift(network, probe=mode, **kwargs) for _ in range(steps)]
+    return network, stats
+
+
+class TestProbeModes(unittest.TestCase):
+    """Test that probe modes agree with the copying probe"""
+
+    def assertSameDrift(self, network, **kwargs):
+        reference, reference_stats = drift_runs(network, 'copy', **kwargs)
+        for mode in PROBE_MODES[1:]:
+            drifted, stats = drift_runs(network, mode, **kwargs)
+            for a, b in zip(reference.layers, drifted.layers):
+                np.testing.assert_array_equal(a.weights, b.weights)
+            self.assertEqual([s['choices'] for s in stats], [s['choices'] for s in reference_stats])
+            self.assertEqual([s['final_H'] for s in stats], [s['final_H'] for s in reference_stats])
+        return reference_stats
+
+    def test_recorded_harmony(self):
+        """HomeostaticNetwork drifts identically in every mode"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7, 8], seed=1)
+        self.assertSameDrift(network)
+        self.assertSameDrift(network, show_optimal_path=False, learning_rate=0.01)
+
+    def test_weight_dependent_harmony(self):
+        """Forward guidance, mistakes and self-correction also agree"""
+        network = WeightHarmonyNetwork(4, 4, hidden_fib_indices=[7], seed=2)
+        stats = self.assertSameDrift(network, steps=40, learning_rate=0.05)
+        totals = {key: sum(s['choices'][key] for s in stats) for key in stats[0]['choices']}
+        self.assertGreater(totals['learned_from_mistake'], 0)
+
+    def test_evaluation_counts(self):
+        """Batched mode evaluates harmony once per call and reports the savings"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7, 7], seed=3)
+        n_layers = len(network.layers)
+
+        _, copy_stats = drift_runs(network, 'copy', steps=1)
+        self.assertEqual(copy_stats[0]['harmony_evaluations'], 1 + 3 * n_layers)
+        self.assertEqual(copy_stats[0]['harmony_evaluations_saved'], 0)
+
+        _, batched_stats = drift_runs(network, 'batched', steps=1)
+        self.assertEqual(batched_stats[0]['harmony_evaluations'], 1)
+        self.assertEqual(batched_stats[0]['harmony_evaluations_saved'], 3 * n_layers)
+
+        # Weight-dependent harmony cannot be batched
+        _, fallback = drift_runs(WeightHarmonyNetwork(4, 4, hidden_fib_indices=[7], seed=3), 'batched', steps=1)
+        self.assertEqual(fallback[0]['harmony_evaluations_saved'], 0)
+
+    def test_no_weight_copies(self):
+        """Batched mode updates weights in place; inplace mode ping-pongs two arrays"""
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=4)
+        before = [layer.weights for layer in network.layers]
+        choice_based_weight_drift(network, probe='batched')
+        self.assertTrue(all(layer.weights is w for layer, w in zip(network.layers, before)))
+
+        seen = set()
+        for _ in range(4):
+            choice_based_weight_drift(network, probe='inplace')
+            seen.add(id(network.layers[0].weights))
+        self.assertEqual(len(seen), 2)
+
+    def test_invalid_mode(self):
+        network = HomeostaticNetwork(4, 4, hidden_fib_indices=[7], seed=5)
+        with self.assertRaises(ValueError):
+            choice_based_weight_drift(network, probe='guess')
+
+
+if __name__ == '__main__':
+    unittest.main()